@@ -1,18 +1,27 @@
 """JWT authentication middleware."""
 
-from fastapi import Request, HTTPException, status
+from fastapi import HTTPException, Request, status
 from sqlalchemy.orm import Session
 
-from app.utils.security import decode_access_token
-from app.services.auth_service import get_user_by_id, UserNotFoundError
+from app.database.models import Project
 from app.database.session import SessionLocal
+from app.services import auth_cache
+from app.services.access_control import (
+    PermissionDeniedError,
+    ProjectNotFoundError,
+    authorize_project,
+    get_authorized_project,
+)
+from app.services.auth_service import UserNotFoundError, get_user_by_id
 
 
 async def auth_middleware(request: Request, call_next):
     """
     Extract and validate JWT token from Authorization header.
 
-    Attaches user to request.state.user if valid token.
+    Attaches the user (a cached UserPrincipal) to request.state.user if valid
+    token. Decoded tokens and principals are served from auth_cache; the
+    database is only queried on a cache miss.
     Raises 401 if token invalid/expired/missing on protected endpoints.
     """
     # Get authorization header
@@ -50,8 +59,8 @@ async def auth_middleware(request: Request, call_next):
             )
         return await call_next(request)
 
-    # Validate token
-    payload = decode_access_token(token)
+    # Validate token (memoized until it expires)
+    payload = auth_cache.decode_token(token)
     if not payload:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -59,18 +68,20 @@ async def auth_middleware(request: Request, call_next):
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Load user from database
-    db = SessionLocal()
-    try:
-        user = get_user_by_id(db, payload.get("user_id"))
-        request.state.user = user
-    except UserNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-        )
-    finally:
-        db.close()
+    # Load user from cache, falling back to the database
+    user = auth_cache.get_principal(payload.get("user_id"))
+    if user is None:
+        db = SessionLocal()
+        try:
+            user = auth_cache.remember_user(get_user_by_id(db, payload.get("user_id")))
+        except UserNotFoundError as e:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+            ) from e
+        finally:
+            db.close()
+    request.state.user = user
 
     return await call_next(request)
 
@@ -88,3 +99,42 @@ def get_current_user(request: Request):
             detail="Not authenticated",
         )
     return user
+
+
+def _raise_access_error(error: Exception):
+    if isinstance(error, ProjectNotFoundError):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        ) from error
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="You don't have access to this project",
+    ) from error
+
+
+def check_project_access(db: Session, project_id: str, user) -> None:
+    """
+    Verify project exists and user has access (shared by project-scoped routes).
+
+    Uses the cached membership sets of app/services/access_control.py: no
+    query on a cache hit, one on a miss.
+
+    Raises 404 if project not found, 403 if user is not a member.
+    """
+    try:
+        authorize_project(db, project_id, user.id, user.role)
+    except (ProjectNotFoundError, PermissionDeniedError) as e:
+        _raise_access_error(e)
+
+
+def get_accessible_project(db: Session, project_id: str, user) -> Project:
+    """check_project_access, returning the Project row (for routes that update it).
+
+    The row is read with db.get(); the membership check is cached as in
+    check_project_access, so a cache hit costs that one query.
+    """
+    try:
+        return get_authorized_project(db, project_id, user.id, user.role)
+    except (ProjectNotFoundError, PermissionDeniedError) as e:
+        _raise_access_error(e)
@@ -0,0 +1,87 @@
+"""Request body size limit for document uploads.
+
+Story 10.2: FastAPI reads (and spools) the whole multipart form before the
+upload handler runs, so the size limit has to be enforced at the ASGI layer:
+a declared Content-Length over the limit is answered with 400 without reading
+the body, and a body that streams past the limit (chunked, or with a wrong
+Content-Length) is cut off as soon as it crosses it.
+"""
+
+import re
+
+from fastapi import status
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services.upload_storage import FileTooLargeError, max_document_bytes
+
+# Allowance for multipart boundaries and form fields on top of the file limit
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+DOCUMENT_UPLOAD_PATH = re.compile(r"^/api/projects/[^/]+/documents/?$")
+
+
+class RequestBodyTooLarge(Exception):
+    """Raised from receive() once an upload body crosses the limit."""
+
+
+def upload_body_limit() -> int:
+    """Largest request body accepted by the document upload endpoint."""
+    return max_document_bytes() + MULTIPART_OVERHEAD_BYTES
+
+
+class UploadSizeLimitMiddleware:
+    """Reject oversized document uploads before the form is parsed."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or not DOCUMENT_UPLOAD_PATH.match(scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        limit = upload_body_limit()
+
+        content_length = dict(scope["headers"]).get(b"content-length", b"")
+        if content_length.isdigit() and int(content_length) > limit:
+            await self._reject(scope, receive, send)
+            return
+
+        received = 0
+        exceeded = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    exceeded = True
+                    raise RequestBodyTooLarge(limit)
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            # Once the body is cut off, the app's own error response (form
+            # parsing wraps the exception) is replaced by ours.
+            if not exceeded:
+                await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except RequestBodyTooLarge:
+            pass
+        if exceeded:
+            await self._reject(scope, receive, send)
+
+    @staticmethod
+    async def _reject(scope: Scope, receive: Receive, send: Send) -> None:
+        response = JSONResponse(
+            {"detail": str(FileTooLargeError(max_document_bytes()))},
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+        await response(scope, receive, send)
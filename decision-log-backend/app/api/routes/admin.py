@@ -4,9 +4,13 @@ Story 7.4: Backend Gmail API Poller
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
 
 from app.api.middleware.auth import get_current_user
+from app.database.session import get_db
 from app.scheduler import app_scheduler
+from app.services.ingestion_queue import queue_stats
+from app.services.llm_cache import get_llm_cache
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
@@ -25,3 +29,21 @@ def require_director(current_user=Depends(get_current_user)):
 async def get_scheduler_status(current_user=Depends(require_director)):
     """Return background scheduler status. Admin (director) only."""
     return app_scheduler.get_status()
+
+
+@router.get("/ingestion/jobs")
+async def get_ingestion_job_stats(
+    current_user=Depends(require_director),
+    db: Session = Depends(get_db),
+):
+    """Return ingestion job queue counts by status. Admin (director) only."""
+    return queue_stats(db)
+
+
+@router.get("/llm-cache")
+async def get_llm_cache_stats(current_user=Depends(require_director)):
+    """Return LLM response cache hit/miss counters. Admin (director) only."""
+    cache = get_llm_cache()
+    if cache is None:
+        return {"enabled": False}
+    return cache.stats()
@@ -77,7 +77,7 @@ async def login(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
             headers={"WWW-Authenticate": "Bearer"},
-        )
+        ) from e
 
 
 @router.get("/me", response_model=UserResponse)
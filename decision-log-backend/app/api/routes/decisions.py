@@ -11,8 +11,10 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
+from app.database.full_text import text_match
 from app.database.models import ProjectItem, Source, Transcript
 from app.database.session import get_db
+from app.services.pagination import CountMode, InvalidCursorError, count_rows, paginate
 
 # Backward compatibility alias for route internals
 Decision = ProjectItem
@@ -34,12 +36,16 @@ async def list_decisions(
     offset: int = 0,
     sort_by: str = "created_at",
     sort_order: str = "desc",
+    cursor: Optional[str] = None,
+    count: CountMode = "exact",
     db: Session = Depends(get_db),
 ):
     """
     V1 backward-compatible decisions endpoint.
     Internally queries project_items WHERE item_type='decision'.
     Response uses V1 field names (decision_statement, discipline singular).
+    Pages with ?cursor=<next_cursor> (keyset on the sort column and id) or
+    with offset; ?count=estimated|none skips the exact total.
     """
     # Query only decisions (V1 item type)
     query = (
@@ -75,32 +81,35 @@ async def list_decisions(
             query = query.filter(Decision.anomaly_flags.isnot(None))
 
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            (Decision.decision_statement.ilike(search_term))
-            | (Decision.why.ilike(search_term))
-        )
+        query = query.filter(text_match(db, Decision, search))
 
     # Get total count before pagination
-    total = query.count()
+    total = count_rows(db, query, count)
 
     # Apply sorting
-    if sort_by == "created_at":
-        col = Decision.created_at
-    elif sort_by == "confidence":
+    if sort_by == "confidence":
         col = Decision.confidence
     else:
+        sort_by = "created_at"
         col = Decision.created_at
-
-    if sort_order.lower() == "asc":
-        query = query.order_by(col.asc())
-    else:
-        query = query.order_by(col.desc())
+    descending = sort_order.lower() != "asc"
 
     # Apply pagination
-    query = query.limit(limit).offset(offset)
-
-    rows = query.all()
+    try:
+        rows, next_cursor = paginate(
+            query,
+            [col, Decision.id],
+            descending=descending,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            scope=f"{sort_by}:{'desc' if descending else 'asc'}",
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from e
 
     # Transform to V1 response shape
     decisions_list = []
@@ -148,6 +157,7 @@ async def list_decisions(
             "total": total,
             "limit": limit,
             "offset": offset,
+            "next_cursor": next_cursor,
             "facets": {
                 "disciplines": disciplines_facet,
                 "meeting_types": {},
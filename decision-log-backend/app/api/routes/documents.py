@@ -1,30 +1,44 @@
 """Document upload endpoints for PDF and DOCX ingestion.
 
 Story 10.2: Document Ingestion (PDF & DOCX)
+
+Uploads are streamed to disk (never held in memory, the size limit is
+checked per chunk; oversized bodies are rejected before form parsing by
+app/api/middleware/upload_limit.py) and acknowledged with 202; text extraction
+and the AI summary run in an ingestion worker (prepare_document job). Clients
+poll GET .../documents/{source_id}/status (optionally long-polling with ?wait=).
 """
 
+import asyncio
 import os
 import uuid
 import logging
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Request, UploadFile, status
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from app.config import settings
-from app.database.models import Source
+from app.api.middleware.auth import check_project_access
+from app.database.models import IngestionJob, Source
 from app.database.session import get_db
-from app.services.document_processor import DocumentProcessor
+from app.services.ingestion_queue import JOB_PREPARE_DOCUMENT, enqueue_job
+from app.services.upload_storage import (
+    FileTooLargeError,
+    document_path,
+    max_document_bytes,
+    save_stream,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-MAX_DOCUMENT_SIZE_MB = int(os.getenv("MAX_DOCUMENT_SIZE_MB", "10"))
-MAX_DOCUMENT_SIZE_BYTES = MAX_DOCUMENT_SIZE_MB * 1024 * 1024
-
 ALLOWED_EXTENSIONS = {"pdf", "docx"}
 
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+STATUS_POLL_INTERVAL_SECONDS = 0.5
+
 
 def _get_user(request: Request):
     """Extract authenticated user from request state (set by auth middleware)."""
@@ -37,39 +51,7 @@ def _get_user(request: Request):
     return user
 
 
-def _generate_summary(text: str) -> str:
-    """Generate a one-line AI summary from extracted text using Claude.
-
-    Falls back to a text truncation if the API call fails.
-    """
-    snippet = text[:2000]
-    try:
-        from anthropic import Anthropic
-
-        client = Anthropic(api_key=settings.anthropic_api_key)
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=100,
-            messages=[
-                {
-                    "role": "user",
-                    "content": (
-                        "Summarize the following document excerpt in one concise sentence "
-                        "(max 120 characters). Return ONLY the summary, no preamble.\n\n"
-                        f"{snippet}"
-                    ),
-                }
-            ],
-        )
-        summary = response.content[0].text.strip()
-        return summary[:200]  # Safety cap
-    except Exception as e:
-        logger.warning(f"AI summary generation failed, using fallback: {e}")
-        # Fallback: first 200 chars of extracted text
-        return snippet[:200].strip() + ("..." if len(snippet) > 200 else "")
-
-
-@router.post("/projects/{project_id}/documents")
+@router.post("/projects/{project_id}/documents", status_code=status.HTTP_202_ACCEPTED)
 async def upload_document(
     project_id: str,
     request: Request,
@@ -80,8 +62,9 @@ async def upload_document(
     """
     Upload a PDF or DOCX document for a project.
 
-    Extracts text, generates AI summary, and creates a Source record
-    with ingestion_status='pending' for admin review.
+    Stores the file and creates a Source record with
+    ingestion_status='preparing'. A worker then extracts the text, generates
+    the AI summary and moves the source to 'pending' for admin review.
 
     Args:
         project_id: UUID of the project.
@@ -89,7 +72,7 @@ async def upload_document(
         title: Optional title (defaults to filename).
 
     Returns:
-        Source ID, status, and AI summary.
+        Source ID, status, and the URL to poll for completion.
     """
     # Authenticate
     user = _get_user(request)
@@ -108,69 +91,130 @@ async def upload_document(
             detail=f"Only PDF and DOCX files are supported. Got: .{ext}",
         )
 
-    # Read file content
-    content = await file.read()
+    # Generate source ID before saving file
+    source_id = uuid.uuid4()
 
-    # Validate file size
-    if len(content) > MAX_DOCUMENT_SIZE_BYTES:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File size exceeds {MAX_DOCUMENT_SIZE_MB}MB limit",
+    # Stream file to disk (validates size as it goes)
+    file_path = document_path(project_id, source_id, ext)
+    try:
+        file_size = await run_in_threadpool(
+            save_stream, file.file, file_path, max_document_bytes(), UPLOAD_CHUNK_BYTES
         )
+    except FileTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
-    if len(content) == 0:
+    if file_size == 0:
+        os.remove(file_path)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Uploaded file is empty",
         )
 
-    # Extract text
-    processor = DocumentProcessor()
-    raw_text = processor.extract_text(content, ext)
-
-    if not raw_text:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail="Could not extract text from the uploaded document",
-        )
-
-    # Generate source ID before saving file
-    source_id = uuid.uuid4()
-
-    # Save file to disk
-    file_path = f"uploads/documents/{project_id}/{source_id}.{ext}"
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-    with open(file_path, "wb") as f:
-        f.write(content)
-
-    # Generate AI summary
-    summary = _generate_summary(raw_text)
-
-    # Create Source record
+    # Create Source record; text and summary are filled in by the worker
     source = Source(
         id=source_id,
         project_id=project_id,
         source_type="document",
         title=title or file.filename,
-        raw_content=raw_text,
         file_url=file_path,
         file_type=ext,
-        file_size=len(content),
-        ai_summary=summary,
-        ingestion_status="pending",
+        file_size=file_size,
+        ingestion_status="preparing",
         occurred_at=datetime.now(timezone.utc),
     )
     db.add(source)
+    enqueue_job(db, source.id, job_type=JOB_PREPARE_DOCUMENT)
     db.commit()
-    db.refresh(source)
 
     logger.info(
         f"Document uploaded: source_id={source_id}, project={project_id}, "
-        f"type={ext}, size={len(content)} bytes"
+        f"type={ext}, size={file_size} bytes"
     )
 
+    return {
+        "source_id": str(source_id),
+        "status": "preparing",
+        "status_url": f"/api/projects/{project_id}/documents/{source_id}/status",
+    }
+
+
+def _document_status(source: Source, job) -> dict:
+    """Build the status payload for an uploaded document."""
+    doc_status = source.ingestion_status
+    error = None
+    if doc_status == "preparing" and job is not None and job.status == "failed":
+        doc_status = "failed"
+        error = job.last_error
+    elif doc_status == "failed":
+        error = "Could not extract text from the uploaded document"
     return {
         "source_id": str(source.id),
-        "status": "pending",
-        "ai_summary": summary,
+        "status": doc_status,
+        "ai_summary": source.ai_summary,
+        "error": error,
     }
+
+
+@router.get("/projects/{project_id}/documents/{source_id}/status")
+async def get_document_status(
+    project_id: str,
+    source_id: str,
+    request: Request,
+    wait: int = Query(0, ge=0, le=30, description="Long-poll up to N seconds for preparation to finish"),
+    db: Session = Depends(get_db),
+):
+    """
+    Get the preparation status of an uploaded document.
+
+    Status is 'preparing' until the worker finishes, then 'pending' (ready
+    for review, ai_summary populated) or 'failed'. With ?wait=N the request
+    is held until preparation finishes or N seconds elapse; the queries run
+    in the threadpool and no transaction is held between polls.
+    """
+    user = _get_user(request)
+    await run_in_threadpool(check_project_access, db, project_id, user)
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    while True:
+        payload = await run_in_threadpool(_load_document_status, db, project_id, source_id)
+        if payload is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Document not found",
+            )
+        if payload["status"] != "preparing" or loop.time() >= deadline:
+            return payload
+        await asyncio.sleep(STATUS_POLL_INTERVAL_SECONDS)
+
+
+def _load_document_status(db: Session, project_id: str, source_id: str):
+    """Status payload of a project's document (None if not found).
+
+    Ends the read transaction so the connection is released while the
+    caller waits, and the next poll sees the worker's commit.
+    """
+    try:
+        source = (
+            db.query(Source)
+            .filter(
+                Source.id == source_id,
+                Source.project_id == project_id,
+                Source.source_type == "document",
+            )
+            .first()
+        )
+        if not source:
+            return None
+        job = (
+            db.query(IngestionJob)
+            .filter(
+                IngestionJob.source_id == source.id,
+                IngestionJob.job_type == JOB_PREPARE_DOCUMENT,
+            )
+            .order_by(IngestionJob.created_at.desc())
+            .first()
+        )
+        return _document_status(source, job)
+    finally:
+        db.rollback()
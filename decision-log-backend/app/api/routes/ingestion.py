@@ -2,18 +2,21 @@
 
 Provides admin control over what content enters the system. Sources arrive
 via webhooks (pending status) and must be approved before ETL processing.
+Approval enqueues a durable ingestion job executed by app/worker.py.
 """
 
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
 
 from app.api.models.ingestion import IngestionBatchAction, IngestionUpdate
+from app.database.full_text import text_match
 from app.database.models import Project, Source
 from app.database.session import get_db
-from app.services.ingestion_pipeline import process_approved_source
+from app.services.ingestion_queue import enqueue_job
+from app.services.pagination import CountMode, InvalidCursorError, count_rows, paginate
 
 router = APIRouter()
 
@@ -48,14 +51,19 @@ async def list_sources(
     ingestion_status: Optional[str] = Query("pending", description="Filter by ingestion status"),
     date_from: Optional[str] = Query(None, description="Filter by occurred_at >= date"),
     date_to: Optional[str] = Query(None, description="Filter by occurred_at <= date"),
+    search: Optional[str] = Query(None, description="Full-text search (title, summary, sender)"),
     limit: int = Query(50, ge=1, le=200, description="Results per page"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page (replaces offset)"),
+    count: CountMode = Query("exact", description="Total count mode: exact, estimated or none"),
     db: Session = Depends(get_db),
 ):
     """
     List sources with pagination and filters.
 
     Default filter: ingestion_status=pending.
+    Pages with ?cursor=<next_cursor> (keyset on created_at, id) or with
+    offset; ?count=estimated|none skips the exact total.
     Returns sources joined with project_name from the Project table.
     JWT authentication required.
     """
@@ -90,14 +98,28 @@ async def list_sources(
         except (ValueError, TypeError):
             pass
 
+    if search:
+        query = query.filter(text_match(db, Source, search))
+
     # Get total count before pagination
-    total = query.count()
+    total = count_rows(db, query, count)
 
     # Apply ordering and pagination
-    query = query.order_by(Source.created_at.desc())
-    query = query.limit(limit).offset(offset)
-
-    rows = query.all()
+    try:
+        rows, next_cursor = paginate(
+            query,
+            [Source.created_at, Source.id],
+            descending=True,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            scope="created_at:desc",
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from e
 
     # Format response
     sources_list = []
@@ -124,6 +146,7 @@ async def list_sources(
         "total": total,
         "limit": limit,
         "offset": offset,
+        "next_cursor": next_cursor,
     }
 
 
@@ -132,14 +155,13 @@ async def update_source_status(
     source_id: str,
     update: IngestionUpdate,
     request: Request,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     """
     Update source ingestion status (approve or reject).
 
     Admin-only endpoint. On approval, sets approved_by/approved_at
-    and triggers the ETL pipeline as a background task.
+    and enqueues an ingestion job in the same transaction.
     """
     user = _require_admin(request)
 
@@ -155,11 +177,9 @@ async def update_source_status(
     if update.ingestion_status == "approved":
         source.approved_by = user.id
         source.approved_at = datetime.utcnow()
-        db.commit()
-        # Trigger ETL pipeline in background
-        background_tasks.add_task(process_approved_source, str(source.id))
-    else:
-        db.commit()
+        enqueue_job(db, source.id)
+
+    db.commit()
 
     return {
         "id": str(source.id),
@@ -171,7 +191,6 @@ async def update_source_status(
 async def batch_update_sources(
     batch: IngestionBatchAction,
     request: Request,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     """
@@ -194,16 +213,12 @@ async def batch_update_sources(
         if new_status == "approved":
             source.approved_by = user.id
             source.approved_at = datetime.utcnow()
+            enqueue_job(db, source.id)
 
         updated_count += 1
 
     db.commit()
 
-    # Trigger ETL for approved sources
-    if new_status == "approved":
-        for sid in batch.source_ids:
-            background_tasks.add_task(process_approved_source, sid)
-
     return {
         "updated": updated_count,
         "action": batch.action,
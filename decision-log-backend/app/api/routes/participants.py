@@ -5,8 +5,9 @@ import uuid
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
+from app.api.middleware.auth import check_project_access
 from app.api.models.project import ParticipantCreate, ParticipantUpdate
-from app.database.models import Project, ProjectMember, ProjectParticipant
+from app.database.models import ProjectParticipant
 from app.database.session import get_db
 
 router = APIRouter()
@@ -19,21 +20,6 @@ def _get_user(request: Request):
     return user
 
 
-def _check_project_access(db: Session, project_id: str, user) -> Project:
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
-    if user.role != "director":
-        is_member = (
-            db.query(ProjectMember)
-            .filter(ProjectMember.project_id == project_id, ProjectMember.user_id == str(user.id))
-            .first()
-        )
-        if not is_member:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
-    return project
-
-
 def _participant_to_response(p: ProjectParticipant) -> dict:
     return {
         "id": str(p.id),
@@ -52,7 +38,7 @@ async def list_participants(
 ):
     """List project participants."""
     user = _get_user(request)
-    _check_project_access(db, project_id, user)
+    check_project_access(db, project_id, user)
 
     participants = (
         db.query(ProjectParticipant)
@@ -72,7 +58,7 @@ async def add_participant(
 ):
     """Add a participant to a project."""
     user = _get_user(request)
-    _check_project_access(db, project_id, user)
+    check_project_access(db, project_id, user)
 
     # Check unique email per project
     if body.email:
@@ -131,7 +117,7 @@ async def update_participant(
 ):
     """Update a project participant."""
     user = _get_user(request)
-    _check_project_access(db, project_id, user)
+    check_project_access(db, project_id, user)
 
     participant = (
         db.query(ProjectParticipant)
@@ -168,7 +154,7 @@ async def remove_participant(
 ):
     """Remove a participant from a project."""
     user = _get_user(request)
-    _check_project_access(db, project_id, user)
+    check_project_access(db, project_id, user)
 
     participant = (
         db.query(ProjectParticipant)
@@ -2,12 +2,14 @@
 
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from app.api.middleware.auth import check_project_access
 from app.api.models.project_item import (
     ProjectItemCreate,
     ProjectItemListResponse,
@@ -15,8 +17,20 @@ from app.api.models.project_item import (
     ProjectItemUpdate,
     SourceInfo,
 )
-from app.database.models import Project, ProjectItem, ProjectMember, Source, User
+from app.database.full_text import text_match
+from app.database.models import ProjectItem, Source, User
+from app.database.project_stats import rollup_facets
 from app.database.session import get_db
+from app.services.item_facets import compute_item_facets
+from app.services.item_search import (
+    HybridResult,
+    ItemFilters,
+    SemanticSearchUnavailableError,
+    hybrid_search,
+    lexical_search,
+    semantic_search,
+)
+from app.services.pagination import CountMode, InvalidCursorError, count_rows, paginate
 
 router = APIRouter()
 
@@ -32,31 +46,6 @@ def _get_user(request: Request):
     return user
 
 
-def _check_project_access(db: Session, project_id: str, user) -> Project:
-    """Verify project exists and user has access."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found",
-        )
-    if user.role != "director":
-        is_member = (
-            db.query(ProjectMember)
-            .filter(
-                ProjectMember.project_id == project_id,
-                ProjectMember.user_id == str(user.id),
-            )
-            .first()
-        )
-        if not is_member:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You don't have access to this project",
-            )
-    return project
-
-
 def _item_to_response(item: ProjectItem) -> dict:
     """Convert a ProjectItem ORM object to response dict."""
     source_info = None
@@ -92,34 +81,6 @@ def _item_to_response(item: ProjectItem) -> dict:
     }
 
 
-def _compute_facets(db: Session, project_id: str) -> dict:
-    """Compute facet counts for a project's items."""
-    items = db.query(ProjectItem).filter(ProjectItem.project_id == project_id).all()
-
-    item_types: dict = {}
-    source_types: dict = {}
-    disciplines: dict = {}
-
-    for item in items:
-        # Count by item_type
-        it = item.item_type or "decision"
-        item_types[it] = item_types.get(it, 0) + 1
-
-        # Count by source_type
-        st = item.source_type or "meeting"
-        source_types[st] = source_types.get(st, 0) + 1
-
-        # Count by discipline (from affected_disciplines array)
-        for d in (item.affected_disciplines or []):
-            disciplines[d] = disciplines.get(d, 0) + 1
-
-    return {
-        "item_types": item_types,
-        "source_types": source_types,
-        "disciplines": disciplines,
-    }
-
-
 @router.get("/projects/{project_id}/items")
 async def list_project_items(
     project_id: str,
@@ -136,86 +97,174 @@ async def list_project_items(
     sort_order: str = Query("desc", pattern=r"^(asc|desc)$"),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
+    count: CountMode = "exact",
 ):
-    """List project items with full filter support."""
+    """List project items with full filter support.
+
+    Pages with ?cursor=<next_cursor> (keyset on the sort column and id) or
+    with offset; ?count=estimated|none skips the exact total.
+    """
     user = _get_user(request)
-    _check_project_access(db, project_id, user)
+    check_project_access(db, project_id, user)
 
-    query = db.query(ProjectItem).filter(ProjectItem.project_id == project_id)
+    # Filter conditions keyed by dimension (facets skip their own dimension)
+    filters = {}
 
     # Multi-value filter: ?item_type=decision,topic
     if item_type:
         types = [t.strip() for t in item_type.split(",")]
-        query = query.filter(ProjectItem.item_type.in_(types))
+        filters["item_type"] = ProjectItem.item_type.in_(types)
 
     # Multi-value filter: ?source_type=meeting,email
     if source_type:
         stypes = [s.strip() for s in source_type.split(",")]
-        query = query.filter(ProjectItem.source_type.in_(stypes))
+        filters["source_type"] = ProjectItem.source_type.in_(stypes)
 
     # JSONB discipline filter: ?discipline=structural,architecture
     if discipline:
         disciplines_list = [d.strip() for d in discipline.split(",")]
         # Use OR logic — item matches if ANY of the requested disciplines is present
-        discipline_filters = []
-        for d in disciplines_list:
-            discipline_filters.append(
-                ProjectItem.affected_disciplines.contains([d])
-            )
-        if discipline_filters:
-            query = query.filter(or_(*discipline_filters))
+        filters["discipline"] = or_(
+            *(ProjectItem.affected_disciplines.contains([d]) for d in disciplines_list)
+        )
 
     # Milestone filter
     if is_milestone is not None:
-        query = query.filter(ProjectItem.is_milestone == is_milestone)
+        filters["is_milestone"] = ProjectItem.is_milestone == is_milestone
 
     # Date range filter
     if date_from:
-        query = query.filter(ProjectItem.created_at >= date_from)
+        filters["date_from"] = ProjectItem.created_at >= date_from
     if date_to:
-        query = query.filter(ProjectItem.created_at <= date_to)
+        filters["date_to"] = ProjectItem.created_at <= date_to
 
-    # Text search across multiple fields
+    # Full-text search (statement, why, who, owner, source_excerpt)
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            or_(
-                ProjectItem.decision_statement.ilike(search_term),
-                ProjectItem.who.ilike(search_term),
-                ProjectItem.why.ilike(search_term),
-            )
-        )
+        filters["search"] = text_match(db, ProjectItem, search)
+
+    query = db.query(ProjectItem).filter(
+        ProjectItem.project_id == project_id, *filters.values()
+    )
+
+    # Unfiltered lists read counts from the project_stats rollup (None without rows)
+    rollup = rollup_facets(db, project_id) if not filters else None
 
     # Get total count before pagination
-    total = query.count()
+    if rollup and count != "none":
+        total = sum(rollup["item_types"].values())
+    else:
+        total = count_rows(db, query, count)
 
-    # Apply sorting
+    # Apply sorting (id breaks ties so keyset pages are stable)
     sort_col = {
         "created_at": ProjectItem.created_at,
         "confidence": ProjectItem.confidence,
         "item_type": ProjectItem.item_type,
     }.get(sort_by, ProjectItem.created_at)
 
-    if sort_order == "asc":
-        query = query.order_by(sort_col.asc())
-    else:
-        query = query.order_by(sort_col.desc())
-
     # Apply pagination
-    items = query.limit(limit).offset(offset).all()
+    try:
+        items, next_cursor = paginate(
+            query,
+            [sort_col, ProjectItem.id],
+            descending=sort_order != "asc",
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            scope=f"{sort_by}:{sort_order}",
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from e
 
-    # Compute facets
-    facets = _compute_facets(db, project_id)
+    # Compute facets (SQL aggregates, reflecting the active filters)
+    facets = rollup if rollup is not None else compute_item_facets(db, project_id, filters)
 
     return {
         "items": [_item_to_response(item) for item in items],
         "total": total,
         "limit": limit,
         "offset": offset,
+        "next_cursor": next_cursor,
         "facets": facets,
     }
 
 
+def _split_csv(value: Optional[str]) -> list:
+    """Split a comma-separated multi-value query parameter."""
+    return [v.strip() for v in value.split(",") if v.strip()] if value else []
+
+
+def _score_breakdown(hit: HybridResult) -> dict:
+    """RRF score plus rank/score of the item in each retrieval (None if absent)."""
+    breakdown = {"rrf": round(hit.score, 6)}
+    for name in ("lexical", "semantic"):
+        retrieval = getattr(hit, name)
+        breakdown[name] = (
+            {"rank": retrieval.rank, "score": round(retrieval.score, 4)} if retrieval else None
+        )
+    return breakdown
+
+
+# Declared before /items/{item_id} so "search" is not captured as an item id
+@router.get("/projects/{project_id}/items/search")
+async def search_project_items(
+    project_id: str,
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=1000),
+    db: Session = Depends(get_db),
+    item_type: Optional[str] = None,
+    source_type: Optional[str] = None,
+    discipline: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    mode: Literal["semantic", "lexical", "hybrid"] = "semantic",
+):
+    """Search a project's items.
+
+    mode=semantic ranks by embedding similarity; mode=lexical runs a
+    full-text search (words and "quoted phrases") ranked by relevance;
+    mode=hybrid fuses both with reciprocal rank fusion and returns each
+    result's per-retrieval ranks and scores.
+    """
+    user = _get_user(request)
+    check_project_access(db, project_id, user)
+
+    filters = ItemFilters(
+        item_types=_split_csv(item_type),
+        source_types=_split_csv(source_type),
+        disciplines=_split_csv(discipline),
+    )
+    if mode == "hybrid":
+        hits = await hybrid_search(db, project_id, q, filters, limit)
+        items = [
+            {
+                **_item_to_response(hit.item),
+                "score": round(hit.score, 6),
+                "scores": _score_breakdown(hit),
+            }
+            for hit in hits
+        ]
+    else:
+        search = lexical_search if mode == "lexical" else semantic_search
+        try:
+            # Query embedding is CPU-bound; keep it off the event loop
+            results = await run_in_threadpool(search, db, project_id, q, filters, limit)
+        except SemanticSearchUnavailableError as e:
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)) from e
+        items = [{**_item_to_response(item), "score": round(score, 4)} for item, score in results]
+
+    return {
+        "items": items,
+        "total": len(items),
+        "query": q,
+        "mode": mode,
+        "limit": limit,
+    }
+
+
 @router.get("/projects/{project_id}/items/{item_id}")
 async def get_project_item(
     project_id: str,
@@ -225,7 +274,7 @@ async def get_project_item(
 ):
     """Get single project item detail with source info."""
     user = _get_user(request)
-    _check_project_access(db, project_id, user)
+    check_project_access(db, project_id, user)
 
     item = (
         db.query(ProjectItem)
@@ -250,7 +299,7 @@ async def create_project_item(
 ):
     """Create a manual input project item."""
     user = _get_user(request)
-    _check_project_access(db, project_id, user)
+    check_project_access(db, project_id, user)
 
     item = ProjectItem(
         id=uuid.uuid4(),
@@ -289,7 +338,7 @@ async def update_project_item(
 ):
     """Update a project item (milestone toggle, is_done, statement)."""
     user = _get_user(request)
-    _check_project_access(db, project_id, user)
+    check_project_access(db, project_id, user)
 
     item = (
         db.query(ProjectItem)
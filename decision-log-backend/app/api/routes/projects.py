@@ -8,9 +8,11 @@ from uuid import UUID
 
 from app.database.session import get_db
 from app.database.models import Project
+from app.services.pagination import InvalidCursorError
 from app.services.project_service import (
     get_projects,
     get_project,
+    project_cursor,
     ProjectNotFoundError,
     PermissionDeniedError,
 )
@@ -33,6 +35,7 @@ async def list_projects(
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
     archived: bool = Query(False),
+    cursor: Optional[str] = Query(None),
 ):
     """
     List all projects accessible to current user.
@@ -41,6 +44,8 @@ async def list_projects(
     - limit: Number of results per page (default 50, max 100)
     - offset: Pagination offset (default 0)
     - archived: Include archived projects (default false)
+    - cursor: next_cursor from the previous page (keyset pagination;
+      replaces offset)
 
     Returns:
         List of projects with pagination metadata
@@ -53,20 +58,30 @@ async def list_projects(
             detail="Not authenticated",
         )
 
-    # Get projects
-    projects, total = get_projects(
-        db,
-        str(user.id),
-        limit=limit,
-        offset=offset,
-        archived=archived,
-    )
+    # Get projects (one extra row tells whether another page exists)
+    try:
+        projects, total = get_projects(
+            db,
+            str(user.id),
+            limit=limit + 1,
+            offset=offset,
+            archived=archived,
+            cursor=cursor,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from e
+    has_more = len(projects) > limit
+    projects = projects[:limit]
 
     return {
         "projects": projects,
         "total": total,
         "limit": limit,
         "offset": offset,
+        "next_cursor": project_cursor(projects[-1]) if has_more else None,
     }
 
 
@@ -102,19 +117,19 @@ async def get_project_detail(
 
     try:
         # Get project details
-        project = get_project(db, str(project_id), str(user.id))
+        project = get_project(db, str(project_id), str(user.id), user.role)
         return project
 
-    except ProjectNotFoundError:
+    except ProjectNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project not found",
-        )
-    except PermissionDeniedError:
+        ) from e
+    except PermissionDeniedError as e:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have access to this project",
-        )
+        ) from e
 
 
 @router.patch("/{project_id}")
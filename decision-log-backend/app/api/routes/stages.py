@@ -7,8 +7,9 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
+from app.api.middleware.auth import get_accessible_project
 from app.api.models.project import StageCreate, StageResponse, StageTemplateResponse, StageUpdate
-from app.database.models import Project, ProjectMember, ProjectStage, StageTemplate
+from app.database.models import Project, ProjectStage, StageTemplate
 from app.database.session import get_db
 
 router = APIRouter()
@@ -21,21 +22,6 @@ def _get_user(request: Request):
     return user
 
 
-def _check_project_access(db: Session, project_id: str, user) -> Project:
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
-    if user.role != "director":
-        is_member = (
-            db.query(ProjectMember)
-            .filter(ProjectMember.project_id == project_id, ProjectMember.user_id == str(user.id))
-            .first()
-        )
-        if not is_member:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
-    return project
-
-
 def validate_stage_schedule(stages: List[StageCreate]):
     """Validate no overlaps and sequential ordering."""
     sorted_stages = sorted(stages, key=lambda s: s.stage_from)
@@ -71,7 +57,7 @@ async def list_stages(
 ):
     """List stages ordered by sort_order."""
     user = _get_user(request)
-    project = _check_project_access(db, project_id, user)
+    project = get_accessible_project(db, project_id, user)
 
     stages = (
         db.query(ProjectStage)
@@ -91,7 +77,7 @@ async def set_stages(
 ):
     """Set stage schedule (replaces all existing stages)."""
     user = _get_user(request)
-    project = _check_project_access(db, project_id, user)
+    project = get_accessible_project(db, project_id, user)
 
     # Validate schedule
     validate_stage_schedule(stages)
@@ -133,7 +119,7 @@ async def update_stage(
 ):
     """Update a single stage."""
     user = _get_user(request)
-    project = _check_project_access(db, project_id, user)
+    project = get_accessible_project(db, project_id, user)
 
     stage = (
         db.query(ProjectStage)
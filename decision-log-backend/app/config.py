@@ -32,6 +32,33 @@ class Settings(BaseSettings):
     # CORS
     cors_origins: List[str] = ["http://localhost:5173", "http://localhost:3000"]
 
+    # --- Gmail API Poller (Story 7.4, app/services/gmail_poller.py) ---
+    # OAuth2 credentials — use service account for server-to-server auth
+    gmail_client_id: Optional[str] = None
+    gmail_client_secret: Optional[str] = None
+    gmail_refresh_token: Optional[str] = None
+    # Alternative: service account JSON (base64-encoded)
+    gmail_service_account_json: Optional[str] = None
+    gmail_poll_interval_minutes: int = 30  # How often to poll Gmail
+    gmail_label_filter: str = ""  # Gmail label to filter (empty = all unread)
+    gmail_max_results_per_poll: int = 50  # Max emails fetched per cycle
+    gmail_batch_size: int = 50  # messages.get calls per batch HTTP request (Gmail max 100)
+    gmail_quota_units_per_second: int = 250  # Per-user Gmail quota; batches are paced to stay under it
+    gmail_incremental_sync: bool = True  # Sync from the last historyId instead of re-listing unread mail
+    gmail_label_cache_ttl_seconds: int = 3600  # Label id -> name registry lifetime (unknown ids reload it)
+    gmail_summary_interval_minutes: int = 5  # How often the summary stage picks up unsummarised emails
+    gmail_summary_batch_size: int = 100  # Emails summarised per summary stage run
+
+    def is_gmail_configured(self) -> bool:
+        """Return True if Gmail API credentials are present."""
+        has_oauth2 = all([
+            self.gmail_client_id,
+            self.gmail_client_secret,
+            self.gmail_refresh_token,
+        ])
+        has_service_account = self.gmail_service_account_json is not None
+        return has_oauth2 or has_service_account
+
     # --- Google Drive API (Story 10.3) ---
     google_drive_enabled: bool = False
     google_drive_service_account_key: Optional[str] = None
@@ -41,6 +68,65 @@ class Settings(BaseSettings):
         """Return True if Google Drive monitoring is enabled and configured."""
         return self.google_drive_enabled and self.google_drive_service_account_key is not None
 
+    # --- Ingestion job queue (worker: python -m app.worker) ---
+    ingestion_worker_processes: int = 1
+    ingestion_worker_concurrency: int = 4  # Jobs in flight per worker process
+    ingestion_worker_poll_seconds: float = 2.0
+    ingestion_job_lease_seconds: int = 600  # Expired leases are re-claimed by other workers
+    ingestion_job_max_attempts: int = 3
+    ingestion_job_retry_delay_seconds: int = 30
+
+    # --- Auth caches (auth_middleware, app/services/auth_cache.py) ---
+    auth_user_cache_size: int = 10000
+    auth_user_cache_ttl_seconds: int = 60  # Bounds staleness of changes made by other processes
+    auth_token_cache_size: int = 10000
+
+    # --- Project access cache (app/services/access_control.py) ---
+    project_access_cache_size: int = 10000
+    project_access_cache_ttl_seconds: int = 300
+
+    # --- LLM client (shared AsyncAnthropic, app/services/llm_client.py) ---
+    llm_max_concurrency: int = 8  # Claude requests in flight per process
+    llm_max_connections: int = 20
+    llm_max_retries: int = 2
+    llm_timeout_seconds: float = 120.0
+
+    # --- LLM response cache (app/services/llm_cache.py) ---
+    llm_cache_enabled: bool = True
+    llm_cache_path: str = ".cache/llm_responses.sqlite3"
+    llm_cache_ttl_seconds: int = 2592000  # 30 days
+    llm_cache_max_entries: int = 50000
+
+    # --- Document storage (app/services/upload_storage.py) ---
+    document_upload_dir: str = "uploads/documents"
+    max_document_size_mb: int = 100  # Uploads/downloads are streamed to disk
+
+    # --- PDF text extraction (app/services/document_processor.py) ---
+    pdf_extraction_workers: int = 4  # Process pool size; 0/1 = one worker (in-process without a timeout)
+    pdf_page_timeout_seconds: float = 30.0  # 0 disables the timeout (and the pool for small PDFs)
+    pdf_parallel_min_pages: int = 8  # Smaller PDFs are not worth the pool round-trip
+
+    # --- Chunked extraction (app/services/chunking.py) ---
+    extraction_chunk_chars: int = 24000  # ~6k tokens per chunk prompt
+    extraction_chunk_overlap_chars: int = 1500
+
+    # --- Embeddings (app/services/enrichment_service.py) ---
+    embedding_batch_size: int = 64
+    # host:port of a shared encoder process (python -m app.services.encoder_server);
+    # empty loads the model in every process
+    embedding_server_address: str = ""
+    embedding_server_authkey: Optional[str] = None  # Defaults to JWT_SECRET_KEY
+    vector_search_ef_search: int = 100  # HNSW candidate list size per query
+    # pgvector >= 0.8 iterative HNSW scans for filtered queries: strict_order,
+    # relaxed_order, or off (older pgvector; filtered queries short of the
+    # limit then fall back to an exact scan)
+    vector_search_iterative_scan: str = "strict_order"
+    # auto: pgvector on PostgreSQL, in-process NumPy index elsewhere; or force "pgvector"/"numpy"
+    vector_search_backend: str = "auto"
+    # mode=hybrid item search: candidates per retrieval, and RRF constant k
+    hybrid_search_candidates: int = 50
+    hybrid_search_rrf_k: int = 60
+
     class Config:
         # Load from .env.development first (for development), then fall back to .env
         env_file = ".env.development"
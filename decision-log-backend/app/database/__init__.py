@@ -0,0 +1,11 @@
+"""Database package.
+
+Importing it registers the ORM event listeners that keep the project_stats
+rollup in sync with project_items (app/database/project_stats.py) and the
+DDL events that create the full-text search columns and indexes with the
+tables (app/database/full_text.py), so every process that uses the models
+gets both.
+"""
+
+from app.database import full_text as _full_text  # noqa: F401
+from app.database import project_stats as _project_stats  # noqa: F401
@@ -0,0 +1,247 @@
+"""Full-text search indexes for project items and sources.
+
+PostgreSQL: a generated, weighted tsvector column (search_vector) on each
+table with a GIN index; queries use websearch_to_tsquery and rank with
+ts_rank_cd. SQLite: a contentless FTS5 table per source table, kept in sync
+by triggers and ranked with bm25(). Both are created together with the
+tables (create_all) and documented in migration 010; ensure_full_text(),
+run by init_db, adds them to tables that already existed. Other backends
+fall back to ILIKE.
+
+Search input is plain text: words must all match (stemmed), "double
+quoted" runs match as phrases.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from sqlalchemy import (
+    DDL,
+    bindparam,
+    column,
+    event,
+    false,
+    func,
+    inspect,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.database.models import ProjectItem, Source
+
+# Text search configuration baked into the generated columns
+TS_CONFIG = "english"
+
+
+@dataclass(frozen=True)
+class _SearchSpec:
+    """Indexed text of one table: (FTS column, SQL expression, weight)."""
+
+    table: str
+    fields: Tuple[Tuple[str, str, str], ...]
+
+    @property
+    def fts_table(self) -> str:
+        return f"{self.table}_fts"
+
+
+ITEM_SEARCH = _SearchSpec(
+    "project_items",
+    (
+        ("statement", "coalesce({p}statement, {p}decision_statement, '')", "A"),
+        ("why", "coalesce({p}why, '')", "B"),
+        ("who", "coalesce({p}who, '') || ' ' || coalesce({p}owner, '')", "C"),
+        ("source_excerpt", "coalesce({p}source_excerpt, '')", "D"),
+    ),
+)
+
+SOURCE_SEARCH = _SearchSpec(
+    "sources",
+    (
+        ("title", "coalesce({p}title, '')", "A"),
+        ("ai_summary", "coalesce({p}ai_summary, '')", "B"),
+        ("email_from", "coalesce({p}email_from, '')", "C"),
+    ),
+)
+
+_SPECS = {ProjectItem: ITEM_SEARCH, Source: SOURCE_SEARCH}
+
+# ILIKE fallback columns for backends without a full-text index
+_FALLBACK_COLUMNS = {
+    ProjectItem: (ProjectItem.decision_statement, ProjectItem.who, ProjectItem.why),
+    Source: (Source.title, Source.ai_summary),
+}
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Schema (created with the tables)
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def _tsvector_sql(spec: _SearchSpec) -> str:
+    return " || ".join(
+        f"setweight(to_tsvector('{TS_CONFIG}', {expr.format(p='')}), '{weight}')"
+        for _, expr, weight in spec.fields
+    )
+
+
+def postgresql_ddl(spec: _SearchSpec) -> list:
+    return [
+        f"ALTER TABLE {spec.table} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({_tsvector_sql(spec)}) STORED",
+        f"CREATE INDEX IF NOT EXISTS idx_{spec.table}_search ON {spec.table} USING gin (search_vector)",
+    ]
+
+
+def sqlite_ddl(spec: _SearchSpec) -> list:
+    names = ", ".join(name for name, _, _ in spec.fields)
+
+    def values(prefix):
+        return ", ".join(expr.format(p=prefix) for _, expr, _ in spec.fields)
+
+    fts = spec.fts_table
+    source_columns = ", ".join(
+        dict.fromkeys(c for _, expr, _ in spec.fields for c in re.findall(r"\{p\}(\w+)", expr))
+    )
+    delete = f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.rowid, {values('old.')});"
+    insert = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.rowid, {values('new.')});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{names}, content='', tokenize='porter unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {spec.table} BEGIN {insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {spec.table} BEGIN {delete} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {source_columns} ON {spec.table} "
+        f"BEGIN {delete} {insert} END",
+    ]
+
+
+for _model, _spec in _SPECS.items():
+    for _statement in postgresql_ddl(_spec):
+        event.listen(_model.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+    for _statement in sqlite_ddl(_spec):
+        event.listen(_model.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+    event.listen(
+        _model.__table__,
+        "after_drop",
+        DDL(f"DROP TABLE IF EXISTS {_spec.fts_table}").execute_if(dialect="sqlite"),
+    )
+
+
+def ensure_full_text(db: Session) -> list:
+    """Create the full-text objects missing from existing tables (idempotent).
+
+    create_all only fires after_create for new tables, so databases created
+    before the search indexes never got them. New SQLite FTS5 tables are
+    filled from their source table. Runs in the caller's transaction; commit
+    afterwards.
+
+    Returns:
+        Names of the tables whose full-text objects were added.
+    """
+    dialect = _dialect(db)
+    if dialect not in ("postgresql", "sqlite"):
+        return []
+    inspector = inspect(db.connection())
+    added = []
+    for model, spec in _SPECS.items():
+        if not inspector.has_table(spec.table):
+            continue
+        if dialect == "postgresql":
+            columns = {c["name"] for c in inspector.get_columns(spec.table)}
+            missing = "search_vector" not in columns
+            statements = postgresql_ddl(spec)
+        else:
+            missing = not inspector.has_table(spec.fts_table)
+            statements = sqlite_ddl(spec)
+        # IF NOT EXISTS throughout: also restores a dropped index or trigger
+        for statement in statements:
+            db.execute(text(statement))
+        if missing:
+            if dialect == "sqlite":
+                rebuild_sqlite_index(db, model)
+            added.append(spec.table)
+    return added
+
+
+def rebuild_sqlite_index(db: Session, model) -> None:
+    """Refill a SQLite FTS5 table from its source table (e.g. after a restore)."""
+    spec = _SPECS[model]
+    names = ", ".join(name for name, _, _ in spec.fields)
+    exprs = ", ".join(expr.format(p="") for _, expr, _ in spec.fields)
+    db.execute(text(f"INSERT INTO {spec.fts_table}({spec.fts_table}) VALUES ('delete-all')"))
+    db.execute(
+        text(f"INSERT INTO {spec.fts_table}(rowid, {names}) SELECT rowid, {exprs} FROM {spec.table}")
+    )
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Query helpers
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def fts5_query(search_text: str) -> Optional[str]:
+    """Translate plain search text to an FTS5 MATCH expression (None if empty).
+
+    Every term is quoted, so FTS5 operators in user input are literal.
+    """
+    parts = []
+    for phrase, word in re.findall(r'"([^"]*)"|(\S+)', search_text):
+        if phrase:
+            tokens = re.findall(r"\w+", phrase)
+            if tokens:
+                parts.append('"' + " ".join(tokens) + '"')
+        else:
+            parts.extend(f'"{token}"' for token in re.findall(r"\w+", word))
+    return " ".join(parts) or None
+
+
+def _dialect(db: Session) -> str:
+    return db.get_bind().dialect.name
+
+
+def _fts5_rows(spec: _SearchSpec, match: str):
+    fts = table(spec.fts_table, column("rowid"))
+    return fts, literal_column(spec.fts_table).op("MATCH")(bindparam(None, match))
+
+
+def text_match(db: Session, model, search_text: str) -> ColumnElement:
+    """Condition: the row matches the search text."""
+    spec = _SPECS[model]
+    dialect = _dialect(db)
+    if dialect == "postgresql":
+        query = func.websearch_to_tsquery(TS_CONFIG, search_text)
+        return literal_column(f"{spec.table}.search_vector").op("@@")(query)
+    if dialect == "sqlite":
+        match = fts5_query(search_text)
+        if match is None:
+            return false()
+        fts, condition = _fts5_rows(spec, match)
+        return literal_column(f"{spec.table}.rowid").in_(select(fts.c.rowid).where(condition))
+    term = f"%{search_text}%"
+    return or_(*(c.ilike(term) for c in _FALLBACK_COLUMNS[model]))
+
+
+def text_rank(db: Session, model, search_text: str) -> ColumnElement:
+    """Relevance of a matching row (higher is better)."""
+    spec = _SPECS[model]
+    dialect = _dialect(db)
+    if dialect == "postgresql":
+        query = func.websearch_to_tsquery(TS_CONFIG, search_text)
+        return func.ts_rank_cd(literal_column(f"{spec.table}.search_vector"), query)
+    if dialect == "sqlite":
+        match = fts5_query(search_text) or '""'
+        fts, condition = _fts5_rows(spec, match)
+        # bm25() is lower-is-better
+        return (
+            select(-func.bm25(literal_column(spec.fts_table)))
+            .select_from(fts)
+            .where(condition, fts.c.rowid == literal_column(f"{spec.table}.rowid"))
+            .scalar_subquery()
+        )
+    return literal_column("1.0")
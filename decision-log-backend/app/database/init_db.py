@@ -7,7 +7,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from app.database.models import Base
-from app.database.session import engine
+from app.database.session import SessionLocal, engine
 from app.database.seed import seed_database
 
 
@@ -20,11 +20,34 @@ def init_db():
     Base.metadata.create_all(bind=engine)
     print("✅ Database tables created successfully!")
 
+    # Objects create_all only adds to new tables: search indexes, rollups
+    ensure_derived_schema()
+
     # Seed with test data
     print("\n🌱 Seeding database with test data...")
     os.environ["DEMO_MODE"] = "true"  # Enable demo mode for seeding
     seed_database()
 
 
+def ensure_derived_schema():
+    """Add missing full-text objects and fill an empty project_stats table."""
+    from app.database.full_text import ensure_full_text
+    from app.database.project_stats import backfill_project_stats
+
+    db = SessionLocal()
+    try:
+        for table_name in ensure_full_text(db):
+            print(f"✅ Full-text search index added to {table_name}")
+        written = backfill_project_stats(db)
+        db.commit()
+        if written:
+            print(f"✅ project_stats backfilled ({written} row(s))")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
 if __name__ == "__main__":
     init_db()
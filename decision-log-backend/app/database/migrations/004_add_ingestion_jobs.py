@@ -0,0 +1,50 @@
+"""Migration 004: Add ingestion_jobs table (durable ingestion job queue).
+
+Replaces FastAPI BackgroundTasks for processing approved sources. Jobs are
+claimed by ingestion workers (python -m app.worker) using a lease
+(locked_until) so jobs held by a crashed worker are picked up again.
+
+Changes:
+- Create ingestion_jobs table
+- Indexes for claiming due jobs and for finding expired leases
+"""
+
+# ──────────────────────────────────────────────────────────────────────────────
+# NOTE: Tables are auto-created by SQLAlchemy's Base.metadata.create_all() in
+# init_db.py. The SQL below documents the schema for manual execution on
+# PostgreSQL if needed.
+# ──────────────────────────────────────────────────────────────────────────────
+
+UPGRADE_SQL = """
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS ingestion_jobs (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    source_id UUID NOT NULL REFERENCES sources(id) ON DELETE CASCADE,
+    job_type VARCHAR(50) NOT NULL DEFAULT 'process_source',
+    status VARCHAR(50) NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    run_after TIMESTAMP NOT NULL DEFAULT now(),
+    locked_by VARCHAR(255),
+    locked_until TIMESTAMP,
+    last_error TEXT,
+    finished_at TIMESTAMP,
+    created_at TIMESTAMP NOT NULL DEFAULT now(),
+    updated_at TIMESTAMP NOT NULL DEFAULT now(),
+    CONSTRAINT ck_ingestion_job_status_valid
+        CHECK (status IN ('queued', 'running', 'succeeded', 'failed'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_ingestion_jobs_claim ON ingestion_jobs(status, run_after);
+CREATE INDEX IF NOT EXISTS idx_ingestion_jobs_lease ON ingestion_jobs(status, locked_until);
+CREATE INDEX IF NOT EXISTS idx_ingestion_jobs_source ON ingestion_jobs(source_id);
+
+COMMIT;
+"""
+
+DOWNGRADE_SQL = """
+BEGIN;
+DROP TABLE IF EXISTS ingestion_jobs;
+COMMIT;
+"""
@@ -0,0 +1,37 @@
+"""Migration 005: Add 'preparing' and 'failed' source ingestion statuses.
+
+Document uploads are accepted immediately (202) and prepared by an ingestion
+worker (text extraction + AI summary) before they enter the review queue.
+
+Changes:
+- sources.ingestion_status may be 'preparing' (upload stored, worker pending)
+  or 'failed' (no text could be extracted)
+"""
+
+# ──────────────────────────────────────────────────────────────────────────────
+# NOTE: Tables are auto-created by SQLAlchemy's Base.metadata.create_all() in
+# init_db.py. The SQL below documents the schema change for manual execution
+# on PostgreSQL if needed.
+# ──────────────────────────────────────────────────────────────────────────────
+
+UPGRADE_SQL = """
+BEGIN;
+
+ALTER TABLE sources DROP CONSTRAINT IF EXISTS ck_ingestion_status_valid;
+ALTER TABLE sources ADD CONSTRAINT ck_ingestion_status_valid
+    CHECK (ingestion_status IN ('preparing', 'pending', 'approved', 'rejected', 'processed', 'failed'));
+
+COMMIT;
+"""
+
+DOWNGRADE_SQL = """
+BEGIN;
+
+UPDATE sources SET ingestion_status = 'rejected'
+    WHERE ingestion_status IN ('preparing', 'failed');
+ALTER TABLE sources DROP CONSTRAINT IF EXISTS ck_ingestion_status_valid;
+ALTER TABLE sources ADD CONSTRAINT ck_ingestion_status_valid
+    CHECK (ingestion_status IN ('pending', 'approved', 'rejected', 'processed'));
+
+COMMIT;
+"""
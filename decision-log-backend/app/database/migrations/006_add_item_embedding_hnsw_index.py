@@ -0,0 +1,33 @@
+"""Migration 006: HNSW index on project_items.embedding for semantic search.
+
+GET /projects/{id}/items/search ranks items by cosine distance to the query
+embedding (ORDER BY embedding <=> :query LIMIT k). Without an ANN index this
+is a sequential scan over every vector in the project.
+
+Changes:
+- Create idx_project_items_embedding_hnsw (HNSW, vector_cosine_ops)
+
+Requires pgvector >= 0.5.0. Query-time recall is tuned with hnsw.ef_search
+(VECTOR_SEARCH_EF_SEARCH, set per query by app/services/item_search.py);
+filtered queries use hnsw.iterative_scan on pgvector >= 0.8.0
+(VECTOR_SEARCH_ITERATIVE_SCAN).
+"""
+
+# ──────────────────────────────────────────────────────────────────────────────
+# NOTE: Tables are auto-created by SQLAlchemy's Base.metadata.create_all() in
+# init_db.py. The SQL below documents the schema change for manual execution
+# on PostgreSQL if needed.
+# ──────────────────────────────────────────────────────────────────────────────
+
+# CONCURRENTLY cannot run inside a transaction block
+UPGRADE_SQL = """
+CREATE EXTENSION IF NOT EXISTS vector;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_project_items_embedding_hnsw
+    ON project_items USING hnsw (embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
+"""
+
+DOWNGRADE_SQL = """
+DROP INDEX CONCURRENTLY IF EXISTS idx_project_items_embedding_hnsw;
+"""
@@ -0,0 +1,59 @@
+"""Migration 007: project_stats rollup table.
+
+Project lists, dashboards and unfiltered item facets used to recount
+project_items on every request. project_stats keeps one row per (project,
+item_type, source_type, discipline) with item/milestone/done counts and the
+latest created_at; discipline='*' rows count each item once.
+
+Changes:
+- Create project_stats (maintained from ProjectItem writes by
+  app/database/project_stats.py)
+- Create idx_project_stats_project
+- Backfill from project_items (same as python -m app.database.project_stats)
+"""
+
+# ──────────────────────────────────────────────────────────────────────────────
+# NOTE: Tables are auto-created by SQLAlchemy's Base.metadata.create_all() in
+# init_db.py. The SQL below documents the schema change for manual execution
+# on PostgreSQL if needed.
+# ──────────────────────────────────────────────────────────────────────────────
+
+UPGRADE_SQL = """
+CREATE TABLE IF NOT EXISTS project_stats (
+    project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    item_type VARCHAR(50) NOT NULL,
+    source_type VARCHAR(50) NOT NULL,
+    discipline VARCHAR(100) NOT NULL,
+    item_count INTEGER NOT NULL DEFAULT 0,
+    milestone_count INTEGER NOT NULL DEFAULT 0,
+    done_count INTEGER NOT NULL DEFAULT 0,
+    latest_item_at TIMESTAMP,
+    PRIMARY KEY (project_id, item_type, source_type, discipline)
+);
+
+CREATE INDEX IF NOT EXISTS idx_project_stats_project
+    ON project_stats (project_id, discipline);
+
+INSERT INTO project_stats
+SELECT project_id, item_type, source_type, '*',
+       COUNT(*),
+       COUNT(*) FILTER (WHERE is_milestone),
+       COUNT(*) FILTER (WHERE is_done),
+       MAX(created_at)
+FROM project_items
+GROUP BY project_id, item_type, source_type;
+
+INSERT INTO project_stats
+SELECT i.project_id, i.item_type, i.source_type, d.value,
+       COUNT(DISTINCT i.id),
+       COUNT(DISTINCT i.id) FILTER (WHERE i.is_milestone),
+       COUNT(DISTINCT i.id) FILTER (WHERE i.is_done),
+       MAX(i.created_at)
+FROM project_items i
+CROSS JOIN LATERAL jsonb_array_elements_text(i.affected_disciplines::jsonb) AS d(value)
+GROUP BY i.project_id, i.item_type, i.source_type, d.value;
+"""
+
+DOWNGRADE_SQL = """
+DROP TABLE IF EXISTS project_stats;
+"""
@@ -0,0 +1,25 @@
+"""Migration 008: add id to idx_projects_created for keyset pagination.
+
+GET /api/projects pages with a (created_at, id) cursor, ordered by
+created_at DESC, id DESC. With id in the index, each page is a bounded
+index range scan instead of a sort over every accessible project.
+
+Changes:
+- Recreate idx_projects_created on (created_at, id)
+"""
+
+# ──────────────────────────────────────────────────────────────────────────────
+# NOTE: Tables are auto-created by SQLAlchemy's Base.metadata.create_all() in
+# init_db.py. The SQL below documents the schema change for manual execution
+# on PostgreSQL if needed.
+# ──────────────────────────────────────────────────────────────────────────────
+
+UPGRADE_SQL = """
+DROP INDEX IF EXISTS idx_projects_created;
+CREATE INDEX idx_projects_created ON projects (created_at, id);
+"""
+
+DOWNGRADE_SQL = """
+DROP INDEX IF EXISTS idx_projects_created;
+CREATE INDEX idx_projects_created ON projects (created_at);
+"""
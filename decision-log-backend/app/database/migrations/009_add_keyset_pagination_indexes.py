@@ -0,0 +1,48 @@
+"""Migration 009: indexes for keyset (cursor) pagination of listings.
+
+GET /projects/{id}/items, GET /ingestion and the V1 decisions listing page
+with a cursor on (sort column, id) instead of OFFSET. Each sort mode needs
+an index ending in (sort column, id) so a page is a bounded range scan.
+
+Changes:
+- Extend idx_project_items_composite with id
+- Create idx_project_items_project_created, idx_project_items_project_confidence,
+  idx_project_items_project_item_type
+- Create idx_sources_status_created
+
+NULL confidences sort highest (b-tree default), so one ascending index
+serves both directions.
+"""
+
+# ──────────────────────────────────────────────────────────────────────────────
+# NOTE: Tables are auto-created by SQLAlchemy's Base.metadata.create_all() in
+# init_db.py. The SQL below documents the schema change for manual execution
+# on PostgreSQL if needed.
+# ──────────────────────────────────────────────────────────────────────────────
+
+UPGRADE_SQL = """
+DROP INDEX IF EXISTS idx_project_items_composite;
+CREATE INDEX idx_project_items_composite
+    ON project_items (project_id, discipline, created_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_project_items_project_created
+    ON project_items (project_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_project_items_project_confidence
+    ON project_items (project_id, confidence, id);
+CREATE INDEX IF NOT EXISTS idx_project_items_project_item_type
+    ON project_items (project_id, item_type, id);
+
+CREATE INDEX IF NOT EXISTS idx_sources_status_created
+    ON sources (ingestion_status, created_at, id);
+"""
+
+DOWNGRADE_SQL = """
+DROP INDEX IF EXISTS idx_sources_status_created;
+DROP INDEX IF EXISTS idx_project_items_project_item_type;
+DROP INDEX IF EXISTS idx_project_items_project_confidence;
+DROP INDEX IF EXISTS idx_project_items_project_created;
+
+DROP INDEX IF EXISTS idx_project_items_composite;
+CREATE INDEX idx_project_items_composite
+    ON project_items (project_id, discipline, created_at);
+"""
@@ -0,0 +1,56 @@
+"""Migration 010: full-text search columns and indexes.
+
+Keyword search on project items (list, decisions and /items/search with
+mode=lexical) and on sources (GET /ingestion?search=) used ILIKE '%term%',
+which scans every row and ignores stemming and relevance. PostgreSQL now
+matches against a generated, weighted tsvector column with a GIN index.
+
+Changes:
+- Add project_items.search_vector: statement (A), why (B), who/owner (C),
+  source_excerpt (D)
+- Add sources.search_vector: title (A), ai_summary (B), email_from (C)
+- Create GIN indexes idx_project_items_search, idx_sources_search
+
+SQLite uses FTS5 tables (project_items_fts, sources_fts) maintained by
+triggers; they are created with the tables, and
+app.database.full_text.rebuild_sqlite_index refills them. On both backends
+init_db runs app.database.full_text.ensure_full_text, which adds whatever is
+missing from existing tables.
+
+Adding a STORED generated column rewrites the table; run off-peak.
+"""
+
+# ──────────────────────────────────────────────────────────────────────────────
+# NOTE: Tables are auto-created by SQLAlchemy's Base.metadata.create_all() in
+# init_db.py. The SQL below documents the schema change for manual execution
+# on PostgreSQL if needed.
+# ──────────────────────────────────────────────────────────────────────────────
+
+UPGRADE_SQL = """
+ALTER TABLE project_items ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(statement, decision_statement, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(why, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(who, '') || ' ' || coalesce(owner, '')), 'C') ||
+        setweight(to_tsvector('english', coalesce(source_excerpt, '')), 'D')
+    ) STORED;
+CREATE INDEX IF NOT EXISTS idx_project_items_search
+    ON project_items USING gin (search_vector);
+
+ALTER TABLE sources ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(ai_summary, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(email_from, '')), 'C')
+    ) STORED;
+CREATE INDEX IF NOT EXISTS idx_sources_search
+    ON sources USING gin (search_vector);
+"""
+
+DOWNGRADE_SQL = """
+DROP INDEX IF EXISTS idx_sources_search;
+ALTER TABLE sources DROP COLUMN IF EXISTS search_vector;
+
+DROP INDEX IF EXISTS idx_project_items_search;
+ALTER TABLE project_items DROP COLUMN IF EXISTS search_vector;
+"""
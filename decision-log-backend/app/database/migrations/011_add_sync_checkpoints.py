@@ -0,0 +1,28 @@
+"""Migration 011: sync_checkpoints table.
+
+The Gmail poller re-listed every unread message on each cycle. It now syncs
+incrementally from the last Gmail historyId (users.history.list), stored in
+sync_checkpoints, and falls back to a full listing when the checkpoint is
+missing or has expired.
+
+Changes:
+- Create sync_checkpoints (name, value, updated_at)
+"""
+
+# ──────────────────────────────────────────────────────────────────────────────
+# NOTE: Tables are auto-created by SQLAlchemy's Base.metadata.create_all() in
+# init_db.py. The SQL below documents the schema change for manual execution
+# on PostgreSQL if needed.
+# ──────────────────────────────────────────────────────────────────────────────
+
+UPGRADE_SQL = """
+CREATE TABLE IF NOT EXISTS sync_checkpoints (
+    name VARCHAR(100) PRIMARY KEY,
+    value VARCHAR(255) NOT NULL,
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+"""
+
+DOWNGRADE_SQL = """
+DROP TABLE IF EXISTS sync_checkpoints;
+"""
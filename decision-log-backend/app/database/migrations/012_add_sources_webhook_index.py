@@ -0,0 +1,27 @@
+"""Migration 012: index on sources.webhook_id.
+
+The Tactiq webhook and the Gmail poller look up sources by webhook_id to
+deduplicate, and the poller now checks every listed message id in one
+webhook_id IN (...) query before downloading anything. The column had no
+index in the ORM schema, so each lookup scanned sources.
+
+Changes:
+- Create idx_sources_webhook
+
+Databases migrated with 002 already have idx_sources_webhook (unique,
+partial); IF NOT EXISTS keeps that one.
+"""
+
+# ──────────────────────────────────────────────────────────────────────────────
+# NOTE: Tables are auto-created by SQLAlchemy's Base.metadata.create_all() in
+# init_db.py. The SQL below documents the schema change for manual execution
+# on PostgreSQL if needed.
+# ──────────────────────────────────────────────────────────────────────────────
+
+UPGRADE_SQL = """
+CREATE INDEX IF NOT EXISTS idx_sources_webhook ON sources (webhook_id);
+"""
+
+DOWNGRADE_SQL = """
+DROP INDEX IF EXISTS idx_sources_webhook;
+"""
@@ -24,7 +24,9 @@ from sqlalchemy import (
     func,
 )
 from sqlalchemy.dialects.postgresql import UUID as PGUID
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.sql.functions import now
 
 try:
     from pgvector.sqlalchemy import Vector as VECTOR
@@ -34,12 +36,27 @@ except ImportError:
 # Use JSON for SQLite compatibility
 JSONType = JSON
 
+
+@compiles(now, "sqlite")
+def _sqlite_now(element, compiler, **kw):
+    """now() in the text format SQLite DateTime columns use for Python values.
+
+    CURRENT_TIMESTAMP has no fractional seconds, so defaults would not sort
+    or compare as equal against stored datetimes; %f gives milliseconds,
+    padded to the six digits of SQLAlchemy's storage format.
+    """
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
+
 # Create a hybrid UUID type that works with both PostgreSQL and SQLite
 class GUID(TypeDecorator):
     """Platform-independent GUID type that uses CHAR(32) on SQLite and UUID on PostgreSQL."""
     impl = String
     cache_ok = True
 
+    @property
+    def python_type(self):
+        return uuid.UUID
+
     def load_dialect_impl(self, dialect):
         if dialect.name == 'postgresql':
             return dialect.type_descriptor(PGUID(as_uuid=True))
@@ -120,7 +137,7 @@ class Project(Base):
     participants = relationship("ProjectParticipant", back_populates="project", cascade="all, delete-orphan")
 
     __table_args__ = (
-        Index("idx_projects_created", "created_at"),
+        Index("idx_projects_created", "created_at", "id"),  # Keyset paging order
         Index("idx_projects_archived", "archived_at"),
     )
 
@@ -212,14 +229,50 @@ class Source(Base):
             name="ck_source_type_valid",
         ),
         CheckConstraint(
-            "ingestion_status IN ('pending', 'approved', 'rejected', 'processed')",
+            "ingestion_status IN ('preparing', 'pending', 'approved', 'rejected', 'processed', 'failed')",
             name="ck_ingestion_status_valid",
         ),
         Index("idx_sources_project", "project_id"),
         Index("idx_sources_status", "ingestion_status"),
         Index("idx_sources_type", "source_type"),
         Index("idx_sources_occurred", "occurred_at"),
+        Index("idx_sources_status_created", "ingestion_status", "created_at", "id"),  # Keyset paging
         Index("idx_sources_drive_file", "drive_file_id"),
+        Index("idx_sources_webhook", "webhook_id"),  # Webhook/Gmail deduplication
+    )
+
+
+class IngestionJob(Base):
+    """Durable ingestion job — leased by workers in app/worker.py.
+
+    A job is claimed by setting status='running' with a lease (locked_until).
+    Jobs whose lease expires (crashed worker) become claimable again.
+    """
+
+    __tablename__ = "ingestion_jobs"
+
+    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    source_id = Column(GUID(), ForeignKey("sources.id", ondelete="CASCADE"), nullable=False)
+    job_type = Column(String(50), nullable=False, default="process_source")
+    status = Column(String(50), nullable=False, default="queued")
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    run_after = Column(DateTime, nullable=False, default=func.now())
+    locked_by = Column(String(255))
+    locked_until = Column(DateTime)
+    last_error = Column(Text)
+    finished_at = Column(DateTime)
+    created_at = Column(DateTime, nullable=False, default=func.now())
+    updated_at = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('queued', 'running', 'succeeded', 'failed')",
+            name="ck_ingestion_job_status_valid",
+        ),
+        Index("idx_ingestion_jobs_claim", "status", "run_after"),
+        Index("idx_ingestion_jobs_lease", "status", "locked_until"),
+        Index("idx_ingestion_jobs_source", "source_id"),
     )
 
 
@@ -309,13 +362,64 @@ class ProjectItem(Base):
         Index("idx_project_items_discipline", "discipline"),
         Index("idx_project_items_confidence", "confidence"),
         Index("idx_project_items_created", "created_at"),
-        Index("idx_project_items_composite", "project_id", "discipline", "created_at"),
+        Index("idx_project_items_composite", "project_id", "discipline", "created_at", "id"),
+        # Keyset pagination: one index per list sort mode (sort column, id)
+        Index("idx_project_items_project_created", "project_id", "created_at", "id"),
+        Index("idx_project_items_project_confidence", "project_id", "confidence", "id"),
+        Index("idx_project_items_project_item_type", "project_id", "item_type", "id"),
         Index("idx_project_items_type", "item_type"),
         Index("idx_project_items_source_type", "source_type"),
         Index("idx_project_items_source", "source_id"),
+        # ANN index for semantic search (pgvector, migration 006)
+        Index(
+            "idx_project_items_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
+
+class ProjectStat(Base):
+    """Per-project item rollup, maintained transactionally from ProjectItem writes.
+
+    One row per (project, item_type, source_type, discipline). Rows with
+    discipline='*' count each item once; other rows count items per entry of
+    affected_disciplines. Maintained by app/database/project_stats.py;
+    rebuild with python -m app.database.project_stats.
+    """
+
+    __tablename__ = "project_stats"
+
+    project_id = Column(GUID(), ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    item_type = Column(String(50), primary_key=True)
+    source_type = Column(String(50), primary_key=True)
+    discipline = Column(String(100), primary_key=True)  # '*' = all disciplines
+    item_count = Column(Integer, nullable=False, default=0)
+    milestone_count = Column(Integer, nullable=False, default=0)
+    done_count = Column(Integer, nullable=False, default=0)
+    latest_item_at = Column(DateTime)
+
+    __table_args__ = (
+        Index("idx_project_stats_project", "project_id", "discipline"),
     )
 
 
+class SyncCheckpoint(Base):
+    """Resume position of an incremental external sync (e.g. the Gmail historyId).
+
+    One row per sync, keyed by name; written in the same transaction as the
+    records the sync created.
+    """
+
+    __tablename__ = "sync_checkpoints"
+
+    name = Column(String(100), primary_key=True)
+    value = Column(String(255), nullable=False)
+    updated_at = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
+
+
 class SharedLink(Base):
     """Shared link model for public read-only access to project resources (Story 8.4)."""
 
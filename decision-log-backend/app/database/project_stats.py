@@ -0,0 +1,446 @@
+"""Transactional maintenance of the project_stats rollup table.
+
+ProjectItem inserts, updates and deletes are turned into per-group deltas
+by ORM mapper events and applied at the end of the same flush, so the
+rollup commits or rolls back together with the items. Rows with
+discipline='*' count every item once; the other rows count items per
+entry of affected_disciplines.
+
+init_db.py backfills the table while it is empty. Readers fall back to
+live aggregates for a project without rollup rows. Bulk query.update() and
+query.delete() statements bypass the ORM events; run the rebuild command
+after them:
+
+    python -m app.database.project_stats                   # all projects
+    python -m app.database.project_stats --project-id <uuid>
+"""
+
+import argparse
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import (
+    Integer,
+    and_,
+    case,
+    cast,
+    delete,
+    event,
+    exists,
+    func,
+    inspect,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session, object_session
+
+from app.database.models import ProjectItem, ProjectStat
+
+logger = logging.getLogger(__name__)
+
+ALL_DISCIPLINES = "*"
+
+_DELTAS_KEY = "project_stats_deltas"
+_TRACKED = ("project_id", "item_type", "source_type", "affected_disciplines", "is_milestone", "is_done")
+
+GroupKey = Tuple[str, str, str, str]
+
+
+class _Delta:
+    """Accumulated change for one rollup row within a flush."""
+
+    __slots__ = ("items", "milestones", "done", "latest", "added_now", "removed")
+
+    def __init__(self):
+        self.items = 0
+        self.milestones = 0
+        self.done = 0
+        self.latest = None  # Newest known created_at among added items
+        self.added_now = False  # An added item's created_at is the server's now()
+        self.removed = False  # latest_item_at must be recomputed
+
+
+def _group_keys(project_id, item_type, source_type, disciplines) -> List[GroupKey]:
+    project_id = str(project_id)
+    item_type = item_type or "decision"
+    source_type = source_type or "meeting"
+    keys = [(project_id, item_type, source_type, ALL_DISCIPLINES)]
+    keys += [(project_id, item_type, source_type, d) for d in dict.fromkeys(disciplines or [])]
+    return keys
+
+
+def _record(target: ProjectItem, values: dict, sign: int, created_at=None) -> None:
+    """Add (+1) or remove (-1) an item's contribution for the current flush."""
+    session = object_session(target)
+    if session is None:
+        return
+    deltas: Dict[GroupKey, _Delta] = session.info.setdefault(_DELTAS_KEY, {})
+    keys = _group_keys(
+        values["project_id"], values["item_type"], values["source_type"], values["affected_disciplines"]
+    )
+    for key in keys:
+        delta = deltas.setdefault(key, _Delta())
+        delta.items += sign
+        delta.milestones += sign * int(bool(values["is_milestone"]))
+        delta.done += sign * int(bool(values["is_done"]))
+        if sign < 0:
+            delta.removed = True
+        elif created_at is None:
+            delta.added_now = True
+        elif delta.latest is None or created_at > delta.latest:
+            delta.latest = created_at
+
+
+def _current_values(target: ProjectItem) -> dict:
+    state = inspect(target)
+    return {name: state.dict.get(name) for name in _TRACKED}
+
+
+def _current_values_loaded(target: ProjectItem) -> dict:
+    # The row still exists before its DELETE, so expired attributes can load
+    return {name: getattr(target, name) for name in _TRACKED}
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# ORM events
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+# Load the previous value on assignment so updates can subtract it even when
+# the attribute was expired (e.g. after a commit)
+for _name in _TRACKED:
+    event.listen(getattr(ProjectItem, _name), "set", lambda *args: None, active_history=True)
+
+
+@event.listens_for(ProjectItem, "after_insert")
+def _item_inserted(mapper, connection, target):
+    # created_at defaults to the server's now(), which is not loaded yet
+    _record(target, _current_values(target), +1, inspect(target).dict.get("created_at"))
+
+
+@event.listens_for(ProjectItem, "after_update")
+def _item_updated(mapper, connection, target):
+    state = inspect(target)
+    old, new, changed = {}, {}, False
+    for name in _TRACKED:
+        history = state.attrs[name].history
+        current = state.dict.get(name)
+        if history.deleted:
+            changed = True
+            old[name] = history.deleted[0]
+        else:
+            old[name] = current
+        new[name] = current
+    if not changed:
+        return
+    _record(target, old, -1)
+    _record(target, new, +1, state.dict.get("created_at"))
+    if state.dict.get("created_at") is None:
+        # Unknown creation time: recompute latest_item_at for the new groups
+        for key in _group_keys(
+            new["project_id"], new["item_type"], new["source_type"], new["affected_disciplines"]
+        ):
+            delta = object_session(target).info[_DELTAS_KEY][key]
+            delta.added_now = False
+            delta.removed = True
+
+
+@event.listens_for(ProjectItem, "before_delete")
+def _item_deleted(mapper, connection, target):
+    _record(target, _current_values_loaded(target), -1)
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_deltas(session, flush_context):
+    deltas = session.info.pop(_DELTAS_KEY, None)
+    if deltas:
+        apply_deltas(session.connection(), deltas)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_deltas(session):
+    session.info.pop(_DELTAS_KEY, None)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Applying deltas
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def _key_filter(key: GroupKey):
+    project_id, item_type, source_type, discipline = key
+    return and_(
+        ProjectStat.project_id == project_id,
+        ProjectStat.item_type == item_type,
+        ProjectStat.source_type == source_type,
+        ProjectStat.discipline == discipline,
+    )
+
+
+def _has_discipline(connection, discipline: str):
+    """SQL condition: the current project_items row lists this discipline."""
+    if connection.dialect.name == "postgresql":
+        return cast(ProjectItem.affected_disciplines, JSONB).op("?")(discipline)
+    elements = func.json_each(ProjectItem.affected_disciplines).table_valued("value")
+    return exists(select(literal(1)).select_from(elements).where(elements.c.value == discipline))
+
+
+def _latest_subquery(connection, key: GroupKey):
+    project_id, item_type, source_type, discipline = key
+    conditions = [
+        ProjectItem.project_id == project_id,
+        func.coalesce(ProjectItem.item_type, "decision") == item_type,
+        func.coalesce(ProjectItem.source_type, "meeting") == source_type,
+    ]
+    if discipline != ALL_DISCIPLINES:
+        conditions.append(_has_discipline(connection, discipline))
+    return select(func.max(ProjectItem.created_at)).where(*conditions).scalar_subquery()
+
+
+def _upsert(connection, key: GroupKey, delta: _Delta) -> None:
+    project_id, item_type, source_type, discipline = key
+    table = ProjectStat.__table__
+    latest = func.now() if delta.added_now else delta.latest
+    values = {
+        "project_id": project_id,
+        "item_type": item_type,
+        "source_type": source_type,
+        "discipline": discipline,
+        "item_count": delta.items,
+        "milestone_count": delta.milestones,
+        "done_count": delta.done,
+        "latest_item_at": latest,
+    }
+    dialect = connection.dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        stmt = insert(table).values(**values)
+        new_latest = stmt.excluded.latest_item_at
+        if dialect == "postgresql":
+            merged_latest = func.greatest(table.c.latest_item_at, new_latest)
+        else:
+            # SQLite's scalar max() returns NULL if any argument is NULL
+            merged_latest = func.max(
+                func.coalesce(table.c.latest_item_at, new_latest),
+                func.coalesce(new_latest, table.c.latest_item_at),
+            )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["project_id", "item_type", "source_type", "discipline"],
+            set_={
+                "item_count": table.c.item_count + stmt.excluded.item_count,
+                "milestone_count": table.c.milestone_count + stmt.excluded.milestone_count,
+                "done_count": table.c.done_count + stmt.excluded.done_count,
+                "latest_item_at": merged_latest,
+            },
+        )
+        connection.execute(stmt)
+        return
+
+    result = connection.execute(
+        update(table)
+        .where(_key_filter(key))
+        .values(
+            item_count=table.c.item_count + delta.items,
+            milestone_count=table.c.milestone_count + delta.milestones,
+            done_count=table.c.done_count + delta.done,
+        )
+    )
+    if result.rowcount == 0:
+        connection.execute(table.insert().values(**values))
+    elif latest is not None:
+        connection.execute(
+            update(table)
+            .where(_key_filter(key), (table.c.latest_item_at < latest) | table.c.latest_item_at.is_(None))
+            .values(latest_item_at=latest)
+        )
+
+
+def apply_deltas(connection, deltas: Dict[GroupKey, _Delta]) -> None:
+    """Apply accumulated per-group deltas inside the current transaction."""
+    table = ProjectStat.__table__
+    for key, delta in deltas.items():
+        if delta.items > 0 or (delta.items == 0 and (delta.latest or delta.added_now)):
+            _upsert(connection, key, delta)
+        elif delta.items or delta.milestones or delta.done:
+            connection.execute(
+                update(table)
+                .where(_key_filter(key))
+                .values(
+                    item_count=table.c.item_count + delta.items,
+                    milestone_count=table.c.milestone_count + delta.milestones,
+                    done_count=table.c.done_count + delta.done,
+                )
+            )
+        if delta.removed:
+            connection.execute(
+                update(table)
+                .where(_key_filter(key))
+                .values(latest_item_at=_latest_subquery(connection, key))
+            )
+    connection.execute(delete(table).where(table.c.item_count <= 0))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Reads
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def rollup_facets(db: Session, project_id) -> Optional[Dict[str, Dict[str, int]]]:
+    """Unfiltered item facets for a project (same shape as compute_item_facets).
+
+    Returns None if the project has no rollup rows (no items, or a table that
+    was never backfilled); callers then aggregate project_items directly.
+    """
+    rows = db.execute(
+        select(
+            ProjectStat.item_type,
+            ProjectStat.source_type,
+            ProjectStat.discipline,
+            ProjectStat.item_count,
+        ).where(ProjectStat.project_id == project_id)
+    ).all()
+    if not rows:
+        return None
+
+    facets = {"item_types": {}, "source_types": {}, "disciplines": {}}
+    for item_type, source_type, discipline, count in rows:
+        if discipline == ALL_DISCIPLINES:
+            facets["item_types"][item_type] = facets["item_types"].get(item_type, 0) + count
+            facets["source_types"][source_type] = facets["source_types"].get(source_type, 0) + count
+        else:
+            facets["disciplines"][discipline] = facets["disciplines"].get(discipline, 0) + count
+    return facets
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Rebuild
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def _discipline_elements(connection):
+    if connection.dialect.name == "postgresql":
+        return (
+            func.jsonb_array_elements_text(cast(ProjectItem.affected_disciplines, JSONB))
+            .table_valued("value")
+            .lateral()
+        )
+    return func.json_each(ProjectItem.affected_disciplines).table_valued("value")
+
+
+def rebuild_project_stats(db: Session, project_ids: Optional[Iterable[str]] = None) -> int:
+    """Recompute project_stats from project_items (all projects, or the given ones).
+
+    Runs in the caller's transaction; commit afterwards.
+
+    Returns:
+        Number of rollup rows written.
+    """
+    connection = db.connection()
+    table = ProjectStat.__table__
+    project_ids = [str(p) for p in project_ids] if project_ids is not None else None
+
+    wipe = delete(table)
+    if project_ids is not None:
+        wipe = wipe.where(table.c.project_id.in_(project_ids))
+    connection.execute(wipe)
+
+    item_type = func.coalesce(ProjectItem.item_type, "decision")
+    source_type = func.coalesce(ProjectItem.source_type, "meeting")
+    milestone = func.sum(cast(ProjectItem.is_milestone, Integer))
+    done = func.sum(cast(ProjectItem.is_done, Integer))
+
+    totals = select(
+        ProjectItem.project_id,
+        item_type,
+        source_type,
+        literal(ALL_DISCIPLINES),
+        func.count(),
+        milestone,
+        done,
+        func.max(ProjectItem.created_at),
+    ).group_by(ProjectItem.project_id, item_type, source_type)
+
+    elements = _discipline_elements(connection)
+    per_discipline = (
+        select(
+            ProjectItem.project_id,
+            item_type,
+            source_type,
+            elements.c.value,
+            # DISTINCT: an item listing a discipline twice still counts once
+            func.count(func.distinct(ProjectItem.id)),
+            func.count(func.distinct(case((ProjectItem.is_milestone, ProjectItem.id)))),
+            func.count(func.distinct(case((ProjectItem.is_done, ProjectItem.id)))),
+            func.max(ProjectItem.created_at),
+        )
+        .select_from(ProjectItem)
+        .join(elements, literal(True))
+        .group_by(ProjectItem.project_id, item_type, source_type, elements.c.value)
+    )
+
+    columns = [
+        "project_id",
+        "item_type",
+        "source_type",
+        "discipline",
+        "item_count",
+        "milestone_count",
+        "done_count",
+        "latest_item_at",
+    ]
+    written = 0
+    for query in (totals, per_discipline):
+        if project_ids is not None:
+            query = query.where(ProjectItem.project_id.in_(project_ids))
+        written += connection.execute(table.insert().from_select(columns, query)).rowcount or 0
+    return written
+
+
+def backfill_project_stats(db: Session) -> int:
+    """Rebuild project_stats if it is empty while project_items is not.
+
+    Covers a table created by create_all next to existing items. Runs in the
+    caller's transaction; commit afterwards.
+
+    Returns:
+        Number of rollup rows written (0 if there was nothing to fill).
+    """
+    if db.execute(select(ProjectStat.project_id).limit(1)).first() is not None:
+        return 0
+    if db.execute(select(ProjectItem.id).limit(1)).first() is None:
+        return 0
+    return rebuild_project_stats(db)
+
+
+def main(argv=None):
+    from app.config import settings
+    from app.database.session import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Rebuild the project_stats rollup table")
+    parser.add_argument("--project-id", action="append", help="Only rebuild this project (repeatable)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.DEBUG if settings.debug else logging.INFO,
+        format="%(asctime)s %(name)s %(levelname)s %(message)s",
+    )
+
+    db = SessionLocal()
+    try:
+        written = rebuild_project_stats(db, args.project_id)
+        db.commit()
+        logger.info(f"Rebuilt project_stats: {written} row(s)")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ from app.config import settings
 from app.api.routes import admin, auth, health, projects, decisions, digest, documents, webhooks
 from app.api.routes.shared_links import router as shared_links_router
 from app.api.middleware.auth import auth_middleware
+from app.api.middleware.upload_limit import UploadSizeLimitMiddleware
 from app.database.init_db import init_db
 from app.scheduler import app_scheduler
 
@@ -60,6 +61,9 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Reject oversized document uploads before the multipart body is parsed
+app.add_middleware(UploadSizeLimitMiddleware)
+
 # Add authentication middleware (must be before CORS)
 app.middleware("http")(auth_middleware)
 
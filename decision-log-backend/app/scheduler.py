@@ -1,7 +1,8 @@
 """Background job scheduler using APScheduler.
 
 Manages scheduled background jobs for the application.
-Supports Gmail email polling (Story 7.4) and Google Drive folder monitoring (Story 10.3).
+Supports Gmail email polling and summarisation (Story 7.4) and Google Drive
+folder monitoring (Story 10.3).
 """
 
 import logging
@@ -33,6 +34,18 @@ def _run_gmail_poll():
         logger.error(f"Scheduler: Gmail poll failed with unhandled exception: {e}")
 
 
+def _run_gmail_summaries():
+    """Wrapper for the Gmail summary stage (AI summaries of polled emails)."""
+    from app.services.gmail_poller import gmail_poller_service
+
+    try:
+        stats = gmail_poller_service.run_summary_stage()
+        if stats["summarized"] or stats["failed"]:
+            logger.info(f"Scheduler: Gmail summaries complete -- {stats}")
+    except Exception as e:
+        logger.error(f"Scheduler: Gmail summaries failed with unhandled exception: {e}")
+
+
 def _run_drive_poll():
     """Wrapper for Drive folder poll cycle (Story 10.3)."""
     from app.database.session import SessionLocal
@@ -57,6 +70,7 @@ class AppScheduler:
     def __init__(self):
         self._scheduler = BackgroundScheduler()
         self._gmail_job = None
+        self._gmail_summary_job = None
         self._drive_job = None
 
     def start(self):
@@ -99,6 +113,20 @@ class AppScheduler:
                 misfire_grace_time=60,
             )
             jobs_registered += 1
+
+            # Summaries run as their own job so LLM latency never delays polling
+            self._gmail_summary_job = self._scheduler.add_job(
+                _run_gmail_summaries,
+                trigger=IntervalTrigger(
+                    minutes=max(settings.gmail_summary_interval_minutes, 1)
+                ),
+                id="gmail_summaries",
+                name="Gmail Email Summaries",
+                max_instances=1,
+                coalesce=True,
+                misfire_grace_time=60,
+            )
+            jobs_registered += 1
         else:
             logger.info(
                 "Scheduler: Gmail credentials not configured -- "
@@ -0,0 +1,179 @@
+"""Project access control shared by the project-scoped routes.
+
+Directors may access every project; other users only the projects they are
+a member of. Each user's membership set (project ids) is cached after one
+query, together with the ids of projects known to exist, so a repeated
+check does no database work and a cache miss costs a single query:
+
+    SELECT project_id, true FROM project_members WHERE user_id = :user
+    UNION ALL
+    SELECT id, false FROM projects WHERE id = :project
+
+Project rows themselves are not cached: get_authorized_project loads the
+row with db.get() (one query, none if the session already holds it), so
+routes that update a project never start from stale values.
+
+Membership sets are dropped when a commit inserts, updates or deletes
+project_members rows of the user; deleting a project drops all of them
+(members are removed by ON DELETE CASCADE, which the ORM does not see).
+Changes made by other processes are picked up after
+PROJECT_ACCESS_CACHE_TTL_SECONDS.
+"""
+
+import uuid
+from typing import FrozenSet, Tuple
+
+from sqlalchemy import event, inspect, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database.models import Project, ProjectMember
+from app.services.auth_cache import TTLLRUCache
+
+_CHANGES_KEY = "access_control_changes"
+
+
+class ProjectNotFoundError(Exception):
+    """Raised when project is not found."""
+    pass
+
+
+class PermissionDeniedError(Exception):
+    """Raised when user doesn't have access to project."""
+    pass
+
+
+_CACHE_SIZE = settings.project_access_cache_size
+_CACHE_TTL = settings.project_access_cache_ttl_seconds
+
+# user id -> frozenset of project ids the user is a member of
+memberships = TTLLRUCache(_CACHE_SIZE, _CACHE_TTL)
+# project id -> True for projects seen in the database
+known_projects = TTLLRUCache(_CACHE_SIZE, _CACHE_TTL)
+
+
+def _key(value) -> str:
+    """Canonical id string (accepts UUIDs, hex and hyphenated strings)."""
+    try:
+        return str(value if isinstance(value, uuid.UUID) else uuid.UUID(str(value)))
+    except ValueError:
+        return str(value)
+
+
+def _load(db: Session, user_id: str, project_id: str) -> Tuple[FrozenSet[str], bool]:
+    """(user's membership set, whether project_id exists) in one query."""
+    statement = union_all(
+        select(ProjectMember.project_id, literal(True)).where(ProjectMember.user_id == user_id),
+        select(Project.id, literal(False)).where(Project.id == project_id),
+    )
+    members, exists = set(), False
+    for row_project_id, is_member in db.execute(statement):
+        if is_member:
+            members.add(_key(row_project_id))
+        else:
+            exists = True
+    return frozenset(members), exists
+
+
+def _project_exists(db: Session, project_id: str) -> bool:
+    if known_projects.get(project_id):
+        return True
+    exists = db.execute(select(Project.id).where(Project.id == project_id)).first() is not None
+    if exists:
+        known_projects.set(project_id, True)
+    return exists
+
+
+def authorize_project(db: Session, project_id, user_id, role: str) -> None:
+    """Check that the user may access the project.
+
+    Raises:
+        ProjectNotFoundError: If project not found
+        PermissionDeniedError: If user is not a director or project member
+    """
+    project_id, user_id = _key(project_id), _key(user_id)
+    if role == "director":
+        if not _project_exists(db, project_id):
+            raise ProjectNotFoundError(f"Project {project_id} not found")
+        return
+
+    members = memberships.get(user_id)
+    if members is None:
+        members, exists = _load(db, user_id, project_id)
+        memberships.set(user_id, members)
+        if exists:
+            known_projects.set(project_id, True)
+        elif project_id not in members:
+            raise ProjectNotFoundError(f"Project {project_id} not found")
+    if project_id in members:
+        return
+    if not _project_exists(db, project_id):
+        raise ProjectNotFoundError(f"Project {project_id} not found")
+    raise PermissionDeniedError(f"User {user_id} doesn't have access to project {project_id}")
+
+
+def get_authorized_project(db: Session, project_id, user_id, role: str) -> Project:
+    """authorize_project, returning the Project row loaded in db.
+
+    Raises:
+        ProjectNotFoundError: If project not found
+        PermissionDeniedError: If user is not a director or project member
+    """
+    project_id = _key(project_id)
+    try:
+        project = db.get(Project, uuid.UUID(project_id))
+    except ValueError:
+        project = None
+    if project is None:
+        known_projects.pop(project_id)
+        raise ProjectNotFoundError(f"Project {project_id} not found")
+    # The row was just read: the check below only needs the membership set
+    known_projects.set(project_id, True)
+    authorize_project(db, project_id, user_id, role)
+    return project
+
+
+def invalidate(user_id=None) -> None:
+    """Drop one user's membership set (or every cached entry)."""
+    if user_id is None:
+        memberships.clear()
+        known_projects.clear()
+    else:
+        memberships.pop(_key(user_id))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Invalidation from ORM sessions
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_membership_changes(session, flush_context):
+    changes = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, ProjectMember):
+            # Current and previous user_id (if it was reassigned)
+            history = inspect(obj).attrs.user_id.history
+            user_ids = [obj.user_id, *(history.deleted or ())]
+            changes.update(("member", _key(user_id)) for user_id in user_ids if user_id)
+    for obj in session.deleted:
+        if isinstance(obj, Project):
+            changes.add(("project", _key(obj.id)))
+    if changes:
+        session.info.setdefault(_CHANGES_KEY, set()).update(changes)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_membership_changes(session):
+    changes = session.info.pop(_CHANGES_KEY, ())
+    for kind, key in changes:
+        if kind == "member":
+            memberships.pop(key)
+        else:
+            known_projects.pop(key)
+            memberships.clear()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_membership_changes(session):
+    session.info.pop(_CHANGES_KEY, None)
@@ -0,0 +1,178 @@
+"""In-process caches for request authentication.
+
+auth_middleware used to open a session and load the User on every request.
+Authenticated users are now kept as immutable UserPrincipal snapshots in a
+TTL-bounded LRU cache keyed by user id, and decoded JWT payloads are
+memoized per token until the token expires, so a warm request does no
+database work and no signature check.
+
+Cached principals are dropped when a User update or delete is committed by
+any session of this process (soft delete is an update of deleted_at).
+Changes made elsewhere (another process, bulk UPDATE statements) are picked
+up after AUTH_USER_CACHE_TTL_SECONDS at the latest.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database.models import User
+from app.utils.security import decode_access_token
+
+_INVALIDATED_KEY = "auth_cache_invalidated_users"
+
+
+class TTLLRUCache:
+    """Thread-safe LRU cache whose entries also expire after a time to live."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        # key -> (expires_at, value), least recently used first
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store value for ttl_seconds (default: the cache's TTL, whichever is shorter)."""
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+@dataclass(frozen=True)
+class UserPrincipal:
+    """Read-only snapshot of an authenticated user (request.state.user).
+
+    Exposes the User columns routes read; it is not attached to any session.
+    """
+
+    id: uuid.UUID
+    email: str
+    name: str
+    role: str
+    created_at: Optional[datetime] = None
+    last_login_at: Optional[datetime] = None
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserPrincipal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            role=user.role,
+            created_at=user.created_at,
+            last_login_at=user.last_login_at,
+        )
+
+
+def _key(user_id) -> str:
+    """Canonical id string (accepts UUIDs, hex and hyphenated strings)."""
+    try:
+        return str(user_id if isinstance(user_id, uuid.UUID) else uuid.UUID(str(user_id)))
+    except ValueError:
+        return str(user_id)
+
+
+principals = TTLLRUCache(settings.auth_user_cache_size, settings.auth_user_cache_ttl_seconds)
+# JWT payloads are valid until their exp claim; the TTL only caps memory age
+tokens = TTLLRUCache(settings.auth_token_cache_size, settings.jwt_expiration_minutes * 60)
+
+
+def decode_token(token: str) -> Optional[Dict]:
+    """decode_access_token, memoized per token until the token expires."""
+    payload = tokens.get(token)
+    if payload is not None:
+        return payload
+    payload = decode_access_token(token)
+    if payload and "exp" in payload:
+        tokens.set(token, payload, payload["exp"] - time.time())
+    return payload
+
+
+def get_principal(user_id) -> Optional[UserPrincipal]:
+    """Cached principal for user_id, or None on a miss."""
+    return principals.get(_key(user_id))
+
+
+def remember_user(user: User) -> UserPrincipal:
+    """Cache (and return) the principal of a user just loaded from the database."""
+    principal = UserPrincipal.from_user(user)
+    principals.set(_key(user.id), principal)
+    return principal
+
+
+def invalidate_user(user_id=None) -> None:
+    """Drop one cached principal (or all of them and the token memo)."""
+    if user_id is None:
+        principals.clear()
+        tokens.clear()
+    else:
+        principals.pop(_key(user_id))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Invalidation from ORM sessions
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_user_changes(session, flush_context):
+    changed = [
+        obj.id for obj in list(session.dirty) + list(session.deleted) if isinstance(obj, User)
+    ]
+    if changed:
+        session.info.setdefault(_INVALIDATED_KEY, set()).update(_key(i) for i in changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session):
+    for user_id in session.info.pop(_INVALIDATED_KEY, ()):
+        principals.pop(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_user_changes(session):
+    session.info.pop(_INVALIDATED_KEY, None)
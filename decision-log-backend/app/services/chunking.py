@@ -0,0 +1,277 @@
+"""Chunked map-reduce extraction for long sources.
+
+Long transcripts and documents are split into overlapping windows along
+natural boundaries (speaker turns for meetings, pages or headings for
+documents). Each chunk is extracted concurrently and the per-chunk item lists
+are merged, with duplicates from the overlapping regions collapsed.
+
+A chunk whose response hits max_tokens is split again and re-extracted, so
+long item lists are never silently truncated. A chunk whose call fails makes
+the whole extraction fail (ChunkExtractionError) instead of returning the
+other chunks' items, so the ingestion job is retried.
+"""
+
+import asyncio
+import difflib
+import logging
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.services.document_processor import PAGE_BREAK
+
+logger = logging.getLogger(__name__)
+
+# "00:12:31 Maria Silva: ...", "[12:31] Maria: ...", "Maria Silva: ..."
+_SPEAKER_TURN_RE = re.compile(
+    r"^\s*(?:\[?\d{1,2}:\d{2}(?::\d{2})?\]?\s*[-–]?\s*)?[A-Z][\w .'’-]{0,40}:\s"
+)
+
+# Markdown headings, numbered headings ("3.2 Structural"), short ALL-CAPS lines
+_HEADING_RE = re.compile(
+    r"^\s*(?:#{1,6}\s+\S|\d+(?:\.\d+)*\.?\s+[A-Z]\S*|[A-Z][A-Z0-9 ,&/()-]{3,60}$)"
+)
+
+# Re-splitting a truncated chunk stops once it is this small
+_MIN_RESPLIT_CHARS = 2000
+_MAX_RESPLIT_DEPTH = 3
+
+# Chunk extraction result: (items, truncated)
+ChunkResult = Tuple[List[Dict[str, Any]], bool]
+
+
+class ChunkExtractionError(Exception):
+    """Raised when one or more chunks of a source could not be extracted."""
+    pass
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Splitting
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def _split_lines(text: str, is_boundary: Callable[[str], bool]) -> List[str]:
+    """Group lines into units, starting a new unit at each boundary line."""
+    units: List[str] = []
+    current: List[str] = []
+    for line in text.splitlines():
+        if current and is_boundary(line):
+            units.append("\n".join(current))
+            current = []
+        current.append(line)
+    if current:
+        units.append("\n".join(current))
+    return [u for u in units if u.strip()]
+
+
+def _hard_wrap(unit: str, max_chars: int) -> List[str]:
+    """Split an oversized unit on paragraph, then line, then character boundaries."""
+    if len(unit) <= max_chars:
+        return [unit]
+    for separator in ("\n\n", "\n", " "):
+        parts = unit.split(separator)
+        if len(parts) > 1:
+            pieces: List[str] = []
+            current = ""
+            for part in parts:
+                candidate = f"{current}{separator}{part}" if current else part
+                if len(candidate) <= max_chars:
+                    current = candidate
+                    continue
+                if current:
+                    pieces.append(current)
+                current = part
+            if current:
+                pieces.append(current)
+            return [p for piece in pieces for p in _hard_wrap(piece, max_chars)]
+    return [unit[i:i + max_chars] for i in range(0, len(unit), max_chars)]
+
+
+def pack_units(units: List[str], max_chars: int, overlap_chars: int) -> List[str]:
+    """Greedily pack units into windows of at most max_chars.
+
+    Each window after the first starts with the trailing units of the previous
+    window (up to overlap_chars), so items spanning a boundary appear whole in
+    at least one window.
+    """
+    units = [piece for unit in units for piece in _hard_wrap(unit, max_chars)]
+    chunks: List[str] = []
+    window: List[str] = []
+    size = 0
+    for unit in units:
+        if window and size + len(unit) + 1 > max_chars:
+            chunks.append("\n".join(window))
+            overlap: List[str] = []
+            overlap_size = 0
+            for previous in reversed(window):
+                if overlap_size + len(previous) > overlap_chars:
+                    break
+                overlap.insert(0, previous)
+                overlap_size += len(previous) + 1
+            # Never let the overlap crowd out the next unit
+            while overlap and overlap_size + len(unit) + 1 > max_chars:
+                overlap_size -= len(overlap.pop(0)) + 1
+            window, size = overlap, overlap_size
+        window.append(unit)
+        size += len(unit) + 1
+    if window:
+        chunks.append("\n".join(window))
+    return chunks
+
+
+def split_transcript(
+    text: str,
+    max_chars: Optional[int] = None,
+    overlap_chars: Optional[int] = None,
+) -> List[str]:
+    """Split a meeting transcript into overlapping windows on speaker turns."""
+    max_chars = max_chars or settings.extraction_chunk_chars
+    overlap_chars = settings.extraction_chunk_overlap_chars if overlap_chars is None else overlap_chars
+    if len(text) <= max_chars:
+        return [text]
+    units = _split_lines(text, lambda line: bool(_SPEAKER_TURN_RE.match(line)))
+    return pack_units(units, max_chars, overlap_chars)
+
+
+def split_document(
+    text: str,
+    max_chars: Optional[int] = None,
+    overlap_chars: Optional[int] = None,
+) -> List[str]:
+    """Split document text into overlapping windows on pages, else headings."""
+    max_chars = max_chars or settings.extraction_chunk_chars
+    overlap_chars = settings.extraction_chunk_overlap_chars if overlap_chars is None else overlap_chars
+    if len(text) <= max_chars:
+        return [text]
+    if PAGE_BREAK in text:
+        units = [page.strip("\n") for page in text.split(PAGE_BREAK) if page.strip()]
+    else:
+        units = _split_lines(text, lambda line: bool(_HEADING_RE.match(line)))
+    return pack_units(units, max_chars, overlap_chars)
+
+
+def label_chunk(chunk: str, index: int, total: int) -> str:
+    """Prefix a chunk with its position so the model knows it is an excerpt."""
+    if total <= 1:
+        return chunk
+    return (
+        f"[Excerpt {index + 1} of {total}. The text may start or end mid-discussion; "
+        f"extract only items stated in this excerpt.]\n\n{chunk}"
+    )
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Map
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+async def extract_chunks(
+    chunks: List[str],
+    extract_fn: Callable[[str], Awaitable[ChunkResult]],
+    resplit_fn: Callable[..., List[str]],
+) -> List[List[Dict[str, Any]]]:
+    """Extract all chunks concurrently.
+
+    Args:
+        chunks: Text windows from split_transcript/split_document
+        extract_fn: Coroutine returning (items, truncated) for one chunk's text
+        resplit_fn: Splitter used to halve chunks whose output was truncated
+
+    Returns:
+        One item list per extracted (sub-)chunk.
+
+    Raises:
+        ChunkExtractionError: If any chunk failed (after all chunks finished)
+    """
+
+    async def run(text: str, depth: int) -> List[List[Dict[str, Any]]]:
+        items, truncated = await extract_fn(text)
+        if not truncated:
+            return [items]
+        if depth < _MAX_RESPLIT_DEPTH and len(text) > _MIN_RESPLIT_CHARS:
+            halves = resplit_fn(
+                text,
+                max_chars=len(text) // 2 + 1,
+                overlap_chars=min(settings.extraction_chunk_overlap_chars, len(text) // 8),
+            )
+            if len(halves) > 1:
+                logger.info(
+                    f"Chunking: output truncated at max_tokens, re-extracting as {len(halves)} parts"
+                )
+                nested = await asyncio.gather(*(run(half, depth + 1) for half in halves))
+                return [items] + [result for part in nested for result in part]
+        logger.warning(
+            f"Chunking: output still truncated for a {len(text)}-char chunk; "
+            f"keeping {len(items)} parsed item(s)"
+        )
+        return [items]
+
+    nested = await asyncio.gather(
+        *(run(label_chunk(chunk, i, len(chunks)), 0) for i, chunk in enumerate(chunks)),
+        return_exceptions=True,
+    )
+    failures = [part for part in nested if isinstance(part, BaseException)]
+    if failures:
+        raise ChunkExtractionError(
+            f"{len(failures)} of {len(chunks)} chunk(s) failed: {failures[0]}"
+        ) from failures[0]
+    return [result for part in nested for result in part]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Reduce
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def _normalize_statement(item: Dict[str, Any]) -> str:
+    statement = item.get("statement") or item.get("decision_statement") or ""
+    statement = re.sub(r"[^\w\s]", "", str(statement).lower())
+    return re.sub(r"\s+", " ", statement).strip()
+
+
+def _merge_into(kept: Dict[str, Any], duplicate: Dict[str, Any]) -> None:
+    """Keep the more confident item's fields and union the disciplines."""
+    disciplines = list(kept.get("affected_disciplines") or [])
+    for discipline in duplicate.get("affected_disciplines") or []:
+        if discipline not in disciplines:
+            disciplines.append(discipline)
+    if float(duplicate.get("confidence") or 0) > float(kept.get("confidence") or 0):
+        kept.update(duplicate)
+    if disciplines:
+        kept["affected_disciplines"] = disciplines
+
+
+def merge_items(
+    chunk_items: List[List[Dict[str, Any]]],
+    similarity: float = 0.9,
+) -> List[Dict[str, Any]]:
+    """Combine per-chunk item lists, collapsing duplicates.
+
+    Items are duplicates when they share an item_type and their normalized
+    statements are identical or nearly so (the same item extracted from the
+    overlap of two windows is usually worded slightly differently).
+    Order of first appearance is preserved.
+    """
+    merged: List[Dict[str, Any]] = []
+    keys: List[Tuple[str, str]] = []
+    for items in chunk_items:
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            key = (str(item.get("item_type", "")), _normalize_statement(item))
+            match = None
+            for i, (item_type, statement) in enumerate(keys):
+                if item_type != key[0]:
+                    continue
+                if statement == key[1] or (
+                    statement and key[1]
+                    and difflib.SequenceMatcher(None, statement, key[1]).ratio() >= similarity
+                ):
+                    match = i
+                    break
+            if match is None:
+                merged.append(dict(item))
+                keys.append(key)
+            else:
+                _merge_into(merged[match], item)
+    return merged
@@ -2,6 +2,7 @@
 
 Story 10.2: Document Ingestion (PDF & DOCX)
 Follows the same pattern as EmailExtractor (Story 10.1).
+Long documents are chunked on pages/headings and extracted map-reduce style.
 """
 
 import json
@@ -11,8 +12,15 @@ from pathlib import Path
 
 from sqlalchemy.orm import Session
 
-from app.config import settings
 from app.database.models import Source
+from app.services.chunking import (
+    ChunkExtractionError,
+    extract_chunks,
+    merge_items,
+    split_document,
+)
+from app.services.llm_client import get_llm_client, run_sync
+from app.services.prompt_loader import prompt_version
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +35,10 @@ class DocumentExtractor:
         self.prompt_template = PROMPT_PATH.read_text() if PROMPT_PATH.exists() else ""
 
     def extract(self, source: Source, participants: list) -> list[dict]:
+        """Synchronous wrapper around aextract() (runs on the shared LLM loop)."""
+        return run_sync(self.aextract(source, participants))
+
+    async def aextract(self, source: Source, participants: list) -> list[dict]:
         """Extract project items from a document source.
 
         Args:
@@ -58,53 +70,69 @@ class DocumentExtractor:
         if source.project:
             project_name = source.project.name or ""
 
-        # Fill prompt template
-        prompt = self.prompt_template
-        prompt = prompt.replace("{{project_name}}", project_name)
-        prompt = prompt.replace("{{document_title}}", source.title or "Untitled Document")
-        prompt = prompt.replace("{{file_type}}", source.file_type or "unknown")
-        prompt = prompt.replace("{{upload_date}}", source.created_at.isoformat() if source.created_at else datetime.now(timezone.utc).isoformat())
-        prompt = prompt.replace("{{participants}}", participants_text)
-        prompt = prompt.replace("{{document_text}}", source.raw_content)
-
-        # Call Claude API
+        # Fill prompt template (document text is filled in per chunk)
+        prompt_base = self.prompt_template
+        prompt_base = prompt_base.replace("{{project_name}}", project_name)
+        prompt_base = prompt_base.replace("{{document_title}}", source.title or "Untitled Document")
+        prompt_base = prompt_base.replace("{{file_type}}", source.file_type or "unknown")
+        prompt_base = prompt_base.replace("{{upload_date}}", source.created_at.isoformat() if source.created_at else datetime.now(timezone.utc).isoformat())
+        prompt_base = prompt_base.replace("{{participants}}", participants_text)
+
+        # Map: extract page/heading chunks concurrently; reduce: merge duplicates
+        # A failed chunk raises ChunkExtractionError so the job is retried
+        chunks = split_document(source.raw_content)
         try:
-            from anthropic import Anthropic
-
-            client = Anthropic(api_key=settings.anthropic_api_key)
-            response = client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4096,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    }
-                ],
+            chunk_items = await extract_chunks(
+                chunks,
+                lambda chunk_text: self._extract_chunk(
+                    prompt_base.replace("{{document_text}}", chunk_text)
+                ),
+                resplit_fn=split_document,
             )
-            raw_response = response.content[0].text.strip()
-        except Exception as e:
+        except ChunkExtractionError as e:
             logger.error(f"Claude API call failed for document extraction: {e}")
-            return []
+            raise
+
+        items = merge_items(chunk_items)
+        logger.info(
+            f"Extracted {len(items)} items from document source {source.id} "
+            f"({len(chunks)} chunk(s))"
+        )
+        return items
+
+    async def _extract_chunk(self, prompt: str) -> tuple[list[dict], bool]:
+        """Call Claude for one chunk; returns (items, output_truncated)."""
+        response = await get_llm_client().create_message(
+            prompt,
+            model="claude-sonnet-4-20250514",
+            max_tokens=4096,
+            temperature=0.0,
+            prompt_version=prompt_version("extract_document"),
+            validate=lambda r: isinstance(_parse_response(r.content[0].text), list),
+        )
+        raw_response = response.content[0].text.strip()
+        truncated = getattr(response, "stop_reason", None) == "max_tokens"
 
         # Parse JSON response
         try:
-            # Handle potential markdown code fences
-            text = raw_response
-            if text.startswith("```"):
-                # Strip ```json ... ``` wrapper
-                lines = text.split("\n")
-                text = "\n".join(lines[1:-1]) if len(lines) > 2 else text
-
-            items = json.loads(text)
+            items = _parse_response(raw_response)
             if not isinstance(items, list):
                 logger.error(f"Expected JSON array from Claude, got {type(items)}")
-                return []
-
-            logger.info(f"Extracted {len(items)} items from document source {source.id}")
-            return items
+                return [], truncated
+            return items, truncated
 
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse Claude response as JSON: {e}")
-            logger.debug(f"Raw response: {raw_response[:500]}")
-            return []
+            if not truncated:
+                logger.error(f"Failed to parse Claude response as JSON: {e}")
+                logger.debug(f"Raw response: {raw_response[:500]}")
+            return [], truncated
+
+
+def _parse_response(raw_response: str):
+    """Decode Claude's JSON answer, stripping a markdown code fence if present."""
+    text = raw_response.strip()
+    if text.startswith("```"):
+        # Strip ```json ... ``` wrapper
+        lines = text.split("\n")
+        text = "\n".join(lines[1:-1]) if len(lines) > 2 else text
+    return json.loads(text)
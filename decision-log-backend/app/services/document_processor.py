@@ -1,19 +1,122 @@
 """Document text extraction service for PDF and DOCX files.
 
 Story 10.2: Document Ingestion (PDF & DOCX)
+
+Large PDFs are split into page ranges that are extracted in parallel by a
+process pool (pdfplumber is CPU-bound and holds the GIL). Whenever a page
+timeout is configured every PDF, small ones included, is extracted in the
+pool, and each range must finish within page_timeout seconds per page
+(future.result(timeout=...), so it works from any thread). A range that
+overruns is retried one page per task; a page that still overruns
+contributes no text and the rest of the document is still returned.
+
+A hung worker can only be stopped by terminating the pool. The shared pool is
+then retired (the next call creates a new one); other callers whose ranges
+were running on it get BrokenProcessPool and resubmit them to the new pool.
 """
 
+import concurrent.futures
 import io
 import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from itertools import pairwise
+from typing import List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Separator between PDF pages; the extraction chunker splits on it
+PAGE_BREAK = "\f"
+
+# Added to each range's time budget: worker start-up and opening the PDF
+_RANGE_OVERHEAD_SECONDS = 10
+# Resubmissions of ranges whose pool was retired by another caller
+_MAX_POOL_ATTEMPTS = 3
+
+
+def _extract_pdf_pages(path: str, start: int, end: int) -> List[str]:
+    """Extract pages [start, end) of a PDF file (runs in a pool worker).
+
+    Pages that fail are returned as empty strings so page order is preserved.
+    """
+    import pdfplumber
+
+    texts: List[str] = []
+    with pdfplumber.open(path) as pdf:
+        for index in range(start, end):
+            try:
+                texts.append(pdf.pages[index].extract_text() or "")
+            except Exception as e:
+                logger.warning(f"PDF page {index + 1} extraction failed: {e}")
+                texts.append("")
+    return texts
+
+
+_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _get_pool(workers: int) -> concurrent.futures.ProcessPoolExecutor:
+    """Return the shared extraction pool, (re)creating it when needed.
+
+    Uses the 'spawn' start method: callers run inside multi-threaded
+    processes (API, ingestion worker), where forking is unsafe.
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _pool_workers = workers
+        return _pool
+
+
+def _retire_pool(pool: concurrent.futures.ProcessPoolExecutor) -> None:
+    """Terminate a pool with a hung worker; the next _get_pool() starts a fresh one.
+
+    Ranges other callers still had on it fail with BrokenProcessPool and are
+    resubmitted by _run_ranges.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    processes = list((getattr(pool, "_processes", None) or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+
 
 class DocumentProcessor:
     """Extracts text content from PDF and DOCX documents."""
 
     SUPPORTED_TYPES = ("pdf", "docx")
 
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        page_timeout: Optional[float] = None,
+        parallel_min_pages: Optional[int] = None,
+    ):
+        from app.config import settings
+
+        self.workers = settings.pdf_extraction_workers if workers is None else workers
+        self.page_timeout = (
+            settings.pdf_page_timeout_seconds if page_timeout is None else page_timeout
+        )
+        self.parallel_min_pages = (
+            settings.pdf_parallel_min_pages if parallel_min_pages is None else parallel_min_pages
+        )
+
     def extract_text(self, content: bytes, file_type: str) -> str:
         """Extract text from a document based on file type.
 
@@ -37,8 +140,34 @@ class DocumentProcessor:
         logger.warning(f"Unsupported file type for text extraction: {file_type}")
         return ""
 
+    def extract_text_from_file(self, path: str, file_type: str) -> str:
+        """Extract text from a document on disk.
+
+        Parsers open the file directly (pdfminer and zipfile read it lazily),
+        so memory use does not grow with file size.
+        """
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return ""
+
+        file_type = file_type.lower()
+
+        if file_type == "pdf":
+            return self._extract_pdf_file(path)
+        elif file_type == "docx":
+            return self._extract_docx(path)
+
+        logger.warning(f"Unsupported file type for text extraction: {file_type}")
+        return ""
+
     def _extract_pdf(self, content: bytes) -> str:
         """Extract text from all pages of a PDF document."""
+        if self._uses_pool():
+            # Pool workers open the PDF by path
+            with tempfile.NamedTemporaryFile(suffix=".pdf") as tmp:
+                tmp.write(content)
+                tmp.flush()
+                return self._extract_pdf_file(tmp.name)
+
         import pdfplumber
 
         text_parts = []
@@ -52,14 +181,124 @@ class DocumentProcessor:
             logger.error(f"Error extracting PDF text: {e}")
             return ""
 
-        return "\n\n".join(text_parts)
+        return f"\n\n{PAGE_BREAK}".join(text_parts)
+
+    def _uses_pool(self) -> bool:
+        """Pool extraction is needed for parallelism and for page timeouts."""
+        return self.workers > 1 or self.page_timeout > 0
+
+    def _extract_pdf_file(self, path: str) -> str:
+        """Extract a PDF on disk, in parallel page ranges when it is large enough."""
+        import pdfplumber
+
+        try:
+            with pdfplumber.open(path) as pdf:
+                page_count = len(pdf.pages)
+        except Exception as e:
+            logger.error(f"Error extracting PDF text: {e}")
+            return ""
+
+        try:
+            if self._uses_pool():
+                pages = self._extract_pdf_pooled(path, page_count)
+            else:
+                pages = _extract_pdf_pages(path, 0, page_count)
+        except Exception as e:
+            logger.error(f"Error extracting PDF text: {e}")
+            return ""
+
+        return f"\n\n{PAGE_BREAK}".join(text for text in pages if text)
+
+    def _extract_pdf_pooled(self, path: str, page_count: int) -> List[str]:
+        """Extract page ranges in the process pool and reassemble them in order."""
+        workers = max(self.workers, 1)
+        if workers > 1 and page_count >= self.parallel_min_pages:
+            # A few ranges per worker keeps the pool busy when page costs differ
+            range_count = min(page_count, workers * 4)
+        else:
+            range_count = 1
+        bounds = [page_count * i // range_count for i in range(range_count + 1)]
+        ranges = list(pairwise(bounds))
+
+        pages = [text for texts in self._run_ranges(path, ranges) for text in texts]
+        if range_count > 1:
+            logger.info(
+                f"Extracted {page_count} PDF pages in {len(ranges)} ranges "
+                f"across {workers} workers"
+            )
+        return pages
+
+    def _range_budget(self, pages: int) -> Optional[float]:
+        if self.page_timeout <= 0:
+            return None
+        return self.page_timeout * pages + _RANGE_OVERHEAD_SECONDS
+
+    def _run_ranges(self, path: str, ranges: List[Tuple[int, int]]) -> List[List[str]]:
+        """Run page ranges in the pool; returns one text list per range.
+
+        A range that overruns its budget retires the pool and is re-run one
+        page per task, so only the pages that hang are lost.
+        """
+        workers = max(self.workers, 1)
+        results: List[Optional[List[str]]] = [None] * len(ranges)
+        pending = list(range(len(ranges)))
+
+        for _attempt in range(_MAX_POOL_ATTEMPTS):
+            pool = _get_pool(workers)
+            try:
+                futures = {
+                    i: pool.submit(_extract_pdf_pages, path, *ranges[i]) for i in pending
+                }
+            except (BrokenProcessPool, RuntimeError):
+                # Retired by another caller between _get_pool() and submit()
+                _retire_pool(pool)
+                continue
+
+            broken = []
+            for i, future in futures.items():
+                start, end = ranges[i]
+                budget = self._range_budget(end - start)
+                try:
+                    results[i] = future.result(timeout=budget)
+                except concurrent.futures.TimeoutError:
+                    _retire_pool(pool)
+                    if end - start == 1:
+                        logger.warning(
+                            f"PDF page {start + 1} timed out after {self.page_timeout}s, skipping"
+                        )
+                        results[i] = [""]
+                    else:
+                        logger.warning(
+                            f"PDF pages {start + 1}-{end} did not finish in {budget}s, "
+                            f"retrying page by page"
+                        )
+                        single_pages = [(page, page + 1) for page in range(start, end)]
+                        results[i] = [
+                            texts[0] if texts else ""
+                            for texts in self._run_ranges(path, single_pages)
+                        ]
+                except BrokenProcessPool:
+                    broken.append(i)
+                except Exception as e:
+                    logger.error(f"PDF pages {start + 1}-{end} extraction failed: {e}")
+                    results[i] = [""] * (end - start)
+
+            pending = broken
+            if not pending:
+                break
+
+        for i in pending:
+            start, end = ranges[i]
+            logger.error(f"PDF pages {start + 1}-{end} lost: extraction pool kept failing")
+            results[i] = [""] * (end - start)
+        return results
 
-    def _extract_docx(self, content: bytes) -> str:
-        """Extract text from all paragraphs of a DOCX document."""
+    def _extract_docx(self, content) -> str:
+        """Extract text from all paragraphs of a DOCX document (bytes or file path)."""
         from docx import Document
 
         try:
-            doc = Document(io.BytesIO(content))
+            doc = Document(io.BytesIO(content) if isinstance(content, bytes) else content)
             paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
         except Exception as e:
             logger.error(f"Error extracting DOCX text: {e}")
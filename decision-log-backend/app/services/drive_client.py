@@ -3,14 +3,17 @@
 Story 10.3: Google Drive Folder Monitoring
 """
 
-import io
 import logging
 import os
 
+from app.services.upload_storage import LimitedWriter
+
 logger = logging.getLogger(__name__)
 
 SCOPES = ['https://www.googleapis.com/auth/drive.readonly']
 
+DOWNLOAD_CHUNK_BYTES = 4 * 1024 * 1024
+
 # Supported MIME types for document processing
 SUPPORTED_MIME_TYPES = {
     'application/pdf': 'pdf',
@@ -69,24 +72,36 @@ class DriveClient:
         ).execute()
         return results.get('files', [])
 
-    def download_file(self, file_id: str) -> bytes:
-        """Download file content by file ID.
+    def download_to_file(self, file_id: str, dest_path: str, max_bytes: int) -> int:
+        """Stream file content by file ID straight to disk.
 
         Args:
             file_id: Google Drive file ID.
+            dest_path: Local path to write to (parent directories are created).
+            max_bytes: Size limit, enforced per downloaded chunk.
 
         Returns:
-            Raw file bytes.
+            Number of bytes written.
+
+        Raises:
+            FileTooLargeError: if the file exceeds max_bytes (dest_path is removed).
         """
         from googleapiclient.http import MediaIoBaseDownload
 
         request = self.service.files().get_media(fileId=file_id)
-        buffer = io.BytesIO()
-        downloader = MediaIoBaseDownload(buffer, request)
-        done = False
-        while not done:
-            _, done = downloader.next_chunk()
-        return buffer.getvalue()
+        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+        try:
+            with open(dest_path, "wb") as f:
+                writer = LimitedWriter(f, max_bytes)
+                downloader = MediaIoBaseDownload(writer, request, chunksize=DOWNLOAD_CHUNK_BYTES)
+                done = False
+                while not done:
+                    _, done = downloader.next_chunk()
+        except BaseException:
+            if os.path.exists(dest_path):
+                os.remove(dest_path)
+            raise
+        return writer.written
 
     def verify_folder_access(self, folder_id: str) -> bool:
         """Check if the service account can access the folder.
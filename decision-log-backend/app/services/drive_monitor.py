@@ -7,7 +7,6 @@ Story 10.3: Google Drive Folder Monitoring
 """
 
 import logging
-import os
 from datetime import datetime, timezone
 
 from sqlalchemy.orm import Session
@@ -15,6 +14,7 @@ from sqlalchemy.orm import Session
 from app.database.models import Source, Project
 from app.services.drive_client import DriveClient, SUPPORTED_MIME_TYPES
 from app.services.document_processor import DocumentProcessor
+from app.services.upload_storage import document_path, max_document_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -76,24 +76,22 @@ class DriveMonitor:
         """Download, extract text, and create Source record."""
         logger.info(f"Found new file: {file_info['name']} in project {project.name}")
 
-        content = self.drive.download_file(file_info['id'])
-
         # Determine file extension from MIME type
         ext = SUPPORTED_MIME_TYPES.get(file_info.get('mimeType', ''), 'pdf')
 
-        # Extract text
+        # Stream the file straight to local storage (constant memory)
+        file_path = document_path(project.id, file_info['id'], ext)
+        file_size = self.drive.download_to_file(
+            file_info['id'], file_path, max_bytes=max_document_bytes()
+        )
+
+        # Extract text from the stored file
         raw_text = ""
         try:
-            raw_text = self.processor.extract_text(content, ext)
+            raw_text = self.processor.extract_text_from_file(file_path, ext)
         except Exception as e:
             logger.error(f"Text extraction failed for {file_info['name']}: {e}")
 
-        # Save file locally
-        file_path = f"uploads/documents/{project.id}/{file_info['id']}.{ext}"
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, "wb") as f:
-            f.write(content)
-
         # Create Source record
         source = Source(
             project_id=project.id,
@@ -103,7 +101,7 @@ class DriveMonitor:
             raw_content=raw_text or "",
             file_url=file_info.get('webViewLink', file_path),
             file_type=ext,
-            file_size=int(file_info.get('size', 0)),
+            file_size=file_size or int(file_info.get('size', 0)),
             drive_file_id=file_info['id'],
             drive_folder_id=project.drive_folder_id,
             ai_summary=None,  # Summary generation deferred to ingestion approval
@@ -5,14 +5,15 @@ Handles quoted reply stripping, thread deduplication, discipline inference,
 and Claude API extraction of 5 item types from email bodies.
 """
 
+import asyncio
 import json
 import logging
 from pathlib import Path
 
-from anthropic import Anthropic
-
-from app.config import settings
 from app.database.models import Source, ProjectParticipant
+from app.services.chunking import ChunkExtractionError
+from app.services.llm_client import get_llm_client, run_sync
+from app.services.prompt_loader import prompt_version
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +44,14 @@ def strip_quoted_replies(body: str) -> str:
     return "\n".join(clean_lines)
 
 
+def _parse_response(raw_text: str):
+    """Decode Claude's JSON answer (handles markdown code blocks)."""
+    raw_text = raw_text.strip()
+    if raw_text.startswith("```"):
+        raw_text = raw_text.split("\n", 1)[1].rsplit("```", 1)[0]
+    return json.loads(raw_text)
+
+
 class EmailExtractor:
     """Extracts project items from email source content using Claude API."""
 
@@ -51,6 +60,10 @@ class EmailExtractor:
         self.prompt_template = PROMPT_PATH.read_text() if PROMPT_PATH.exists() else ""
 
     def extract(self, source: Source, participants: list) -> list[dict]:
+        """Synchronous wrapper around aextract() (runs on the shared LLM loop)."""
+        return run_sync(self.aextract(source, participants))
+
+    async def aextract(self, source: Source, participants: list) -> list[dict]:
         """Extract project items from an email source.
 
         Args:
@@ -60,32 +73,40 @@ class EmailExtractor:
         Returns:
             List of dicts with keys: item_type, statement, who,
             affected_disciplines, owner, due_date.
+
+        Raises:
+            ChunkExtractionError: If the Claude call failed, so the ingestion
+                job is retried instead of storing the email with no items.
         """
         clean_body = strip_quoted_replies(source.raw_content or "")
         if not clean_body.strip():
             return []
 
-        if self.check_thread_overlap(source):
+        # Session I/O stays off the event loop
+        if await asyncio.to_thread(self.check_thread_overlap, source):
             logger.warning(f"Thread overlap detected for source {source.id}")
 
         prompt = self._build_prompt(source, participants, clean_body)
 
         try:
-            client = Anthropic(api_key=settings.anthropic_api_key)
-            response = client.messages.create(
+            response = await get_llm_client().create_message(
+                prompt,
                 model="claude-sonnet-4-20250514",
                 max_tokens=4096,
-                messages=[{"role": "user", "content": prompt}],
+                temperature=0.0,
+                prompt_version=prompt_version("extract_email"),
+                validate=lambda r: isinstance(_parse_response(r.content[0].text), list),
             )
-            raw_text = response.content[0].text.strip()
-            # Extract JSON from response (handle markdown code blocks)
-            if raw_text.startswith("```"):
-                raw_text = raw_text.split("\n", 1)[1].rsplit("```", 1)[0]
-            items = json.loads(raw_text)
-            return items if isinstance(items, list) else []
         except Exception as e:
             logger.error(f"Email extraction failed for source {source.id}: {e}")
+            raise ChunkExtractionError(f"Email extraction failed for source {source.id}: {e}") from e
+
+        try:
+            items = _parse_response(response.content[0].text)
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse email extraction response as JSON: {e}")
             return []
+        return items if isinstance(items, list) else []
 
     def _build_prompt(
         self, source: Source, participants: list, clean_body: str
@@ -0,0 +1,101 @@
+"""Backfill ProjectItem.embedding for rows stored without one.
+
+Walks project_items with keyset pagination on id (no OFFSET scans) and
+commits after every chunk, so the command can be stopped at any point and
+re-run; finished rows are skipped because their embedding is no longer null.
+
+    python -m app.services.embedding_backfill
+    python -m app.services.embedding_backfill --chunk-size 500 --project-id <uuid>
+    python -m app.services.embedding_backfill --after-id <last id logged>
+"""
+
+import argparse
+import logging
+from typing import Callable, Optional
+
+from app.config import settings
+from app.database.models import ProjectItem
+from app.database.session import SessionLocal
+from app.services.enrichment_service import embed_project_items
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 256
+
+
+def backfill_embeddings(
+    session_factory: Callable = SessionLocal,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    project_id: Optional[str] = None,
+    after_id: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> int:
+    """Embed items with a null embedding, one keyset-paginated chunk at a time.
+
+    Args:
+        session_factory: Session factory (one session per chunk).
+        chunk_size: Items per chunk (one batched encode + commit each).
+        project_id: Only backfill this project's items.
+        after_id: Resume after this item id.
+        limit: Stop after this many items.
+
+    Returns:
+        Number of items embedded.
+    """
+    total = 0
+    last_id = after_id
+    while limit is None or total < limit:
+        db = session_factory()
+        try:
+            query = db.query(ProjectItem).filter(ProjectItem.embedding.is_(None))
+            if project_id:
+                query = query.filter(ProjectItem.project_id == project_id)
+            if last_id:
+                query = query.filter(ProjectItem.id > last_id)
+            size = chunk_size if limit is None else min(chunk_size, limit - total)
+            items = query.order_by(ProjectItem.id).limit(size).all()
+            if not items:
+                break
+
+            embedded = embed_project_items(items)
+            if embedded == 0:
+                logger.error("No embedding encoder available; stopping backfill")
+                break
+
+            db.commit()
+            total += embedded
+            last_id = str(items[-1].id)
+            logger.info(f"Embedded {total} item(s) so far (last id {last_id})")
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Backfill project item embeddings")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--project-id", help="Only backfill this project")
+    parser.add_argument("--after-id", help="Resume after this item id")
+    parser.add_argument("--limit", type=int, help="Stop after this many items")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.DEBUG if settings.debug else logging.INFO,
+        format="%(asctime)s %(name)s %(levelname)s %(message)s",
+    )
+
+    total = backfill_embeddings(
+        chunk_size=args.chunk_size,
+        project_id=args.project_id,
+        after_id=args.after_id,
+        limit=args.limit,
+    )
+    logger.info(f"Backfill complete: {total} item(s) embedded")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Long-lived embedding encoder process.
+
+Loads the sentence-transformers model once per host and serves batched
+encode requests from API and ingestion worker processes:
+
+    python -m app.services.encoder_server                  # EMBEDDING_SERVER_ADDRESS
+    python -m app.services.encoder_server --address 127.0.0.1:50055
+
+Clients enable it by setting EMBEDDING_SERVER_ADDRESS to the same host:port;
+enrichment_service.encode_texts then sends each batch here instead of
+loading its own copy of the model. Connections are authenticated with
+EMBEDDING_SERVER_AUTHKEY (default: JWT_SECRET_KEY).
+"""
+
+import argparse
+import logging
+import os
+import threading
+from multiprocessing.managers import BaseManager
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ADDRESS = "127.0.0.1:50055"
+
+
+class EncoderServerManager(BaseManager):
+    """Server side: owns the SharedEncoder instance."""
+
+
+class EncoderClientManager(BaseManager):
+    """Client side: connects to a running encoder server."""
+
+
+EncoderClientManager.register("get_encoder")
+
+
+class SharedEncoder:
+    """Encoder object served to clients; one model, one forward pass at a time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def encode(self, texts: List[str], batch_size: int) -> Optional[np.ndarray]:
+        from app.services.enrichment_service import encode_texts_local
+
+        with self._lock:
+            return encode_texts_local(texts, batch_size)
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    """Split "host:port" into a (host, port) tuple."""
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def _authkey() -> bytes:
+    return (settings.embedding_server_authkey or settings.jwt_secret_key).encode()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Client
+# ──────────────────────────────────────────────────────────────────────────────
+
+_remote = None
+_remote_pid: Optional[int] = None
+_remote_lock = threading.Lock()
+
+
+def _get_remote():
+    """Return a proxy to the shared encoder, connecting on first use per process."""
+    global _remote, _remote_pid
+    with _remote_lock:
+        if _remote is None or _remote_pid != os.getpid():
+            manager = EncoderClientManager(
+                address=parse_address(settings.embedding_server_address),
+                authkey=_authkey(),
+            )
+            manager.connect()
+            _remote = manager.get_encoder()
+            _remote_pid = os.getpid()
+        return _remote
+
+
+def encode_remote(texts: List[str], batch_size: int) -> Optional[np.ndarray]:
+    """Encode texts in the encoder process (float32 matrix, or None if it has no model).
+
+    A broken connection is dropped so the next call reconnects.
+    """
+    global _remote
+    try:
+        return _get_remote().encode(texts, batch_size)
+    except (ConnectionError, EOFError, OSError):
+        with _remote_lock:
+            _remote = None
+        raise
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Server
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def make_server(address: str):
+    """Build the encoder server (call serve_forever() on the result)."""
+    encoder = SharedEncoder()
+    EncoderServerManager.register("get_encoder", callable=lambda: encoder)
+    manager = EncoderServerManager(address=parse_address(address), authkey=_authkey())
+    return manager.get_server()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the shared embedding encoder")
+    parser.add_argument(
+        "--address",
+        default=settings.embedding_server_address or DEFAULT_ADDRESS,
+        help="host:port to listen on (default: EMBEDDING_SERVER_ADDRESS)",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.DEBUG if settings.debug else logging.INFO,
+        format="%(asctime)s %(name)s %(levelname)s %(message)s",
+    )
+
+    from app.services.enrichment_service import _get_embedding_model
+
+    # Load the model before accepting connections
+    if _get_embedding_model() is None:
+        raise SystemExit("sentence-transformers is not installed")
+
+    server = make_server(args.address)
+    logger.info(f"Encoder server listening on {args.address}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
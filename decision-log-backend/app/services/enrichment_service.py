@@ -4,34 +4,116 @@ Story 5.4: AI Extraction Prompt Evolution
 
 Generates 384-dimensional embeddings using sentence-transformers (all-MiniLM-L6-v2)
 for semantic search across all item types.
+
+Texts are encoded in batches (EMBEDDING_BATCH_SIZE) into a float32 matrix.
+When EMBEDDING_SERVER_ADDRESS is set, encoding is delegated to a long-lived
+encoder process (python -m app.services.encoder_server) so the model is
+loaded once per host instead of once per API/worker process.
 """
 
 import logging
+import threading
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
+from app.config import settings
+
 logger = logging.getLogger(__name__)
 
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+EMBEDDING_DIM = 384
+
 # Lazy-loaded model
 _embedding_model = None
+_model_lock = threading.Lock()
 
 
 def _get_embedding_model():
-    """Lazy-load the sentence-transformers model."""
+    """Lazy-load the sentence-transformers model (once per process)."""
     global _embedding_model
     if _embedding_model is None:
-        try:
-            from sentence_transformers import SentenceTransformer
-            _embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
-            logger.info("Loaded embedding model: all-MiniLM-L6-v2")
-        except ImportError:
-            logger.warning(
-                "sentence-transformers not available. "
-                "Install with: pip install sentence-transformers"
-            )
-            return None
+        with _model_lock:
+            if _embedding_model is not None:
+                return _embedding_model
+            try:
+                from sentence_transformers import SentenceTransformer
+                _embedding_model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+                logger.info(f"Loaded embedding model: {EMBEDDING_MODEL_NAME}")
+            except ImportError:
+                logger.warning(
+                    "sentence-transformers not available. "
+                    "Install with: pip install sentence-transformers"
+                )
+                return None
     return _embedding_model
 
 
+def encode_texts_local(texts: List[str], batch_size: int) -> Optional[np.ndarray]:
+    """Encode texts with the in-process model.
+
+    Returns:
+        (len(texts), EMBEDDING_DIM) float32 matrix of normalized embeddings,
+        or None if sentence-transformers is not available.
+    """
+    model = _get_embedding_model()
+    if model is None:
+        return None
+
+    vectors = model.encode(
+        texts,
+        batch_size=batch_size,
+        normalize_embeddings=True,
+        convert_to_numpy=True,
+        show_progress_bar=False,
+    )
+    return np.asarray(vectors, dtype=np.float32).reshape(len(texts), -1)
+
+
+def encode_texts(texts: List[str], batch_size: Optional[int] = None) -> Optional[np.ndarray]:
+    """Encode a list of texts in batches.
+
+    Uses the shared encoder process when EMBEDDING_SERVER_ADDRESS is set,
+    falling back to the in-process model if it is unreachable.
+
+    Args:
+        texts: Texts to embed.
+        batch_size: Texts per forward pass (default: EMBEDDING_BATCH_SIZE).
+
+    Returns:
+        (len(texts), EMBEDDING_DIM) float32 matrix, row i for texts[i],
+        or None if no encoder is available.
+    """
+    if not texts:
+        return np.empty((0, EMBEDDING_DIM), dtype=np.float32)
+
+    batch_size = batch_size or settings.embedding_batch_size
+
+    if settings.embedding_server_address:
+        from app.services import encoder_server
+
+        try:
+            return encoder_server.encode_remote(texts, batch_size)
+        except Exception as e:
+            logger.warning(f"Encoder server unavailable, encoding in-process: {e}")
+
+    return encode_texts_local(texts, batch_size)
+
+
+# Separator and labelled slots of an embedding text (shared with search queries)
+EMBEDDING_TEXT_SEPARATOR = " | "
+
+
+def type_label(item_type: str) -> str:
+    """Item type slot of an embedding text."""
+    return f"Type: {item_type}"
+
+
+def disciplines_label(disciplines: List[str]) -> str:
+    """Disciplines slot of an embedding text."""
+    return f"Disciplines: {', '.join(disciplines)}"
+
+
 def build_embedding_text(item: Dict[str, Any]) -> str:
     """Build the text to embed from item fields.
 
@@ -39,7 +121,7 @@ def build_embedding_text(item: Dict[str, Any]) -> str:
     """
     parts = [
         item.get("statement", ""),
-        f"Type: {item.get('item_type', 'decision')}",
+        type_label(item.get("item_type", "decision")),
         f"Who: {item.get('who', '')}",
     ]
 
@@ -71,9 +153,9 @@ def build_embedding_text(item: Dict[str, Any]) -> str:
     # Add disciplines
     disciplines = item.get("affected_disciplines", [])
     if disciplines:
-        parts.append(f"Disciplines: {', '.join(disciplines)}")
+        parts.append(disciplines_label(disciplines))
 
-    return " | ".join(filter(None, parts))
+    return EMBEDDING_TEXT_SEPARATOR.join(filter(None, parts))
 
 
 def generate_embedding(text: str) -> Optional[List[float]]:
@@ -81,40 +163,74 @@ def generate_embedding(text: str) -> Optional[List[float]]:
 
     Returns None if sentence-transformers is not available.
     """
-    model = _get_embedding_model()
-    if model is None:
-        return None
-
     try:
-        embedding = model.encode(text, normalize_embeddings=True)
-        return embedding.tolist()
+        vectors = encode_texts([text])
     except Exception as e:
         logger.error(f"Embedding generation failed: {e}")
         return None
 
+    return vectors[0].tolist() if vectors is not None else None
+
 
 def enrich_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Generate embeddings for a list of extracted items.
 
+    All items are encoded in one batched call.
+
     Args:
         items: List of item dicts from extraction
 
     Returns:
         Same items with 'embedding' field added (None if model unavailable)
     """
-    model = _get_embedding_model()
+    if not items:
+        return items
 
-    for item in items:
-        text = build_embedding_text(item)
-        if model is not None:
-            try:
-                embedding = model.encode(text, normalize_embeddings=True)
-                item["embedding"] = embedding.tolist()
-            except Exception as e:
-                logger.error(f"Failed to generate embedding: {e}")
-                item["embedding"] = None
-        else:
-            item["embedding"] = None
+    texts = [build_embedding_text(item) for item in items]
+    try:
+        vectors = encode_texts(texts)
+    except Exception as e:
+        logger.error(f"Failed to generate embeddings: {e}")
+        vectors = None
+
+    for index, item in enumerate(items):
+        item["embedding"] = vectors[index].tolist() if vectors is not None else None
 
     logger.info(f"Enriched {len(items)} items with embeddings")
     return items
+
+
+def item_embedding_fields(item) -> Dict[str, Any]:
+    """Map a ProjectItem row to the dict shape used by build_embedding_text."""
+    return {
+        "statement": item.statement or item.decision_statement,
+        "item_type": item.item_type,
+        "who": item.who,
+        "why": item.why,
+        "causation": item.causation,
+        "owner": item.owner,
+        "affected_disciplines": item.affected_disciplines or [],
+    }
+
+
+def embed_project_items(items: List[Any], batch_size: Optional[int] = None) -> int:
+    """Set ProjectItem.embedding for a list of items with one batched encode.
+
+    Does not commit; callers write the vectors in their own transaction.
+    Items are left with a null embedding if no encoder is available (the
+    backfill command picks them up later).
+
+    Returns:
+        Number of items embedded.
+    """
+    if not items:
+        return 0
+
+    texts = [build_embedding_text(item_embedding_fields(item)) for item in items]
+    vectors = encode_texts(texts, batch_size)
+    if vectors is None:
+        return 0
+
+    for item, vector in zip(items, vectors, strict=True):
+        item.embedding = vector.tolist()
+    return len(items)
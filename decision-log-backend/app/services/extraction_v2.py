@@ -10,7 +10,8 @@ import json
 import logging
 from typing import Any, Dict, List, Optional
 
-from app.services.prompt_loader import render_prompt
+from app.services.chunking import ChunkExtractionError
+from app.services.prompt_loader import prompt_version, render_prompt
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +73,27 @@ def build_extraction_prompt(
     return render_prompt("extract_meeting", variables)
 
 
+def _parse_items_response(response_text: str) -> List[Dict[str, Any]]:
+    """Parse and validate the {"items": [...]} JSON returned for one prompt."""
+    # Extract JSON from response (may be wrapped in markdown code blocks)
+    json_text = response_text
+    if "```json" in json_text:
+        json_text = json_text.split("```json")[1].split("```")[0].strip()
+    elif "```" in json_text:
+        json_text = json_text.split("```")[1].split("```")[0].strip()
+
+    result = json.loads(json_text)
+    items = result.get("items", [])
+
+    # Validate and normalize items
+    validated = []
+    for item in items:
+        validated_item = _validate_item(item)
+        if validated_item:
+            validated.append(validated_item)
+    return validated
+
+
 async def extract_items_from_transcript(
     transcript_text: str,
     meeting_title: str = "Untitled Meeting",
@@ -83,6 +105,9 @@ async def extract_items_from_transcript(
 ) -> List[Dict[str, Any]]:
     """Extract project items from a meeting transcript using Claude API.
 
+    Long transcripts are split on speaker turns into overlapping windows that
+    are extracted concurrently and merged (see app/services/chunking.py).
+
     Args:
         transcript_text: Full meeting transcript text
         meeting_title: Title of the meeting
@@ -90,63 +115,60 @@ async def extract_items_from_transcript(
         meeting_type: Type of meeting
         duration_minutes: Duration in minutes
         participants: Participant roster for discipline inference
-        api_key: Anthropic API key (falls back to settings)
+        api_key: Anthropic API key (falls back to the shared client)
 
     Returns:
         List of extracted item dicts with item_type, statement, who, etc.
     """
-    prompt = build_extraction_prompt(
-        transcript_text=transcript_text,
-        meeting_title=meeting_title,
-        meeting_date=meeting_date,
-        meeting_type=meeting_type,
-        duration_minutes=duration_minutes,
-        participants=participants,
-    )
-
     try:
-        import anthropic
-        from app.config import settings
-
-        client = anthropic.Anthropic(api_key=api_key or settings.anthropic_api_key)
-
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=4096,
-            messages=[
-                {"role": "user", "content": prompt},
-            ],
+        from app.services.chunking import extract_chunks, merge_items, split_transcript
+        from app.services.llm_client import LLMClient, get_llm_client
+
+        client = LLMClient(api_key=api_key) if api_key else get_llm_client()
+
+        async def extract_chunk(chunk_text: str):
+            prompt = build_extraction_prompt(
+                transcript_text=chunk_text,
+                meeting_title=meeting_title,
+                meeting_date=meeting_date,
+                meeting_type=meeting_type,
+                duration_minutes=duration_minutes,
+                participants=participants,
+            )
+            response = await client.create_message(
+                prompt,
+                model="claude-sonnet-4-20250514",
+                max_tokens=4096,
+                temperature=0.0,
+                prompt_version=prompt_version("extract_meeting"),
+                validate=lambda r: _parse_items_response(r.content[0].text) is not None,
+            )
+            truncated = getattr(response, "stop_reason", None) == "max_tokens"
+            try:
+                return _parse_items_response(response.content[0].text), truncated
+            except json.JSONDecodeError as e:
+                if not truncated:
+                    logger.error(f"Failed to parse extraction response as JSON: {e}")
+                return [], truncated
+
+        chunks = split_transcript(transcript_text)
+        validated = merge_items(
+            await extract_chunks(chunks, extract_chunk, resplit_fn=split_transcript)
         )
 
-        # Parse JSON from response
-        response_text = response.content[0].text
-
-        # Extract JSON from response (may be wrapped in markdown code blocks)
-        json_text = response_text
-        if "```json" in json_text:
-            json_text = json_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in json_text:
-            json_text = json_text.split("```")[1].split("```")[0].strip()
-
-        result = json.loads(json_text)
-        items = result.get("items", [])
-
-        # Validate and normalize items
-        validated = []
-        for item in items:
-            validated_item = _validate_item(item)
-            if validated_item:
-                validated.append(validated_item)
-
-        logger.info(f"Extracted {len(validated)} items from transcript: {meeting_title}")
+        logger.info(
+            f"Extracted {len(validated)} items from transcript: {meeting_title} "
+            f"({len(chunks)} chunk(s))"
+        )
         return validated
 
     except ImportError:
         logger.warning("anthropic package not available — returning empty extraction")
         return []
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse extraction response as JSON: {e}")
-        return []
+    except ChunkExtractionError as e:
+        # Partial results would drop items; fail so the ingestion job is retried
+        logger.error(f"Extraction failed: {e}")
+        raise
     except Exception as e:
         logger.error(f"Extraction failed: {e}")
         return []
@@ -1,35 +1,90 @@
 """Gmail API polling service for email ingestion.
 
 Polls Gmail for project-related emails, deduplicates by thread ID + message ID,
-creates Source records with status='pending', and generates AI one-line summaries.
+and creates Source records with status='pending'. AI one-line summaries are
+generated afterwards by a separate summary stage (run_summary_stage), so a
+poll cycle only waits on Gmail and the database.
+
+Message bodies are fetched with Gmail batch HTTP requests (GMAIL_BATCH_SIZE
+messages.get calls per round trip), paced to stay under the per-user quota
+(GMAIL_QUOTA_UNITS_PER_SECOND); sub-requests rejected with 429/5xx are
+retried in a later batch with exponential backoff.
+
+Cycles are incremental: the mailbox historyId reached by the last cycle is
+stored as a sync checkpoint, and the next cycle asks users.history.list for
+the messages added since then instead of re-listing every unread message, so
+a quiet mailbox costs one API call per cycle. The first cycle, and any cycle
+whose checkpoint Gmail no longer has (404), lists unread messages in full and
+records the current historyId.
+
+The checkpoint advances even when some messages fail: their ids are stored
+next to it (one sync_checkpoints row each, holding the attempt count) and
+fetched again by the following cycles, until they are stored or have failed
+MAX_MESSAGE_ATTEMPTS times.
+
+Listed messages already stored as Sources are dropped with one IN query on
+sources.webhook_id before anything is downloaded.
+
+Label ids are resolved to names from a registry loaded with one labels.list
+call and kept for GMAIL_LABEL_CACHE_TTL_SECONDS; an id missing from it
+triggers one reload per cycle.
+
+The summary stage picks up pending email Sources without an ai_summary
+(newest first, GMAIL_SUMMARY_BATCH_SIZE per run) and summarises them
+concurrently through the shared LLM client (llm_client.py), so at most
+LLM_MAX_CONCURRENCY Claude calls are in flight process-wide. Sources whose
+summary failed stay NULL and are retried on later runs with exponential
+backoff (SUMMARY_RETRY_BASE_SECONDS), until SUMMARY_MAX_ATTEMPTS failures.
 
 Story 7.4: Backend Gmail API Poller
 """
 
+import asyncio
 import base64
 import logging
 import time
 from datetime import datetime, timezone
 from email.utils import parseaddr
+from functools import partial
 from html.parser import HTMLParser
 from typing import Optional
 from uuid import uuid4
 
-from anthropic import Anthropic
 from googleapiclient.errors import HttpError
 from sqlalchemy.orm import Session
 
 from app.config import settings
-from app.database.models import Source
+from app.database.models import Source, SyncCheckpoint
 from app.database.session import SessionLocal
 from app.services.email_matcher import email_matcher_service
 from app.services.gmail_auth import gmail_auth_service
+from app.services.llm_client import get_llm_client, run_sync
 
 logger = logging.getLogger(__name__)
 
 # Gmail API quota retry config
 MAX_RETRIES = 5
 RETRY_BASE_SECONDS = 1  # Doubles each attempt: 1, 2, 4, 8, 16
+RETRYABLE_STATUS_CODES = (429, 500, 503)
+
+# Gmail quota cost of one messages.get call
+MESSAGE_GET_QUOTA_UNITS = 5
+
+# sync_checkpoints row holding the last synced mailbox historyId
+HISTORY_CHECKPOINT = "gmail_history_id"
+
+# sync_checkpoints rows "<prefix><message id>" -> failed attempts of a message to retry
+FAILED_MESSAGE_PREFIX = "gmail_failed:"
+
+# Cycles a failing message is retried in before it is given up
+MAX_MESSAGE_ATTEMPTS = 5
+
+# Summary stage retries of a Source whose summary failed
+SUMMARY_MAX_ATTEMPTS = 5
+SUMMARY_RETRY_BASE_SECONDS = 300  # Doubles after each failure: 5, 10, 20, 40 min
+
+# Labels of new messages the incremental sync ignores (is:unread excludes them too)
+EXCLUDED_LABELS = {"SPAM", "TRASH", "DRAFT", "SENT"}
 
 
 class HTMLStripper(HTMLParser):
@@ -64,30 +119,45 @@ class GmailPollerService:
     - Match emails to projects (delegated to EmailMatcherService)
     - Deduplicate by thread ID + message ID
     - Create Source records with status='pending'
-    - Generate AI one-line summaries via Claude
+    - Generate AI one-line summaries via Claude (summary stage, after polling)
     - Respect Gmail API quotas with exponential backoff
     """
 
     def __init__(self):
-        self.anthropic = Anthropic(api_key=settings.anthropic_api_key)
         self._api_call_count = 0
+        self._http_request_count = 0
+        self._sync_mode = "full"
+        # Label registry: label id -> name, loaded at (monotonic time)
+        self._label_names: Optional[dict[str, str]] = None
+        self._labels_loaded_at = 0.0
+        self._labels_refreshed = False
+        # Summary stage: source id -> (failed attempts, monotonic time of next retry)
+        self._summary_failures: dict = {}
 
     def run_poll_cycle(self) -> dict:
         """
         Execute one complete polling cycle.
 
         Returns:
-            dict with keys: emails_fetched, emails_stored, emails_skipped, errors
+            dict with keys: emails_fetched, emails_stored, emails_skipped, errors,
+            api_calls (Gmail API calls, batched ones included),
+            http_requests (HTTP round trips),
+            sync_mode ("incremental" or "full")
         """
         stats = {
             "emails_fetched": 0,
             "emails_stored": 0,
             "emails_skipped": 0,
             "errors": 0,
+            "api_calls": 0,
+            "http_requests": 0,
+            "sync_mode": "full",
         }
 
         logger.info("GmailPoller: Starting poll cycle")
         self._api_call_count = 0
+        self._http_request_count = 0
+        self._labels_refreshed = False
 
         try:
             service = gmail_auth_service.get_service()
@@ -96,26 +166,51 @@ class GmailPollerService:
             stats["errors"] += 1
             return stats
 
-        # Fetch message list from Gmail
+        db = SessionLocal()
         try:
-            messages = self._list_messages(service)
-        except Exception as e:
-            logger.error(f"GmailPoller: Failed to list messages: {e}")
-            stats["errors"] += 1
-            return stats
+            # Fetch new message stubs (since the checkpoint, or all unread)
+            start_history_id = self._load_history_id(db)
+            try:
+                messages, history_id = self._sync_messages(service, start_history_id)
+            except Exception as e:
+                logger.error(f"GmailPoller: Failed to list messages: {e}")
+                stats["errors"] += 1
+                return self._with_api_stats(stats)
+
+            # Messages that failed in earlier cycles are retried alongside
+            failed_attempts = self._load_failed_messages(db)
+            listed = {m["id"] for m in messages}
+            messages = messages + [{"id": i} for i in failed_attempts if i not in listed]
+
+            stats["emails_fetched"] = len(messages)
+            stats["sync_mode"] = self._sync_mode
+            logger.info(
+                f"GmailPoller: Fetched {len(messages)} messages "
+                f"({self._sync_mode} sync, API calls: {self._api_call_count})"
+            )
 
-        stats["emails_fetched"] = len(messages)
-        logger.info(
-            f"GmailPoller: Fetched {len(messages)} messages "
-            f"(API calls: {self._api_call_count})"
-        )
+            # Skip messages stored by earlier cycles before downloading them
+            known = self._stored_message_ids(db, messages)
+            if known:
+                stats["emails_skipped"] += len(known)
+                messages = [m for m in messages if m["id"] not in known]
+                logger.info(f"GmailPoller: Skipping {len(known)} already stored messages")
 
-        # Process each message
-        db = SessionLocal()
-        try:
+            # Fetch full messages in batches
+            try:
+                fetched = self._fetch_messages(service, [m["id"] for m in messages])
+            except Exception as e:
+                logger.error(f"GmailPoller: Batch fetch failed, fetching one by one: {e}")
+                fetched = {}
+
+            # Process each message
+            failed: dict[str, int] = {}
             for msg_stub in messages:
                 try:
-                    stored = self._process_message(service, db, msg_stub["id"])
+                    msg = fetched.get(msg_stub["id"])
+                    if isinstance(msg, Exception):
+                        raise msg
+                    stored = self._process_message(service, db, msg_stub["id"], msg)
                     if stored:
                         stats["emails_stored"] += 1
                     else:
@@ -125,6 +220,17 @@ class GmailPollerService:
                         f"GmailPoller: Error processing message {msg_stub['id']}: {e}"
                     )
                     stats["errors"] += 1
+                    attempts = failed_attempts.get(msg_stub["id"], 0) + 1
+                    if attempts < MAX_MESSAGE_ATTEMPTS:
+                        failed[msg_stub["id"]] = attempts
+                    else:
+                        logger.error(
+                            f"GmailPoller: Giving up on message {msg_stub['id']} "
+                            f"after {attempts} attempts"
+                        )
+
+            # Failed messages are retried by id, so the checkpoint always advances
+            self._save_sync_state(db, history_id, failed)
         finally:
             db.close()
 
@@ -133,10 +239,180 @@ class GmailPollerService:
             f"stored={stats['emails_stored']}, "
             f"skipped={stats['emails_skipped']}, "
             f"errors={stats['errors']}, "
-            f"total_api_calls={self._api_call_count}"
+            f"total_api_calls={self._api_call_count}, "
+            f"http_requests={self._http_request_count}"
         )
+        return self._with_api_stats(stats)
+
+    def _with_api_stats(self, stats: dict) -> dict:
+        stats["api_calls"] = self._api_call_count
+        stats["http_requests"] = self._http_request_count
         return stats
 
+    def _load_history_id(self, db: Session) -> Optional[str]:
+        """Return the stored historyId checkpoint, or None to run a full sync."""
+        if not settings.gmail_incremental_sync:
+            return None
+        try:
+            checkpoint = db.get(SyncCheckpoint, HISTORY_CHECKPOINT)
+        except Exception as e:
+            logger.warning(f"GmailPoller: Could not load sync checkpoint: {e}")
+            db.rollback()
+            return None
+        return checkpoint.value if checkpoint else None
+
+    def _load_failed_messages(self, db: Session) -> dict[str, int]:
+        """Return message id -> failed attempts of the messages to retry this cycle."""
+        if not settings.gmail_incremental_sync:
+            return {}
+        try:
+            rows = (
+                db.query(SyncCheckpoint.name, SyncCheckpoint.value)
+                .filter(SyncCheckpoint.name.startswith(FAILED_MESSAGE_PREFIX))
+                .all()
+            )
+        except Exception as e:
+            logger.warning(f"GmailPoller: Could not load failed messages: {e}")
+            db.rollback()
+            return {}
+        return {name[len(FAILED_MESSAGE_PREFIX):]: int(value) for name, value in rows}
+
+    def _save_sync_state(
+        self, db: Session, history_id: Optional[str], failed: dict[str, int]
+    ) -> None:
+        """Store the historyId the next cycle syncs from and the messages it retries."""
+        if not settings.gmail_incremental_sync:
+            return
+        try:
+            db.query(SyncCheckpoint).filter(
+                SyncCheckpoint.name.startswith(FAILED_MESSAGE_PREFIX)
+            ).delete(synchronize_session=False)
+            db.add_all(
+                SyncCheckpoint(name=FAILED_MESSAGE_PREFIX + message_id, value=str(attempts))
+                for message_id, attempts in failed.items()
+            )
+            if history_id:
+                db.merge(SyncCheckpoint(name=HISTORY_CHECKPOINT, value=str(history_id)))
+            db.commit()
+        except Exception as e:
+            logger.error(f"GmailPoller: Could not save sync checkpoint: {e}")
+            db.rollback()
+
+    def _sync_messages(
+        self, service, start_history_id: Optional[str]
+    ) -> tuple[list[dict], Optional[str]]:
+        """
+        Fetch the message stubs to process this cycle.
+
+        Lists the history since start_history_id when there is one; falls
+        back to listing unread messages when there is none or Gmail no
+        longer has it (HTTP 404, history older than about a week).
+
+        Returns:
+            (list of {id, threadId} dicts, historyId to checkpoint)
+        """
+        if start_history_id:
+            try:
+                messages, history_id = self._list_history(service, start_history_id)
+                self._sync_mode = "incremental"
+                return messages, history_id
+            except HttpError as e:
+                if e.status_code != 404:
+                    raise
+                logger.warning(
+                    f"GmailPoller: History checkpoint {start_history_id} expired, "
+                    f"running a full sync"
+                )
+
+        self._sync_mode = "full"
+        history_id = None
+        if settings.gmail_incremental_sync:
+            # Read before listing so messages arriving meanwhile are in the next cycle
+            profile = self._call_gmail_api(service.users().getProfile, userId="me")
+            history_id = profile.get("historyId")
+        return self._list_messages(service), history_id
+
+    def _list_history(
+        self, service, start_history_id: str
+    ) -> tuple[list[dict], Optional[str]]:
+        """
+        List messages added or labelled since start_history_id (users.history.list).
+
+        Keeps unread messages outside spam/trash/drafts/sent (the filter the
+        full listing applies), restricted to GMAIL_LABEL_FILTER if set.
+        labelAdded records are included, so mail that gets the filter label
+        (or is marked unread) after it arrived is picked up like a full
+        listing would. Every match is returned; GMAIL_MAX_RESULTS_PER_POLL is
+        the page size.
+
+        Returns:
+            (list of {id, threadId} dicts, mailbox historyId after the last page)
+        """
+        params = {
+            "userId": "me",
+            "startHistoryId": start_history_id,
+            "historyTypes": ["messageAdded", "labelAdded"],
+            "maxResults": settings.gmail_max_results_per_poll,
+        }
+        if settings.gmail_label_filter:
+            label_id = self._label_id(service, settings.gmail_label_filter)
+            if label_id is None:
+                logger.warning(
+                    f"GmailPoller: Label '{settings.gmail_label_filter}' not found"
+                )
+                return [], None
+            params["labelId"] = label_id
+
+        messages: dict[str, dict] = {}
+        history_id = None
+        while True:
+            response = self._call_gmail_api(service.users().history().list, **params)
+            history_id = response.get("historyId", history_id)
+            for record in response.get("history", []):
+                changes = record.get("messagesAdded", []) + record.get("labelsAdded", [])
+                for change in changes:
+                    msg = change.get("message", {})
+                    label_ids = set(msg.get("labelIds", []))
+                    if "UNREAD" not in label_ids or label_ids & EXCLUDED_LABELS:
+                        continue
+                    messages.setdefault(
+                        msg["id"], {"id": msg["id"], "threadId": msg.get("threadId")}
+                    )
+            if not response.get("nextPageToken"):
+                break
+            params["pageToken"] = response["nextPageToken"]
+
+        return list(messages.values()), history_id
+
+    def _label_id(self, service, label_name: str) -> Optional[str]:
+        """Resolve a Gmail label name to its ID (None if the mailbox has no such label)."""
+        for _ in range(2):
+            for label_id, name in self._label_registry(service).items():
+                if name == label_name:
+                    return label_id
+            if not self._refresh_labels():
+                break
+        return None
+
+    def _label_registry(self, service) -> dict[str, str]:
+        """Label id -> name map, reloaded with labels.list once it is older than the TTL."""
+        age = time.monotonic() - self._labels_loaded_at
+        if self._label_names is None or age >= settings.gmail_label_cache_ttl_seconds:
+            response = self._call_gmail_api(service.users().labels().list, userId="me")
+            self._label_names = {
+                label["id"]: label.get("name", "") for label in response.get("labels", [])
+            }
+            self._labels_loaded_at = time.monotonic()
+        return self._label_names
+
+    def _refresh_labels(self) -> bool:
+        """Drop the registry so the next lookup reloads it; at most once per cycle."""
+        if self._labels_refreshed:
+            return False
+        self._labels_refreshed = True
+        self._label_names = None
+        return True
+
     def _list_messages(self, service) -> list[dict]:
         """
         Fetch list of unread message stubs from Gmail.
@@ -160,19 +436,96 @@ class GmailPollerService:
 
         return response.get("messages", [])
 
-    def _process_message(self, service, db: Session, message_id: str) -> bool:
+    def _fetch_messages(self, service, message_ids: list[str]) -> dict:
         """
-        Fetch full message, match to project, deduplicate, and store.
+        Fetch full messages with Gmail batch HTTP requests.
+
+        Each batch carries up to GMAIL_BATCH_SIZE messages.get calls in one
+        round trip. Batches are paced so their quota cost stays under
+        GMAIL_QUOTA_UNITS_PER_SECOND; sub-requests failing with 429/5xx are
+        retried in a new batch with exponential backoff.
+
+        Returns:
+            message_id -> message dict, or the HttpError it failed with.
+            Messages missing from the result are fetched individually.
+        """
+        results: dict = {}
+        pending = list(message_ids)
+        batch_size = max(1, min(settings.gmail_batch_size, 100))
+
+        for attempt in range(MAX_RETRIES):
+            retry: list[str] = []
+            on_response = partial(self._collect_response, results, retry)
+
+            for start in range(0, len(pending), batch_size):
+                chunk = pending[start:start + batch_size]
+                batch = service.new_batch_http_request(callback=on_response)
+                for message_id in chunk:
+                    batch.add(
+                        service.users().messages().get(
+                            userId="me", id=message_id, format="full"
+                        ),
+                        request_id=message_id,
+                    )
+                self._execute_batch(batch, len(chunk))
+
+            if not retry or attempt == MAX_RETRIES - 1:
+                break
+            wait_seconds = RETRY_BASE_SECONDS * (2**attempt)
+            logger.warning(
+                f"GmailPoller: {len(retry)} batched requests throttled/failed on "
+                f"attempt {attempt + 1}/{MAX_RETRIES}. Retrying in {wait_seconds}s..."
+            )
+            time.sleep(wait_seconds)
+            pending = retry
+
+        return results
+
+    @staticmethod
+    def _collect_response(
+        results: dict, retry: list[str], request_id, response, exception
+    ) -> None:
+        """Batch callback: record the message or error, queue 429/5xx for retry."""
+        if exception is None:
+            results[request_id] = response
+            return
+        results[request_id] = exception
+        if isinstance(exception, HttpError) and (
+            exception.status_code in RETRYABLE_STATUS_CODES
+        ):
+            retry.append(request_id)
+
+    def _execute_batch(self, batch, size: int) -> None:
+        """Execute one batch request (retrying the whole batch on 429/5xx), paced for quota."""
+        started = time.monotonic()
+        self._api_call_count += size
+        self._execute_with_retry(batch.execute)
+
+        # Spread batches so their quota cost stays under the per-second limit
+        min_seconds = size * MESSAGE_GET_QUOTA_UNITS / settings.gmail_quota_units_per_second
+        remaining = min_seconds - (time.monotonic() - started)
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def _process_message(
+        self, service, db: Session, message_id: str, msg: Optional[dict] = None
+    ) -> bool:
+        """
+        Match a message to a project, deduplicate, and store.
+
+        Args:
+            msg: Full message already fetched in a batch; fetched here if None.
 
         Returns True if a Source record was created, False if skipped.
         """
         # Fetch full message from Gmail
-        msg = self._call_gmail_api(
-            service.users().messages().get,
-            userId="me",
-            id=message_id,
-            format="full",
-        )
+        if msg is None:
+            msg = self._call_gmail_api(
+                service.users().messages().get,
+                userId="me",
+                id=message_id,
+                format="full",
+            )
 
         # Extract headers
         headers = {
@@ -226,9 +579,6 @@ class GmailPollerService:
             )
             return False
 
-        # Generate AI summary
-        ai_summary = self._generate_summary(subject, raw_content)
-
         # Create Source record
         source = Source(
             id=uuid4(),
@@ -238,7 +588,7 @@ class GmailPollerService:
             occurred_at=occurred_at,
             ingestion_status="pending",
             raw_content=raw_content,
-            ai_summary=ai_summary,
+            ai_summary=None,  # Filled in by run_summary_stage
             email_from=email_from,
             email_to=email_to,
             email_cc=email_cc,
@@ -255,6 +605,30 @@ class GmailPollerService:
         )
         return True
 
+    def _stored_message_ids(self, db: Session, messages: list[dict]) -> set[str]:
+        """
+        Return the ids of listed messages that already have a Source.
+
+        Bulk form of _is_duplicate: one query with webhook_id IN (...),
+        matching the thread too when the stub carries its threadId.
+        """
+        if not messages:
+            return set()
+        stubs = {m["id"]: m.get("threadId") for m in messages}
+        rows = (
+            db.query(Source.webhook_id, Source.email_thread_id)
+            .filter(
+                Source.webhook_id.in_(list(stubs)),
+                Source.source_type == "email",
+            )
+            .all()
+        )
+        return {
+            message_id
+            for message_id, thread_id in rows
+            if stubs[message_id] in (None, thread_id)
+        }
+
     def _is_duplicate(self, db: Session, thread_id: str, message_id: str) -> bool:
         """
         Check if a Source record already exists for this message.
@@ -272,7 +646,96 @@ class GmailPollerService:
         )
         return existing is not None
 
-    def _generate_summary(self, subject: str, body: str) -> Optional[str]:
+    def run_summary_stage(self, limit: Optional[int] = None) -> dict:
+        """
+        Summarise pending email Sources that have no AI summary yet.
+
+        Claude calls run concurrently on the shared LLM client (bounded by
+        LLM_MAX_CONCURRENCY); the summaries are written in one commit at the
+        end. Sources whose summary failed are skipped until their backoff
+        expires, and for good after SUMMARY_MAX_ATTEMPTS failures.
+
+        Args:
+            limit: Max Sources per run (default GMAIL_SUMMARY_BATCH_SIZE)
+
+        Returns:
+            dict with keys: summarized, failed
+        """
+        stats = {"summarized": 0, "failed": 0}
+        db = SessionLocal()
+        try:
+            query = db.query(Source).filter(
+                Source.source_type == "email",
+                Source.ingestion_status == "pending",
+                Source.ai_summary.is_(None),
+                Source.raw_content.isnot(None),
+                Source.raw_content != "",
+            )
+            deferred = self._deferred_summaries()
+            if deferred:
+                query = query.filter(Source.id.notin_(deferred))
+            sources = (
+                query.order_by(Source.created_at.desc())
+                .limit(limit or settings.gmail_summary_batch_size)
+                .all()
+            )
+            if not sources:
+                return stats
+
+            logger.info(f"GmailPoller: Summarising {len(sources)} emails")
+            summaries = run_sync(
+                self._generate_summaries([(s.title, s.raw_content) for s in sources])
+            )
+            for source, summary in zip(sources, summaries, strict=True):
+                if summary is None:
+                    stats["failed"] += 1
+                    self._record_summary_failure(source.id)
+                    continue
+                source.ai_summary = summary
+                self._summary_failures.pop(source.id, None)
+                stats["summarized"] += 1
+            db.commit()
+        except Exception as e:
+            logger.error(f"GmailPoller: Summary stage failed: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+        logger.info(
+            f"GmailPoller: Summary stage complete -- "
+            f"summarized={stats['summarized']}, failed={stats['failed']}"
+        )
+        return stats
+
+    def _deferred_summaries(self) -> list:
+        """Ids of Sources whose summary is backing off or has been given up."""
+        now = time.monotonic()
+        return [
+            source_id
+            for source_id, (attempts, retry_at) in self._summary_failures.items()
+            if attempts >= SUMMARY_MAX_ATTEMPTS or retry_at > now
+        ]
+
+    def _record_summary_failure(self, source_id) -> None:
+        """Count a failed summary and schedule its retry with exponential backoff."""
+        attempts = self._summary_failures.get(source_id, (0, 0.0))[0] + 1
+        retry_at = time.monotonic() + SUMMARY_RETRY_BASE_SECONDS * (2 ** (attempts - 1))
+        self._summary_failures[source_id] = (attempts, retry_at)
+        if attempts >= SUMMARY_MAX_ATTEMPTS:
+            logger.error(
+                f"GmailPoller: Giving up on the summary of source {source_id} "
+                f"after {attempts} attempts"
+            )
+
+    async def _generate_summaries(
+        self, emails: list[tuple[str, str]]
+    ) -> list[Optional[str]]:
+        """Run _generate_summary for (subject, body) pairs concurrently, in order."""
+        return await asyncio.gather(
+            *(self._generate_summary(subject, body) for subject, body in emails)
+        )
+
+    async def _generate_summary(self, subject: str, body: str) -> Optional[str]:
         """
         Generate a one-line AI summary of the email using Claude.
 
@@ -285,7 +748,9 @@ class GmailPollerService:
             # Truncate body to avoid excessive token usage
             truncated_body = body[:3000] if len(body) > 3000 else body
 
-            response = self.anthropic.messages.create(
+            response = await get_llm_client().create_message(
+                prompt_version="email_summary@v1",
+                validate=lambda r: r.content[0].text.strip(),
                 model="claude-3-5-sonnet-20241022",
                 max_tokens=100,
                 temperature=0.0,
@@ -394,7 +859,8 @@ class GmailPollerService:
         """
         Resolve Gmail label IDs to human-readable label names.
 
-        System labels (INBOX, UNREAD, etc.) are excluded.
+        System labels (INBOX, UNREAD, etc.) are excluded. Names come from the
+        cached label registry; unknown ids are skipped.
         """
         system_labels = {
             "INBOX",
@@ -410,21 +876,26 @@ class GmailPollerService:
             "CATEGORY_UPDATES",
             "CATEGORY_FORUMS",
         }
+        custom_ids = [label_id for label_id in label_ids if label_id not in system_labels]
+        if not custom_ids:
+            return []
+        try:
+            labels = self._label_registry(service)
+            # Labels created since the registry was loaded
+            if any(label_id not in labels for label_id in custom_ids) and (
+                self._refresh_labels()
+            ):
+                labels = self._label_registry(service)
+        except Exception as e:
+            logger.debug(f"GmailPoller: Could not load labels: {e}")
+            return []
+
         names = []
-        for label_id in label_ids:
-            if label_id in system_labels:
-                continue
-            try:
-                label_info = self._call_gmail_api(
-                    service.users().labels().get,
-                    userId="me",
-                    id=label_id,
-                )
-                names.append(label_info.get("name", ""))
-            except Exception as e:
-                logger.debug(
-                    f"GmailPoller: Could not resolve label {label_id}: {e}"
-                )
+        for label_id in custom_ids:
+            if label_id in labels:
+                names.append(labels[label_id])
+            else:
+                logger.debug(f"GmailPoller: Could not resolve label {label_id}")
         return names
 
     def _call_gmail_api(self, method, **kwargs):
@@ -443,13 +914,23 @@ class GmailPollerService:
             HttpError: If all retries exhausted
         """
         self._api_call_count += 1
+        return self._execute_with_retry(method(**kwargs).execute)
+
+    def _execute_with_retry(self, execute):
+        """
+        Run one HTTP round trip with exponential backoff on 429/500/503.
+
+        Raises:
+            HttpError: If all retries exhausted or the error is not retryable
+        """
         last_error = None
 
         for attempt in range(MAX_RETRIES):
             try:
-                return method(**kwargs).execute()
+                self._http_request_count += 1
+                return execute()
             except HttpError as e:
-                if e.status_code in (429, 500, 503):
+                if e.status_code in RETRYABLE_STATUS_CODES:
                     wait_seconds = RETRY_BASE_SECONDS * (2**attempt)
                     logger.warning(
                         f"GmailPoller: API error {e.status_code} on attempt "
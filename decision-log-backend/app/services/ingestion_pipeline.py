@@ -3,18 +3,64 @@
 Story 7.1: Base pipeline for meeting transcripts.
 Story 10.1: Added email source handling via EmailExtractor.
 Story 10.2: Added document source handling via DocumentExtractor.
+
+Uploaded documents first pass through prepare_document_source(), which
+extracts text and generates the AI summary before the source enters the
+review queue.
+
+Processing runs extract -> enrich (batched embeddings, see
+enrichment_service.embed_project_items) -> store in one transaction.
+
+Extraction is async end to end and shares the process-wide LLM client
+(app/services/llm_client.py); process_approved_sources() extracts a batch of
+sources concurrently, bounded by the client's concurrency limit.
 """
 
 import asyncio
 import logging
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session, joinedload
 
 from app.database.models import ProjectItem, ProjectParticipant, Source
 from app.database.session import SessionLocal
+from app.services.llm_client import run_sync
 
 logger = logging.getLogger(__name__)
 
 
 def process_approved_source(source_id: str) -> None:
+    """Synchronous entry point (job handler) for process_approved_source_async()."""
+    run_sync(process_approved_source_async(source_id))
+
+
+def process_approved_sources(source_ids: List[str]) -> Dict[str, Optional[str]]:
+    """Synchronous entry point for process_approved_sources_async()."""
+    return run_sync(process_approved_sources_async(source_ids))
+
+
+async def process_approved_sources_async(
+    source_ids: List[str],
+) -> Dict[str, Optional[str]]:
+    """Process several approved sources concurrently.
+
+    Each source runs in its own session; in-flight Claude requests are capped
+    by the shared LLM client's semaphore.
+
+    Returns:
+        Mapping of source_id -> None on success, or the error message.
+    """
+    results = await asyncio.gather(
+        *(process_approved_source_async(source_id) for source_id in source_ids),
+        return_exceptions=True,
+    )
+    return {
+        str(source_id): (str(result) if isinstance(result, Exception) else None)
+        for source_id, result in zip(source_ids, results, strict=True)
+    }
+
+
+async def process_approved_source_async(source_id: str) -> None:
     """Process an approved source and extract project items.
 
     Dispatches to the appropriate extractor based on source_type:
@@ -22,29 +68,29 @@ def process_approved_source(source_id: str) -> None:
     - 'document' -> DocumentExtractor
     - 'meeting' -> extraction_v2 transcript extractor (legacy)
 
+    Runs inside an ingestion worker (app/worker.py). Failures are rolled back
+    and re-raised so the job queue can retry the source.
+
+    Database work runs in worker threads (asyncio.to_thread) so it never
+    blocks the shared LLM event loop; only the Claude calls are awaited there.
+    The session is used by one thread at a time.
+
     Args:
         source_id: UUID string of the Source record to process.
     """
     db = SessionLocal()
     try:
-        source = db.query(Source).filter(Source.id == source_id).first()
-        if not source:
-            return
-        if source.ingestion_status != "approved":
+        loaded = await asyncio.to_thread(_load_source, db, source_id)
+        if loaded is None:
             return
-
-        participants = (
-            db.query(ProjectParticipant)
-            .filter_by(project_id=source.project_id)
-            .all()
-        )
+        source, participants = loaded
 
         # Story 10.1: Email source handling
         if source.source_type == "email":
             from app.services.email_extractor import EmailExtractor
 
             extractor = EmailExtractor(db)
-            extracted_items = extractor.extract(source, list(participants))
+            extracted_items = await extractor.aextract(source, list(participants))
 
         # Story 10.2: Document source handling
         elif source.source_type == "document":
@@ -60,25 +106,24 @@ def process_approved_source(source_id: str) -> None:
                 for p in participants
             ]
             extractor = DocumentExtractor(db)
-            extracted_items = extractor.extract(source, participant_dicts)
+            extracted_items = await extractor.aextract(source, participant_dicts)
 
         else:
             # Existing meeting extraction (Story 7.1)
             from app.services.extraction_v2 import extract_items_from_transcript
 
-            extracted_items = asyncio.run(
-                extract_items_from_transcript(
-                    transcript_text=source.raw_content or "",
-                    participants=[
-                        {"name": p.name, "discipline": p.discipline}
-                        for p in participants
-                    ],
-                    project_id=str(source.project_id),
-                    source_id=str(source.id),
-                )
+            extracted_items = await extract_items_from_transcript(
+                transcript_text=source.raw_content or "",
+                meeting_title=source.title or "Untitled Meeting",
+                meeting_date=str(source.occurred_at or ""),
+                participants=[
+                    {"name": p.name, "discipline": p.discipline}
+                    for p in participants
+                ],
             )
 
         # Store extracted items
+        items = []
         for item_data in extracted_items:
             if isinstance(item_data, dict):
                 item = ProjectItem(
@@ -103,11 +148,119 @@ def process_approved_source(source_id: str) -> None:
                     confidence=item_data.get("confidence"),
                 )
                 db.add(item)
+                items.append(item)
+
+        # Enrichment stage: embed all of the source's items in one batch
+        await _embed_items(source_id, items)
 
         source.ingestion_status = "processed"
-        db.commit()
+        await asyncio.to_thread(db.commit)
     except Exception as e:
         logger.error(f"Error processing source {source_id}: {e}")
-        db.rollback()
+        await asyncio.to_thread(db.rollback)
+        raise
+    finally:
+        await asyncio.to_thread(db.close)
+
+
+def _load_source(
+    db: Session, source_id: str
+) -> Optional[Tuple[Source, List[ProjectParticipant]]]:
+    """Load an approved source (with its project) and the project's participants.
+
+    Returns None if the source is missing or not approved.
+    """
+    source = (
+        db.query(Source)
+        .options(joinedload(Source.project))
+        .filter(Source.id == source_id)
+        .first()
+    )
+    if not source or source.ingestion_status != "approved":
+        return None
+    participants = (
+        db.query(ProjectParticipant)
+        .filter_by(project_id=source.project_id)
+        .all()
+    )
+    return source, participants
+
+
+async def _embed_items(source_id: str, items: List[ProjectItem]) -> None:
+    """Attach embeddings to a source's new items before they are committed.
+
+    Embedding failures are logged, not raised: items are still stored (with a
+    null embedding) and picked up by the backfill command
+    (python -m app.services.embedding_backfill).
+    """
+    from app.services.enrichment_service import embed_project_items
+
+    try:
+        # Model inference is CPU-bound; keep the shared event loop responsive
+        embedded = await asyncio.to_thread(embed_project_items, items)
+    except Exception as e:
+        logger.error(f"Embedding failed for source {source_id}: {e}")
+        return
+    if embedded < len(items):
+        logger.warning(f"Stored {len(items) - embedded} item(s) without embeddings for source {source_id}")
+
+
+def prepare_document_source(source_id: str) -> None:
+    """Synchronous entry point (job handler) for prepare_document_source_async()."""
+    run_sync(prepare_document_source_async(source_id))
+
+
+def _load_preparing_source(db: Session, source_id: str) -> Optional[Source]:
+    """Load a document source awaiting preparation (None if missing or already prepared)."""
+    source = db.query(Source).filter(Source.id == source_id).first()
+    if not source or source.ingestion_status != "preparing":
+        return None
+    return source
+
+
+async def prepare_document_source_async(source_id: str) -> None:
+    """Extract text and generate the AI summary for an uploaded document.
+
+    The upload endpoint stores the file and creates the Source with
+    ingestion_status='preparing'. This stage fills raw_content/ai_summary and
+    moves the source to 'pending' (admin review), or to 'failed' if the file
+    yields no text. Transient errors are re-raised so the job is retried.
+
+    As in process_approved_source_async, database work and text extraction
+    run in worker threads; only the summary call is awaited on the loop.
+
+    Args:
+        source_id: UUID string of the Source record to prepare.
+    """
+    from app.services.document_processor import DocumentProcessor
+    from app.services.summary_service import summarize_document_text
+
+    db = SessionLocal()
+    try:
+        source = await asyncio.to_thread(_load_preparing_source, db, source_id)
+        if source is None:
+            return
+
+        # pdfplumber is CPU-bound; keep the shared event loop responsive
+        raw_text = await asyncio.to_thread(
+            DocumentProcessor().extract_text_from_file,
+            source.file_url,
+            source.file_type or "",
+        )
+        if not raw_text:
+            logger.warning(f"No text extracted from document source {source_id}")
+            source.ingestion_status = "failed"
+            await asyncio.to_thread(db.commit)
+            return
+
+        source.raw_content = raw_text
+        source.ai_summary = await summarize_document_text(raw_text)
+        source.ingestion_status = "pending"
+        await asyncio.to_thread(db.commit)
+        logger.info(f"Document source {source_id} prepared ({len(raw_text)} chars)")
+    except Exception as e:
+        logger.error(f"Error preparing document source {source_id}: {e}")
+        await asyncio.to_thread(db.rollback)
+        raise
     finally:
-        db.close()
+        await asyncio.to_thread(db.close)
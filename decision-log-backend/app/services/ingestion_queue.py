@@ -0,0 +1,293 @@
+"""Durable ingestion job queue backed by the ingestion_jobs table.
+
+Replaces FastAPI BackgroundTasks for source processing: jobs survive API
+restarts and are executed by one or more worker processes (app/worker.py).
+
+Claiming uses a lease (locked_until). A worker that crashes mid-job simply
+stops renewing its lease, and the job becomes claimable again once the lease
+expires. On PostgreSQL, claims use FOR UPDATE SKIP LOCKED so concurrent
+workers never contend for the same row; every claim is additionally guarded
+by a conditional UPDATE so SQLite (no row locks) stays correct.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database.models import IngestionJob
+
+logger = logging.getLogger(__name__)
+
+# Job types (dispatched by app.worker.JOB_HANDLERS)
+JOB_PROCESS_SOURCE = "process_source"
+JOB_PREPARE_DOCUMENT = "prepare_document"  # Text extraction + summary after upload
+
+ACTIVE_STATUSES = ("queued", "running")
+
+
+def enqueue_job(
+    db: Session,
+    source_id,
+    job_type: str = JOB_PROCESS_SOURCE,
+    max_attempts: Optional[int] = None,
+) -> IngestionJob:
+    """Add a job to the queue (idempotent per source + job type).
+
+    Does not commit — the caller commits, so enqueueing is atomic with the
+    state change that triggered it (e.g. a source being approved).
+
+    Args:
+        db: Database session
+        source_id: UUID of the Source the job operates on
+        job_type: Handler name (see JOB_* constants)
+        max_attempts: Override settings.ingestion_job_max_attempts
+
+    Returns:
+        The new job, or the already queued/running job for the same source.
+    """
+    existing = (
+        db.query(IngestionJob)
+        .filter(
+            IngestionJob.source_id == source_id,
+            IngestionJob.job_type == job_type,
+            IngestionJob.status.in_(ACTIVE_STATUSES),
+        )
+        .first()
+    )
+    if existing:
+        return existing
+
+    now = datetime.utcnow()
+    job = IngestionJob(
+        source_id=source_id,
+        job_type=job_type,
+        status="queued",
+        attempts=0,
+        max_attempts=max_attempts or settings.ingestion_job_max_attempts,
+        run_after=now,
+        created_at=now,
+        updated_at=now,
+    )
+    db.add(job)
+    db.flush()  # Make the job visible to idempotency checks in this transaction
+    return job
+
+
+def _claimable(now: datetime):
+    """Filter for jobs a worker may claim: due queued jobs or expired leases."""
+    return or_(
+        and_(IngestionJob.status == "queued", IngestionJob.run_after <= now),
+        and_(
+            IngestionJob.status == "running",
+            IngestionJob.locked_until < now,
+            IngestionJob.attempts < IngestionJob.max_attempts,
+        ),
+    )
+
+
+def _fail_exhausted_leases(db: Session, now: datetime) -> int:
+    """Mark jobs whose lease expired on their final attempt as failed."""
+    return (
+        db.query(IngestionJob)
+        .filter(
+            IngestionJob.status == "running",
+            IngestionJob.locked_until < now,
+            IngestionJob.attempts >= IngestionJob.max_attempts,
+        )
+        .update(
+            {
+                IngestionJob.status: "failed",
+                IngestionJob.last_error: "Lease expired on final attempt",
+                IngestionJob.locked_by: None,
+                IngestionJob.locked_until: None,
+                IngestionJob.finished_at: now,
+                IngestionJob.updated_at: now,
+            },
+            synchronize_session=False,
+        )
+    )
+
+
+def claim_job(
+    db: Session,
+    worker_id: str,
+    lease_seconds: Optional[int] = None,
+) -> Optional[IngestionJob]:
+    """Claim the next due job for a worker.
+
+    Args:
+        db: Database session
+        worker_id: Unique identifier of the claiming worker slot
+        lease_seconds: Lease length (defaults to settings.ingestion_job_lease_seconds)
+
+    Returns:
+        The claimed job (status='running', attempts incremented), or None.
+    """
+    lease = lease_seconds or settings.ingestion_job_lease_seconds
+    now = datetime.utcnow()
+
+    if _fail_exhausted_leases(db, now):
+        db.commit()
+
+    query = (
+        db.query(IngestionJob)
+        .filter(_claimable(now))
+        .order_by(IngestionJob.run_after, IngestionJob.created_at)
+        .limit(1)
+    )
+    if db.get_bind().dialect.name == "postgresql":
+        query = query.with_for_update(skip_locked=True)
+
+    job = query.first()
+    if job is None:
+        db.rollback()
+        return None
+
+    # Conditional update: only succeeds if nobody claimed the job in between
+    claimed = (
+        db.query(IngestionJob)
+        .filter(IngestionJob.id == job.id, _claimable(now))
+        .update(
+            {
+                IngestionJob.status: "running",
+                IngestionJob.attempts: IngestionJob.attempts + 1,
+                IngestionJob.locked_by: worker_id,
+                IngestionJob.locked_until: now + timedelta(seconds=lease),
+                IngestionJob.updated_at: now,
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    if not claimed:
+        return None
+
+    db.refresh(job)
+    logger.info(
+        f"IngestionQueue: {worker_id} claimed job {job.id} "
+        f"({job.job_type}, source={job.source_id}, attempt {job.attempts}/{job.max_attempts})"
+    )
+    return job
+
+
+def extend_lease(
+    db: Session,
+    job_id,
+    worker_id: str,
+    lease_seconds: Optional[int] = None,
+) -> bool:
+    """Renew a running job's lease. Returns False if the worker lost the lease."""
+    lease = lease_seconds or settings.ingestion_job_lease_seconds
+    now = datetime.utcnow()
+    renewed = (
+        db.query(IngestionJob)
+        .filter(
+            IngestionJob.id == job_id,
+            IngestionJob.status == "running",
+            IngestionJob.locked_by == worker_id,
+        )
+        .update(
+            {
+                IngestionJob.locked_until: now + timedelta(seconds=lease),
+                IngestionJob.updated_at: now,
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return bool(renewed)
+
+
+def complete_job(db: Session, job_id, worker_id: str) -> bool:
+    """Mark a job as succeeded. Returns False if the worker no longer held the lease."""
+    now = datetime.utcnow()
+    updated = (
+        db.query(IngestionJob)
+        .filter(
+            IngestionJob.id == job_id,
+            IngestionJob.status == "running",
+            IngestionJob.locked_by == worker_id,
+        )
+        .update(
+            {
+                IngestionJob.status: "succeeded",
+                IngestionJob.locked_by: None,
+                IngestionJob.locked_until: None,
+                IngestionJob.last_error: None,
+                IngestionJob.finished_at: now,
+                IngestionJob.updated_at: now,
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return bool(updated)
+
+
+def fail_job(
+    db: Session,
+    job_id,
+    worker_id: str,
+    error: str,
+    retry_delay_seconds: Optional[int] = None,
+) -> str:
+    """Record a failed attempt.
+
+    The job is re-queued with a linear backoff while attempts remain,
+    otherwise it is marked failed.
+
+    Returns:
+        The job's new status ('queued' or 'failed'), or '' if the lease was lost.
+    """
+    delay = (
+        retry_delay_seconds
+        if retry_delay_seconds is not None
+        else settings.ingestion_job_retry_delay_seconds
+    )
+    job = (
+        db.query(IngestionJob)
+        .filter(
+            IngestionJob.id == job_id,
+            IngestionJob.status == "running",
+            IngestionJob.locked_by == worker_id,
+        )
+        .first()
+    )
+    if job is None:
+        db.rollback()
+        return ""
+
+    now = datetime.utcnow()
+    job.last_error = error[:2000]
+    job.locked_by = None
+    job.locked_until = None
+    job.updated_at = now
+    if job.attempts < job.max_attempts:
+        job.status = "queued"
+        job.run_after = now + timedelta(seconds=delay * job.attempts)
+    else:
+        job.status = "failed"
+        job.finished_at = now
+    db.commit()
+
+    logger.warning(
+        f"IngestionQueue: job {job.id} attempt {job.attempts}/{job.max_attempts} "
+        f"failed -> {job.status}: {error}"
+    )
+    return job.status
+
+
+def queue_stats(db: Session) -> dict:
+    """Return job counts per status (for admin monitoring)."""
+    rows = (
+        db.query(IngestionJob.status, func.count(IngestionJob.id))
+        .group_by(IngestionJob.status)
+        .all()
+    )
+    stats = {status: 0 for status in ("queued", "running", "succeeded", "failed")}
+    stats.update(dict(rows))
+    return stats
@@ -0,0 +1,83 @@
+"""Facet counts for project item lists, computed with SQL aggregates.
+
+Each facet is one GROUP BY query that returns one row per group, so the
+cost of a request grows with the number of groups, not the number of items.
+affected_disciplines (a JSON array) is unnested with
+jsonb_array_elements_text on PostgreSQL and json_each on SQLite.
+
+Facets are disjunctive: each one applies every active filter except its
+own, so selecting item_type=decision still shows the counts of the other
+item types (under the remaining filters).
+"""
+
+from typing import Dict, Mapping
+
+from sqlalchemy import cast, func, select, true
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.database.models import ProjectItem
+
+
+def _conditions(project_id: str, filters: Mapping[str, ColumnElement], exclude: str) -> list:
+    return [ProjectItem.project_id == project_id] + [
+        condition for dimension, condition in filters.items() if dimension != exclude
+    ]
+
+
+def _scalar_facet(db: Session, column, default: str, conditions: list) -> Dict[str, int]:
+    value = func.coalesce(column, default)
+    rows = db.execute(
+        select(value, func.count()).where(*conditions).group_by(value)
+    ).all()
+    return dict(rows)
+
+
+def _discipline_facet(db: Session, conditions: list) -> Dict[str, int]:
+    if db.get_bind().dialect.name == "postgresql":
+        elements = (
+            func.jsonb_array_elements_text(cast(ProjectItem.affected_disciplines, JSONB))
+            .table_valued("value")
+            .lateral()
+        )
+    else:
+        elements = func.json_each(ProjectItem.affected_disciplines).table_valued("value")
+
+    rows = db.execute(
+        select(elements.c.value, func.count())
+        .select_from(ProjectItem)
+        .join(elements, true())
+        .where(*conditions)
+        .group_by(elements.c.value)
+    ).all()
+    return dict(rows)
+
+
+def compute_item_facets(
+    db: Session,
+    project_id: str,
+    filters: Mapping[str, ColumnElement] = None,
+) -> Dict[str, Dict[str, int]]:
+    """Count a project's items by item_type, source_type and discipline.
+
+    Args:
+        db: Database session.
+        project_id: Project to count.
+        filters: Active filter conditions keyed by dimension ("item_type",
+            "source_type", "discipline", or any other key for filters that
+            apply to every facet).
+
+    Returns:
+        {"item_types": {...}, "source_types": {...}, "disciplines": {...}}
+    """
+    filters = filters or {}
+    return {
+        "item_types": _scalar_facet(
+            db, ProjectItem.item_type, "decision", _conditions(project_id, filters, "item_type")
+        ),
+        "source_types": _scalar_facet(
+            db, ProjectItem.source_type, "meeting", _conditions(project_id, filters, "source_type")
+        ),
+        "disciplines": _discipline_facet(db, _conditions(project_id, filters, "discipline")),
+    }
@@ -0,0 +1,310 @@
+"""Semantic and lexical search over project items.
+
+Semantic: queries are embedded with the same model as the items
+(enrichment_service.encode_texts) and ranked by cosine distance. On
+PostgreSQL the ANN query runs on project_items.embedding through the HNSW
+index (idx_project_items_embedding_hnsw, migration 006); elsewhere it runs
+on the in-process NumPy index (app/services/vector_index.py). Both backends
+return the same shape of results (VECTOR_SEARCH_BACKEND selects one).
+
+The HNSW index covers all projects and the project/type filters are applied
+to its candidates, so a small project in a large table can get few or no
+rows from a plain scan. Iterative scans (VECTOR_SEARCH_ITERATIVE_SCAN) keep
+the index scan going until the page is filled, and a page that still comes
+back short is re-run as an exact scan over the project's rows.
+
+Lexical: full-text search through app/database/full_text.py (tsvector + GIN
+on PostgreSQL, FTS5 on SQLite), ranked by the backend's relevance score.
+
+Hybrid: both retrievals run concurrently and are fused with reciprocal rank
+fusion, score = sum(1 / (HYBRID_SEARCH_RRF_K + rank)) over the lists an item
+appears in; each result keeps its per-retrieval rank and score.
+
+Filtered queries are laid out like the items' embedding text
+(build_embedding_text): a single item_type filter fills the Type slot and
+discipline filters the Disciplines slot; other queries are embedded as typed.
+"""
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import or_, text
+from sqlalchemy.orm import Query, Session, joinedload
+
+from app.config import settings
+from app.database.full_text import text_match, text_rank
+from app.database.models import ProjectItem
+from app.services import vector_index
+from app.services.enrichment_service import (
+    EMBEDDING_TEXT_SEPARATOR,
+    disciplines_label,
+    encode_texts,
+    type_label,
+)
+
+logger = logging.getLogger(__name__)
+
+ITERATIVE_SCAN_MODES = ("off", "strict_order", "relaxed_order")
+
+
+class SemanticSearchUnavailableError(Exception):
+    """Raised when no embedding model or vector backend is available."""
+
+
+@dataclass
+class ItemFilters:
+    """Optional filters shared by the item search backends."""
+
+    item_types: List[str] = field(default_factory=list)
+    source_types: List[str] = field(default_factory=list)
+    disciplines: List[str] = field(default_factory=list)
+
+
+def query_embedding_text(query_text: str, filters: Optional[ItemFilters] = None) -> str:
+    """Lay out a search query like an item's embedding text.
+
+    Only the slots a query can fill are added: Type for a single item_type
+    filter and Disciplines for discipline filters, formatted by the helpers
+    build_embedding_text uses. An unfiltered query is embedded as typed.
+    """
+    filters = filters or ItemFilters()
+    parts = [query_text]
+    if len(filters.item_types) == 1:
+        parts.append(type_label(filters.item_types[0]))
+    if filters.disciplines:
+        parts.append(disciplines_label(filters.disciplines))
+    return EMBEDDING_TEXT_SEPARATOR.join(parts)
+
+
+def embed_query(query_text: str, filters: Optional[ItemFilters] = None) -> List[float]:
+    """Embed a search query with the item embedding model."""
+    vectors = encode_texts([query_embedding_text(query_text, filters)])
+    if vectors is None:
+        raise SemanticSearchUnavailableError("No embedding model available")
+    return vectors[0].tolist()
+
+
+def apply_item_filters(query: Query, filters: ItemFilters) -> Query:
+    """Apply item_type / source_type / discipline filters (OR within each)."""
+    if filters.item_types:
+        query = query.filter(ProjectItem.item_type.in_(filters.item_types))
+    if filters.source_types:
+        query = query.filter(ProjectItem.source_type.in_(filters.source_types))
+    if filters.disciplines:
+        query = query.filter(
+            or_(*(ProjectItem.affected_disciplines.contains([d]) for d in filters.disciplines))
+        )
+    return query
+
+
+def build_semantic_query(
+    db: Session,
+    project_id: str,
+    vector: Sequence[float],
+    filters: ItemFilters,
+    limit: int,
+) -> Query:
+    """Build the pgvector ANN query: ORDER BY embedding <=> :vector LIMIT :limit."""
+    distance = ProjectItem.embedding.cosine_distance(vector)
+    query = (
+        db.query(ProjectItem, distance.label("distance"))
+        .options(joinedload(ProjectItem.source))
+        .filter(
+            ProjectItem.project_id == project_id,
+            ProjectItem.embedding.isnot(None),
+        )
+    )
+    return apply_item_filters(query, filters).order_by(distance).limit(limit)
+
+
+def search_backend(db: Session) -> str:
+    """Resolve VECTOR_SEARCH_BACKEND ("auto" -> pgvector on PostgreSQL, else numpy)."""
+    backend = settings.vector_search_backend
+    if backend == "auto":
+        return "pgvector" if db.get_bind().dialect.name == "postgresql" else "numpy"
+    return backend
+
+
+def _pgvector_search(db, project_id, vector, filters, limit) -> List[Tuple[ProjectItem, float]]:
+    if db.get_bind().dialect.name != "postgresql":
+        raise SemanticSearchUnavailableError("pgvector search requires PostgreSQL")
+
+    ef_search = max(settings.vector_search_ef_search, limit)
+    db.execute(text(f"SET LOCAL hnsw.ef_search = {int(ef_search)}"))
+    iterative_scan = settings.vector_search_iterative_scan
+    if iterative_scan not in ITERATIVE_SCAN_MODES:
+        raise ValueError(f"Invalid VECTOR_SEARCH_ITERATIVE_SCAN: {iterative_scan!r}")
+    if iterative_scan != "off":
+        db.execute(text(f"SET LOCAL hnsw.iterative_scan = {iterative_scan}"))
+
+    query = build_semantic_query(db, project_id, vector, filters, limit)
+    rows = query.all()
+    if len(rows) < limit:
+        # Either the project has fewer matches, or the HNSW scan stopped
+        # (hnsw.max_scan_tuples, iterative scans off) before reaching them:
+        # rank the project's rows exactly (project_id index, no HNSW)
+        db.execute(text("SET LOCAL enable_indexscan = off"))
+        try:
+            rows = query.all()
+        finally:
+            db.execute(text("SET LOCAL enable_indexscan = on"))
+    # relaxed_order may return neighbours slightly out of order
+    rows = sorted(rows, key=lambda row: row[1])
+    return [(item, 1.0 - float(distance)) for item, distance in rows]
+
+
+def _numpy_search(db, project_id, vector, filters, limit) -> List[Tuple[ProjectItem, float]]:
+    hits = vector_index.registry.get(db, project_id).search(
+        vector,
+        limit,
+        item_types=filters.item_types,
+        source_types=filters.source_types,
+        disciplines=filters.disciplines,
+    )
+    if not hits:
+        return []
+    items = {
+        str(item.id): item
+        for item in db.query(ProjectItem)
+        .options(joinedload(ProjectItem.source))
+        .filter(ProjectItem.id.in_([item_id for item_id, _ in hits]))
+        .all()
+    }
+    return [(items[item_id], score) for item_id, score in hits if item_id in items]
+
+
+def semantic_search(
+    db: Session,
+    project_id: str,
+    query_text: str,
+    filters: Optional[ItemFilters] = None,
+    limit: int = 20,
+) -> List[Tuple[ProjectItem, float]]:
+    """Return the items closest to query_text, best first.
+
+    Returns:
+        List of (item, score) pairs, score = cosine similarity in [-1, 1].
+
+    Raises:
+        SemanticSearchUnavailableError: no embedding model, or pgvector was
+            requested on a database without it.
+    """
+    filters = filters or ItemFilters()
+    vector = embed_query(query_text, filters)
+    return vector_search(db, project_id, vector, filters, limit)
+
+
+def vector_search(
+    db: Session,
+    project_id: str,
+    vector: Sequence[float],
+    filters: ItemFilters,
+    limit: int,
+) -> List[Tuple[ProjectItem, float]]:
+    """Return the items closest to an already embedded query, best first."""
+    if search_backend(db) == "pgvector":
+        return _pgvector_search(db, project_id, vector, filters, limit)
+    return _numpy_search(db, project_id, vector, filters, limit)
+
+
+def lexical_search(
+    db: Session,
+    project_id: str,
+    query_text: str,
+    filters: Optional[ItemFilters] = None,
+    limit: int = 20,
+) -> List[Tuple[ProjectItem, float]]:
+    """Return the items matching query_text by full-text search, best first.
+
+    Returns:
+        List of (item, score) pairs; score is ts_rank_cd on PostgreSQL and
+        -bm25 on SQLite (higher is better, not comparable across backends).
+    """
+    filters = filters or ItemFilters()
+    rank = text_rank(db, ProjectItem, query_text).label("rank")
+    query = (
+        db.query(ProjectItem, rank)
+        .options(joinedload(ProjectItem.source))
+        .filter(
+            ProjectItem.project_id == project_id,
+            text_match(db, ProjectItem, query_text),
+        )
+    )
+    rows = apply_item_filters(query, filters).order_by(rank.desc(), ProjectItem.id).limit(limit).all()
+    return [(item, float(score or 0.0)) for item, score in rows]
+
+
+@dataclass
+class RetrievalHit:
+    """Position of an item in one retrieval's results (rank is 1-based)."""
+
+    rank: int
+    score: float
+
+
+@dataclass
+class HybridResult:
+    """One fused result with its per-retrieval breakdown."""
+
+    item: ProjectItem
+    score: float
+    lexical: Optional[RetrievalHit] = None
+    semantic: Optional[RetrievalHit] = None
+
+
+def reciprocal_rank_fusion(
+    lexical: List[Tuple[ProjectItem, float]],
+    semantic: List[Tuple[ProjectItem, float]],
+    k: int = 60,
+) -> List[HybridResult]:
+    """Fuse two ranked lists: score = sum of 1 / (k + rank), best first."""
+    fused: Dict[str, HybridResult] = {}
+    for name, results in (("lexical", lexical), ("semantic", semantic)):
+        for rank, (item, score) in enumerate(results, start=1):
+            result = fused.setdefault(str(item.id), HybridResult(item=item, score=0.0))
+            result.score += 1.0 / (k + rank)
+            setattr(result, name, RetrievalHit(rank=rank, score=score))
+    return sorted(fused.values(), key=lambda r: (-r.score, str(r.item.id)))
+
+
+async def hybrid_search(
+    db: Session,
+    project_id: str,
+    query_text: str,
+    filters: Optional[ItemFilters] = None,
+    limit: int = 20,
+) -> List[HybridResult]:
+    """Full-text and vector retrieval run concurrently, fused with RRF.
+
+    Each retrieval returns up to HYBRID_SEARCH_CANDIDATES items. The query
+    embedding (CPU) overlaps the full-text query; the session is used by
+    one thread at a time. Without an embedding model or vector backend the
+    results are the full-text ones alone.
+    """
+    filters = filters or ItemFilters()
+    depth = max(limit, settings.hybrid_search_candidates)
+    db_lock = threading.Lock()
+
+    def lexical():
+        with db_lock:
+            return lexical_search(db, project_id, query_text, filters, depth)
+
+    def semantic():
+        try:
+            vector = embed_query(query_text, filters)
+            with db_lock:
+                return vector_search(db, project_id, vector, filters, depth)
+        except SemanticSearchUnavailableError as e:
+            logger.warning(f"Hybrid search without vector retrieval: {e}")
+            return []
+
+    lexical_results, semantic_results = await asyncio.gather(
+        asyncio.to_thread(lexical), asyncio.to_thread(semantic)
+    )
+    fused = reciprocal_rank_fusion(
+        lexical_results, semantic_results, settings.hybrid_search_rrf_k
+    )
+    return fused[:limit]
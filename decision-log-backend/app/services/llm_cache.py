@@ -0,0 +1,271 @@
+"""Content-addressed cache for Claude responses.
+
+Re-approving a source, re-running a poll or retrying a job after a crash
+sends byte-identical prompts again. Responses are stored in a local SQLite
+file keyed by a SHA-256 of (model, prompt template version, rendered
+messages, max_tokens, sampling params), so replays cost neither API spend nor
+latency.
+
+Only deterministic calls (temperature=0) are cached, and only responses that
+completed (stop_reason other than max_tokens) and passed the caller's
+validate() check, so a truncated or unparseable answer is never replayed to
+a retry.
+
+Entries expire after LLM_CACHE_TTL_SECONDS and the least recently used ones
+are evicted beyond LLM_CACHE_MAX_ENTRIES. Hit/miss counters are kept per
+process and exposed via GET /api/admin/llm-cache.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Run LRU eviction after this many writes (not on every insert)
+_EVICT_EVERY = 100
+
+
+@dataclass
+class CachedResponse:
+    """Cached stand-in for an anthropic Message (text content only)."""
+
+    text: str
+    stop_reason: Optional[str] = None
+
+    @property
+    def content(self) -> List[SimpleNamespace]:
+        return [SimpleNamespace(type="text", text=self.text)]
+
+
+def make_cache_key(
+    model: str,
+    messages: List[Dict[str, Any]],
+    max_tokens: int,
+    prompt_version: Optional[str] = None,
+    **params: Any,
+) -> str:
+    """Hash everything that determines the response into a cache key."""
+    payload = {
+        "model": model,
+        "prompt_version": prompt_version or "",
+        "messages": messages,
+        "max_tokens": max_tokens,
+        "params": params,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def is_cacheable_call(params: Dict[str, Any]) -> bool:
+    """Whether a request is deterministic enough to replay (temperature=0)."""
+    return params.get("temperature") == 0
+
+
+def is_cacheable_response(
+    response: Any, validate: Optional[Callable[[Any], Any]] = None
+) -> bool:
+    """Whether a response may be stored: complete and accepted by validate()."""
+    if getattr(response, "stop_reason", None) == "max_tokens":
+        return False
+    if validate is None:
+        return True
+    try:
+        return bool(validate(response))
+    except Exception:
+        return False
+
+
+class LLMCache:
+    """SQLite-backed response store with TTL and LRU size bounds.
+
+    Safe to share between threads of a process; several processes may use
+    the same file (SQLite WAL mode).
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_seconds: Optional[int] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.path = path or settings.llm_cache_path
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.llm_cache_ttl_seconds
+        self.max_entries = max_entries or settings.llm_cache_max_entries
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    stop_reason TEXT,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_responses_accessed "
+                "ON llm_responses (accessed_at)"
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached response for key, or None (expired entries count as misses)."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, stop_reason, created_at FROM llm_responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row and now - row[2] <= self.ttl_seconds:
+                self._conn.execute(
+                    "UPDATE llm_responses SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+                self._conn.commit()
+                self.hits += 1
+                return CachedResponse(text=row[0], stop_reason=row[1])
+            if row:
+                self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                self._conn.commit()
+            self.misses += 1
+            return None
+
+    def put(self, key: str, model: str, response: Any) -> None:
+        """Store the text of a Messages API response."""
+        try:
+            text = response.content[0].text
+        except (AttributeError, IndexError, TypeError):
+            return
+        if not isinstance(text, str):
+            return
+        stop_reason = getattr(response, "stop_reason", None)
+        if not isinstance(stop_reason, str):
+            stop_reason = None
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses "
+                "(key, model, response, stop_reason, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, text, stop_reason, now, now),
+            )
+            self.writes += 1
+            if self.writes % _EVICT_EVERY == 0:
+                self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then the least recently used beyond max_entries."""
+        expired = self._conn.execute(
+            "DELETE FROM llm_responses WHERE created_at < ?", (now - self.ttl_seconds,)
+        ).rowcount
+        excess = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0] - self.max_entries
+        lru = 0
+        if excess > 0:
+            lru = self._conn.execute(
+                "DELETE FROM llm_responses WHERE key IN ("
+                "SELECT key FROM llm_responses ORDER BY accessed_at LIMIT ?)",
+                (excess,),
+            ).rowcount
+        self.evictions += expired + lru
+
+    def evict(self) -> None:
+        """Run TTL/size eviction now."""
+        with self._lock:
+            self._evict(time.time())
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Delete all entries and reset counters."""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses")
+            self._conn.commit()
+            self.hits = self.misses = self.writes = self.evictions = 0
+
+    def stats(self) -> dict:
+        """Return hit/miss counters (this process) and the current entry count."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "enabled": True,
+            "path": self.path,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+        }
+
+
+_cache: Optional[LLMCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """Return the process-wide cache, or None when LLM_CACHE_ENABLED is false."""
+    global _cache
+    if not settings.llm_cache_enabled:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    _cache = LLMCache()
+                except (sqlite3.Error, OSError) as e:
+                    logger.error(f"LLMCache: could not open {settings.llm_cache_path}: {e}")
+                    return None
+    return _cache
+
+
+def cached_create(
+    create: Callable[..., Any],
+    *,
+    model: str,
+    max_tokens: int,
+    messages: List[Dict[str, Any]],
+    prompt_version: Optional[str] = None,
+    validate: Optional[Callable[[Any], Any]] = None,
+    **params: Any,
+):
+    """Call a synchronous messages.create through the cache.
+
+    For callers that own a sync Anthropic client; async code should use
+    LLMClient.create_message, which caches the same way.
+    """
+    cache = get_llm_cache() if is_cacheable_call(params) else None
+    key = None
+    if cache is not None:
+        key = make_cache_key(model, messages, max_tokens, prompt_version, **params)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    response = create(model=model, max_tokens=max_tokens, messages=messages, **params)
+    if cache is not None and is_cacheable_response(response, validate):
+        cache.put(key, model, response)
+    return response
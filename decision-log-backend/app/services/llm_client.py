@@ -0,0 +1,208 @@
+"""Shared async Claude client for all LLM calls.
+
+One AsyncAnthropic client (and its pooled HTTP connections) is reused for every
+request made from an event loop, and a semaphore bounds the number of requests
+in flight so batch processing cannot exceed the API rate limits.
+
+Sync callers (ingestion worker threads, the extractors' extract() wrappers)
+use run_sync(), which executes coroutines on a single long-lived background
+event loop. That way the client, its keep-alive connections and the
+concurrency limit are shared across all threads of a process instead of being
+rebuilt per call by asyncio.run().
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+import httpx
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
+
+from app.config import settings
+from app.services.llm_cache import (
+    get_llm_cache,
+    is_cacheable_call,
+    is_cacheable_response,
+    make_cache_key,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "claude-sonnet-4-20250514"
+
+T = TypeVar("T")
+
+
+class LLMClient:
+    """Process-wide AsyncAnthropic wrapper with bounded concurrency.
+
+    asyncio primitives and httpx connection pools are bound to the event loop
+    that created them, so the client/semaphore pair is created lazily once per
+    loop and cached for the lifetime of that loop.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        max_connections: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+    ):
+        self.api_key = api_key or settings.anthropic_api_key
+        self.max_concurrency = max_concurrency or settings.llm_max_concurrency
+        self.max_connections = max_connections or settings.llm_max_connections
+        self.max_retries = max_retries if max_retries is not None else settings.llm_max_retries
+        self.timeout_seconds = timeout_seconds or settings.llm_timeout_seconds
+        self._states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[AsyncAnthropic, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def _state(self) -> Tuple[AsyncAnthropic, asyncio.Semaphore]:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._states.get(loop)
+            if state is None:
+                http_client = DefaultAsyncHttpxClient(
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                    ),
+                )
+                client = AsyncAnthropic(
+                    api_key=self.api_key,
+                    max_retries=self.max_retries,
+                    timeout=self.timeout_seconds,
+                    http_client=http_client,
+                )
+                state = (client, asyncio.Semaphore(self.max_concurrency))
+                self._states[loop] = state
+            return state
+
+    async def create_message(
+        self,
+        prompt: Optional[str] = None,
+        *,
+        messages: Optional[List[Dict[str, Any]]] = None,
+        model: str = DEFAULT_MODEL,
+        max_tokens: int = 4096,
+        prompt_version: Optional[str] = None,
+        use_cache: bool = True,
+        validate: Optional[Callable[[Any], Any]] = None,
+        **kwargs: Any,
+    ):
+        """Send a Messages API request, waiting for a free concurrency slot.
+
+        Identical temperature=0 requests are served from the response cache
+        (llm_cache.py) when it is enabled. Cache reads and writes run in a
+        worker thread so the SQLite I/O never blocks the event loop.
+
+        Args:
+            prompt: Single user prompt (shorthand for messages=[{"role": "user", ...}])
+            messages: Full message list (takes precedence over prompt)
+            model: Claude model name
+            max_tokens: Output token limit
+            prompt_version: Version of the prompt template, part of the cache key
+            use_cache: Set False to always call the API
+            validate: Called with the response; it is cached only if this
+                returns truthy (e.g. the caller's parser accepts it)
+            **kwargs: Passed through to messages.create (system, temperature, ...)
+
+        Returns:
+            The anthropic Message response, or a CachedResponse on a cache hit.
+        """
+        if messages is None:
+            messages = [{"role": "user", "content": prompt or ""}]
+
+        cache = get_llm_cache() if use_cache and is_cacheable_call(kwargs) else None
+        key = None
+        if cache is not None:
+            key = make_cache_key(model, messages, max_tokens, prompt_version, **kwargs)
+            cached = await asyncio.to_thread(cache.get, key)
+            if cached is not None:
+                return cached
+
+        client, semaphore = self._state()
+        async with semaphore:
+            response = await client.messages.create(
+                model=model,
+                max_tokens=max_tokens,
+                messages=messages,
+                **kwargs,
+            )
+        if cache is not None and is_cacheable_response(response, validate):
+            await asyncio.to_thread(cache.put, key, model, response)
+        return response
+
+    async def complete(self, prompt: str, **kwargs: Any) -> str:
+        """Send a single-prompt request and return the text of the first content block."""
+        response = await self.create_message(prompt, **kwargs)
+        return response.content[0].text
+
+    async def aclose(self) -> None:
+        """Close the client bound to the current event loop, if any."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._states.pop(loop, None)
+        if state is not None:
+            await state[0].close()
+
+
+_llm_client: Optional[LLMClient] = None
+_llm_client_lock = threading.Lock()
+
+
+def get_llm_client() -> LLMClient:
+    """Return the process-wide LLMClient, creating it on first use."""
+    global _llm_client
+    if _llm_client is None:
+        with _llm_client_lock:
+            if _llm_client is None:
+                _llm_client = LLMClient()
+    return _llm_client
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Sync bridge
+# ──────────────────────────────────────────────────────────────────────────────
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Start (once per process) the event loop that serves sync callers."""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        with _loop_lock:
+            if _loop is None or _loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="llm-event-loop",
+                    daemon=True,
+                )
+                thread.start()
+                _loop = loop
+    return _loop
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """Run a coroutine on the shared background loop and wait for its result.
+
+    Safe to call from any number of threads concurrently; their requests are
+    multiplexed over the shared client and limited by its semaphore. Must not
+    be called from a coroutine already running on the background loop.
+    """
+    loop = _background_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_sync() called from the LLM event loop; await the coroutine instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
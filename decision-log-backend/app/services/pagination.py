@@ -0,0 +1,259 @@
+"""Opaque cursors for keyset pagination, and optional/estimated totals.
+
+A cursor carries the sort-key values of the last row of a page (ending with
+the row id as a tie-breaker). The next page continues strictly after that
+row, so deep pages cost the same as the first one and rows inserted while
+paging do not shift later pages the way OFFSET does. NULL sort values order
+highest on every backend (PostgreSQL's default, so plain b-tree indexes
+serve both directions). The "after the cursor" condition is a row-value
+comparison where possible, so a composite index on the sort columns serves
+it as a range scan (SQLite datetimes are stored in one format for this, see
+app/database/models.py).
+
+Listings accept count=exact|estimated|none: "estimated" reads the planner's
+row estimate on PostgreSQL (EXPLAIN, no scan) and is exact elsewhere.
+"""
+
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any, List, Literal, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, false, literal, or_, tuple_
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+CountMode = Literal["exact", "estimated", "none"]
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def _encode_value(value: Any):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _decode_value(value: Any):
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode sort-key values (datetimes, UUIDs, strings, numbers, None)."""
+    payload = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _check_type(value: Any, expected: Optional[type]):
+    """Coerce a decoded cursor value to expected, or raise ValueError."""
+    if value is None or expected is None:
+        return value
+    if expected is uuid.UUID:
+        if not isinstance(value, str):
+            raise ValueError("expected a UUID string")
+        return uuid.UUID(value)
+    if expected is float:
+        expected = (int, float)
+    if isinstance(value, bool) or not isinstance(value, expected):
+        raise ValueError(f"unexpected cursor value type {type(value).__name__}")
+    return value
+
+
+def decode_cursor(cursor: str, size: int, types: Optional[Sequence[Optional[type]]] = None) -> List[Any]:
+    """Decode a cursor produced by encode_cursor with `size` values.
+
+    Args:
+        types: Expected Python type of each value (None: unchecked); UUID
+            strings are returned as uuid.UUID.
+
+    Raises:
+        InvalidCursorError: Malformed cursor, wrong number of values or a
+            value of the wrong type.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError("unexpected cursor shape")
+        values = [_decode_value(v) for v in values]
+        if types is not None:
+            values = [_check_type(v, t) for v, t in zip(values, types, strict=True)]
+        return values
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from e
+
+
+def _nullable(column) -> bool:
+    return getattr(getattr(column, "expression", column), "nullable", True)
+
+
+def _python_type(column) -> Optional[type]:
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        return None
+
+
+def keyset_after(columns: Sequence, values: Sequence, descending: bool = True):
+    """Condition selecting rows strictly after `values` in (columns...) order.
+
+    With non-NULL values this is the row-value comparison (a, b) < (x, y),
+    which PostgreSQL and SQLite serve as a range scan of a composite index on
+    the same columns. NULLs order highest, so NULL cursor values and
+    ascending order over a nullable column (NULL rows are still to come)
+    use the expanded a > x OR (a = x AND b > y) form instead, bounded by
+    a <= x / a >= x on the leading column where that holds.
+    """
+    if None not in values and (descending or not any(_nullable(c) for c in columns)):
+        keys = tuple_(*columns)
+        bounds = tuple_(*(literal(v, c.type) for c, v in zip(columns, values, strict=True)))
+        return keys < bounds if descending else keys > bounds
+
+    clauses, equal = [], []
+    for column, value in zip(columns, values, strict=True):
+        if value is None:
+            step = column.isnot(None) if descending else false()
+            same = column.is_(None)
+        else:
+            if descending:
+                step = column < value
+            elif _nullable(column):
+                step = or_(column > value, column.is_(None))
+            else:
+                step = column > value
+            same = column == value
+        clauses.append(and_(*equal, step))
+        equal.append(same)
+    condition = or_(*clauses)
+
+    # Redundant range bound on the leading column, usable by an index
+    leading, value = columns[0], values[0]
+    if value is not None and descending:
+        condition = and_(leading <= value, condition)
+    elif value is not None and not _nullable(leading):
+        condition = and_(leading >= value, condition)
+    return condition
+
+
+def keyset_order(columns: Sequence, descending: bool = True) -> list:
+    """ORDER BY clauses matching keyset_after (NULLs highest)."""
+    order = []
+    for column in columns:
+        if descending:
+            order.append(column.desc().nulls_first() if _nullable(column) else column.desc())
+        else:
+            order.append(column.asc().nulls_last() if _nullable(column) else column.asc())
+    return order
+
+
+def apply_keyset(
+    query: Query,
+    columns: Sequence,
+    descending: bool,
+    cursor: Optional[str] = None,
+    scope: str = "",
+) -> Query:
+    """Order query by columns and, given a cursor, continue after it.
+
+    Raises:
+        InvalidCursorError: Malformed cursor or one from another sort mode.
+    """
+    query = query.order_by(*keyset_order(columns, descending))
+    if cursor:
+        values = decode_cursor(cursor, len(columns) + 1, [str] + [_python_type(c) for c in columns])
+        if values[0] != scope:
+            raise InvalidCursorError("Cursor does not match the requested sort")
+        query = query.filter(keyset_after(columns, values[1:], descending))
+    return query
+
+
+def row_cursor(entity, columns: Sequence, scope: str = "") -> str:
+    """Cursor continuing after entity (an ORM object exposing columns)."""
+    return encode_cursor(scope, *(getattr(entity, c.key) for c in columns))
+
+
+def paginate(
+    query: Query,
+    columns: Sequence,
+    descending: bool,
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    scope: str = "",
+) -> Tuple[list, Optional[str]]:
+    """Fetch one page ordered by columns (last one must be unique, e.g. id).
+
+    Args:
+        query: Filtered query; its first entity must expose `columns`.
+        columns: Sort key columns.
+        descending: Sort direction.
+        limit: Page size.
+        offset: Used only for the first page when no cursor is given.
+        cursor: next_cursor from the previous page.
+        scope: Sort mode tag stored in the cursor; a cursor from another
+            sort mode is rejected.
+
+    Returns:
+        (rows, next_cursor); next_cursor is None on the last page.
+
+    Raises:
+        InvalidCursorError: Malformed cursor or one from another sort mode.
+    """
+    query = apply_keyset(query, columns, descending, cursor, scope)
+    if offset and not cursor:
+        query = query.offset(offset)
+
+    # One extra row tells whether another page exists
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, row_cursor(last[0] if isinstance(last, Row) else last, columns, scope)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Totals
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) <statement>, compiled with normal bind params."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def estimate_count(db: Session, query: Query) -> int:
+    """Planner row estimate for query on PostgreSQL; exact count elsewhere."""
+    if db.get_bind().dialect.name != "postgresql":
+        return query.count()
+    plan = db.execute(_Explain(query.statement)).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_rows(db: Session, query: Query, mode: CountMode = "exact") -> Optional[int]:
+    """Total for a listing: exact, estimated, or None when not requested."""
+    if mode == "none":
+        return None
+    if mode == "estimated":
+        return estimate_count(db, query)
+    return query.count()
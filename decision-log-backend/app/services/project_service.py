@@ -1,25 +1,26 @@
 """Project service for querying and filtering projects."""
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import func
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session
 
-from app.database.models import Project, ProjectItem, ProjectMember, User
+from app.database.models import Project, ProjectItem, ProjectMember, ProjectStat, Transcript, User
+from app.database.project_stats import ALL_DISCIPLINES
+from app.services.access_control import (  # noqa: F401 (re-exported)
+    PermissionDeniedError,
+    ProjectNotFoundError,
+    authorize_project,
+)
+from app.services.pagination import apply_keyset, encode_cursor
 
 # Backward compatibility alias
 Decision = ProjectItem
 
-
-class ProjectNotFoundError(Exception):
-    """Raised when project is not found."""
-    pass
-
-
-class PermissionDeniedError(Exception):
-    """Raised when user doesn't have access to project."""
-    pass
+# Project list order (newest first); id breaks ties for keyset pagination
+PROJECT_SORT = [Project.created_at, Project.id]
+PROJECT_CURSOR_SCOPE = "created_at:desc"
 
 
 def get_projects(
@@ -28,19 +29,30 @@ def get_projects(
     limit: int = 50,
     offset: int = 0,
     archived: bool = False,
+    cursor: Optional[str] = None,
 ) -> Tuple[List[Dict], int]:
     """
     Get all projects accessible to user with pagination.
 
+    The page is fetched in one query: member and item counts are correlated
+    subqueries over project_members and the project_stats rollup, evaluated
+    only for the returned rows. A project without rollup rows is counted
+    from project_items directly.
+
     Args:
         db: Database session
         user_id: Current user ID
         limit: Results per page (default 50)
-        offset: Pagination offset (default 0)
+        offset: Pagination offset (default 0, ignored when cursor is given)
         archived: Include archived projects (default False)
+        cursor: Keyset cursor from project_cursor() of the previous page's
+            last project (continues after it in created_at, id order)
 
     Returns:
         Tuple of (projects_list, total_count)
+
+    Raises:
+        InvalidCursorError: If cursor is malformed
     """
     user = db.query(User).filter(User.id == user_id).one()
 
@@ -64,45 +76,72 @@ def get_projects(
     # Get total count
     total_count = query.count()
 
+    member_count = (
+        select(func.count(ProjectMember.user_id))
+        .where(ProjectMember.project_id == Project.id)
+        .correlate(Project)
+        .scalar_subquery()
+    )
+    stats = (
+        select(ProjectStat)
+        .where(ProjectStat.project_id == Project.id, ProjectStat.discipline == ALL_DISCIPLINES)
+        .correlate(Project)
+    )
+    items = select(ProjectItem).where(ProjectItem.project_id == Project.id).correlate(Project)
+    # COALESCE only evaluates the live aggregate when the rollup has no rows
+    decision_count = func.coalesce(
+        stats.with_only_columns(func.sum(ProjectStat.item_count)).scalar_subquery(),
+        items.with_only_columns(func.count()).scalar_subquery(),
+    )
+    latest_decision = func.coalesce(
+        stats.with_only_columns(func.max(ProjectStat.latest_item_at)).scalar_subquery(),
+        items.with_only_columns(func.max(ProjectItem.created_at)).scalar_subquery(),
+    )
+
     # Apply sorting and pagination
-    projects = query.order_by(Project.created_at.desc()).limit(limit).offset(offset).all()
+    page = apply_keyset(
+        query.add_columns(
+            member_count.label("member_count"),
+            decision_count.label("decision_count"),
+            latest_decision.label("latest_decision"),
+        ),
+        PROJECT_SORT,
+        descending=True,
+        cursor=cursor,
+        scope=PROJECT_CURSOR_SCOPE,
+    )
+    if not cursor:
+        page = page.offset(offset)
+    rows = page.limit(limit).all()
 
     # Format response
     result = []
-    for project in projects:
-        # Count decisions and members
-        decision_count = (
-            db.query(func.count(Decision.id))
-            .filter(Decision.project_id == project.id)
-            .scalar()
-        )
-        member_count = (
-            db.query(func.count(ProjectMember.user_id))
-            .filter(ProjectMember.project_id == project.id)
-            .scalar()
-        )
-        latest_decision = (
-            db.query(func.max(Decision.created_at))
-            .filter(Decision.project_id == project.id)
-            .scalar()
-        )
-
+    for project, members, decisions, latest in rows:
         result.append(
             {
                 "id": str(project.id),
                 "name": project.name,
                 "description": project.description,
                 "created_at": project.created_at.isoformat(),
-                "member_count": member_count or 0,
-                "decision_count": decision_count or 0,
-                "latest_decision": latest_decision.isoformat() if latest_decision else None,
+                "member_count": members or 0,
+                "decision_count": decisions or 0,
+                "latest_decision": latest.isoformat() if latest else None,
             }
         )
 
     return result, total_count
 
 
-def get_project(db: Session, project_id: str, user_id: str) -> Dict:
+def project_cursor(project: Dict) -> str:
+    """Keyset cursor continuing after a project returned by get_projects."""
+    return encode_cursor(
+        PROJECT_CURSOR_SCOPE, datetime.fromisoformat(project["created_at"]), project["id"]
+    )
+
+
+def get_project(
+    db: Session, project_id: str, user_id: str, role: Optional[str] = None
+) -> Dict:
     """
     Get detailed project information with statistics.
 
@@ -110,6 +149,7 @@ def get_project(db: Session, project_id: str, user_id: str) -> Dict:
         db: Database session
         project_id: Project UUID
         user_id: Current user ID
+        role: Current user's role (looked up if omitted)
 
     Returns:
         Project details with stats
@@ -123,22 +163,11 @@ def get_project(db: Session, project_id: str, user_id: str) -> Dict:
     if not project:
         raise ProjectNotFoundError(f"Project {project_id} not found")
 
-    # Check authorization
-    user = db.query(User).filter(User.id == user_id).one()
-    if user.role != "director":
-        # Check if user is member
-        is_member = (
-            db.query(ProjectMember)
-            .filter(
-                ProjectMember.project_id == project_id,
-                ProjectMember.user_id == user_id,
-            )
-            .first()
-        )
-        if not is_member:
-            raise PermissionDeniedError(
-                f"User {user_id} doesn't have access to project {project_id}"
-            )
+    # Check authorization (cached membership sets, see access_control)
+    if role is None:
+        role = db.query(User.role).filter(User.id == user_id).scalar()
+    if role != "director":
+        authorize_project(db, project_id, user_id, role)
 
     # Get members
     members = (
@@ -158,41 +187,34 @@ def get_project(db: Session, project_id: str, user_id: str) -> Dict:
         for pm in members
     ]
 
-    # Get statistics
-    decisions = db.query(Decision).filter(Decision.project_id == project_id).all()
-
-    total_decisions = len(decisions)
-
-    # Decisions last week
+    # Get statistics (SQL aggregates; no items are loaded)
     one_week_ago = datetime.utcnow() - timedelta(days=7)
-    decisions_last_week = len(
-        [d for d in decisions if d.created_at >= one_week_ago]
-    )
+    total_decisions, decisions_last_week = db.execute(
+        select(
+            func.count(),
+            func.coalesce(func.sum(case((Decision.created_at >= one_week_ago, 1), else_=0)), 0),
+        ).where(Decision.project_id == project_id)
+    ).one()
 
     # By discipline
-    decisions_by_discipline = {}
-    for decision in decisions:
-        discipline = decision.discipline
-        decisions_by_discipline[discipline] = decisions_by_discipline.get(discipline, 0) + 1
+    decisions_by_discipline = dict(
+        db.execute(
+            select(Decision.discipline, func.count())
+            .where(Decision.project_id == project_id)
+            .group_by(Decision.discipline)
+        ).all()
+    )
 
     # By meeting type (from transcripts)
-    from app.database.models import Transcript
-    transcripts = db.query(Transcript).filter(
-        Transcript.project_id == project_id
-    ).all()
-
-    decisions_by_meeting_type = {}
-    for decision in decisions:
-        if decision.transcript_id:
-            transcript = next(
-                (t for t in transcripts if t.id == decision.transcript_id),
-                None,
-            )
-            if transcript and transcript.meeting_type:
-                meeting_type = transcript.meeting_type
-                decisions_by_meeting_type[meeting_type] = (
-                    decisions_by_meeting_type.get(meeting_type, 0) + 1
-                )
+    decisions_by_meeting_type = dict(
+        db.execute(
+            select(Transcript.meeting_type, func.count())
+            .select_from(Decision)
+            .join(Transcript, Decision.transcript_id == Transcript.id)
+            .where(Decision.project_id == project_id, Transcript.meeting_type.isnot(None))
+            .group_by(Transcript.meeting_type)
+        ).all()
+    )
 
     return {
         "id": str(project.id),
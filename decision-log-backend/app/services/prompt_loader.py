@@ -3,6 +3,7 @@
 Story 5.4: AI Extraction Prompt Evolution
 """
 
+import hashlib
 import os
 from pathlib import Path
 from typing import Dict, Optional
@@ -54,6 +55,16 @@ def render_prompt(name: str, variables: Dict[str, str], reload: bool = False) ->
     return rendered
 
 
+def prompt_version(name: str) -> str:
+    """Return a short content hash identifying the current version of a prompt.
+
+    Used in LLM response cache keys so editing a template invalidates its
+    cached responses.
+    """
+    digest = hashlib.sha256(load_prompt(name).encode("utf-8")).hexdigest()[:12]
+    return f"{name}@{digest}"
+
+
 def clear_cache():
     """Clear the prompt cache (for testing/development)."""
     _prompt_cache.clear()
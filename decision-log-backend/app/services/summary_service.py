@@ -1,16 +1,15 @@
 """AI summary generation service for ingested sources.
 
 Uses Anthropic Claude API to generate one-line summaries from source content.
-Runs as a background task — creates its own DB session.
+generate_ai_summary runs as a background task and creates its own DB session;
+summarize_document_text is awaited by the document preparation stage.
 """
 
 import logging
 
-from anthropic import Anthropic
-
-from app.config import settings
 from app.database.models import Source
 from app.database.session import SessionLocal
+from app.services.llm_client import get_llm_client, run_sync
 
 logger = logging.getLogger(__name__)
 
@@ -35,11 +34,15 @@ def generate_ai_summary(source_id: str) -> None:
         text_preview = source.raw_content[:2000]
         prompt = f"Summarize this meeting transcript in ONE sentence (max 100 words):\n\n{text_preview}"
 
-        client = Anthropic(api_key=settings.anthropic_api_key)
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=150,
-            messages=[{"role": "user", "content": prompt}],
+        response = run_sync(
+            get_llm_client().create_message(
+                prompt,
+                model="claude-sonnet-4-20250514",
+                max_tokens=150,
+                temperature=0.0,
+                prompt_version="meeting_summary@v1",
+                validate=lambda r: r.content[0].text.strip(),
+            )
         )
 
         source.ai_summary = response.content[0].text.strip()
@@ -51,3 +54,30 @@ def generate_ai_summary(source_id: str) -> None:
         db.rollback()
     finally:
         db.close()
+
+
+async def summarize_document_text(text: str) -> str:
+    """Generate a one-line AI summary from extracted document text.
+
+    Falls back to a text truncation if the API call fails.
+    """
+    snippet = text[:2000]
+    try:
+        response = await get_llm_client().create_message(
+            (
+                "Summarize the following document excerpt in one concise sentence "
+                "(max 120 characters). Return ONLY the summary, no preamble.\n\n"
+                f"{snippet}"
+            ),
+            model="claude-sonnet-4-20250514",
+            max_tokens=100,
+            temperature=0.0,
+            prompt_version="document_summary@v1",
+            validate=lambda r: r.content[0].text.strip(),
+        )
+        summary = response.content[0].text.strip()
+        return summary[:200]  # Safety cap
+    except Exception as e:
+        logger.warning(f"AI summary generation failed, using fallback: {e}")
+        # Fallback: first 200 chars of extracted text
+        return snippet[:200].strip() + ("..." if len(snippet) > 200 else "")
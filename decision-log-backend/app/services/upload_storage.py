@@ -0,0 +1,86 @@
+"""On-disk storage for uploaded and downloaded documents.
+
+Files are streamed to their final location in fixed-size chunks, so memory
+per upload stays constant regardless of file size. The size limit is enforced
+while copying; a file that exceeds it is removed before the error is raised.
+"""
+
+import os
+from typing import BinaryIO
+
+from app.config import settings
+
+COPY_CHUNK_BYTES = 1024 * 1024
+
+
+class FileTooLargeError(ValueError):
+    """Raised when a streamed file exceeds the configured size limit."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        super().__init__(f"File size exceeds {max_bytes // (1024 * 1024)}MB limit")
+
+
+def max_document_bytes() -> int:
+    """Maximum accepted document size in bytes (MAX_DOCUMENT_SIZE_MB)."""
+    return settings.max_document_size_mb * 1024 * 1024
+
+
+def document_path(project_id, file_id, ext: str) -> str:
+    """Return the storage path for a project document."""
+    return os.path.join(settings.document_upload_dir, str(project_id), f"{file_id}.{ext}")
+
+
+def save_stream(
+    src: BinaryIO,
+    dest_path: str,
+    max_bytes: int,
+    chunk_bytes: int = COPY_CHUNK_BYTES,
+) -> int:
+    """Copy a file-like object to dest_path chunk by chunk.
+
+    Returns:
+        Number of bytes written.
+
+    Raises:
+        FileTooLargeError: if more than max_bytes are read (dest_path is removed).
+    """
+    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    written = 0
+    try:
+        with open(dest_path, "wb") as dest:
+            while True:
+                chunk = src.read(chunk_bytes)
+                if not chunk:
+                    break
+                written += len(chunk)
+                if written > max_bytes:
+                    raise FileTooLargeError(max_bytes)
+                dest.write(chunk)
+    except BaseException:
+        if os.path.exists(dest_path):
+            os.remove(dest_path)
+        raise
+    return written
+
+
+class LimitedWriter:
+    """Writable file wrapper that raises FileTooLargeError past max_bytes.
+
+    Lets pull-based downloaders (e.g. googleapiclient's MediaIoBaseDownload)
+    write straight to disk with the limit enforced per chunk.
+    """
+
+    def __init__(self, fileobj: BinaryIO, max_bytes: int):
+        self._file = fileobj
+        self.max_bytes = max_bytes
+        self.written = 0
+
+    def write(self, data: bytes) -> int:
+        self.written += len(data)
+        if self.written > self.max_bytes:
+            raise FileTooLargeError(self.max_bytes)
+        return self._file.write(data)
+
+    def flush(self) -> None:
+        self._file.flush()
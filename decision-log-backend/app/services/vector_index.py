@@ -0,0 +1,390 @@
+"""In-process vector index over project item embeddings.
+
+Fallback for semantic search where pgvector is not available (SQLite test
+suite, single-box installs), and a baseline to benchmark pgvector against.
+
+Each project's embeddings live in one contiguous float32 matrix (rows are
+L2-normalized), so a top-k cosine query is a single matmul plus
+np.argpartition. A project is loaded from the database on its first query
+and then kept current from ORM commits: ProjectItem inserts, updates and
+deletes flushed by any session of this process are applied after the
+transaction commits (changes of rolled-back transactions or savepoints are
+discarded).
+
+Items written by other processes (python -m app.worker, embedding_backfill)
+are picked up by a freshness probe on every get(): the count and
+max(updated_at) of the project's embedded items. When they change, the rows
+updated since the last probe are re-read; if the count still differs (items
+deleted or moved away), the project is reloaded. Bulk UPDATE/DELETE
+statements that do not touch updated_at are not seen; call invalidate()
+after running them.
+"""
+
+import json
+import logging
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import event, func, inspect
+from sqlalchemy.orm import Query, Session
+
+from app.database.models import ProjectItem
+from app.services.enrichment_service import EMBEDDING_DIM
+
+logger = logging.getLogger(__name__)
+
+_CHANGES_KEY = "vector_index_changes"
+
+# (embedded item count, max(updated_at)) of a project, see _probe()
+Stamp = Tuple[int, Optional[object]]
+
+
+def _key(project_id) -> str:
+    """Canonical id string (accepts UUIDs, hex and hyphenated strings)."""
+    return str(project_id if isinstance(project_id, uuid.UUID) else uuid.UUID(str(project_id)))
+
+
+def _to_vector(value) -> Optional[np.ndarray]:
+    """Coerce a stored embedding (list, ndarray or '[...]' string) to float32."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = json.loads(value)
+    vector = np.asarray(value, dtype=np.float32).reshape(-1)
+    if vector.shape[0] != EMBEDDING_DIM:
+        return None
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+
+@dataclass
+class _Row:
+    """Snapshot of the indexed fields of one ProjectItem."""
+
+    item_id: str
+    project_id: str
+    vector: Optional[np.ndarray]
+    item_type: str
+    source_type: str
+    disciplines: Tuple[str, ...]
+
+    @classmethod
+    def from_values(cls, item_id, project_id, embedding, item_type, source_type, disciplines):
+        return cls(
+            item_id=_key(item_id),
+            project_id=_key(project_id),
+            vector=_to_vector(embedding),
+            item_type=item_type or "decision",
+            source_type=source_type or "meeting",
+            disciplines=tuple(disciplines or ()),
+        )
+
+
+class ProjectVectorIndex:
+    """Embeddings of one project in a contiguous, growable float32 matrix."""
+
+    def __init__(self, capacity: int = 64):
+        self.stamp: Optional[Stamp] = None  # Database state the index reflects
+        self._matrix = np.zeros((capacity, EMBEDDING_DIM), dtype=np.float32)
+        self._size = 0
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._item_types: List[str] = []
+        self._source_types: List[str] = []
+        self._disciplines: List[Tuple[str, ...]] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def upsert(self, row: _Row) -> None:
+        """Insert or replace an item; an item without a vector is removed."""
+        with self._lock:
+            if row.vector is None:
+                self._remove_locked(row.item_id)
+                return
+            index = self._rows.get(row.item_id)
+            if index is None:
+                if self._size == self._matrix.shape[0]:
+                    grown = np.zeros((self._size * 2, EMBEDDING_DIM), dtype=np.float32)
+                    grown[: self._size] = self._matrix[: self._size]
+                    self._matrix = grown
+                index = self._size
+                self._size += 1
+                self._rows[row.item_id] = index
+                self._ids.append(row.item_id)
+                self._item_types.append(row.item_type)
+                self._source_types.append(row.source_type)
+                self._disciplines.append(row.disciplines)
+            else:
+                self._item_types[index] = row.item_type
+                self._source_types[index] = row.source_type
+                self._disciplines[index] = row.disciplines
+            self._matrix[index] = row.vector
+
+    def remove(self, item_id: str) -> None:
+        with self._lock:
+            self._remove_locked(item_id)
+
+    def _remove_locked(self, item_id: str) -> None:
+        index = self._rows.pop(item_id, None)
+        if index is None:
+            return
+        # Move the last row into the hole to keep the matrix contiguous
+        last = self._size - 1
+        if index != last:
+            moved_id = self._ids[last]
+            self._matrix[index] = self._matrix[last]
+            self._ids[index] = moved_id
+            self._item_types[index] = self._item_types[last]
+            self._source_types[index] = self._source_types[last]
+            self._disciplines[index] = self._disciplines[last]
+            self._rows[moved_id] = index
+        self._ids.pop()
+        self._item_types.pop()
+        self._source_types.pop()
+        self._disciplines.pop()
+        self._size = last
+
+    def search(
+        self,
+        vector: Sequence[float],
+        k: int,
+        item_types: Sequence[str] = (),
+        source_types: Sequence[str] = (),
+        disciplines: Sequence[str] = (),
+    ) -> List[Tuple[str, float]]:
+        """Top-k items by cosine similarity, best first.
+
+        Filters match any of the given values (disciplines: any overlap).
+
+        Returns:
+            List of (item_id, score) pairs.
+        """
+        query = _to_vector(vector)
+        if query is None:
+            return []
+        with self._lock:
+            if self._size == 0:
+                return []
+            candidates = self._filter_locked(item_types, source_types, disciplines)
+            if candidates is None:
+                scores = self._matrix[: self._size] @ query
+                positions = np.arange(self._size)
+            else:
+                if candidates.size == 0:
+                    return []
+                scores = self._matrix[candidates] @ query
+                positions = candidates
+            k = min(k, scores.shape[0])
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+            return [(self._ids[positions[i]], float(scores[i])) for i in top]
+
+    def _filter_locked(self, item_types, source_types, disciplines) -> Optional[np.ndarray]:
+        if not (item_types or source_types or disciplines):
+            return None
+        mask = np.ones(self._size, dtype=bool)
+        if item_types:
+            mask &= np.isin(np.asarray(self._item_types), list(item_types))
+        if source_types:
+            mask &= np.isin(np.asarray(self._source_types), list(source_types))
+        if disciplines:
+            wanted = set(disciplines)
+            mask &= np.fromiter(
+                (not wanted.isdisjoint(d) for d in self._disciplines),
+                dtype=bool,
+                count=self._size,
+            )
+        return np.flatnonzero(mask)
+
+
+def _item_rows(db: Session) -> Query:
+    return db.query(
+        ProjectItem.id,
+        ProjectItem.project_id,
+        ProjectItem.embedding,
+        ProjectItem.item_type,
+        ProjectItem.source_type,
+        ProjectItem.affected_disciplines,
+    )
+
+
+def _probe(db: Session, project_id: str) -> Stamp:
+    """Cheap change marker for a project's embedded items (one aggregate query)."""
+    count, updated_at = (
+        db.query(func.count(ProjectItem.id), func.max(ProjectItem.updated_at))
+        .filter(
+            ProjectItem.project_id == project_id,
+            ProjectItem.embedding.isnot(None),
+        )
+        .one()
+    )
+    return count, updated_at
+
+
+class VectorIndexRegistry:
+    """Lazily loaded per-project indexes, kept current from ORM commits."""
+
+    def __init__(self):
+        self._indexes: Dict[str, ProjectVectorIndex] = {}
+        # project_id -> changes committed while the project was loading
+        self._loading: Dict[str, List[Tuple[str, object]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, project_id: str) -> ProjectVectorIndex:
+        """Return the project's index, loading or refreshing it when the database changed."""
+        project_id = _key(project_id)
+        with self._lock:
+            index = self._indexes.get(project_id)
+        stamp = _probe(db, project_id)
+        if index is not None and (index.stamp == stamp or self._catch_up(db, index, project_id, stamp)):
+            return index
+        return self._load(db, project_id, stamp)
+
+    def _catch_up(self, db: Session, index: ProjectVectorIndex, project_id: str, stamp: Stamp) -> bool:
+        """Re-read the rows updated since index.stamp; False if a reload is needed."""
+        since = index.stamp[1] if index.stamp else None
+        if since is None:
+            return False
+        rows = _item_rows(db).filter(
+            ProjectItem.project_id == project_id,
+            ProjectItem.updated_at >= since,
+        )
+        for values in rows.all():
+            index.upsert(_Row.from_values(*values))
+        if len(index) != stamp[0]:
+            return False
+        index.stamp = stamp
+        return True
+
+    def _load(self, db: Session, project_id: str, stamp: Stamp) -> ProjectVectorIndex:
+        with self._lock:
+            self._loading.setdefault(project_id, [])
+
+        try:
+            rows = (
+                _item_rows(db)
+                .filter(
+                    ProjectItem.project_id == project_id,
+                    ProjectItem.embedding.isnot(None),
+                )
+                .all()
+            )
+            index = ProjectVectorIndex(capacity=max(64, len(rows)))
+            for values in rows:
+                index.upsert(_Row.from_values(*values))
+            # Probed before the load: later writes show up as a change
+            index.stamp = stamp
+        except Exception:
+            with self._lock:
+                self._loading.pop(project_id, None)
+            raise
+
+        with self._lock:
+            # Replay commits that raced with the load (latest state wins)
+            for kind, change in self._loading.pop(project_id, []):
+                self._apply(index, kind, change)
+            self._indexes[project_id] = index
+        logger.info(f"Loaded vector index for project {project_id}: {len(index)} items")
+        return index
+
+    def invalidate(self, project_id: Optional[str] = None) -> None:
+        """Drop one project's index (or all); it is reloaded on next use."""
+        with self._lock:
+            if project_id is None:
+                self._indexes.clear()
+            else:
+                self._indexes.pop(_key(project_id), None)
+
+    def apply_changes(self, changes: List[Tuple[str, object]]) -> None:
+        """Apply committed ('upsert', _Row) / ('remove', (project_id, item_id)) changes."""
+        with self._lock:
+            for kind, change in changes:
+                project_id = change.project_id if kind == "upsert" else change[0]
+                if project_id in self._loading:
+                    self._loading[project_id].append((kind, change))
+                index = self._indexes.get(project_id)
+                if index is not None:
+                    self._apply(index, kind, change)
+
+    @staticmethod
+    def _apply(index: ProjectVectorIndex, kind: str, change) -> None:
+        if kind == "upsert":
+            index.upsert(change)
+        else:
+            index.remove(change[1])
+
+    def is_tracking(self) -> bool:
+        with self._lock:
+            return bool(self._indexes or self._loading)
+
+
+registry = VectorIndexRegistry()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Incremental maintenance from ORM sessions
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def _current_transaction(session):
+    return session.get_nested_transaction() or session.get_transaction()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_item_changes(session, flush_context):
+    if not registry.is_tracking():
+        return
+    # Changes are kept per transaction so a savepoint's can be dropped alone
+    pending = session.info.setdefault(_CHANGES_KEY, {})
+    changes = pending.setdefault(_current_transaction(session), [])
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, ProjectItem) and obj.id is not None:
+            # An item moved to another project leaves the old project's index
+            for old_project_id in inspect(obj).attrs.project_id.history.deleted:
+                if old_project_id is not None:
+                    changes.append(("remove", (_key(old_project_id), _key(obj.id))))
+            changes.append(
+                (
+                    "upsert",
+                    _Row.from_values(
+                        obj.id,
+                        obj.project_id,
+                        obj.embedding,
+                        obj.item_type,
+                        obj.source_type,
+                        obj.affected_disciplines,
+                    ),
+                )
+            )
+    for obj in session.deleted:
+        if isinstance(obj, ProjectItem):
+            changes.append(("remove", (_key(obj.project_id), _key(obj.id))))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_item_changes(session):
+    pending = session.info.get(_CHANGES_KEY)
+    if not pending:
+        return
+    transaction = _current_transaction(session)
+    changes = pending.pop(transaction, None)
+    if not changes:
+        return
+    if transaction.nested:
+        # Released savepoint: its changes commit with the enclosing transaction
+        pending.setdefault(transaction.parent, []).extend(changes)
+    else:
+        registry.apply_changes(changes)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_item_changes(session, transaction):
+    # Anything still pending for an ended transaction was rolled back
+    pending = session.info.get(_CHANGES_KEY)
+    if pending:
+        pending.pop(transaction, None)
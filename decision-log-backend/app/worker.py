@@ -0,0 +1,214 @@
+"""Ingestion worker — executes jobs from the durable ingestion queue.
+
+Runs separately from the API process:
+
+    python -m app.worker                      # settings-driven defaults
+    python -m app.worker --processes 4 --concurrency 8
+
+Each process runs `concurrency` worker slots, each claiming one job at a
+time. Leases are renewed by a heartbeat while a job runs, so a crashed
+worker's jobs are picked up by another worker once the lease expires.
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+from typing import Callable, Dict, Optional
+
+from app.config import settings
+from app.database.session import SessionLocal, engine
+from app.services import ingestion_queue
+from app.services.ingestion_pipeline import prepare_document_source, process_approved_source
+
+logger = logging.getLogger(__name__)
+
+# job_type -> handler(source_id)
+JOB_HANDLERS: Dict[str, Callable[[str], None]] = {
+    ingestion_queue.JOB_PROCESS_SOURCE: process_approved_source,
+    ingestion_queue.JOB_PREPARE_DOCUMENT: prepare_document_source,
+}
+
+
+class IngestionWorker:
+    """Runs N concurrent worker slots that claim and execute ingestion jobs."""
+
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        lease_seconds: Optional[int] = None,
+        poll_seconds: Optional[float] = None,
+        session_factory=SessionLocal,
+        handlers: Optional[Dict[str, Callable[[str], None]]] = None,
+    ):
+        self.concurrency = concurrency or settings.ingestion_worker_concurrency
+        self.lease_seconds = lease_seconds or settings.ingestion_job_lease_seconds
+        self.poll_seconds = (
+            poll_seconds if poll_seconds is not None else settings.ingestion_worker_poll_seconds
+        )
+        self.session_factory = session_factory
+        self.handlers = handlers if handlers is not None else JOB_HANDLERS
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._stop = threading.Event()
+
+    def stop(self):
+        """Ask all slots to exit after their current job."""
+        self._stop.set()
+
+    def run_forever(self):
+        """Run worker slots until stop() is called (SIGINT/SIGTERM in the CLI)."""
+        logger.info(
+            f"IngestionWorker {self.worker_id}: starting {self.concurrency} slot(s), "
+            f"lease={self.lease_seconds}s"
+        )
+        threads = [
+            threading.Thread(
+                target=self._slot_loop,
+                args=(f"{self.worker_id}/{slot}",),
+                name=f"ingestion-worker-{slot}",
+                daemon=True,
+            )
+            for slot in range(self.concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        logger.info(f"IngestionWorker {self.worker_id}: stopped")
+
+    def _slot_loop(self, slot_id: str):
+        while not self._stop.is_set():
+            try:
+                ran = self.run_once(slot_id)
+            except Exception as e:
+                logger.error(f"IngestionWorker {slot_id}: queue error: {e}")
+                ran = False
+            if not ran:
+                self._stop.wait(self.poll_seconds)
+
+    def run_once(self, slot_id: Optional[str] = None) -> bool:
+        """Claim and execute a single job.
+
+        Returns:
+            True if a job was claimed (whatever its outcome), False if the queue was empty.
+        """
+        slot_id = slot_id or f"{self.worker_id}/0"
+        db = self.session_factory()
+        try:
+            job = ingestion_queue.claim_job(db, slot_id, self.lease_seconds)
+            if job is None:
+                return False
+            job_id, job_type, source_id = job.id, job.job_type, str(job.source_id)
+        finally:
+            db.close()
+
+        handler = self.handlers.get(job_type)
+        heartbeat_stop = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat,
+            args=(job_id, slot_id, heartbeat_stop),
+            daemon=True,
+        )
+        heartbeat.start()
+        error = None
+        try:
+            if handler is None:
+                raise ValueError(f"No handler registered for job type '{job_type}'")
+            handler(source_id)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            heartbeat_stop.set()
+            heartbeat.join()
+
+        db = self.session_factory()
+        try:
+            if error is None:
+                ingestion_queue.complete_job(db, job_id, slot_id)
+            else:
+                ingestion_queue.fail_job(db, job_id, slot_id, error)
+        finally:
+            db.close()
+        return True
+
+    def _heartbeat(self, job_id, slot_id: str, done: threading.Event):
+        """Renew the job lease at a third of its length until the job finishes."""
+        interval = max(self.lease_seconds / 3, 1)
+        while not done.wait(interval):
+            db = self.session_factory()
+            try:
+                if not ingestion_queue.extend_lease(db, job_id, slot_id, self.lease_seconds):
+                    logger.warning(f"IngestionWorker {slot_id}: lost lease on job {job_id}")
+                    return
+            except Exception as e:
+                logger.error(f"IngestionWorker {slot_id}: heartbeat failed for {job_id}: {e}")
+            finally:
+                db.close()
+
+
+def _run_process(concurrency: int):
+    """Entry point for a single worker process."""
+    # Never reuse pooled connections inherited from the parent process
+    engine.dispose()
+    worker = IngestionWorker(concurrency=concurrency)
+
+    def _handle_signal(signum, frame):
+        logger.info(f"IngestionWorker {worker.worker_id}: received signal {signum}, draining")
+        worker.stop()
+
+    signal.signal(signal.SIGINT, _handle_signal)
+    signal.signal(signal.SIGTERM, _handle_signal)
+    worker.run_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run DecisionLog ingestion workers")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=settings.ingestion_worker_processes,
+        help="Worker processes to start (default: INGESTION_WORKER_PROCESSES)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.ingestion_worker_concurrency,
+        help="Concurrent jobs per process (default: INGESTION_WORKER_CONCURRENCY)",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.DEBUG if settings.debug else logging.INFO,
+        format="%(asctime)s %(processName)s %(name)s %(levelname)s %(message)s",
+    )
+
+    if args.processes <= 1:
+        _run_process(args.concurrency)
+        return
+
+    processes = [
+        multiprocessing.Process(
+            target=_run_process,
+            args=(args.concurrency,),
+            name=f"ingestion-worker-{i}",
+        )
+        for i in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+
+    def _forward_signal(signum, frame):
+        for process in processes:
+            if process.is_alive():
+                process.terminate()  # SIGTERM -> child drains its current jobs
+
+    signal.signal(signal.SIGTERM, _forward_signal)
+    for process in processes:
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Benchmark recall and latency of item search modes on the seed dataset.
+
+    DEMO_MODE=true python -m app.database.seed
+    python -m app.services.embedding_backfill
+    python scripts/benchmark_hybrid_search.py --k 5 --repeat 20
+
+Runs a fixed set of labelled queries (exact phrases and concepts) against
+the seeded projects in lexical, semantic and hybrid mode, and reports
+recall@k (share of the relevant items returned in the top k) and p50/p95
+latency per mode. Semantic mode is skipped when no embedding model is
+available; hybrid mode then measures the full-text retrieval alone.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database.models import Project, ProjectItem  # noqa: E402
+from app.database.session import SessionLocal  # noqa: E402
+from app.services.item_search import (  # noqa: E402
+    SemanticSearchUnavailableError,
+    hybrid_search,
+    lexical_search,
+    semantic_search,
+)
+
+# (project name, query, substrings identifying the relevant seed items)
+QUERIES = [
+    ("Residential Tower Alpha", '"Level 3"', ["BIM Level 3 coordination"]),
+    ("Residential Tower Alpha", "post-tensioned slabs", ["post-tensioned slabs"]),
+    ("Residential Tower Alpha", "structural changes to the podium", ["transfer beams at level 5"]),
+    (
+        "Residential Tower Alpha",
+        "earthquake protection",
+        ["seismic isolation bearings", "seismic zone 3"],
+    ),
+    (
+        "Residential Tower Alpha",
+        "energy efficiency",
+        ["LED lighting system", "geothermal heat pump", "load analysis for LED"],
+    ),
+    ("Residential Tower Alpha", "heritage trees", ["Preserve existing trees", "heritage trees"]),
+    (
+        "Residential Tower Alpha",
+        "ground conditions",
+        ["soil bearing capacity test", "Soil analysis confirms"],
+    ),
+    ("Residential Tower Alpha", "rebar grade", ["grade 60 rebar"]),
+    (
+        "Commercial Plaza Beta",
+        "facade",
+        ["curtain wall", "Facade maintenance access", "facade maintenance system"],
+    ),
+    ("Commercial Plaza Beta", "renewable power", ["rooftop solar panels", "solar panel vendor"]),
+]
+
+MODES = ("lexical", "semantic", "hybrid")
+
+
+def _search(db, mode, project_id, query, k):
+    if mode == "hybrid":
+        return [hit.item for hit in asyncio.run(hybrid_search(db, project_id, query, limit=k))]
+    search = lexical_search if mode == "lexical" else semantic_search
+    return [item for item, _ in search(db, project_id, query, limit=k)]
+
+
+def _relevant_ids(db, project_id, substrings):
+    items = db.query(ProjectItem).filter(ProjectItem.project_id == project_id).all()
+    return {
+        str(item.id)
+        for item in items
+        if any(s.lower() in (item.statement or "").lower() for s in substrings)
+    }
+
+
+def run(k: int, repeat: int):
+    db = SessionLocal()
+    try:
+        projects = {p.name: str(p.id) for p in db.query(Project).all()}
+        cases = []
+        for project_name, query, substrings in QUERIES:
+            project_id = projects.get(project_name)
+            relevant = _relevant_ids(db, project_id, substrings) if project_id else set()
+            if not relevant:
+                print(f"Skipping {query!r}: no seeded items in {project_name!r}")
+                continue
+            cases.append((project_id, query, relevant))
+        if not cases:
+            print("No seed data found; run DEMO_MODE=true python -m app.database.seed")
+            return
+
+        for mode in MODES:
+            recalls, timings = [], []
+            try:
+                for project_id, query, relevant in cases:
+                    found = {str(item.id) for item in _search(db, mode, project_id, query, k)}
+                    recalls.append(len(found & relevant) / len(relevant))
+                    for _ in range(repeat):
+                        start = time.perf_counter()
+                        _search(db, mode, project_id, query, k)
+                        timings.append((time.perf_counter() - start) * 1000)
+                        db.rollback()
+            except SemanticSearchUnavailableError as e:
+                print(f"{mode:>8}: skipped ({e})")
+                continue
+            timings = np.array(timings)
+            print(
+                f"{mode:>8}: recall@{k}={np.mean(recalls):.2f} "
+                f"p50={np.percentile(timings, 50):.2f}ms p95={np.percentile(timings, 95):.2f}ms "
+                f"({len(cases)} queries)"
+            )
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per query")
+    args = parser.parse_args()
+    run(args.k, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
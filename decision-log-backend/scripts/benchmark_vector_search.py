@@ -0,0 +1,96 @@
+"""Benchmark top-k vector search latency (in-process NumPy index vs pgvector).
+
+    python scripts/benchmark_vector_search.py --items 100000
+    python scripts/benchmark_vector_search.py --project-id <uuid> --backend pgvector
+
+Without --project-id, a synthetic index of random unit vectors is searched
+in-process. With --project-id, the project's real embeddings are queried
+through the configured backend (random query vectors, no model needed).
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.enrichment_service import EMBEDDING_DIM  # noqa: E402
+from app.services.vector_index import ProjectVectorIndex, _Row  # noqa: E402
+
+
+def _random_unit(rng, n):
+    vectors = rng.standard_normal((n, EMBEDDING_DIM)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _report(label, timings_ms):
+    timings = np.array(timings_ms)
+    print(
+        f"{label}: p50={np.percentile(timings, 50):.2f}ms "
+        f"p95={np.percentile(timings, 95):.2f}ms max={timings.max():.2f}ms"
+    )
+
+
+def bench_synthetic(items: int, queries: int, k: int):
+    rng = np.random.default_rng(0)
+    index = ProjectVectorIndex(capacity=items)
+    project_id = uuid.uuid4()
+    start = time.perf_counter()
+    for i, vector in enumerate(_random_unit(rng, items)):
+        index.upsert(
+            _Row.from_values(uuid.UUID(int=i + 1), project_id, vector, "decision", "meeting", ())
+        )
+    print(f"Built index of {items} items in {time.perf_counter() - start:.2f}s")
+
+    timings = []
+    for query in _random_unit(rng, queries):
+        start = time.perf_counter()
+        index.search(query, k)
+        timings.append((time.perf_counter() - start) * 1000)
+    _report(f"numpy top-{k}", timings)
+
+
+def bench_project(project_id: str, backend: str, queries: int, k: int):
+    from unittest.mock import patch
+
+    from app.config import settings
+    from app.database.session import SessionLocal
+    from app.services.item_search import semantic_search
+
+    settings.vector_search_backend = backend
+    rng = np.random.default_rng(0)
+    db = SessionLocal()
+    try:
+        timings = []
+        for query in _random_unit(rng, queries):
+            with patch("app.services.item_search.encode_texts", return_value=query[None, :]):
+                start = time.perf_counter()
+                semantic_search(db, project_id, "benchmark", limit=k)
+                timings.append((time.perf_counter() - start) * 1000)
+            db.rollback()
+        _report(f"{backend} top-{k} (project {project_id})", timings)
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--project-id")
+    parser.add_argument("--backend", choices=("numpy", "pgvector"), default="numpy")
+    args = parser.parse_args()
+
+    if args.project_id:
+        bench_project(args.project_id, args.backend, args.queries, args.k)
+    else:
+        bench_synthetic(args.items, args.queries, args.k)
+
+
+if __name__ == "__main__":
+    main()
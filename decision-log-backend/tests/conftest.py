@@ -65,6 +65,14 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(skip_pg)
 
 
+@pytest.fixture(autouse=True)
+def _disable_llm_cache(monkeypatch):
+    """Keep tests hermetic: never read or write the on-disk LLM response cache."""
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "llm_cache_enabled", False)
+
+
 @pytest.fixture(scope="function")
 def db_session() -> Session:
     """
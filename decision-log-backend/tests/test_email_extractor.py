@@ -5,7 +5,7 @@ Covers:
 - EmailExtractor.extract: Claude API integration (mocked)
 - Item structure validation
 - Thread overlap detection
-- Edge cases: empty body, only-quoted body, failed API call
+- Edge cases: empty body, only-quoted body, failed API call (raised for retry)
 - Pipeline integration: email branch in ingestion_pipeline
 """
 
@@ -13,7 +13,7 @@ import json
 import uuid
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from sqlalchemy.orm import Session
@@ -24,6 +24,7 @@ from app.database.models import (
     ProjectParticipant,
     Source,
 )
+from app.services.chunking import ChunkExtractionError
 from app.services.email_extractor import EmailExtractor, strip_quoted_replies
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -202,10 +203,10 @@ class TestStripQuotedReplies:
 class TestEmailExtractor:
     """Tests for the EmailExtractor service."""
 
-    @patch("app.services.email_extractor.Anthropic")
+    @patch("app.services.email_extractor.get_llm_client")
     def test_extract_produces_items(
         self,
-        mock_anthropic_cls,
+        mock_get_client,
         db_session,
         email_source,
         sample_participants,
@@ -213,19 +214,19 @@ class TestEmailExtractor:
     ):
         """extract() should return a list of item dicts from Claude API."""
         mock_client = MagicMock()
-        mock_client.messages.create.return_value = mock_anthropic_response
-        mock_anthropic_cls.return_value = mock_client
+        mock_client.create_message = AsyncMock(return_value=mock_anthropic_response)
+        mock_get_client.return_value = mock_client
 
         extractor = EmailExtractor(db_session)
         items = extractor.extract(email_source, sample_participants)
 
         assert len(items) == 2
-        mock_client.messages.create.assert_called_once()
+        mock_client.create_message.assert_awaited_once()
 
-    @patch("app.services.email_extractor.Anthropic")
+    @patch("app.services.email_extractor.get_llm_client")
     def test_items_have_correct_structure(
         self,
-        mock_anthropic_cls,
+        mock_get_client,
         db_session,
         email_source,
         sample_participants,
@@ -233,8 +234,8 @@ class TestEmailExtractor:
     ):
         """Each extracted item must have item_type, statement, who, affected_disciplines."""
         mock_client = MagicMock()
-        mock_client.messages.create.return_value = mock_anthropic_response
-        mock_anthropic_cls.return_value = mock_client
+        mock_client.create_message = AsyncMock(return_value=mock_anthropic_response)
+        mock_get_client.return_value = mock_client
 
         extractor = EmailExtractor(db_session)
         items = extractor.extract(email_source, sample_participants)
@@ -252,10 +253,10 @@ class TestEmailExtractor:
                 "information",
             )
 
-    @patch("app.services.email_extractor.Anthropic")
+    @patch("app.services.email_extractor.get_llm_client")
     def test_handles_markdown_code_block_response(
         self,
-        mock_anthropic_cls,
+        mock_get_client,
         db_session,
         email_source,
         sample_participants,
@@ -278,8 +279,8 @@ class TestEmailExtractor:
             MagicMock(text=f"```json\n{items_json}\n```")
         ]
         mock_client = MagicMock()
-        mock_client.messages.create.return_value = mock_response
-        mock_anthropic_cls.return_value = mock_client
+        mock_client.create_message = AsyncMock(return_value=mock_response)
+        mock_get_client.return_value = mock_client
 
         extractor = EmailExtractor(db_session)
         items = extractor.extract(email_source, sample_participants)
@@ -311,30 +312,29 @@ class TestEmailExtractor:
 
         assert items == []
 
-    @patch("app.services.email_extractor.Anthropic")
-    def test_failed_api_call_returns_empty_list(
+    @patch("app.services.email_extractor.get_llm_client")
+    def test_failed_api_call_raises_for_retry(
         self,
-        mock_anthropic_cls,
+        mock_get_client,
         db_session,
         email_source,
         sample_participants,
     ):
-        """If the Claude API call fails, extract() should return [] without crashing."""
+        """If the Claude API call fails, extract() raises so the ingestion job is retried."""
         mock_client = MagicMock()
-        mock_client.messages.create.side_effect = Exception(
-            "API connection error"
+        mock_client.create_message = AsyncMock(
+            side_effect=Exception("API connection error")
         )
-        mock_anthropic_cls.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         extractor = EmailExtractor(db_session)
-        items = extractor.extract(email_source, sample_participants)
-
-        assert items == []
+        with pytest.raises(ChunkExtractionError):
+            extractor.extract(email_source, sample_participants)
 
-    @patch("app.services.email_extractor.Anthropic")
+    @patch("app.services.email_extractor.get_llm_client")
     def test_invalid_json_returns_empty_list(
         self,
-        mock_anthropic_cls,
+        mock_get_client,
         db_session,
         email_source,
         sample_participants,
@@ -345,8 +345,8 @@ class TestEmailExtractor:
             MagicMock(text="I cannot extract items from this email.")
         ]
         mock_client = MagicMock()
-        mock_client.messages.create.return_value = mock_response
-        mock_anthropic_cls.return_value = mock_client
+        mock_client.create_message = AsyncMock(return_value=mock_response)
+        mock_get_client.return_value = mock_client
 
         extractor = EmailExtractor(db_session)
         items = extractor.extract(email_source, sample_participants)
@@ -472,19 +472,19 @@ class TestPipelineIntegration:
 
         db_session, restore_close = self._make_non_closing_session(db_session)
         mock_client = MagicMock()
-        mock_client.messages.create.return_value = mock_anthropic_response
+        mock_client.create_message = AsyncMock(return_value=mock_anthropic_response)
 
         try:
             with (
                 patch.object(pipeline_mod, "SessionLocal", return_value=db_session),
-                patch("app.services.email_extractor.Anthropic") as mock_anthropic_cls,
+                patch("app.services.email_extractor.get_llm_client") as mock_get_client,
             ):
-                mock_anthropic_cls.return_value = mock_client
+                mock_get_client.return_value = mock_client
 
                 pipeline_mod.process_approved_source(source_id)
 
                 # Verify Claude API was called (email extractor was invoked)
-                mock_client.messages.create.assert_called_once()
+                mock_client.create_message.assert_awaited_once()
 
             # Verify source status was updated
             db_session.refresh(email_source)
@@ -507,14 +507,14 @@ class TestPipelineIntegration:
 
         db_session, restore_close = self._make_non_closing_session(db_session)
         mock_client = MagicMock()
-        mock_client.messages.create.return_value = mock_anthropic_response
+        mock_client.create_message = AsyncMock(return_value=mock_anthropic_response)
 
         try:
             with (
                 patch.object(pipeline_mod, "SessionLocal", return_value=db_session),
-                patch("app.services.email_extractor.Anthropic") as mock_anthropic_cls,
+                patch("app.services.email_extractor.get_llm_client") as mock_get_client,
             ):
-                mock_anthropic_cls.return_value = mock_client
+                mock_get_client.return_value = mock_client
 
                 pipeline_mod.process_approved_source(source_id)
 
@@ -0,0 +1,198 @@
+"""Tests for the shared project access check and its membership cache."""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.api.middleware.auth import check_project_access, get_accessible_project
+from app.database.models import Project, ProjectMember, User
+from app.services import access_control
+from app.services.access_control import (
+    PermissionDeniedError,
+    ProjectNotFoundError,
+    authorize_project,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    access_control.invalidate()
+    yield
+    access_control.invalidate()
+
+
+def _user(db_session: Session, role: str) -> SimpleNamespace:
+    user = User(
+        id=uuid4(),
+        email=f"{role}-{uuid4().hex[:6]}@example.com",
+        password_hash="hashed",
+        name=role.title(),
+        role=role,
+    )
+    db_session.add(user)
+    db_session.commit()
+    # Principal as attached by auth_middleware (no lazy loads)
+    return SimpleNamespace(id=user.id, role=role)
+
+
+@pytest.fixture
+def architect(db_session):
+    return _user(db_session, "architect")
+
+
+@pytest.fixture
+def projects(db_session, architect):
+    member_of, other = Project(id=uuid4(), name="Member"), Project(id=uuid4(), name="Other")
+    db_session.add_all([member_of, other])
+    db_session.add(ProjectMember(project_id=member_of.id, user_id=architect.id, role="member"))
+    db_session.commit()
+    return member_of.id, other.id
+
+
+@pytest.fixture
+def queries(db_session):
+    engine = db_session.get_bind()
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    yield statements
+    event.remove(engine, "before_cursor_execute", count)
+
+
+def _access_status(db_session, project_id, user):
+    try:
+        check_project_access(db_session, str(project_id), user)
+    except HTTPException as e:
+        return e.status_code
+    return 200
+
+
+class TestAuthorizeProject:
+    def test_member_one_query_on_miss_none_on_hit(self, db_session, architect, projects, queries):
+        member_of, _ = projects
+
+        authorize_project(db_session, str(member_of), architect.id, "architect")
+        assert len(queries) == 1
+
+        authorize_project(db_session, str(member_of), architect.id, "architect")
+        authorize_project(db_session, member_of.hex, str(architect.id), "architect")
+        assert len(queries) == 1
+
+    def test_non_member_and_missing_project(self, db_session, architect, projects):
+        _, other = projects
+
+        with pytest.raises(PermissionDeniedError):
+            authorize_project(db_session, str(other), architect.id, "architect")
+        with pytest.raises(ProjectNotFoundError):
+            authorize_project(db_session, str(uuid4()), architect.id, "architect")
+        # Cached membership set, uncached project
+        with pytest.raises(ProjectNotFoundError):
+            authorize_project(db_session, str(uuid4()), architect.id, "architect")
+
+    def test_director_sees_every_existing_project(self, db_session, projects, queries):
+        director = _user(db_session, "director")
+        _, other = projects
+        queries.clear()
+
+        authorize_project(db_session, str(other), director.id, "director")
+        authorize_project(db_session, str(other), director.id, "director")
+        assert len(queries) == 1
+
+        with pytest.raises(ProjectNotFoundError):
+            authorize_project(db_session, str(uuid4()), director.id, "director")
+
+
+class TestInvalidation:
+    def test_added_membership_grants_access(self, db_session, architect, projects):
+        _, other = projects
+        assert _access_status(db_session, other, architect) == 403
+
+        db_session.add(ProjectMember(project_id=other, user_id=architect.id, role="member"))
+        db_session.commit()
+
+        assert _access_status(db_session, other, architect) == 200
+
+    def test_removed_membership_revokes_access(self, db_session, architect, projects):
+        member_of, _ = projects
+        assert _access_status(db_session, member_of, architect) == 200
+
+        db_session.delete(db_session.query(ProjectMember).filter_by(project_id=member_of).one())
+        db_session.commit()
+
+        assert _access_status(db_session, member_of, architect) == 403
+
+    def test_rolled_back_membership_is_ignored(self, db_session, architect, projects, queries):
+        member_of, other = projects
+        assert _access_status(db_session, member_of, architect) == 200
+
+        db_session.add(ProjectMember(project_id=other, user_id=architect.id, role="member"))
+        db_session.flush()
+        db_session.rollback()
+        queries.clear()
+
+        assert _access_status(db_session, member_of, architect) == 200
+        assert queries == []
+
+    def test_deleted_project_is_not_found(self, db_session, architect, projects):
+        member_of, _ = projects
+        assert _access_status(db_session, member_of, architect) == 200
+
+        db_session.query(ProjectMember).filter_by(project_id=member_of).delete()
+        db_session.delete(db_session.get(Project, member_of))
+        db_session.commit()
+
+        assert _access_status(db_session, member_of, architect) == 404
+
+
+class TestGetAccessibleProject:
+    def test_returns_project_row(self, db_session, architect, projects):
+        member_of, other = projects
+
+        assert get_accessible_project(db_session, str(member_of), architect).id == member_of
+        with pytest.raises(HTTPException) as exc:
+            get_accessible_project(db_session, str(other), architect)
+        assert exc.value.status_code == 403
+
+    @pytest.mark.parametrize("role", ["architect", "director"])
+    def test_row_is_the_only_query_on_a_cache_hit(self, db_session, architect, projects, queries, role):
+        member_of, _ = projects
+        user = architect if role == "architect" else _user(db_session, "director")
+        authorize_project(db_session, member_of, user.id, user.role)
+        db_session.expunge_all()
+        queries.clear()
+
+        project = get_accessible_project(db_session, str(member_of), user)
+
+        assert project.name == "Member"
+        assert project in db_session
+        assert len(queries) == 1
+
+    def test_returns_instance_already_in_session(self, db_session, architect, projects):
+        member_of, _ = projects
+        loaded = db_session.get(Project, member_of)
+
+        assert get_accessible_project(db_session, str(member_of), architect) is loaded
+
+    def test_sees_bulk_updates(self, db_session, architect, projects):
+        """The row is read fresh, so updates the ORM events never see are visible."""
+        member_of, _ = projects
+        get_accessible_project(db_session, str(member_of), architect)
+
+        db_session.query(Project).filter(Project.id == member_of).update({"name": "Renamed"})
+        db_session.commit()
+        db_session.expunge_all()
+
+        assert get_accessible_project(db_session, str(member_of), architect).name == "Renamed"
+
+    def test_missing_project_404(self, db_session, architect, projects):
+        for project_id in (str(uuid4()), "not-a-uuid"):
+            with pytest.raises(HTTPException) as exc:
+                get_accessible_project(db_session, project_id, architect)
+            assert exc.value.status_code == 404
@@ -0,0 +1,175 @@
+"""Tests for the auth middleware user and token caches."""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.middleware import auth as auth_mod
+from app.database.models import User
+from app.services import auth_cache
+from app.services.auth_cache import TTLLRUCache, UserPrincipal
+from app.utils.security import create_access_token
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    auth_cache.invalidate_user()
+    yield
+    auth_cache.invalidate_user()
+
+
+@pytest.fixture
+def user(db_session: Session) -> User:
+    user = User(
+        id=uuid4(),
+        email="cached@example.com",
+        password_hash="hashed",
+        name="Cached User",
+        role="architect",
+    )
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+@pytest.fixture
+def middleware_sessions(db_session: Session):
+    """Point the middleware at the test database and count its queries."""
+    engine = db_session.get_bind()
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        if "FROM users" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    with patch.object(auth_mod, "SessionLocal", sessionmaker(bind=engine)):
+        yield statements
+    event.remove(engine, "before_cursor_execute", count)
+
+
+def _authenticate(token: str):
+    request = SimpleNamespace(
+        headers={"Authorization": f"Bearer {token}"},
+        url=SimpleNamespace(path="/api/projects"),
+        method="GET",
+        state=SimpleNamespace(),
+    )
+
+    async def call_next(req):
+        return req.state.user
+
+    return asyncio.run(auth_mod.auth_middleware(request, call_next))
+
+
+def _token(user: User) -> str:
+    return create_access_token(user_id=str(user.id), email=user.email, role=user.role)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# TTL-LRU cache
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestTTLLRUCache:
+    def test_evicts_least_recently_used(self):
+        cache = TTLLRUCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+    def test_entries_expire(self):
+        now = [100.0]
+        cache = TTLLRUCache(max_entries=10, ttl_seconds=60, clock=lambda: now[0])
+        cache.set("a", 1)
+        cache.set("b", 2, ttl_seconds=5)
+
+        now[0] += 10
+        assert (cache.get("a"), cache.get("b")) == (1, None)
+
+        now[0] += 60
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_non_positive_ttl_is_not_stored(self):
+        cache = TTLLRUCache(max_entries=10, ttl_seconds=60)
+        cache.set("a", 1, ttl_seconds=0)
+
+        assert cache.get("a") is None
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Middleware
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestAuthMiddlewareCache:
+    def test_second_request_does_no_db_work(self, user, middleware_sessions):
+        token = _token(user)
+
+        decode_access_token = auth_cache.decode_access_token
+        with patch("app.services.auth_cache.decode_access_token", wraps=decode_access_token) as decode:
+            first = _authenticate(token)
+            second = _authenticate(token)
+
+        assert isinstance(first, UserPrincipal)
+        assert second is first
+        assert (first.id, first.email, first.role) == (user.id, user.email, "architect")
+        assert len(middleware_sessions) == 1
+        assert decode.call_count == 1
+
+    def test_update_invalidates_principal(self, db_session, user, middleware_sessions):
+        token = _token(user)
+        _authenticate(token)
+
+        user.role = "director"
+        db_session.commit()
+
+        assert _authenticate(token).role == "director"
+        assert len(middleware_sessions) == 2
+
+    def test_soft_delete_revokes_access(self, db_session, user, middleware_sessions):
+        token = _token(user)
+        _authenticate(token)
+
+        user.deleted_at = datetime.utcnow()
+        db_session.commit()
+
+        with pytest.raises(HTTPException) as exc:
+            _authenticate(token)
+        assert exc.value.status_code == 401
+
+    def test_rolled_back_update_keeps_principal(self, db_session, user, middleware_sessions):
+        token = _token(user)
+        _authenticate(token)
+
+        user.role = "director"
+        db_session.flush()
+        db_session.rollback()
+
+        assert _authenticate(token).role == "architect"
+        assert len(middleware_sessions) == 1
+
+    def test_expired_token_is_not_served_from_memo(self, user, middleware_sessions):
+        token = create_access_token(
+            user_id=str(user.id),
+            email=user.email,
+            role=user.role,
+            expires_delta=timedelta(seconds=-1),
+        )
+
+        with pytest.raises(HTTPException) as exc:
+            _authenticate(token)
+        assert exc.value.status_code == 401
+        assert len(auth_cache.tokens) == 0
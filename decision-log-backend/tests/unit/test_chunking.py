@@ -0,0 +1,245 @@
+"""Tests for chunked map-reduce extraction (app/services/chunking.py)."""
+
+import asyncio
+import json
+from itertools import pairwise
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.chunking import (
+    ChunkExtractionError,
+    extract_chunks,
+    merge_items,
+    pack_units,
+    split_document,
+    split_transcript,
+)
+from app.services.document_processor import PAGE_BREAK
+
+
+def _transcript(turns: int) -> str:
+    return "\n".join(
+        f"00:{i // 60:02d}:{i % 60:02d} Speaker {i % 3}: Statement number {i} about the facade design."
+        for i in range(turns)
+    )
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Splitting
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestSplitting:
+    """Tests for transcript/document splitting."""
+
+    def test_short_text_is_single_chunk(self):
+        assert split_transcript("Ana: hello", max_chars=1000) == ["Ana: hello"]
+
+    def test_transcript_splits_on_speaker_turns(self):
+        text = _transcript(200)
+        chunks = split_transcript(text, max_chars=2000, overlap_chars=200)
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert len(chunk) <= 2000
+            # Every chunk starts at the beginning of a speaker turn
+            assert chunk.startswith("00:")
+
+    def test_windows_overlap(self):
+        text = _transcript(200)
+        chunks = split_transcript(text, max_chars=2000, overlap_chars=300)
+
+        for previous, current in pairwise(chunks):
+            last_turn = previous.splitlines()[-1]
+            assert last_turn in current
+
+    def test_no_content_lost(self):
+        text = _transcript(200)
+        chunks = split_transcript(text, max_chars=2000, overlap_chars=200)
+        joined = "\n".join(chunks)
+        for line in text.splitlines():
+            assert line in joined
+
+    def test_document_splits_on_pages(self):
+        pages = [f"Page {i} " + "spec text " * 150 for i in range(6)]
+        text = f"\n\n{PAGE_BREAK}".join(pages)
+        chunks = split_document(text, max_chars=4000, overlap_chars=0)
+
+        assert len(chunks) >= 3
+        for chunk in chunks:
+            assert chunk.lstrip().startswith("Page ")
+            assert PAGE_BREAK not in chunk
+
+    def test_document_splits_on_headings_without_pages(self):
+        sections = [f"## Section {i}\n" + "body text " * 100 for i in range(6)]
+        chunks = split_document("\n".join(sections), max_chars=2500, overlap_chars=0)
+
+        assert len(chunks) > 1
+        assert all(chunk.startswith("## Section") for chunk in chunks)
+
+    def test_oversized_unit_is_hard_wrapped(self):
+        chunks = pack_units(["word " * 1000], max_chars=500, overlap_chars=0)
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 500 for chunk in chunks)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Map / reduce
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestMergeItems:
+    """Tests for cross-chunk merge/dedup."""
+
+    def test_exact_duplicates_collapse(self):
+        a = {"item_type": "decision", "statement": "Use CLT slabs.", "confidence": 0.6}
+        b = {"item_type": "decision", "statement": "use clt slabs", "confidence": 0.9}
+        merged = merge_items([[a], [b]])
+
+        assert len(merged) == 1
+        assert merged[0]["confidence"] == 0.9
+
+    def test_near_duplicates_collapse_and_union_disciplines(self):
+        a = {
+            "item_type": "decision",
+            "statement": "Team decided to use CLT floor slabs on levels 2-5",
+            "affected_disciplines": ["structural"],
+        }
+        b = {
+            "item_type": "decision",
+            "statement": "Team decided to use CLT floor slabs on levels 2 to 5",
+            "affected_disciplines": ["architecture"],
+        }
+        merged = merge_items([[a], [b]])
+
+        assert len(merged) == 1
+        assert set(merged[0]["affected_disciplines"]) == {"structural", "architecture"}
+
+    def test_different_types_are_kept(self):
+        a = {"item_type": "decision", "statement": "Use CLT slabs"}
+        b = {"item_type": "topic", "statement": "Use CLT slabs"}
+        assert len(merge_items([[a], [b]])) == 2
+
+    def test_document_items_keyed_on_decision_statement(self):
+        a = {"item_type": "information", "decision_statement": "Permit approved"}
+        b = {"item_type": "information", "decision_statement": "Permit approved."}
+        assert len(merge_items([[a, b]])) == 1
+
+
+class TestExtractChunks:
+    """Tests for concurrent chunk extraction and truncation handling."""
+
+    def test_chunks_extracted_concurrently(self):
+        state = {"now": 0, "peak": 0}
+
+        async def extract_fn(text):
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+            await asyncio.sleep(0.01)
+            state["now"] -= 1
+            return [{"item_type": "topic", "statement": text[-20:]}], False
+
+        chunks = split_transcript(_transcript(200), max_chars=2000, overlap_chars=0)
+        results = asyncio.run(extract_chunks(chunks, extract_fn, split_transcript))
+
+        assert len(results) == len(chunks)
+        assert state["peak"] == len(chunks)
+
+    def test_truncated_chunk_is_resplit(self):
+        text = _transcript(100)
+        seen = []
+
+        async def extract_fn(chunk_text):
+            seen.append(len(chunk_text))
+            truncated = len(chunk_text) > 4000
+            return [], truncated
+
+        results = asyncio.run(extract_chunks([text], extract_fn, split_transcript))
+
+        assert len(seen) > 1
+        assert max(seen[1:]) <= 4000
+        assert len(results) == len(seen)
+
+
+    def test_failed_chunk_fails_the_extraction(self):
+        """One failing chunk raises instead of returning the other chunks' items."""
+        finished = []
+
+        async def extract_fn(text):
+            if text.startswith("[Excerpt 2 of"):
+                raise RuntimeError("overloaded")
+            await asyncio.sleep(0.01)
+            finished.append(text)
+            return [{"item_type": "topic", "statement": text[-20:]}], False
+
+        chunks = split_transcript(_transcript(200), max_chars=2000, overlap_chars=0)
+        with pytest.raises(ChunkExtractionError, match="1 of"):
+            asyncio.run(extract_chunks(chunks, extract_fn, split_transcript))
+
+        # The other chunks still ran to completion (no orphaned requests)
+        assert len(finished) == len(chunks) - 1
+
+
+class TestDocumentExtraction:
+    """Tests for chunked DocumentExtractor.aextract."""
+
+    def test_failed_chunk_is_raised_for_retry(self):
+        from app.services.document_extractor import DocumentExtractor
+
+        response = MagicMock()
+        response.stop_reason = "end_turn"
+        response.content = [MagicMock(text=json.dumps([{"statement": "Use CLT"}]))]
+        client = MagicMock()
+        client.create_message = AsyncMock(side_effect=[response, RuntimeError("overloaded")])
+        source = SimpleNamespace(
+            id="s1",
+            raw_content=f"Page one text{PAGE_BREAK}Page two text",
+            title="Spec",
+            file_type="pdf",
+            created_at=None,
+            project=None,
+        )
+
+        with (
+            patch("app.services.document_extractor.get_llm_client", return_value=client),
+            patch("app.services.chunking.settings") as chunk_settings,
+        ):
+            chunk_settings.extraction_chunk_chars = 20
+            chunk_settings.extraction_chunk_overlap_chars = 0
+            with pytest.raises(ChunkExtractionError):
+                asyncio.run(DocumentExtractor(MagicMock()).aextract(source, []))
+
+        assert client.create_message.await_count == 2
+
+
+class TestTranscriptExtraction:
+    """Tests for chunked extract_items_from_transcript."""
+
+    def test_long_transcript_merges_chunk_items(self):
+        from app.services import extraction_v2
+
+        response = MagicMock()
+        response.stop_reason = "end_turn"
+        response.content = [
+            MagicMock(
+                text=json.dumps(
+                    {"items": [{"item_type": "decision", "statement": "Use CLT", "who": "Ana"}]}
+                )
+            )
+        ]
+        client = MagicMock()
+        client.create_message = AsyncMock(return_value=response)
+
+        with (
+            patch("app.services.llm_client.get_llm_client", return_value=client),
+            patch("app.services.chunking.settings") as chunk_settings,
+        ):
+            chunk_settings.extraction_chunk_chars = 2000
+            chunk_settings.extraction_chunk_overlap_chars = 200
+            items = asyncio.run(extraction_v2.extract_items_from_transcript(_transcript(200)))
+
+        assert client.create_message.await_count > 1
+        assert len(items) == 1
+        assert items[0]["statement"] == "Use CLT"
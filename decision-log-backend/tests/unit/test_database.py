@@ -576,6 +576,7 @@ class TestIndexes:
             "idx_sources_status",
             "idx_sources_type",
             "idx_sources_occurred",
+            "idx_sources_webhook",
         }
         assert expected.issubset(indexes), f"Missing indexes: {expected - indexes}"
 
@@ -4,9 +4,13 @@ Story 10.2: Document Ingestion (PDF & DOCX)
 """
 
 import io
+import threading
+import time
+
 import pytest
 
-from app.services.document_processor import DocumentProcessor
+from app.services import document_processor
+from app.services.document_processor import PAGE_BREAK, DocumentProcessor
 
 
 @pytest.fixture
@@ -151,3 +155,76 @@ def test_supported_types_constant(processor):
     """Verify SUPPORTED_TYPES includes pdf and docx."""
     assert "pdf" in processor.SUPPORTED_TYPES
     assert "docx" in processor.SUPPORTED_TYPES
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Parallel page extraction tests
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def test_parallel_extraction_preserves_page_order(tmp_path):
+    """Page ranges extracted by the process pool are reassembled in order."""
+    pages = [f"Specification page {i:02d}." for i in range(12)]
+    path = tmp_path / "spec.pdf"
+    path.write_bytes(_make_pdf(pages))
+
+    parallel = DocumentProcessor(workers=2, parallel_min_pages=2, page_timeout=30)
+    text = parallel.extract_text_from_file(str(path), "pdf")
+
+    assert text.split(f"\n\n{PAGE_BREAK}") == pages
+
+
+def test_parallel_matches_sequential_for_bytes(tmp_path):
+    """extract_text(bytes) yields the same text in pool and in-process modes."""
+    pdf_bytes = _make_pdf([f"Page {i} content." for i in range(6)])
+
+    sequential = DocumentProcessor(workers=1).extract_text(pdf_bytes, "pdf")
+    parallel = DocumentProcessor(workers=2, parallel_min_pages=2).extract_text(pdf_bytes, "pdf")
+
+    assert parallel == sequential
+
+
+def _slow_pages(path, start, end):
+    """Pool worker stand-in: hangs on any range containing the "Slow" page.
+
+    Runs in a spawned worker, where _extract_pdf_pages is not patched.
+    """
+    texts = document_processor._extract_pdf_pages(path, start, end)
+    if any("Slow" in text for text in texts):
+        time.sleep(60)
+    return texts
+
+
+def test_page_timeout_skips_slow_page_from_any_thread(tmp_path, monkeypatch):
+    """A hung page is skipped even off the main thread; a concurrent caller keeps its pages."""
+    slow_path = tmp_path / "slow.pdf"
+    slow_path.write_bytes(_make_pdf(["Fast page one.", "Slow page.", "Fast page three."]))
+    other_path = tmp_path / "other.pdf"
+    other_path.write_bytes(_make_pdf([f"Other page {i}." for i in range(4)]))
+
+    monkeypatch.setattr(document_processor, "_RANGE_OVERHEAD_SECONDS", 3)
+    monkeypatch.setattr(document_processor, "_extract_pdf_pages", _slow_pages)
+    processor = DocumentProcessor(workers=2, parallel_min_pages=100, page_timeout=0.5)
+    results = {}
+
+    def extract(name, path):
+        results[name] = processor.extract_text_from_file(str(path), "pdf")
+
+    threads = [
+        threading.Thread(target=extract, args=("slow", slow_path)),
+        threading.Thread(target=extract, args=("other", other_path)),
+    ]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=60)
+
+    assert time.monotonic() - started < 30
+    assert results["slow"].split(f"\n\n{PAGE_BREAK}") == ["Fast page one.", "Fast page three."]
+    assert results["other"].split(f"\n\n{PAGE_BREAK}") == [f"Other page {i}." for i in range(4)]
+
+
+def test_extract_text_from_missing_file():
+    """A missing file yields empty text rather than raising."""
+    assert DocumentProcessor(workers=1).extract_text_from_file("/nonexistent.pdf", "pdf") == ""
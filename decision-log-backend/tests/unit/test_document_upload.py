@@ -0,0 +1,344 @@
+"""Tests for asynchronous document upload and the prepare_document stage.
+
+Covers streaming uploads to disk, 202 responses with a queued preparation
+job, the worker stage (text extraction + summary), and status polling.
+"""
+
+import asyncio
+import io
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from starlette.datastructures import UploadFile
+
+from app.api.middleware import upload_limit
+from app.api.middleware.upload_limit import UploadSizeLimitMiddleware
+from app.api.routes import documents as documents_mod
+from app.config import settings
+from app.database.models import IngestionJob, Project, Source
+from app.database.session import get_db
+from app.services.ingestion_queue import JOB_PREPARE_DOCUMENT
+
+
+def _make_pdf(text_pages: list[str]) -> bytes:
+    """Create a simple PDF in memory with one text block per page."""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=letter)
+    for page_text in text_pages:
+        c.drawString(72, 700, page_text)
+        c.showPage()
+    c.save()
+    return buf.getvalue()
+
+
+def _request(headers=None, role="director"):
+    return SimpleNamespace(
+        state=SimpleNamespace(user=SimpleNamespace(id=uuid4(), role=role)),
+        headers=headers or {},
+    )
+
+
+@pytest.fixture
+def test_project(db_session: Session) -> Project:
+    project = Project(name="Upload Project")
+    db_session.add(project)
+    db_session.commit()
+    return project
+
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "document_upload_dir", str(tmp_path / "documents"))
+    return tmp_path / "documents"
+
+
+@pytest.fixture
+def non_closing_session(db_session):
+    """Let pipeline code call db.close() without detaching test fixtures."""
+    original_close = db_session.close
+    db_session.close = lambda: None
+    yield db_session
+    db_session.close = original_close
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Upload endpoint
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestUploadDocument:
+    """Tests for POST /projects/{id}/documents."""
+
+    def test_upload_returns_immediately_with_preparing_source(
+        self, db_session, test_project, upload_dir
+    ):
+        pdf = _make_pdf(["Structural review notes."])
+        upload = UploadFile(file=io.BytesIO(pdf), filename="review.pdf")
+
+        result = asyncio.run(
+            documents_mod.upload_document(
+                str(test_project.id), _request(), file=upload, title=None, db=db_session
+            )
+        )
+
+        assert result["status"] == "preparing"
+        assert result["status_url"].endswith(f"/documents/{result['source_id']}/status")
+        source = db_session.query(Source).one()
+        assert source.ingestion_status == "preparing"
+        assert source.raw_content is None
+        assert source.file_size == len(pdf)
+        with open(source.file_url, "rb") as f:
+            assert f.read() == pdf
+        job = db_session.query(IngestionJob).one()
+        assert job.job_type == JOB_PREPARE_DOCUMENT
+        assert job.source_id == source.id
+
+    def test_upload_over_limit_is_rejected_and_removed(
+        self, db_session, test_project, upload_dir, monkeypatch
+    ):
+        monkeypatch.setattr(documents_mod, "max_document_bytes", lambda: 1024)
+        monkeypatch.setattr(documents_mod, "UPLOAD_CHUNK_BYTES", 256)
+        upload = UploadFile(file=io.BytesIO(b"x" * 4096), filename="big.pdf")
+
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(
+                documents_mod.upload_document(
+                    str(test_project.id), _request(), file=upload, title=None, db=db_session
+                )
+            )
+
+        assert exc.value.status_code == 400
+        assert db_session.query(Source).count() == 0
+        assert not any(upload_dir.rglob("*.pdf"))
+
+    def test_empty_upload_rejected(self, db_session, test_project, upload_dir):
+        upload = UploadFile(file=io.BytesIO(b""), filename="empty.pdf")
+
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(
+                documents_mod.upload_document(
+                    str(test_project.id), _request(), file=upload, title=None, db=db_session
+                )
+            )
+
+        assert exc.value.status_code == 400
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Request size limit (before form parsing)
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def upload_client(db_session, upload_dir, monkeypatch):
+    """TestClient over the documents router with the size-limit middleware."""
+    monkeypatch.setattr(upload_limit, "max_document_bytes", lambda: 1024)
+    monkeypatch.setattr(upload_limit, "MULTIPART_OVERHEAD_BYTES", 512)
+    monkeypatch.setattr(documents_mod, "max_document_bytes", lambda: 1024)
+
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def fake_auth(request, call_next):
+        request.state.user = SimpleNamespace(id=uuid4())
+        return await call_next(request)
+
+    app.add_middleware(UploadSizeLimitMiddleware)
+    app.include_router(documents_mod.router, prefix="/api")
+    app.dependency_overrides[get_db] = lambda: db_session
+    return TestClient(app)
+
+
+def _multipart(payload: bytes, boundary: str = "limit-test") -> tuple[dict, bytes]:
+    body = (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="doc.pdf"\r\n'
+        "Content-Type: application/pdf\r\n\r\n"
+    ).encode() + payload + f"\r\n--{boundary}--\r\n".encode()
+    return {"content-type": f"multipart/form-data; boundary={boundary}"}, body
+
+
+class TestUploadSizeLimit:
+    """Oversized bodies are rejected before FastAPI parses the form."""
+
+    def test_declared_content_length_rejected_without_reading_body(
+        self, upload_client, test_project
+    ):
+        headers, body = _multipart(b"x" * 4096)
+        chunks_read = []
+
+        def stream():
+            chunks_read.append(body)
+            yield body
+
+        with patch.object(documents_mod, "save_stream") as save:
+            response = upload_client.post(
+                f"/api/projects/{test_project.id}/documents",
+                headers={**headers, "content-length": str(len(body))},
+                content=stream(),
+            )
+
+        assert response.status_code == 400
+        assert "exceeds" in response.json()["detail"]
+        assert chunks_read == []
+        save.assert_not_called()
+
+    def test_streamed_body_cut_off_before_handler(self, upload_client, db_session, test_project):
+        headers, body = _multipart(b"x" * 4096)
+
+        def stream():
+            for i in range(0, len(body), 256):
+                yield body[i:i + 256]
+
+        with patch.object(documents_mod, "save_stream") as save:
+            response = upload_client.post(
+                f"/api/projects/{test_project.id}/documents",
+                headers=headers,
+                content=stream(),
+            )
+
+        assert response.status_code == 400
+        assert "exceeds" in response.json()["detail"]
+        save.assert_not_called()
+        assert db_session.query(Source).count() == 0
+
+    def test_upload_within_limit_is_accepted(self, upload_client, db_session, test_project):
+        headers, body = _multipart(b"%PDF-1.4 small")
+
+        response = upload_client.post(
+            f"/api/projects/{test_project.id}/documents", headers=headers, content=body
+        )
+
+        assert response.status_code == 202
+        assert db_session.query(Source).one().file_size == len(b"%PDF-1.4 small")
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# prepare_document stage
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def _preparing_source(db_session, project, path, file_type="pdf") -> Source:
+    source = Source(
+        id=uuid4(),
+        project_id=project.id,
+        source_type="document",
+        title="Spec",
+        occurred_at=datetime(2026, 3, 1),
+        ingestion_status="preparing",
+        file_url=str(path),
+        file_type=file_type,
+    )
+    db_session.add(source)
+    db_session.commit()
+    return source
+
+
+class TestPrepareDocument:
+    """Tests for prepare_document_source (worker stage)."""
+
+    def test_extracts_text_and_summary(self, non_closing_session, test_project, tmp_path):
+        import app.services.ingestion_pipeline as pipeline_mod
+
+        path = tmp_path / "spec.pdf"
+        path.write_bytes(_make_pdf(["Use CLT floor slabs.", "Facade is terracotta."]))
+        source = _preparing_source(non_closing_session, test_project, path)
+
+        with (
+            patch.object(pipeline_mod, "SessionLocal", return_value=non_closing_session),
+            patch(
+                "app.services.summary_service.summarize_document_text",
+                AsyncMock(return_value="CLT slabs and terracotta facade."),
+            ),
+        ):
+            pipeline_mod.prepare_document_source(str(source.id))
+
+        non_closing_session.refresh(source)
+        assert source.ingestion_status == "pending"
+        assert "CLT floor slabs" in source.raw_content
+        assert source.ai_summary == "CLT slabs and terracotta facade."
+
+    def test_no_text_marks_failed(self, non_closing_session, test_project, tmp_path):
+        import app.services.ingestion_pipeline as pipeline_mod
+
+        path = tmp_path / "blank.pdf"
+        path.write_bytes(_make_pdf([""]))
+        source = _preparing_source(non_closing_session, test_project, path)
+
+        with patch.object(pipeline_mod, "SessionLocal", return_value=non_closing_session):
+            pipeline_mod.prepare_document_source(str(source.id))
+
+        non_closing_session.refresh(source)
+        assert source.ingestion_status == "failed"
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Status endpoint
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestDocumentStatus:
+    """Tests for GET /projects/{id}/documents/{source_id}/status."""
+
+    def _status(self, db_session, project, source, wait=0, role="director"):
+        return asyncio.run(
+            documents_mod.get_document_status(
+                str(project.id), str(source.id), _request(role=role), wait=wait, db=db_session
+            )
+        )
+
+    def test_preparing_status(self, db_session, test_project, tmp_path):
+        source = _preparing_source(db_session, test_project, tmp_path / "a.pdf")
+        assert self._status(db_session, test_project, source)["status"] == "preparing"
+
+    def test_ready_status_includes_summary(self, db_session, test_project, tmp_path):
+        source = _preparing_source(db_session, test_project, tmp_path / "a.pdf")
+        source.ingestion_status = "pending"
+        source.ai_summary = "Summary"
+        db_session.commit()
+
+        payload = self._status(db_session, test_project, source, wait=5)
+
+        assert payload["status"] == "pending"
+        assert payload["ai_summary"] == "Summary"
+
+    def test_failed_job_reported(self, db_session, test_project, tmp_path):
+        source = _preparing_source(db_session, test_project, tmp_path / "a.pdf")
+        db_session.add(
+            IngestionJob(
+                source_id=source.id,
+                job_type=JOB_PREPARE_DOCUMENT,
+                status="failed",
+                attempts=3,
+                max_attempts=3,
+                run_after=datetime.utcnow(),
+                last_error="FileNotFoundError: a.pdf",
+            )
+        )
+        db_session.commit()
+
+        payload = self._status(db_session, test_project, source)
+
+        assert payload["status"] == "failed"
+        assert "FileNotFoundError" in payload["error"]
+
+    def test_non_member_gets_403(self, db_session, test_project, tmp_path):
+        source = _preparing_source(db_session, test_project, tmp_path / "a.pdf")
+        with pytest.raises(HTTPException) as exc:
+            self._status(db_session, test_project, source, role="architect")
+        assert exc.value.status_code == 403
+
+    def test_unknown_document_404(self, db_session, test_project):
+        missing = SimpleNamespace(id=uuid4())
+        with pytest.raises(HTTPException) as exc:
+            self._status(db_session, test_project, missing)
+        assert exc.value.status_code == 404
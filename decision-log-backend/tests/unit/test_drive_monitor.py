@@ -58,7 +58,7 @@ class TestDriveMonitor:
         monitor._poll_project(project)
 
         # Should not attempt download since file already exists
-        mock_drive.download_file.assert_not_called()
+        mock_drive.download_to_file.assert_not_called()
 
     @patch('app.services.drive_monitor.DriveClient')
     @patch('app.services.drive_monitor.DocumentProcessor')
@@ -73,15 +73,13 @@ class TestDriveMonitor:
         # No existing source — file is new
         mock_db.query().filter().first.return_value = None
         mock_drive.list_new_files.return_value = [self._make_mock_file()]
-        mock_drive.download_file.return_value = b'fake pdf content'
-        mock_processor.extract_text.return_value = 'Extracted text'
+        mock_drive.download_to_file.return_value = 1024
+        mock_processor.extract_text_from_file.return_value = 'Extracted text'
 
         project = self._make_mock_project()
 
-        with patch('app.services.drive_monitor.os.makedirs'):
-            with patch('builtins.open', MagicMock()):
-                monitor = DriveMonitor(mock_db)
-                monitor._poll_project(project)
+        monitor = DriveMonitor(mock_db)
+        monitor._poll_project(project)
 
         # Source added to session
         mock_db.add.assert_called_once()
@@ -89,6 +87,9 @@ class TestDriveMonitor:
         assert source.source_type == 'document'
         assert source.ingestion_status == 'pending'
         assert source.drive_file_id == 'file-1'
+        assert source.file_size == 1024
+        file_path = mock_drive.download_to_file.call_args[0][1]
+        mock_processor.extract_text_from_file.assert_called_once_with(file_path, 'pdf')
 
     @patch('app.services.drive_monitor.DriveClient')
     @patch('app.services.drive_monitor.DocumentProcessor')
@@ -141,7 +142,7 @@ class TestDriveMonitor:
         # No existing source — file is new
         mock_db.query().filter().first.return_value = None
         mock_drive.list_new_files.return_value = [self._make_mock_file()]
-        mock_drive.download_file.side_effect = Exception("Download failed")
+        mock_drive.download_to_file.side_effect = Exception("Download failed")
 
         project = self._make_mock_project()
         monitor = DriveMonitor(mock_db)
@@ -167,15 +168,13 @@ class TestDriveMonitor:
         # No existing source
         mock_db.query().filter().first.return_value = None
         mock_drive.list_new_files.return_value = [self._make_mock_file()]
-        mock_drive.download_file.return_value = b'corrupted content'
-        mock_processor.extract_text.side_effect = Exception("Extraction failed")
+        mock_drive.download_to_file.return_value = 17
+        mock_processor.extract_text_from_file.side_effect = Exception("Extraction failed")
 
         project = self._make_mock_project()
 
-        with patch('app.services.drive_monitor.os.makedirs'):
-            with patch('builtins.open', MagicMock()):
-                monitor = DriveMonitor(mock_db)
-                monitor._poll_project(project)
+        monitor = DriveMonitor(mock_db)
+        monitor._poll_project(project)
 
         # Source still created with empty raw_content
         mock_db.add.assert_called_once()
@@ -0,0 +1,314 @@
+"""Tests for batched embedding generation and the shared encoder process."""
+
+import contextlib
+import threading
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from app.database.models import Project, ProjectItem, Source
+from app.services import encoder_server
+from app.services import enrichment_service as enrichment_mod
+from app.services.embedding_backfill import backfill_embeddings
+from app.services.enrichment_service import (
+    EMBEDDING_DIM,
+    embed_project_items,
+    encode_texts,
+    enrich_items,
+    generate_embedding,
+)
+
+
+class FakeModel:
+    """Stands in for SentenceTransformer; records encode calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, batch_size=32, **kwargs):
+        self.calls.append((list(texts), batch_size))
+        return np.array(
+            [[float(len(text))] * EMBEDDING_DIM for text in texts], dtype=np.float64
+        )
+
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    model = FakeModel()
+    monkeypatch.setattr(enrichment_mod, "_embedding_model", model)
+    monkeypatch.setattr(enrichment_mod.settings, "embedding_server_address", "")
+    return model
+
+
+def _items(n):
+    return [{"statement": f"Decision {i}", "item_type": "decision"} for i in range(n)]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# In-process encoding
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestEncodeTexts:
+    """Tests for encode_texts with the in-process model."""
+
+    def test_returns_float32_matrix_in_input_order(self, fake_model):
+        vectors = encode_texts(["a", "bbb"], batch_size=16)
+
+        assert vectors.dtype == np.float32
+        assert vectors.shape == (2, EMBEDDING_DIM)
+        assert vectors[0, 0] == 1.0 and vectors[1, 0] == 3.0
+        assert fake_model.calls == [(["a", "bbb"], 16)]
+
+    def test_default_batch_size_from_settings(self, fake_model, monkeypatch):
+        monkeypatch.setattr(enrichment_mod.settings, "embedding_batch_size", 7)
+        encode_texts(["a"])
+        assert fake_model.calls[0][1] == 7
+
+    def test_empty_input(self, fake_model):
+        vectors = encode_texts([])
+        assert vectors.shape == (0, EMBEDDING_DIM)
+        assert fake_model.calls == []
+
+    def test_no_model_returns_none(self, monkeypatch):
+        monkeypatch.setattr(enrichment_mod.settings, "embedding_server_address", "")
+        with patch.object(enrichment_mod, "_get_embedding_model", return_value=None):
+            assert encode_texts(["a"]) is None
+            assert generate_embedding("a") is None
+
+
+class TestEnrichItems:
+    """Tests for enrich_items."""
+
+    def test_encodes_all_items_in_one_call(self, fake_model):
+        items = enrich_items(_items(500))
+
+        assert len(fake_model.calls) == 1
+        assert len(fake_model.calls[0][0]) == 500
+        assert all(len(item["embedding"]) == EMBEDDING_DIM for item in items)
+
+    def test_encoder_failure_sets_none(self, fake_model):
+        fake_model.encode = MagicMock(side_effect=RuntimeError("CUDA OOM"))
+        items = enrich_items(_items(2))
+        assert [item["embedding"] for item in items] == [None, None]
+
+    def test_generate_embedding_returns_list(self, fake_model):
+        embedding = generate_embedding("abcd")
+        assert isinstance(embedding, list)
+        assert embedding[0] == 4.0
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Shared encoder process
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestEncoderServer:
+    """Tests for encoding through the long-lived encoder server."""
+
+    @pytest.fixture
+    def server(self, fake_model, monkeypatch):
+        monkeypatch.setattr(encoder_server, "_remote", None)
+        server = encoder_server.make_server("127.0.0.1:0")
+
+        def serve():
+            with contextlib.suppress(SystemExit):  # serve_forever() exits via sys.exit
+                server.serve_forever()
+
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+        host, port = server.address
+        monkeypatch.setattr(enrichment_mod.settings, "embedding_server_address", f"{host}:{port}")
+        yield server
+        server.stop_event.set()
+
+    def test_remote_encode_uses_server_model(self, server, fake_model):
+        remote = MagicMock(wraps=encoder_server.encode_remote)
+        with patch.object(encoder_server, "encode_remote", remote):
+            vectors = encode_texts(["ab", "c"], batch_size=8)
+
+        remote.assert_called_once_with(["ab", "c"], 8)
+        assert fake_model.calls == [(["ab", "c"], 8)]
+        assert vectors.dtype == np.float32
+        assert vectors[:, 0].tolist() == [2.0, 1.0]
+
+    def test_unreachable_server_falls_back_in_process(self, fake_model, monkeypatch):
+        monkeypatch.setattr(encoder_server, "_remote", None)
+        monkeypatch.setattr(enrichment_mod.settings, "embedding_server_address", "127.0.0.1:1")
+
+        vectors = encode_texts(["abc"])
+
+        assert vectors[0, 0] == 3.0
+        assert len(fake_model.calls) == 1
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Persisting embeddings (pipeline stage and backfill)
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def non_closing_session(db_session):
+    """Let pipeline/backfill code call db.close() without detaching fixtures."""
+    original_close = db_session.close
+    db_session.close = lambda: None
+    yield db_session
+    db_session.close = original_close
+
+
+@pytest.fixture
+def project(db_session):
+    project = Project(name="Embedding Project")
+    db_session.add(project)
+    db_session.commit()
+    return project
+
+
+def _add_items(db_session, project, n):
+    items = [
+        ProjectItem(
+            project_id=project.id,
+            item_type="decision",
+            statement=f"Decision {i}",
+            decision_statement=f"Decision {i}",
+            who="Ana",
+            timestamp="00:00:00",
+            discipline="structural",
+            affected_disciplines=["structural"],
+            why="Because",
+            consensus={},
+        )
+        for i in range(n)
+    ]
+    db_session.add_all(items)
+    db_session.commit()
+    return items
+
+
+def _embedded_count(db_session):
+    return db_session.query(ProjectItem).filter(ProjectItem.embedding.isnot(None)).count()
+
+
+class TestEmbedProjectItems:
+    """Tests for embed_project_items."""
+
+    def test_sets_embedding_on_each_item(self, fake_model, db_session, project):
+        items = _add_items(db_session, project, 3)
+
+        assert embed_project_items(items) == 3
+        db_session.commit()
+
+        assert len(fake_model.calls) == 1
+        assert _embedded_count(db_session) == 3
+
+    def test_no_encoder_leaves_items_untouched(self, db_session, project, monkeypatch):
+        monkeypatch.setattr(enrichment_mod.settings, "embedding_server_address", "")
+        items = _add_items(db_session, project, 2)
+        with patch.object(enrichment_mod, "_get_embedding_model", return_value=None):
+            assert embed_project_items(items) == 0
+        assert all(item.embedding is None for item in items)
+
+
+class TestPipelineEnrichment:
+    """Tests for the enrichment stage of process_approved_source."""
+
+    def _approved_source(self, db_session, project):
+        source = Source(
+            id=uuid4(),
+            project_id=project.id,
+            source_type="document",
+            title="Spec",
+            occurred_at=datetime(2026, 3, 1),
+            ingestion_status="approved",
+            raw_content="Decided to use CLT floor slabs.",
+            file_type="pdf",
+        )
+        db_session.add(source)
+        db_session.commit()
+        return source
+
+    def test_items_stored_with_embeddings(self, fake_model, non_closing_session, project):
+        import app.services.ingestion_pipeline as pipeline_mod
+
+        source = self._approved_source(non_closing_session, project)
+        extracted = [
+            {"item_type": "decision", "statement": "Use CLT", "who": "Ana"},
+            {"item_type": "action_item", "statement": "Send drawings", "owner": "Bo"},
+        ]
+
+        with (
+            patch.object(pipeline_mod, "SessionLocal", return_value=non_closing_session),
+            patch(
+                "app.services.document_extractor.DocumentExtractor.aextract",
+                AsyncMock(return_value=extracted),
+            ),
+        ):
+            pipeline_mod.process_approved_source(str(source.id))
+
+        assert len(fake_model.calls) == 1
+        assert len(fake_model.calls[0][0]) == 2
+        items = non_closing_session.query(ProjectItem).filter_by(source_id=source.id).all()
+        assert len(items) == 2
+        assert all(len(item.embedding) == EMBEDDING_DIM for item in items)
+
+    def test_encoder_failure_still_stores_items(self, fake_model, non_closing_session, project):
+        import app.services.ingestion_pipeline as pipeline_mod
+
+        fake_model.encode = MagicMock(side_effect=RuntimeError("OOM"))
+        source = self._approved_source(non_closing_session, project)
+
+        with (
+            patch.object(pipeline_mod, "SessionLocal", return_value=non_closing_session),
+            patch(
+                "app.services.document_extractor.DocumentExtractor.aextract",
+                AsyncMock(return_value=[{"item_type": "decision", "statement": "Use CLT"}]),
+            ),
+        ):
+            pipeline_mod.process_approved_source(str(source.id))
+
+        non_closing_session.refresh(source)
+        assert source.ingestion_status == "processed"
+        item = non_closing_session.query(ProjectItem).one()
+        assert item.embedding is None
+
+
+class TestBackfill:
+    """Tests for the keyset-paginated embedding backfill."""
+
+    def test_backfills_in_chunks(self, fake_model, non_closing_session, project):
+        _add_items(non_closing_session, project, 5)
+
+        total = backfill_embeddings(lambda: non_closing_session, chunk_size=2)
+
+        assert total == 5
+        assert [len(texts) for texts, _ in fake_model.calls] == [2, 2, 1]
+        assert _embedded_count(non_closing_session) == 5
+
+    def test_resumes_where_it_stopped(self, fake_model, non_closing_session, project):
+        _add_items(non_closing_session, project, 5)
+
+        assert backfill_embeddings(lambda: non_closing_session, chunk_size=2, limit=3) == 3
+        assert _embedded_count(non_closing_session) == 3
+
+        assert backfill_embeddings(lambda: non_closing_session, chunk_size=2) == 2
+        assert _embedded_count(non_closing_session) == 5
+
+    def test_after_id_skips_earlier_rows(self, fake_model, non_closing_session, project):
+        items = _add_items(non_closing_session, project, 4)
+        ordered = sorted(items, key=lambda item: item.id.hex)
+
+        total = backfill_embeddings(
+            lambda: non_closing_session, chunk_size=10, after_id=str(ordered[1].id)
+        )
+
+        assert total == 2
+
+    def test_stops_without_encoder(self, non_closing_session, project, monkeypatch):
+        monkeypatch.setattr(enrichment_mod.settings, "embedding_server_address", "")
+        _add_items(non_closing_session, project, 3)
+
+        with patch.object(enrichment_mod, "_get_embedding_model", return_value=None):
+            assert backfill_embeddings(lambda: non_closing_session, chunk_size=2) == 0
@@ -0,0 +1,240 @@
+"""Tests for full-text search over project items and sources."""
+
+import asyncio
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.api.routes import project_items as project_items_mod
+from app.database.full_text import ensure_full_text, fts5_query, rebuild_sqlite_index, text_match
+from app.database.models import Project, ProjectItem, Source, User
+from app.services.item_search import ItemFilters, lexical_search
+
+
+@pytest.fixture
+def director(db_session):
+    user = User(
+        id=uuid.uuid4(),
+        email="fts-director@example.com",
+        password_hash="hashed",
+        name="Director",
+        role="director",
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+@pytest.fixture
+def project(db_session):
+    project = Project(id=uuid.uuid4(), name="FTS Project")
+    db_session.add(project)
+    db_session.commit()
+    return project
+
+
+def _add_item(db_session, project, statement, why="Because", item_type="decision", **kwargs):
+    item = ProjectItem(
+        id=uuid.uuid4(),
+        project_id=project.id,
+        item_type=item_type,
+        source_type="meeting",
+        statement=statement,
+        decision_statement=statement,
+        who=kwargs.pop("who", "Ana"),
+        timestamp="00:00:00",
+        discipline="structural",
+        affected_disciplines=["structural"],
+        why=why,
+        consensus={},
+        **kwargs,
+    )
+    db_session.add(item)
+    db_session.commit()
+    return item
+
+
+def _matching(db_session, model, search_text):
+    return db_session.query(model).filter(text_match(db_session, model, search_text)).all()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Query translation
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestFts5Query:
+    def test_words_are_quoted(self):
+        assert fts5_query("level 3 slab") == '"level" "3" "slab"'
+
+    def test_phrases_are_kept(self):
+        assert fts5_query('"Level 3 slab" podium') == '"Level 3 slab" "podium"'
+
+    def test_operators_are_literal(self):
+        assert fts5_query("slab OR -NEAR(x) *") == '"slab" "OR" "NEAR" "x"'
+
+    def test_empty(self):
+        assert fts5_query(' "" - ') is None
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Index maintenance and matching
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestItemSearch:
+    def test_matches_indexed_fields_with_stemming(self, db_session, project):
+        slab = _add_item(db_session, project, "Pour the Level 3 slab on Friday")
+        _add_item(db_session, project, "Facade panels approved", why="Cheaper than slabs")
+        owner = _add_item(db_session, project, "Order rebar", owner="Gabriela", item_type="action_item")
+        excerpt = _add_item(db_session, project, "Adjust grid", source_excerpt="the podium transfer beams")
+
+        assert {i.id for i in _matching(db_session, ProjectItem, "slabs")} == {
+            slab.id,
+            db_session.query(ProjectItem).filter(ProjectItem.statement == "Facade panels approved").one().id,
+        }
+        assert [i.id for i in _matching(db_session, ProjectItem, '"level 3 slab"')] == [slab.id]
+        assert [i.id for i in _matching(db_session, ProjectItem, "gabriela")] == [owner.id]
+        assert [i.id for i in _matching(db_session, ProjectItem, "podium beam")] == [excerpt.id]
+        assert _matching(db_session, ProjectItem, "slab podium") == []
+
+    def test_index_follows_updates_and_deletes(self, db_session, project):
+        item = _add_item(db_session, project, "Timber cladding")
+
+        item.statement = "Brick cladding"
+        item.decision_statement = "Brick cladding"
+        db_session.commit()
+        assert _matching(db_session, ProjectItem, "timber") == []
+        assert [i.id for i in _matching(db_session, ProjectItem, "brick")] == [item.id]
+
+        db_session.delete(item)
+        db_session.commit()
+        assert _matching(db_session, ProjectItem, "brick") == []
+
+    def test_rebuild_sqlite_index(self, db_session, project):
+        item = _add_item(db_session, project, "Green roof")
+
+        rebuild_sqlite_index(db_session, ProjectItem)
+        db_session.commit()
+
+        assert [i.id for i in _matching(db_session, ProjectItem, "roof")] == [item.id]
+
+    def test_lexical_search_ranks_and_filters(self, db_session, project):
+        strong = _add_item(db_session, project, "Slab thickness: slab edge and slab depth")
+        weak = _add_item(db_session, project, "Stair core", why="Depends on the slab")
+        _add_item(db_session, project, "Slab formwork", item_type="action_item")
+
+        results = lexical_search(
+            db_session, project.id, "slab", ItemFilters(item_types=["decision"]), limit=10
+        )
+
+        assert [item.id for item, _ in results] == [strong.id, weak.id]
+        assert results[0][1] > results[1][1]
+
+    def test_list_items_search_parameter(self, db_session, project, director):
+        item = _add_item(db_session, project, "Use steel framing")
+        _add_item(db_session, project, "Use timber framing")
+
+        result = asyncio.run(
+            project_items_mod.list_project_items(
+                str(project.id),
+                SimpleNamespace(state=SimpleNamespace(user=director)),
+                db=db_session,
+                item_type=None,
+                source_type=None,
+                discipline=None,
+                is_milestone=None,
+                date_from=None,
+                date_to=None,
+                search="steel",
+                sort_by="created_at",
+                sort_order="desc",
+                limit=50,
+                offset=0,
+                cursor=None,
+                count="exact",
+            )
+        )
+
+        assert result["total"] == 1
+        assert [i["id"] for i in result["items"]] == [str(item.id)]
+
+    def test_search_endpoint_lexical_mode(self, db_session, project, director):
+        item = _add_item(db_session, project, "Level 3 slab pour")
+
+        result = asyncio.run(
+            project_items_mod.search_project_items(
+                str(project.id),
+                SimpleNamespace(state=SimpleNamespace(user=director)),
+                q="slab",
+                db=db_session,
+                item_type=None,
+                source_type=None,
+                discipline=None,
+                limit=20,
+                mode="lexical",
+            )
+        )
+
+        assert result["mode"] == "lexical"
+        assert [i["id"] for i in result["items"]] == [str(item.id)]
+
+
+class TestSourceSearch:
+    def test_matches_title_and_summary(self, db_session, project):
+        review = Source(
+            project_id=project.id,
+            source_type="meeting",
+            title="Foundation review",
+            occurred_at=datetime(2026, 2, 10),
+            ai_summary="Piles were resized",
+        )
+        email = Source(
+            project_id=project.id,
+            source_type="email",
+            title="Re: facade",
+            occurred_at=datetime(2026, 2, 11),
+            email_from="carlos@example.com",
+        )
+        db_session.add_all([review, email])
+        db_session.commit()
+
+        assert [s.id for s in _matching(db_session, Source, "pile")] == [review.id]
+        assert [s.id for s in _matching(db_session, Source, "carlos")] == [email.id]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Existing databases
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestEnsureFullText:
+    def test_adds_missing_index_to_existing_table(self, db_session, project):
+        from sqlalchemy import text
+
+        if db_session.get_bind().dialect.name != "sqlite":
+            pytest.skip("Drops the SQLite FTS5 objects")
+        item = _add_item(db_session, project, "Widen the loading dock")
+        # A database created before the search indexes existed
+        for trigger in ("ai", "ad", "au"):
+            db_session.execute(text(f"DROP TRIGGER project_items_fts_{trigger}"))
+        db_session.execute(text("DROP TABLE project_items_fts"))
+        db_session.commit()
+
+        assert ensure_full_text(db_session) == ["project_items"]
+        db_session.commit()
+
+        assert [i.id for i in _matching(db_session, ProjectItem, "dock")] == [item.id]
+        # Triggers are back: new rows are indexed
+        other = _add_item(db_session, project, "Move the dock ramp")
+        assert {i.id for i in _matching(db_session, ProjectItem, "dock")} == {item.id, other.id}
+
+    def test_is_idempotent(self, db_session, project):
+        item = _add_item(db_session, project, "Widen the loading dock")
+
+        assert ensure_full_text(db_session) == []
+        db_session.commit()
+
+        assert [i.id for i in _matching(db_session, ProjectItem, "dock")] == [item.id]
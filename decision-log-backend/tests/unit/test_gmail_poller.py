@@ -3,14 +3,22 @@
 Story 7.4: Backend Gmail API Poller
 """
 
+import asyncio
 import base64
-import pytest
-from unittest.mock import MagicMock, patch
 from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
 
-from app.services.gmail_poller import GmailPollerService, strip_html, MAX_RETRIES
-
+from app.services.gmail_poller import (
+    MAX_MESSAGE_ATTEMPTS,
+    MAX_RETRIES,
+    SUMMARY_MAX_ATTEMPTS,
+    GmailPollerService,
+    strip_html,
+)
 
 # --- Utility function tests ---
 
@@ -50,10 +58,17 @@ class TestStripHtml:
 
 @pytest.fixture
 def poller():
-    """Create a GmailPollerService instance with mocked Anthropic client."""
-    with patch("app.services.gmail_poller.Anthropic"):
-        service = GmailPollerService()
-    return service
+    """Create a GmailPollerService instance."""
+    return GmailPollerService()
+
+
+@pytest.fixture
+def create_message():
+    """Mocked create_message of the shared LLM client."""
+    client = MagicMock()
+    client.create_message = AsyncMock()
+    with patch("app.services.gmail_poller.get_llm_client", return_value=client):
+        yield client.create_message
 
 
 @pytest.fixture
@@ -230,8 +245,6 @@ class TestGmailPollerExponentialBackoff:
 
     def test_retries_on_429_quota_exceeded(self, poller):
         """Retries on quota exceeded and eventually raises after max retries."""
-        from googleapiclient.errors import HttpError
-        import httplib2
 
         mock_response = httplib2.Response({"status": "429"})
         quota_error = HttpError(resp=mock_response, content=b"Quota exceeded")
@@ -249,8 +262,6 @@ class TestGmailPollerExponentialBackoff:
 
     def test_succeeds_after_transient_failure(self, poller):
         """Returns result after one transient failure."""
-        from googleapiclient.errors import HttpError
-        import httplib2
 
         mock_response = httplib2.Response({"status": "503"})
         transient_error = HttpError(resp=mock_response, content=b"Service unavailable")
@@ -265,8 +276,6 @@ class TestGmailPollerExponentialBackoff:
 
     def test_raises_immediately_on_non_retryable_error(self, poller):
         """Non-retryable errors (e.g., 403) are raised immediately without retry."""
-        from googleapiclient.errors import HttpError
-        import httplib2
 
         mock_response = httplib2.Response({"status": "403"})
         forbidden_error = HttpError(resp=mock_response, content=b"Forbidden")
@@ -296,63 +305,193 @@ class TestGmailPollerExponentialBackoff:
 class TestGmailPollerAISummary:
     """Test AI summary generation."""
 
-    def test_generates_summary_successfully(self, poller):
+    def test_generates_summary_successfully(self, poller, create_message):
         """Returns Claude-generated summary."""
         mock_response = MagicMock()
         mock_response.content = [
             MagicMock(text="Project kickoff confirmed for March 2026.")
         ]
-        poller.anthropic.messages.create.return_value = mock_response
+        create_message.return_value = mock_response
 
-        result = poller._generate_summary(
+        result = asyncio.run(poller._generate_summary(
             "Project Kickoff", "The meeting is confirmed for March."
-        )
+        ))
 
         assert result == "Project kickoff confirmed for March 2026."
 
-    def test_truncates_summary_over_150_chars(self, poller):
+    def test_truncates_summary_over_150_chars(self, poller, create_message):
         """Truncates summary exceeding 150 characters."""
         long_summary = "A" * 200
         mock_response = MagicMock()
         mock_response.content = [MagicMock(text=long_summary)]
-        poller.anthropic.messages.create.return_value = mock_response
+        create_message.return_value = mock_response
 
-        result = poller._generate_summary("Subject", "Body")
+        result = asyncio.run(poller._generate_summary("Subject", "Body"))
 
         assert len(result) <= 150
         assert result.endswith("...")
 
-    def test_returns_none_on_api_failure(self, poller):
+    def test_returns_none_on_api_failure(self, poller, create_message):
         """Returns None (not raises) when Claude API fails."""
-        poller.anthropic.messages.create.side_effect = Exception("API error")
+        create_message.side_effect = Exception("API error")
 
-        result = poller._generate_summary("Subject", "Body")
+        result = asyncio.run(poller._generate_summary("Subject", "Body"))
 
         assert result is None
 
-    def test_returns_none_for_empty_body(self, poller):
+    def test_returns_none_for_empty_body(self, poller, create_message):
         """Returns None without calling API when body is empty."""
-        result = poller._generate_summary("Subject", "")
+        result = asyncio.run(poller._generate_summary("Subject", ""))
 
-        poller.anthropic.messages.create.assert_not_called()
+        create_message.assert_not_called()
         assert result is None
 
-    def test_truncates_body_before_sending(self, poller):
+    def test_truncates_body_before_sending(self, poller, create_message):
         """Long email bodies are truncated to 3000 chars before sending to Claude."""
         mock_response = MagicMock()
         mock_response.content = [MagicMock(text="Summary")]
-        poller.anthropic.messages.create.return_value = mock_response
+        create_message.return_value = mock_response
 
         long_body = "X" * 5000
-        poller._generate_summary("Subject", long_body)
+        asyncio.run(poller._generate_summary("Subject", long_body))
 
         # Check that the body sent to Claude was truncated
-        call_args = poller.anthropic.messages.create.call_args
+        call_args = create_message.call_args
         message_content = call_args[1]["messages"][0]["content"]
         # The message includes the prompt prefix + truncated body (3000 chars)
         assert len(message_content) < 5000
 
 
+class TestGmailPollerSummaryStage:
+    """Test the deferred, concurrent summary stage."""
+
+    @pytest.fixture
+    def emails(self, db_session):
+        from uuid import uuid4
+
+        from app.database.models import Project, Source
+
+        project = Project(id=uuid4(), name="Skyline")
+        db_session.add(project)
+
+        def add(title, raw_content="Body", status="pending", ai_summary=None, source_type="email"):
+            source = Source(
+                id=uuid4(),
+                project_id=project.id,
+                source_type=source_type,
+                title=title,
+                occurred_at=datetime(2026, 1, 5),
+                ingestion_status=status,
+                raw_content=raw_content,
+                ai_summary=ai_summary,
+            )
+            db_session.add(source)
+            return source
+
+        sources = {
+            "new": add("New"),
+            "other": add("Other"),
+            "summarised": add("Summarised", ai_summary="Done."),
+            "empty": add("Empty", raw_content=""),
+            "approved": add("Approved", status="approved"),
+            "meeting": add("Meeting", source_type="meeting"),
+        }
+        db_session.commit()
+        return {name: source.id for name, source in sources.items()}
+
+    def _summary(self, db_session, source_id):
+        from app.database.models import Source
+
+        return db_session.get(Source, source_id).ai_summary
+
+    def test_summarises_pending_emails_without_summary(self, poller, db_session, emails):
+        with patch("app.services.gmail_poller.SessionLocal", return_value=db_session), patch.object(
+            poller, "_generate_summary", side_effect=lambda subject, body: f"{subject} summary."
+        ) as mock_summary:
+            stats = poller.run_summary_stage()
+
+        assert stats == {"summarized": 2, "failed": 0}
+        assert sorted(c.args[0] for c in mock_summary.call_args_list) == ["New", "Other"]
+        assert self._summary(db_session, emails["new"]) == "New summary."
+        assert self._summary(db_session, emails["approved"]) is None
+        assert self._summary(db_session, emails["meeting"]) is None
+
+    def test_failed_summaries_stay_null_for_retry(self, poller, db_session, emails):
+        with patch("app.services.gmail_poller.SessionLocal", return_value=db_session), patch.object(
+            poller,
+            "_generate_summary",
+            side_effect=lambda subject, body: None if subject == "New" else "Ok.",
+        ):
+            stats = poller.run_summary_stage()
+
+        assert stats == {"summarized": 1, "failed": 1}
+        assert self._summary(db_session, emails["new"]) is None
+        assert self._summary(db_session, emails["other"]) == "Ok."
+
+    def test_failed_summary_backs_off_then_is_given_up(self, poller, db_session, emails):
+        def run_stage():
+            with patch("app.services.gmail_poller.SessionLocal", return_value=db_session), patch.object(
+                poller,
+                "_generate_summary",
+                side_effect=lambda subject, body: None if subject == "New" else "Ok.",
+            ) as mock_summary:
+                poller.run_summary_stage()
+            return [c.args[0] for c in mock_summary.call_args_list]
+
+        def expire_backoff():
+            for source_id, (attempts, _) in poller._summary_failures.items():
+                poller._summary_failures[source_id] = (attempts, 0.0)
+
+        assert sorted(run_stage()) == ["New", "Other"]
+        # Backing off: not retried on the next run
+        assert run_stage() == []
+        for _ in range(SUMMARY_MAX_ATTEMPTS - 1):
+            expire_backoff()
+            assert run_stage() == ["New"]
+        expire_backoff()
+        assert run_stage() == []
+        assert self._summary(db_session, emails["new"]) is None
+
+    def test_summaries_run_concurrently(self, poller):
+        """All Claude calls are in flight together, not one after another."""
+        barrier = asyncio.Barrier(3)
+
+        async def generate(subject, body):
+            async with asyncio.timeout(5):
+                await barrier.wait()
+            return subject.lower()
+
+        with patch.object(poller, "_generate_summary", side_effect=generate):
+            summaries = asyncio.run(
+                poller._generate_summaries([("A", "x"), ("B", "y"), ("C", "z")])
+            )
+
+        assert summaries == ["a", "b", "c"]
+
+    def test_poll_cycle_does_not_call_claude(self, poller, mock_db):
+        """_process_message stores the Source without a summary."""
+        body = base64.urlsafe_b64encode(b"Hello").decode()
+        msg = {
+            "threadId": "t1",
+            "labelIds": [],
+            "payload": {
+                "mimeType": "text/plain",
+                "headers": [{"name": "Subject", "value": "Kickoff"}],
+                "body": {"data": body},
+            },
+        }
+
+        with patch(
+            "app.services.gmail_poller.email_matcher_service.match_project", return_value="p1"
+        ), patch.object(poller, "_is_duplicate", return_value=False), patch.object(
+            poller, "_generate_summary"
+        ) as mock_summary:
+            assert poller._process_message(MagicMock(), mock_db, "m1", msg) is True
+
+        mock_summary.assert_not_called()
+        assert mock_db.add.call_args.args[0].ai_summary is None
+
+
 class TestGmailPollerRunCycle:
     """Test the full poll cycle orchestration."""
 
@@ -395,7 +534,9 @@ class TestGmailPollerRunCycle:
             poller, "_list_messages"
         ) as mock_list, patch.object(
             poller, "_process_message"
-        ) as mock_process:
+        ) as mock_process, patch(
+            "app.services.gmail_poller.settings.gmail_incremental_sync", False
+        ):
             mock_auth.get_service.return_value = MagicMock()
             mock_session_factory.return_value = MagicMock()
             mock_list.return_value = [
@@ -415,6 +556,393 @@ class TestGmailPollerRunCycle:
         assert stats["emails_skipped"] == 1
 
 
+class _FakeBatch:
+    """Stand-in for googleapiclient's BatchHttpRequest."""
+
+    def __init__(self, callback, responder):
+        self.callback = callback
+        self.responder = responder
+        self.request_ids = []
+
+    def add(self, request, request_id):
+        self.request_ids.append(request_id)
+
+    def execute(self):
+        for request_id in self.request_ids:
+            response, exception = self.responder(request_id)
+            self.callback(request_id, response, exception)
+
+
+def _batch_service(responder):
+    service = MagicMock()
+    service.batches = []
+
+    def new_batch(callback):
+        batch = _FakeBatch(callback, responder)
+        service.batches.append(batch)
+        return batch
+
+    service.new_batch_http_request.side_effect = new_batch
+    return service
+
+
+class TestGmailPollerBatchFetch:
+    """Test batched message fetching."""
+
+    def test_fetches_in_batches(self, poller):
+        """120 messages are fetched in 3 batch round trips."""
+        service = _batch_service(lambda request_id: ({"id": request_id}, None))
+        ids = [f"msg{i}" for i in range(120)]
+
+        with patch("app.services.gmail_poller.settings.gmail_batch_size", 50), patch(
+            "app.services.gmail_poller.time.sleep"
+        ):
+            results = poller._fetch_messages(service, ids)
+
+        assert results == {i: {"id": i} for i in ids}
+        assert [len(b.request_ids) for b in service.batches] == [50, 50, 20]
+        assert poller._api_call_count == 120
+        assert poller._http_request_count == 3
+
+    def test_retries_throttled_sub_requests(self, poller):
+        """Sub-requests rejected with 429 are retried in a new batch; 404s are not."""
+
+        attempts = {}
+
+        def responder(request_id):
+            attempts[request_id] = attempts.get(request_id, 0) + 1
+            if request_id == "throttled" and attempts[request_id] == 1:
+                return None, HttpError(resp=httplib2.Response({"status": "429"}), content=b"")
+            if request_id == "gone":
+                return None, HttpError(resp=httplib2.Response({"status": "404"}), content=b"")
+            return {"id": request_id}, None
+
+        service = _batch_service(responder)
+
+        with patch("app.services.gmail_poller.time.sleep") as mock_sleep:
+            results = poller._fetch_messages(service, ["ok", "throttled", "gone"])
+
+        assert results["ok"] == {"id": "ok"}
+        assert results["throttled"] == {"id": "throttled"}
+        assert isinstance(results["gone"], HttpError)
+        assert [b.request_ids for b in service.batches] == [["ok", "throttled", "gone"], ["throttled"]]
+        assert mock_sleep.called
+
+    def test_batches_are_paced_for_quota(self, poller):
+        """A batch costing 250 quota units takes at least one second at 250 units/s."""
+        service = _batch_service(lambda request_id: ({"id": request_id}, None))
+
+        with patch(
+            "app.services.gmail_poller.settings.gmail_quota_units_per_second", 250
+        ), patch("app.services.gmail_poller.time.sleep") as mock_sleep:
+            poller._fetch_messages(service, [f"msg{i}" for i in range(50)])
+
+        assert mock_sleep.call_args[0][0] == pytest.approx(1.0, abs=0.1)
+
+    def test_run_cycle_processes_fetched_messages(self, poller):
+        """The cycle hands batched messages to _process_message and reports API usage."""
+        service = _batch_service(lambda request_id: ({"id": request_id}, None))
+
+        with patch(
+            "app.services.gmail_poller.gmail_auth_service"
+        ) as mock_auth, patch(
+            "app.services.gmail_poller.SessionLocal"
+        ), patch.object(
+            poller, "_list_messages", return_value=[{"id": "msg1"}, {"id": "msg2"}]
+        ), patch.object(
+            poller, "_process_message", return_value=True
+        ) as mock_process, patch("app.services.gmail_poller.time.sleep"), patch(
+            "app.services.gmail_poller.settings.gmail_incremental_sync", False
+        ):
+            mock_auth.get_service.return_value = service
+            stats = poller.run_poll_cycle()
+
+        assert [c.args[2:] for c in mock_process.call_args_list] == [
+            ("msg1", {"id": "msg1"}),
+            ("msg2", {"id": "msg2"}),
+        ]
+        assert stats["emails_stored"] == 2
+        assert stats["api_calls"] == 2
+        assert stats["http_requests"] == 1
+
+
+def _history_page(history_id, added, next_page_token=None):
+    page = {
+        "historyId": history_id,
+        "history": [
+            {"messagesAdded": [{"message": {"id": i, "threadId": f"t-{i}", "labelIds": labels}}]}
+            for i, labels in added
+        ],
+    }
+    if next_page_token:
+        page["nextPageToken"] = next_page_token
+    return page
+
+
+def _http_error(status):
+
+    return HttpError(resp=httplib2.Response({"status": str(status)}), content=b"")
+
+
+class TestGmailPollerIncrementalSync:
+    """Test historyId-based incremental sync."""
+
+    def test_lists_new_unread_messages_from_history(self, poller):
+        """History pages are followed; read, spam and repeated messages are dropped."""
+        service = MagicMock()
+        service.users.return_value.history.return_value.list.return_value.execute.side_effect = [
+            _history_page(
+                "120",
+                [("m1", ["UNREAD", "INBOX"]), ("m2", ["INBOX"]), ("m3", ["UNREAD", "SPAM"])],
+                next_page_token="p2",
+            ),
+            _history_page("125", [("m1", ["UNREAD", "INBOX"]), ("m4", ["UNREAD"])]),
+        ]
+
+        messages, history_id = poller._sync_messages(service, "100")
+
+        assert messages == [{"id": "m1", "threadId": "t-m1"}, {"id": "m4", "threadId": "t-m4"}]
+        assert history_id == "125"
+        assert poller._sync_mode == "incremental"
+        assert poller._api_call_count == 2
+        calls = service.users.return_value.history.return_value.list.call_args_list
+        assert calls[0].kwargs["startHistoryId"] == "100"
+        assert "pageToken" not in calls[0].kwargs
+        assert calls[1].kwargs["pageToken"] == "p2"
+
+    def test_relabelled_unread_messages_are_listed(self, poller):
+        """labelAdded records count too: mail labelled after it arrived is picked up."""
+        service = MagicMock()
+        service.users.return_value.history.return_value.list.return_value.execute.return_value = {
+            "historyId": "130",
+            "history": [
+                {
+                    "labelsAdded": [
+                        {
+                            "message": {"id": "m5", "threadId": "t-m5", "labelIds": ["UNREAD", "Label_7"]},
+                            "labelIds": ["Label_7"],
+                        },
+                        {
+                            "message": {"id": "m6", "threadId": "t-m6", "labelIds": ["Label_7", "TRASH"]},
+                            "labelIds": ["Label_7"],
+                        },
+                    ]
+                },
+                {"messagesAdded": [{"message": {"id": "m5", "threadId": "t-m5", "labelIds": ["UNREAD"]}}]},
+            ],
+        }
+
+        messages, _ = poller._sync_messages(service, "100")
+
+        assert messages == [{"id": "m5", "threadId": "t-m5"}]
+        history_list = service.users.return_value.history.return_value.list
+        assert history_list.call_args.kwargs["historyTypes"] == ["messageAdded", "labelAdded"]
+
+    def test_label_filter_is_resolved_to_label_id(self, poller):
+        service = MagicMock()
+        service.users.return_value.labels.return_value.list.return_value.execute.return_value = {
+            "labels": [{"id": "Label_7", "name": "projects"}]
+        }
+        service.users.return_value.history.return_value.list.return_value.execute.return_value = (
+            _history_page("101", [])
+        )
+
+        with patch("app.services.gmail_poller.settings.gmail_label_filter", "projects"):
+            poller._sync_messages(service, "100")
+
+        history_list = service.users.return_value.history.return_value.list
+        assert history_list.call_args.kwargs["labelId"] == "Label_7"
+
+    def test_expired_checkpoint_falls_back_to_full_sync(self, poller):
+        """A 404 from history.list triggers a full listing and a fresh historyId."""
+        service = MagicMock()
+        service.users.return_value.history.return_value.list.return_value.execute.side_effect = (
+            _http_error(404)
+        )
+        service.users.return_value.getProfile.return_value.execute.return_value = {
+            "historyId": "900"
+        }
+
+        with patch.object(poller, "_list_messages", return_value=[{"id": "m1"}]) as mock_list:
+            messages, history_id = poller._sync_messages(service, "100")
+
+        assert messages == [{"id": "m1"}]
+        assert history_id == "900"
+        assert poller._sync_mode == "full"
+        mock_list.assert_called_once()
+
+    def test_other_history_errors_are_raised(self, poller):
+        service = MagicMock()
+        service.users.return_value.history.return_value.list.return_value.execute.side_effect = (
+            _http_error(403)
+        )
+
+        with pytest.raises(HttpError):
+            poller._sync_messages(service, "100")
+
+    def test_checkpoint_advances_past_failed_messages(self, poller, db_session):
+        """The first cycle is full, the next incremental; failures don't hold the checkpoint."""
+        from app.database.models import SyncCheckpoint
+
+        service = _batch_service(lambda request_id: ({"id": request_id}, None))
+        service.users.return_value.getProfile.return_value.execute.return_value = {
+            "historyId": "100"
+        }
+        service.users.return_value.history.return_value.list.return_value.execute.side_effect = [
+            _history_page("110", [("m2", ["UNREAD"])]),
+            _history_page("120", [("m3", ["UNREAD"])]),
+        ]
+
+        with patch(
+            "app.services.gmail_poller.gmail_auth_service"
+        ) as mock_auth, patch(
+            "app.services.gmail_poller.SessionLocal", return_value=db_session
+        ), patch.object(
+            poller, "_list_messages", return_value=[{"id": "m1"}]
+        ), patch.object(
+            poller, "_process_message", side_effect=[True, True, Exception("fail")]
+        ), patch("app.services.gmail_poller.time.sleep"):
+            mock_auth.get_service.return_value = service
+
+            first = poller.run_poll_cycle()
+            assert db_session.get(SyncCheckpoint, "gmail_history_id").value == "100"
+            second = poller.run_poll_cycle()
+            assert db_session.get(SyncCheckpoint, "gmail_history_id").value == "110"
+            third = poller.run_poll_cycle()
+            assert db_session.get(SyncCheckpoint, "gmail_history_id").value == "120"
+            assert db_session.get(SyncCheckpoint, "gmail_failed:m3").value == "1"
+
+        assert first["sync_mode"] == "full"
+        assert (second["sync_mode"], second["emails_stored"]) == ("incremental", 1)
+        # One history.list call and one batch for a single new message
+        assert (second["api_calls"], second["http_requests"]) == (2, 2)
+        assert third["errors"] == 1
+
+    def _run_cycles(self, poller, db_session, process_results):
+        """Run one incremental cycle per _process_message result on a quiet mailbox."""
+        from app.database.models import SyncCheckpoint
+
+        db_session.add_all([
+            SyncCheckpoint(name="gmail_history_id", value="100"),
+            SyncCheckpoint(name="gmail_failed:m1", value="1"),
+        ])
+        db_session.commit()
+        service = _batch_service(lambda request_id: ({"id": request_id}, None))
+        service.users.return_value.history.return_value.list.return_value.execute.return_value = (
+            _history_page("130", [])
+        )
+
+        with patch(
+            "app.services.gmail_poller.gmail_auth_service"
+        ) as mock_auth, patch(
+            "app.services.gmail_poller.SessionLocal", return_value=db_session
+        ), patch.object(
+            poller, "_process_message", side_effect=process_results
+        ) as mock_process, patch("app.services.gmail_poller.time.sleep"):
+            mock_auth.get_service.return_value = service
+            stats = [poller.run_poll_cycle() for _ in process_results]
+
+        return stats, mock_process
+
+    def test_failed_message_is_retried_until_stored(self, poller, db_session):
+        from app.database.models import SyncCheckpoint
+
+        stats, mock_process = self._run_cycles(
+            poller, db_session, [Exception("fail"), True]
+        )
+
+        assert [call.args[2] for call in mock_process.call_args_list] == ["m1", "m1"]
+        assert (stats[0]["errors"], stats[1]["emails_stored"]) == (1, 1)
+        assert db_session.get(SyncCheckpoint, "gmail_failed:m1") is None
+        assert db_session.get(SyncCheckpoint, "gmail_history_id").value == "130"
+
+    def test_failing_message_is_given_up(self, poller, db_session):
+        from app.database.models import SyncCheckpoint
+
+        failures = [Exception("fail")] * (MAX_MESSAGE_ATTEMPTS - 1)
+        stats, mock_process = self._run_cycles(poller, db_session, failures + [True])
+
+        # Tried in MAX_MESSAGE_ATTEMPTS cycles in total (one before this test)
+        assert mock_process.call_count == MAX_MESSAGE_ATTEMPTS - 1
+        assert stats[-1]["emails_fetched"] == 0
+        assert db_session.get(SyncCheckpoint, "gmail_failed:m1") is None
+
+
+class TestGmailPollerPreFetchDedup:
+    """Test the bulk duplicate check that runs before messages are fetched."""
+
+    @pytest.fixture
+    def stored_email(self, db_session):
+        from uuid import uuid4
+
+        from app.database.models import Project, Source
+
+        project = Project(id=uuid4(), name="Skyline")
+        db_session.add(project)
+        db_session.add(
+            Source(
+                id=uuid4(),
+                project_id=project.id,
+                source_type="email",
+                title="Stored",
+                occurred_at=datetime(2026, 1, 5),
+                ingestion_status="pending",
+                email_thread_id="t-m1",
+                webhook_id="m1",
+            )
+        )
+        db_session.commit()
+
+    def test_returns_stored_ids_in_one_query(self, poller, db_session, stored_email):
+        from sqlalchemy import event
+
+        statements = []
+        engine = db_session.get_bind()
+        count = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            known = poller._stored_message_ids(
+                db_session,
+                [
+                    {"id": "m1", "threadId": "t-m1"},
+                    {"id": "m2", "threadId": "t-m2"},
+                    {"id": "m1-other", "threadId": "t-x"},
+                ],
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+
+        assert known == {"m1"}
+        assert len(statements) == 1
+
+    def test_thread_mismatch_is_not_a_duplicate(self, poller, db_session, stored_email):
+        assert poller._stored_message_ids(db_session, [{"id": "m1", "threadId": "t-9"}]) == set()
+        assert poller._stored_message_ids(db_session, [{"id": "m1"}]) == {"m1"}
+
+    def test_run_cycle_does_not_fetch_stored_messages(self, poller, db_session, stored_email):
+        service = _batch_service(lambda request_id: ({"id": request_id}, None))
+
+        with patch(
+            "app.services.gmail_poller.gmail_auth_service"
+        ) as mock_auth, patch(
+            "app.services.gmail_poller.SessionLocal", return_value=db_session
+        ), patch.object(
+            poller,
+            "_list_messages",
+            return_value=[{"id": "m1", "threadId": "t-m1"}, {"id": "m2", "threadId": "t-m2"}],
+        ), patch.object(
+            poller, "_process_message", return_value=True
+        ) as mock_process, patch("app.services.gmail_poller.time.sleep"), patch(
+            "app.services.gmail_poller.settings.gmail_incremental_sync", False
+        ):
+            mock_auth.get_service.return_value = service
+            stats = poller.run_poll_cycle()
+
+        assert [b.request_ids for b in service.batches] == [["m2"]]
+        assert [c.args[2] for c in mock_process.call_args_list] == ["m2"]
+        assert (stats["emails_fetched"], stats["emails_stored"], stats["emails_skipped"]) == (2, 1, 1)
+
+
 class TestGmailPollerLabelResolution:
     """Test label ID to name resolution."""
 
@@ -431,10 +959,10 @@ class TestGmailPollerLabelResolution:
         mock_service.users.return_value.labels.return_value.get.assert_not_called()
 
     def test_resolves_custom_label(self, poller):
-        """Custom label IDs are resolved to their names via API."""
+        """Custom label IDs are resolved to their names via the label registry."""
         mock_service = MagicMock()
-        mock_service.users.return_value.labels.return_value.get.return_value.execute.return_value = {
-            "name": "project/skyline-tower"
+        mock_service.users.return_value.labels.return_value.list.return_value.execute.return_value = {
+            "labels": [{"id": "Label_123", "name": "project/skyline-tower"}]
         }
 
         result = poller._resolve_label_names(mock_service, ["Label_123"])
@@ -444,10 +972,54 @@ class TestGmailPollerLabelResolution:
     def test_handles_label_resolution_error(self, poller):
         """Label resolution errors are caught and label is skipped."""
         mock_service = MagicMock()
-        mock_service.users.return_value.labels.return_value.get.return_value.execute.side_effect = Exception(
-            "Label not found"
+        mock_service.users.return_value.labels.return_value.list.return_value.execute.side_effect = Exception(
+            "Labels unavailable"
         )
 
         result = poller._resolve_label_names(mock_service, ["Label_bad"])
 
         assert result == []
+
+    def test_registry_is_loaded_once_for_many_messages(self, poller):
+        """Resolving labels for many messages costs a single labels.list call."""
+        mock_service = MagicMock()
+        labels_api = mock_service.users.return_value.labels.return_value
+        labels_api.list.return_value.execute.return_value = {
+            "labels": [{"id": "Label_1", "name": "alpha"}, {"id": "Label_2", "name": "beta"}]
+        }
+
+        for _ in range(20):
+            assert poller._resolve_label_names(mock_service, ["INBOX", "Label_1", "Label_2"]) == [
+                "alpha",
+                "beta",
+            ]
+
+        assert labels_api.list.return_value.execute.call_count == 1
+        labels_api.get.assert_not_called()
+
+    def test_unknown_label_reloads_registry_once_per_cycle(self, poller):
+        """A label created since the registry was loaded triggers one reload."""
+        mock_service = MagicMock()
+        execute = mock_service.users.return_value.labels.return_value.list.return_value.execute
+        execute.side_effect = [
+            {"labels": [{"id": "Label_1", "name": "alpha"}]},
+            {"labels": [{"id": "Label_1", "name": "alpha"}, {"id": "Label_2", "name": "beta"}]},
+        ]
+
+        assert poller._resolve_label_names(mock_service, ["Label_1"]) == ["alpha"]
+        assert poller._resolve_label_names(mock_service, ["Label_2"]) == ["beta"]
+        # Deleted label: no further reload within the cycle
+        assert poller._resolve_label_names(mock_service, ["Label_gone"]) == []
+        assert execute.call_count == 2
+
+    def test_registry_expires_after_ttl(self, poller):
+        mock_service = MagicMock()
+        execute = mock_service.users.return_value.labels.return_value.list.return_value.execute
+        execute.return_value = {"labels": [{"id": "Label_1", "name": "alpha"}]}
+
+        with patch("app.services.gmail_poller.time.monotonic", return_value=1000.0):
+            poller._resolve_label_names(mock_service, ["Label_1"])
+        with patch("app.services.gmail_poller.time.monotonic", return_value=1000.0 + 3600):
+            poller._resolve_label_names(mock_service, ["Label_1"])
+
+        assert execute.call_count == 2
@@ -264,6 +264,129 @@ class TestListIngestion:
         for source, project_name in rows:
             assert project_name == "Test Project Alpha"
 
+    def test_list_ingestion_cursor_pagination(
+        self, db_session: Session, multiple_sources: list, director_user: User
+    ):
+        """next_cursor walks every source once, newest first, without totals."""
+        import asyncio
+        from types import SimpleNamespace
+
+        from app.api.routes.ingestion import list_sources
+
+        def page(cursor):
+            return asyncio.run(
+                list_sources(
+                    SimpleNamespace(state=SimpleNamespace(user=director_user)),
+                    project_id=None,
+                    source_type=None,
+                    ingestion_status=None,
+                    date_from=None,
+                    date_to=None,
+                    search=None,
+                    limit=2,
+                    offset=0,
+                    db=db_session,
+                    cursor=cursor,
+                    count="none",
+                )
+            )
+
+        seen, cursor = [], None
+        for _ in range(5):
+            result = page(cursor)
+            assert result["total"] is None
+            seen += [s["id"] for s in result["sources"]]
+            cursor = result["next_cursor"]
+            if cursor is None:
+                break
+
+        expected = [
+            str(s.id)
+            for s in sorted(multiple_sources, key=lambda s: (s.created_at, s.id.hex), reverse=True)
+        ]
+        assert seen == expected
+
+
+    def test_cursor_page_is_served_by_status_index(
+        self, db_session: Session, multiple_sources: list, director_user: User
+    ):
+        """The keyset condition and order are a range scan of idx_sources_status_created."""
+        from sqlalchemy import event
+
+        first = _list_sources(db_session, director_user, ingestion_status="pending", limit=1)
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            second = _list_sources(
+                db_session,
+                director_user,
+                ingestion_status="pending",
+                limit=1,
+                cursor=first["next_cursor"],
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        statement, parameters = next((st, p) for st, p in statements if "LIMIT" in st)
+        plan = " ".join(
+            row[-1]
+            for row in db_session.connection().exec_driver_sql(
+                "EXPLAIN QUERY PLAN " + statement, parameters
+            )
+        )
+
+        assert len(second["sources"]) == 1
+        assert second["sources"][0]["id"] != first["sources"][0]["id"]
+        assert "idx_sources_status_created" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_cursor_with_wrong_value_type_is_rejected(
+        self, db_session: Session, multiple_sources: list, director_user: User
+    ):
+        """A well-formed cursor carrying a non-UUID id is a 400, not a 500."""
+        from fastapi import HTTPException
+
+        from app.services.pagination import encode_cursor
+
+        for values in (
+            (datetime(2026, 2, 10), "not-a-uuid"),
+            ("yesterday", str(uuid4())),
+            (datetime(2026, 2, 10), 42),
+        ):
+            with pytest.raises(HTTPException) as exc_info:
+                _list_sources(
+                    db_session, director_user, cursor=encode_cursor("created_at:desc", *values)
+                )
+            assert exc_info.value.status_code == 400
+
+
+def _list_sources(db_session, user, **overrides):
+    """Call list_sources directly with every query parameter set."""
+    import asyncio
+    from types import SimpleNamespace
+
+    from app.api.routes.ingestion import list_sources
+
+    params = {
+        "project_id": None,
+        "source_type": None,
+        "ingestion_status": None,
+        "date_from": None,
+        "date_to": None,
+        "search": None,
+        "limit": 50,
+        "offset": 0,
+        "cursor": None,
+        "count": "none",
+    }
+    params.update(overrides)
+    return asyncio.run(
+        list_sources(SimpleNamespace(state=SimpleNamespace(user=user)), db=db_session, **params)
+    )
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Test: Approve source (admin only)
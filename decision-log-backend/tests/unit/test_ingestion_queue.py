@@ -0,0 +1,235 @@
+"""Tests for the durable ingestion job queue and worker.
+
+Covers enqueueing, lease-based claiming, crash recovery via lease expiry,
+retry/backoff, and the worker's handler dispatch.
+"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.database.models import IngestionJob, Project, Source
+from app.services import ingestion_queue
+from app.worker import IngestionWorker
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Fixtures
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def approved_sources(db_session: Session) -> list:
+    """Create a project with three approved sources."""
+    project = Project(name="Queue Project")
+    db_session.add(project)
+    db_session.commit()
+
+    sources = []
+    for i in range(3):
+        source = Source(
+            id=uuid4(),
+            project_id=project.id,
+            source_type="meeting",
+            title=f"Meeting {i}",
+            occurred_at=datetime(2026, 2, 10 + i, 9, 0, 0),
+            ingestion_status="approved",
+            raw_content="transcript",
+        )
+        sources.append(source)
+    db_session.add_all(sources)
+    db_session.commit()
+    return sources
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Queue tests
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestEnqueue:
+    """Tests for enqueue_job."""
+
+    def test_enqueue_creates_queued_job(self, db_session, approved_sources):
+        job = ingestion_queue.enqueue_job(db_session, approved_sources[0].id)
+        db_session.commit()
+
+        saved = db_session.query(IngestionJob).filter(IngestionJob.id == job.id).one()
+        assert saved.status == "queued"
+        assert saved.attempts == 0
+        assert saved.job_type == ingestion_queue.JOB_PROCESS_SOURCE
+
+    def test_enqueue_is_idempotent_for_active_jobs(self, db_session, approved_sources):
+        first = ingestion_queue.enqueue_job(db_session, approved_sources[0].id)
+        second = ingestion_queue.enqueue_job(db_session, approved_sources[0].id)
+        db_session.commit()
+
+        assert first.id == second.id
+        assert db_session.query(IngestionJob).count() == 1
+
+
+class TestClaim:
+    """Tests for lease-based claiming."""
+
+    def test_claim_marks_job_running(self, db_session, approved_sources):
+        ingestion_queue.enqueue_job(db_session, approved_sources[0].id)
+        db_session.commit()
+
+        job = ingestion_queue.claim_job(db_session, "worker-a", lease_seconds=60)
+
+        assert job is not None
+        assert job.status == "running"
+        assert job.locked_by == "worker-a"
+        assert job.attempts == 1
+        assert job.locked_until > datetime.utcnow()
+
+    def test_claimed_job_not_claimed_twice(self, db_session, approved_sources):
+        ingestion_queue.enqueue_job(db_session, approved_sources[0].id)
+        db_session.commit()
+
+        assert ingestion_queue.claim_job(db_session, "worker-a") is not None
+        assert ingestion_queue.claim_job(db_session, "worker-b") is None
+
+    def test_each_worker_claims_a_different_job(self, db_session, approved_sources):
+        for source in approved_sources:
+            ingestion_queue.enqueue_job(db_session, source.id)
+        db_session.commit()
+
+        claimed = {
+            ingestion_queue.claim_job(db_session, f"worker-{i}").id for i in range(3)
+        }
+        assert len(claimed) == 3
+
+    def test_expired_lease_is_reclaimed(self, db_session, approved_sources):
+        """A crashed worker's job becomes claimable once its lease expires."""
+        ingestion_queue.enqueue_job(db_session, approved_sources[0].id)
+        db_session.commit()
+        job = ingestion_queue.claim_job(db_session, "crashed-worker")
+
+        job.locked_until = datetime.utcnow() - timedelta(seconds=1)
+        db_session.commit()
+
+        reclaimed = ingestion_queue.claim_job(db_session, "worker-b")
+        assert reclaimed is not None
+        assert reclaimed.id == job.id
+        assert reclaimed.locked_by == "worker-b"
+        assert reclaimed.attempts == 2
+
+    def test_expired_lease_on_final_attempt_fails_job(self, db_session, approved_sources):
+        ingestion_queue.enqueue_job(db_session, approved_sources[0].id, max_attempts=1)
+        db_session.commit()
+        job = ingestion_queue.claim_job(db_session, "crashed-worker")
+        job.locked_until = datetime.utcnow() - timedelta(seconds=1)
+        db_session.commit()
+
+        assert ingestion_queue.claim_job(db_session, "worker-b") is None
+        db_session.refresh(job)
+        assert job.status == "failed"
+
+    def test_extend_lease_requires_ownership(self, db_session, approved_sources):
+        ingestion_queue.enqueue_job(db_session, approved_sources[0].id)
+        db_session.commit()
+        job = ingestion_queue.claim_job(db_session, "worker-a")
+
+        assert ingestion_queue.extend_lease(db_session, job.id, "worker-a") is True
+        assert ingestion_queue.extend_lease(db_session, job.id, "worker-b") is False
+
+
+class TestCompletion:
+    """Tests for completing and failing jobs."""
+
+    def test_complete_job(self, db_session, approved_sources):
+        ingestion_queue.enqueue_job(db_session, approved_sources[0].id)
+        db_session.commit()
+        job = ingestion_queue.claim_job(db_session, "worker-a")
+
+        assert ingestion_queue.complete_job(db_session, job.id, "worker-a") is True
+        db_session.refresh(job)
+        assert job.status == "succeeded"
+        assert job.locked_by is None
+        assert job.finished_at is not None
+
+    def test_fail_job_requeues_with_backoff(self, db_session, approved_sources):
+        ingestion_queue.enqueue_job(db_session, approved_sources[0].id, max_attempts=2)
+        db_session.commit()
+        job = ingestion_queue.claim_job(db_session, "worker-a")
+
+        status = ingestion_queue.fail_job(
+            db_session, job.id, "worker-a", "boom", retry_delay_seconds=60
+        )
+
+        db_session.refresh(job)
+        assert status == "queued"
+        assert job.last_error == "boom"
+        assert job.run_after > datetime.utcnow()
+        # Not due yet
+        assert ingestion_queue.claim_job(db_session, "worker-a") is None
+
+    def test_fail_job_marks_failed_after_max_attempts(self, db_session, approved_sources):
+        ingestion_queue.enqueue_job(db_session, approved_sources[0].id, max_attempts=1)
+        db_session.commit()
+        job = ingestion_queue.claim_job(db_session, "worker-a")
+
+        status = ingestion_queue.fail_job(db_session, job.id, "worker-a", "boom")
+
+        assert status == "failed"
+
+    def test_queue_stats(self, db_session, approved_sources):
+        for source in approved_sources:
+            ingestion_queue.enqueue_job(db_session, source.id)
+        db_session.commit()
+        ingestion_queue.claim_job(db_session, "worker-a")
+
+        stats = ingestion_queue.queue_stats(db_session)
+        assert stats["queued"] == 2
+        assert stats["running"] == 1
+        assert stats["failed"] == 0
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Worker tests
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestIngestionWorker:
+    """Tests for IngestionWorker job execution."""
+
+    def test_run_once_executes_handler_and_completes(self, db_session, approved_sources):
+        source_id = str(approved_sources[0].id)
+        ingestion_queue.enqueue_job(db_session, source_id)
+        db_session.commit()
+        processed = []
+
+        worker = IngestionWorker(
+            concurrency=1,
+            session_factory=lambda: db_session,
+            handlers={ingestion_queue.JOB_PROCESS_SOURCE: processed.append},
+        )
+
+        assert worker.run_once() is True
+        assert processed == [source_id]
+        job = db_session.query(IngestionJob).one()
+        assert job.status == "succeeded"
+
+    def test_run_once_records_handler_failure(self, db_session, approved_sources):
+        ingestion_queue.enqueue_job(db_session, approved_sources[0].id)
+        db_session.commit()
+
+        def failing_handler(source_id):
+            raise RuntimeError("LLM unavailable")
+
+        worker = IngestionWorker(
+            concurrency=1,
+            session_factory=lambda: db_session,
+            handlers={ingestion_queue.JOB_PROCESS_SOURCE: failing_handler},
+        )
+
+        assert worker.run_once() is True
+        job = db_session.query(IngestionJob).one()
+        assert job.status == "queued"
+        assert "LLM unavailable" in job.last_error
+
+    def test_run_once_empty_queue(self, db_session):
+        worker = IngestionWorker(concurrency=1, session_factory=lambda: db_session, handlers={})
+        assert worker.run_once() is False
@@ -0,0 +1,551 @@
+"""Tests for semantic search over project items."""
+
+import asyncio
+import re
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.api.routes import project_items as project_items_mod
+from app.database.models import Project, ProjectItem, User
+from app.services import vector_index
+from app.services.enrichment_service import EMBEDDING_DIM, build_embedding_text
+from app.services.item_search import (
+    ItemFilters,
+    SemanticSearchUnavailableError,
+    build_semantic_query,
+    query_embedding_text,
+    reciprocal_rank_fusion,
+    semantic_search,
+    vector_search,
+)
+from app.services.vector_index import ProjectVectorIndex, _Row
+
+
+@pytest.fixture
+def director(db_session):
+    user = User(
+        id=uuid.uuid4(),
+        email="search-director@example.com",
+        password_hash="hashed",
+        name="Director",
+        role="director",
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+@pytest.fixture
+def project(db_session):
+    project = Project(id=uuid.uuid4(), name="Search Project")
+    db_session.add(project)
+    db_session.commit()
+    return project
+
+
+@pytest.fixture(autouse=True)
+def _reset_vector_index():
+    yield
+    vector_index.registry.invalidate()
+
+
+def _unit(axis: int) -> list:
+    vector = [0.0] * EMBEDDING_DIM
+    vector[axis] = 1.0
+    return vector
+
+
+def _query_embedding(axis: int):
+    """Patch the query encoder to return the unit vector along axis."""
+    return patch(
+        "app.services.item_search.encode_texts",
+        return_value=np.array([_unit(axis)], dtype=np.float32),
+    )
+
+
+def _add_item(db_session, project, statement, axis, item_type="decision", disciplines=None):
+    item = ProjectItem(
+        id=uuid.uuid4(),
+        project_id=project.id,
+        item_type=item_type,
+        source_type="meeting",
+        statement=statement,
+        decision_statement=statement,
+        who="Ana",
+        timestamp="00:00:00",
+        discipline="general",
+        affected_disciplines=disciplines or ["general"],
+        why="Because",
+        consensus={},
+        embedding=_unit(axis) if axis is not None else None,
+    )
+    db_session.add(item)
+    db_session.commit()
+    return item
+
+
+def _item(project, statement, axis):
+    return ProjectItem(
+        id=uuid.uuid4(),
+        project_id=project.id,
+        item_type="decision",
+        statement=statement,
+        decision_statement=statement,
+        who="Ana",
+        timestamp="",
+        discipline="general",
+        why="",
+        consensus={},
+        embedding=_unit(axis),
+    )
+
+
+def _compile_pg(query) -> str:
+    return str(query.statement.compile(dialect=postgresql.dialect()))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Query construction (pgvector)
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestSemanticQuery:
+    """Tests for the pgvector ANN query."""
+
+    def test_orders_by_cosine_distance_with_limit(self, db_session, project):
+        query = build_semantic_query(db_session, str(project.id), [0.1] * 384, ItemFilters(), 10)
+        sql = _compile_pg(query)
+
+        assert "<=>" in sql
+        assert "ORDER BY project_items.embedding <=>" in sql
+        assert "LIMIT" in sql
+        assert "project_items.embedding IS NOT NULL" in sql
+
+    def test_filters_are_applied(self, db_session, project):
+        filters = ItemFilters(
+            item_types=["decision", "topic"],
+            source_types=["meeting"],
+            disciplines=["structural"],
+        )
+        sql = _compile_pg(
+            build_semantic_query(db_session, str(project.id), [0.1] * 384, filters, 10)
+        )
+
+        assert "project_items.item_type IN" in sql
+        assert "project_items.source_type IN" in sql
+        assert "project_items.affected_disciplines" in sql
+
+    def test_hnsw_index_is_postgres_only(self, db_session):
+        index = next(
+            i for i in ProjectItem.__table__.indexes if i.name == "idx_project_items_embedding_hnsw"
+        )
+        ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+        assert "USING hnsw" in ddl
+        assert "vector_cosine_ops" in ddl
+        if db_session.get_bind().dialect.name == "sqlite":
+            names = db_session.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'index'")
+            ).scalars().all()
+            assert "idx_project_items_embedding_hnsw" not in names
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Endpoint
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestSearchEndpoint:
+    """Tests for GET /projects/{id}/items/search."""
+
+    def test_search_route_precedes_item_detail_route(self):
+        paths = [route.path for route in project_items_mod.router.routes]
+        assert paths.index("/projects/{project_id}/items/search") < paths.index(
+            "/projects/{project_id}/items/{item_id}"
+        )
+
+    def _search(self, db_session, project, director, **params):
+        request = SimpleNamespace(state=SimpleNamespace(user=director))
+        query = {
+            "q": "timber floors",
+            "item_type": None,
+            "source_type": None,
+            "discipline": None,
+            "limit": 20,
+        }
+        query.update(params)
+        return asyncio.run(
+            project_items_mod.search_project_items(str(project.id), request, db=db_session, **query)
+        )
+
+    def test_returns_ranked_items_with_scores(self, db_session, project, director):
+        _add_item(db_session, project, "Use CLT floor slabs", axis=0)
+        _add_item(db_session, project, "Facade is terracotta", axis=1)
+
+        with _query_embedding(0):
+            result = self._search(db_session, project, director)
+
+        assert [item["statement"] for item in result["items"]] == [
+            "Use CLT floor slabs",
+            "Facade is terracotta",
+        ]
+        assert result["items"][0]["score"] == 1.0
+        assert result["total"] == 2
+
+    def test_unavailable_model_returns_503(self, db_session, project, director):
+        with patch("app.services.item_search.encode_texts", return_value=None):
+            with pytest.raises(HTTPException) as exc:
+                self._search(db_session, project, director)
+
+        assert exc.value.status_code == 503
+
+    def test_pgvector_backend_on_sqlite_raises(self, db_session, project, monkeypatch):
+        monkeypatch.setattr("app.services.item_search.settings.vector_search_backend", "pgvector")
+        with _query_embedding(0), pytest.raises(SemanticSearchUnavailableError):
+            semantic_search(db_session, str(project.id), "timber floors")
+
+
+class _PostgresSession:
+    """Session stand-in that reports PostgreSQL and records SET LOCAL values."""
+
+    def __init__(self):
+        self.settings = {}
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+
+    def execute(self, statement):
+        name, value = re.fullmatch(r"SET LOCAL (\S+) = (\S+)", str(statement)).groups()
+        self.settings[name] = value
+
+
+def _simulated_hnsw(table, ef_search):
+    """build_semantic_query stand-in for an HNSW index over the whole table.
+
+    With index scans on, the project filter is applied to the ef_search
+    nearest rows of the table (a scan that is not iterative); with
+    enable_indexscan off, the project's rows are ranked exactly.
+    """
+
+    def build(db, project_id, vector, filters, limit):
+        def rows():
+            ranked = sorted(table, key=lambda row: row[2])
+            if db.settings.get("enable_indexscan") != "off":
+                ranked = ranked[:ef_search]
+            matches = [(item, d) for pid, item, d in ranked if pid == project_id]
+            return matches[:limit]
+
+        return SimpleNamespace(all=rows)
+
+    return build
+
+
+class TestFilteredPgvectorSearch:
+    """A small project among a large table still fills its page."""
+
+    def test_small_project_falls_back_to_exact_scan(self, monkeypatch):
+        monkeypatch.setattr("app.services.item_search.settings.vector_search_backend", "pgvector")
+        monkeypatch.setattr("app.services.item_search.settings.vector_search_ef_search", 100)
+        big, small = "big-project", "small-project"
+        table = [(big, SimpleNamespace(id=f"big-{i}"), 0.1 + i / 10000) for i in range(2000)]
+        table += [(small, SimpleNamespace(id=f"small-{i}"), 0.5 + i / 100) for i in range(8)]
+        db = _PostgresSession()
+
+        with patch(
+            "app.services.item_search.build_semantic_query", _simulated_hnsw(table, 100)
+        ):
+            results = vector_search(db, small, [0.1] * EMBEDDING_DIM, ItemFilters(), 5)
+
+        assert [item.id for item, _ in results] == [f"small-{i}" for i in range(5)]
+        assert results[0][1] == pytest.approx(0.5)
+        assert db.settings["hnsw.iterative_scan"] == "strict_order"
+        assert db.settings["enable_indexscan"] == "on"
+
+    def test_full_page_skips_exact_scan(self, monkeypatch):
+        monkeypatch.setattr("app.services.item_search.settings.vector_search_backend", "pgvector")
+        table = [("p", SimpleNamespace(id=f"item-{i}"), i / 100) for i in range(50)]
+        db = _PostgresSession()
+
+        with patch(
+            "app.services.item_search.build_semantic_query", _simulated_hnsw(table, 100)
+        ):
+            results = vector_search(db, "p", [0.1] * EMBEDDING_DIM, ItemFilters(), 10)
+
+        assert len(results) == 10
+        assert "enable_indexscan" not in db.settings
+
+    def test_iterative_scan_can_be_disabled(self, monkeypatch):
+        monkeypatch.setattr("app.services.item_search.settings.vector_search_backend", "pgvector")
+        monkeypatch.setattr("app.services.item_search.settings.vector_search_iterative_scan", "off")
+        db = _PostgresSession()
+
+        with patch("app.services.item_search.build_semantic_query", _simulated_hnsw([], 100)):
+            assert vector_search(db, "p", [0.1] * EMBEDDING_DIM, ItemFilters(), 10) == []
+
+        assert "hnsw.iterative_scan" not in db.settings
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Hybrid search
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestHybridSearch:
+    """Tests for mode=hybrid (full-text + vector, reciprocal rank fusion)."""
+
+    def _search(self, db_session, project, director, q):
+        request = SimpleNamespace(state=SimpleNamespace(user=director))
+        return asyncio.run(
+            project_items_mod.search_project_items(
+                str(project.id),
+                request,
+                q=q,
+                db=db_session,
+                item_type=None,
+                source_type=None,
+                discipline=None,
+                limit=20,
+                mode="hybrid",
+            )
+        )
+
+    def test_reciprocal_rank_fusion(self):
+        a, b, c = (SimpleNamespace(id=uuid.UUID(int=i)) for i in (1, 2, 3))
+
+        fused = reciprocal_rank_fusion([(a, 2.0), (b, 1.0)], [(b, 0.9), (c, 0.8)], k=60)
+
+        assert [r.item for r in fused] == [b, a, c]
+        assert fused[0].score == pytest.approx(1 / 62 + 1 / 61)
+        assert (fused[0].lexical.rank, fused[0].semantic.rank) == (2, 1)
+        assert fused[1].semantic is None and fused[2].lexical is None
+
+    def test_query_uses_item_embedding_template(self):
+        text = query_embedding_text(
+            "podium changes", ItemFilters(item_types=["decision"], disciplines=["structural"])
+        )
+
+        assert text == "podium changes | Type: decision | Disciplines: structural"
+        # Same slots as the stored items' embedding text
+        item_text = build_embedding_text(
+            {"statement": "x", "item_type": "decision", "affected_disciplines": ["structural"]}
+        )
+        assert set(text.split(" | ")[1:]) <= set(item_text.split(" | "))
+
+    def test_unfiltered_query_is_embedded_as_typed(self):
+        assert query_embedding_text("podium changes") == "podium changes"
+        assert (
+            query_embedding_text("podium changes", ItemFilters(item_types=["decision", "topic"]))
+            == "podium changes"
+        )
+
+    def test_fuses_phrase_and_concept_matches(self, db_session, project, director):
+        both = _add_item(db_session, project, "Level 3 slab thickened at the podium", axis=0)
+        phrase = _add_item(
+            db_session, project, "Level 3 slab pour sequence agreed with the contractor", axis=1
+        )
+        concept = _add_item(db_session, project, "Transfer beams for retail podium", axis=2)
+
+        query = np.zeros(EMBEDDING_DIM, dtype=np.float32)
+        query[0], query[2] = 0.8, 0.6
+        with patch("app.services.item_search.encode_texts", return_value=query[None, :]):
+            result = self._search(db_session, project, director, '"level 3 slab"')
+
+        ids = [item["id"] for item in result["items"]]
+        assert result["mode"] == "hybrid"
+        assert ids[0] == str(both.id)
+        assert set(ids) == {str(both.id), str(phrase.id), str(concept.id)}
+
+        top = result["items"][0]["scores"]
+        assert top["lexical"]["rank"] == 1 and top["semantic"]["rank"] == 1
+        assert top["rrf"] == result["items"][0]["score"]
+        by_id = {item["id"]: item["scores"] for item in result["items"]}
+        assert by_id[str(concept.id)]["lexical"] is None
+
+    def test_without_embedding_model_uses_full_text_only(self, db_session, project, director):
+        item = _add_item(db_session, project, "Level 3 slab pour", axis=0)
+
+        with patch("app.services.item_search.encode_texts", return_value=None):
+            result = self._search(db_session, project, director, "slab")
+
+        assert [i["id"] for i in result["items"]] == [str(item.id)]
+        assert result["items"][0]["scores"]["semantic"] is None
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# In-process NumPy index
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def _row(item_id, axis, item_type="decision", disciplines=("general",)):
+    return _Row.from_values(
+        uuid.UUID(int=item_id), uuid.UUID(int=0), _unit(axis), item_type, "meeting", disciplines
+    )
+
+
+class TestProjectVectorIndex:
+    """Tests for ProjectVectorIndex top-k search."""
+
+    def test_top_k_by_cosine_similarity(self):
+        index = ProjectVectorIndex(capacity=2)  # Forces growth
+        for item_id in range(5):
+            index.upsert(_row(item_id, axis=item_id))
+
+        query = np.zeros(EMBEDDING_DIM, dtype=np.float32)
+        query[3], query[1] = 0.9, 0.4
+        hits = index.search(query, k=2)
+
+        assert [item_id for item_id, _ in hits] == [str(uuid.UUID(int=3)), str(uuid.UUID(int=1))]
+        assert hits[0][1] > hits[1][1]
+
+    def test_filters(self):
+        index = ProjectVectorIndex()
+        index.upsert(_row(1, 0, item_type="decision", disciplines=("structural",)))
+        index.upsert(_row(2, 0, item_type="topic", disciplines=("mep",)))
+
+        assert [h[0] for h in index.search(_unit(0), 10, item_types=["topic"])] == [
+            str(uuid.UUID(int=2))
+        ]
+        assert [h[0] for h in index.search(_unit(0), 10, disciplines=["structural", "civil"])] == [
+            str(uuid.UUID(int=1))
+        ]
+        assert index.search(_unit(0), 10, source_types=["email"]) == []
+
+    def test_remove_keeps_matrix_contiguous(self):
+        index = ProjectVectorIndex()
+        for item_id in range(3):
+            index.upsert(_row(item_id, axis=item_id))
+
+        index.remove(str(uuid.UUID(int=0)))
+
+        assert len(index) == 2
+        assert index.search(_unit(2), 1)[0] == (str(uuid.UUID(int=2)), 1.0)
+        assert all(h[0] != str(uuid.UUID(int=0)) for h in index.search(_unit(0), 10))
+
+
+class TestIncrementalUpdates:
+    """The index follows committed ProjectItem inserts, updates and deletes."""
+
+    def test_insert_update_delete_after_load(self, db_session, project):
+        first = _add_item(db_session, project, "Use CLT floor slabs", axis=0)
+        index = vector_index.registry.get(db_session, project.id)
+        assert len(index) == 1
+
+        second = _add_item(db_session, project, "Facade is terracotta", axis=1)
+        assert len(index) == 2
+
+        second.embedding = _unit(0)
+        db_session.commit()
+        assert index.search(_unit(0), 1)[0][1] == pytest.approx(1.0)
+
+        db_session.delete(first)
+        db_session.commit()
+        assert [h[0] for h in index.search(_unit(0), 10)] == [str(second.id)]
+
+    def test_rolled_back_changes_are_ignored(self, db_session, project):
+        index = vector_index.registry.get(db_session, project.id)
+
+        item = ProjectItem(
+            project_id=project.id,
+            item_type="decision",
+            decision_statement="Draft",
+            who="Ana",
+            timestamp="",
+            discipline="general",
+            why="",
+            consensus={},
+            embedding=_unit(0),
+        )
+        db_session.add(item)
+        db_session.flush()
+        db_session.rollback()
+
+        assert len(index) == 0
+
+    def test_items_without_embedding_are_not_indexed(self, db_session, project):
+        _add_item(db_session, project, "Pending enrichment", axis=None)
+        assert len(vector_index.registry.get(db_session, project.id)) == 0
+
+    def test_item_moved_to_another_project_leaves_old_index(self, db_session, project):
+        other = Project(id=uuid.uuid4(), name="Other Project")
+        db_session.add(other)
+        item = _add_item(db_session, project, "Use CLT floor slabs", axis=0)
+        old_index = vector_index.registry.get(db_session, project.id)
+        new_index = vector_index.registry.get(db_session, other.id)
+
+        item.project_id = other.id
+        db_session.commit()
+
+        assert len(old_index) == 0
+        assert [h[0] for h in new_index.search(_unit(0), 10)] == [str(item.id)]
+
+    def test_savepoint_rollback_keeps_outer_changes(self, db_session, project):
+        index = vector_index.registry.get(db_session, project.id)
+
+        kept = _item(project, "Use CLT floor slabs", axis=0)
+        db_session.add(kept)
+        db_session.flush()
+        savepoint = db_session.begin_nested()
+        db_session.add(_item(project, "Draft", axis=1))
+        db_session.flush()
+        savepoint.rollback()
+        released = db_session.begin_nested()
+        db_session.add(_item(project, "Facade is terracotta", axis=2))
+        released.commit()
+        assert len(index) == 0  # Nothing is applied before the outer commit
+
+        db_session.commit()
+
+        assert sorted(h[0] for h in index.search(_unit(0), 10)) == sorted(
+            str(i.id)
+            for i in db_session.query(ProjectItem).filter(ProjectItem.statement != "Draft")
+        )
+        assert len(index) == 2
+
+
+class TestOtherProcessWrites:
+    """Writes from other processes are found by the freshness probe in get()."""
+
+    @staticmethod
+    def _other_process():
+        # Changes made while the registry is not listening reach it only
+        # through the database, like those of python -m app.worker
+        return patch.object(vector_index.registry, "is_tracking", return_value=False)
+
+    def test_insert_update_delete_from_another_process(self, db_session, project):
+        first = _add_item(db_session, project, "Use CLT floor slabs", axis=0)
+        assert len(vector_index.registry.get(db_session, project.id)) == 1
+
+        with self._other_process():
+            second = _add_item(db_session, project, "Facade is terracotta", axis=1)
+        index = vector_index.registry.get(db_session, project.id)
+        assert len(index) == 2
+
+        with self._other_process():
+            second.embedding = _unit(2)
+            # SQLite's CURRENT_TIMESTAMP has one-second resolution
+            second.updated_at = datetime.utcnow() + timedelta(seconds=5)
+            db_session.commit()
+        index = vector_index.registry.get(db_session, project.id)
+        assert index.search(_unit(2), 1)[0] == (str(second.id), pytest.approx(1.0))
+
+        with self._other_process():
+            db_session.delete(first)
+            db_session.commit()
+        index = vector_index.registry.get(db_session, project.id)
+        assert [h[0] for h in index.search(_unit(0), 10)] == [str(second.id)]
+
+    def test_unchanged_project_is_not_reloaded(self, db_session, project):
+        _add_item(db_session, project, "Use CLT floor slabs", axis=0)
+        index = vector_index.registry.get(db_session, project.id)
+
+        assert vector_index.registry.get(db_session, project.id) is index
+
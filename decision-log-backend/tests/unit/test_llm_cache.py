@@ -0,0 +1,231 @@
+"""Tests for the content-addressed LLM response cache."""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services import llm_cache as llm_cache_mod
+from app.services.llm_cache import LLMCache, cached_create, make_cache_key
+from app.services.llm_client import LLMClient
+
+
+def _response(text: str, stop_reason: str = "end_turn"):
+    response = MagicMock()
+    response.content = [MagicMock(text=text)]
+    response.stop_reason = stop_reason
+    return response
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LLMCache(path=str(tmp_path / "llm.sqlite3"), ttl_seconds=3600, max_entries=100)
+
+
+@pytest.fixture
+def enabled_cache(cache, monkeypatch):
+    """Install a temporary cache as the process-wide cache."""
+    monkeypatch.setattr(llm_cache_mod.settings, "llm_cache_enabled", True)
+    monkeypatch.setattr(llm_cache_mod, "_cache", cache)
+    return cache
+
+
+MESSAGES = [{"role": "user", "content": "Summarize"}]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Keys and storage
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestCacheKey:
+    """Tests for make_cache_key."""
+
+    def test_key_is_deterministic(self):
+        assert make_cache_key("m", MESSAGES, 100, "v1") == make_cache_key("m", MESSAGES, 100, "v1")
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            {"model": "other"},
+            {"max_tokens": 200},
+            {"prompt_version": "v2"},
+            {"messages": [{"role": "user", "content": "Summarize!"}]},
+            {"temperature": 0.5},
+        ],
+    )
+    def test_key_changes_with_inputs(self, changed):
+        base = {"model": "m", "messages": MESSAGES, "max_tokens": 100, "prompt_version": "v1"}
+        assert make_cache_key(**base) != make_cache_key(**{**base, **changed})
+
+
+class TestLLMCache:
+    """Tests for LLMCache storage, TTL and eviction."""
+
+    def test_miss_then_hit(self, cache):
+        key = make_cache_key("m", MESSAGES, 100)
+        assert cache.get(key) is None
+
+        cache.put(key, "m", _response("A summary", "end_turn"))
+        hit = cache.get(key)
+
+        assert hit.content[0].text == "A summary"
+        assert hit.stop_reason == "end_turn"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_expired_entry_is_a_miss(self, cache):
+        cache.ttl_seconds = 0
+        cache.put("k", "m", _response("old"))
+        time.sleep(0.01)
+
+        assert cache.get("k") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction_bounds_size(self, cache):
+        cache.max_entries = 3
+        for i in range(5):
+            cache.put(f"k{i}", "m", _response(str(i)))
+            time.sleep(0.001)
+        cache.get("k0")  # Touch: k0 becomes most recently used
+
+        cache.evict()
+
+        assert cache.stats()["entries"] == 3
+        assert cache.get("k0") is not None
+        assert cache.get("k1") is None
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "shared.sqlite3")
+        LLMCache(path=path).put("k", "m", _response("kept"))
+        assert LLMCache(path=path).get("k").content[0].text == "kept"
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Integration with callers
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestCachedCalls:
+    """Tests for cache use by sync and async callers."""
+
+    def test_cached_create_calls_api_once(self, enabled_cache):
+        create = MagicMock(return_value=_response("summary"))
+
+        first = cached_create(create, model="m", max_tokens=100, messages=MESSAGES, temperature=0)
+        second = cached_create(create, model="m", max_tokens=100, messages=MESSAGES, temperature=0)
+
+        create.assert_called_once()
+        assert first.content[0].text == second.content[0].text == "summary"
+        assert enabled_cache.stats()["hits"] == 1
+
+    def test_cached_create_bypassed_when_disabled(self):
+        create = MagicMock(return_value=_response("summary"))
+        cached_create(create, model="m", max_tokens=100, messages=MESSAGES, temperature=0)
+        cached_create(create, model="m", max_tokens=100, messages=MESSAGES, temperature=0)
+        assert create.call_count == 2
+
+    def test_llm_client_serves_replays_from_cache(self, enabled_cache):
+        fake_client = MagicMock()
+
+        async def create(**kwargs):
+            return _response("[]")
+
+        fake_client.messages.create = MagicMock(side_effect=create)
+        client = LLMClient(api_key="test")
+
+        async def replay():
+            await client.create_message("prompt", prompt_version="v1", temperature=0)
+            return await client.create_message("prompt", prompt_version="v1", temperature=0)
+
+        with patch("app.services.llm_client.AsyncAnthropic", return_value=fake_client):
+            result = asyncio.run(replay())
+
+        assert fake_client.messages.create.call_count == 1
+        assert result.content[0].text == "[]"
+
+    def test_use_cache_false_always_calls_api(self, enabled_cache):
+        fake_client = MagicMock()
+
+        async def create(**kwargs):
+            return _response("[]")
+
+        fake_client.messages.create = MagicMock(side_effect=create)
+        client = LLMClient(api_key="test")
+
+        async def replay():
+            await client.create_message("prompt", use_cache=False, temperature=0)
+            await client.create_message("prompt", use_cache=False, temperature=0)
+
+        with patch("app.services.llm_client.AsyncAnthropic", return_value=fake_client):
+            asyncio.run(replay())
+
+        assert fake_client.messages.create.call_count == 2
+
+    @pytest.mark.parametrize("params", [{}, {"temperature": 0.7}])
+    def test_sampled_calls_are_not_cached(self, enabled_cache, params):
+        create = MagicMock(return_value=_response("summary"))
+
+        cached_create(create, model="m", max_tokens=100, messages=MESSAGES, **params)
+        cached_create(create, model="m", max_tokens=100, messages=MESSAGES, **params)
+
+        assert create.call_count == 2
+        assert enabled_cache.stats()["entries"] == 0
+
+    def test_rejected_or_truncated_responses_are_not_cached(self, enabled_cache):
+        """A response the caller cannot parse, or cut at max_tokens, is asked for again."""
+        create = MagicMock(
+            side_effect=[_response("not json"), _response("[1", "max_tokens"), _response("[]")]
+        )
+
+        def call():
+            return cached_create(
+                create,
+                model="m",
+                max_tokens=100,
+                messages=MESSAGES,
+                temperature=0,
+                validate=lambda r: json.loads(r.content[0].text) is not None,
+            )
+
+        call()
+        call()
+        call()
+        assert call().content[0].text == "[]"
+        assert create.call_count == 3
+
+    def test_llm_client_cache_io_runs_off_the_event_loop(self, enabled_cache):
+        fake_client = MagicMock()
+
+        async def create(**kwargs):
+            return _response("[]")
+
+        fake_client.messages.create = MagicMock(side_effect=create)
+        client = LLMClient(api_key="test")
+        threads = []
+        get, put = enabled_cache.get, enabled_cache.put
+
+        def record(method):
+            def wrapper(*args):
+                threads.append(threading.current_thread())
+                return method(*args)
+
+            return wrapper
+
+        async def call():
+            loop_thread = threading.current_thread()
+            await client.create_message("prompt", temperature=0)
+            return loop_thread
+
+        with (
+            patch("app.services.llm_client.AsyncAnthropic", return_value=fake_client),
+            patch.object(enabled_cache, "get", side_effect=record(get)),
+            patch.object(enabled_cache, "put", side_effect=record(put)),
+        ):
+            loop_thread = asyncio.run(call())
+
+        assert len(threads) == 2
+        assert loop_thread not in threads
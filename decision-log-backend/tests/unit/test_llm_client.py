@@ -0,0 +1,225 @@
+"""Tests for the shared async LLM client and concurrent source extraction."""
+
+import asyncio
+import json
+import threading
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.database.models import Base, Project, ProjectItem, Source
+from app.services import llm_client as llm_client_mod
+from app.services.llm_client import LLMClient, get_llm_client, run_sync
+
+
+def _message(text: str):
+    response = MagicMock()
+    response.content = [MagicMock(text=text)]
+    return response
+
+
+class _FakeMessages:
+    """Records peak concurrency of messages.create calls."""
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return _message("[]")
+
+
+@pytest.fixture
+def fake_messages():
+    """Patch AsyncAnthropic so every client shares one fake messages resource."""
+    messages = _FakeMessages()
+    fake_client = MagicMock()
+    fake_client.messages = messages
+    with patch.object(llm_client_mod, "AsyncAnthropic", return_value=fake_client) as cls:
+        yield messages, cls
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# LLMClient
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestLLMClient:
+    """Tests for client reuse and the concurrency bound."""
+
+    def test_semaphore_bounds_in_flight_requests(self, fake_messages):
+        messages, _ = fake_messages
+        client = LLMClient(api_key="test", max_concurrency=3)
+
+        async def burst():
+            await asyncio.gather(*(client.create_message("hi") for _ in range(10)))
+
+        asyncio.run(burst())
+
+        assert messages.calls == 10
+        assert messages.peak == 3
+
+    def test_client_reused_within_loop(self, fake_messages):
+        _, anthropic_cls = fake_messages
+        client = LLMClient(api_key="test", max_concurrency=2)
+
+        async def two_calls():
+            await client.create_message("a")
+            await client.create_message("b")
+
+        asyncio.run(two_calls())
+
+        assert anthropic_cls.call_count == 1
+
+    def test_complete_returns_text(self, fake_messages):
+        client = LLMClient(api_key="test")
+        assert asyncio.run(client.complete("hi")) == "[]"
+
+    def test_run_sync_shares_loop_across_threads(self, fake_messages):
+        messages, anthropic_cls = fake_messages
+        client = LLMClient(api_key="test", max_concurrency=4)
+        threads = [
+            threading.Thread(target=run_sync, args=(client.create_message("x"),))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert messages.calls == 8
+        assert messages.peak <= 4
+        assert anthropic_cls.call_count == 1
+
+    def test_get_llm_client_is_singleton(self):
+        assert get_llm_client() is get_llm_client()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Concurrent pipeline batch
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestProcessApprovedSources:
+    """Tests for process_approved_sources (batch extraction)."""
+
+    @pytest.fixture
+    def db_session(self, tmp_path):
+        """File-backed database: each pipeline session gets its own connection."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'pipeline.db'}")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        yield db
+        db.close()
+        engine.dispose()
+
+    @pytest.fixture
+    def document_sources(self, db_session):
+        project = Project(name="Batch Project")
+        db_session.add(project)
+        db_session.commit()
+        sources = [
+            Source(
+                id=uuid4(),
+                project_id=project.id,
+                source_type="document",
+                title=f"Spec {i}",
+                occurred_at=datetime(2026, 3, 1),
+                ingestion_status="approved",
+                raw_content="Decided to use CLT floor slabs.",
+                file_type="pdf",
+            )
+            for i in range(4)
+        ]
+        db_session.add_all(sources)
+        db_session.commit()
+        return [str(s.id) for s in sources]
+
+    def test_batch_extracts_concurrently(self, db_session, document_sources):
+        import app.services.ingestion_pipeline as pipeline_mod
+
+        items = [{"item_type": "decision", "statement": "Use CLT", "who": "Ana"}]
+        in_flight = {"now": 0, "peak": 0}
+
+        async def create_message(*args, **kwargs):
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            # Hold the slot until every source's call has started (or time out)
+            for _ in range(200):
+                if in_flight["peak"] == len(document_sources):
+                    break
+                await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return _message(json.dumps(items))
+
+        mock_client = MagicMock()
+        mock_client.create_message = AsyncMock(side_effect=create_message)
+        with (
+            patch.object(
+                pipeline_mod, "SessionLocal", sessionmaker(bind=db_session.get_bind())
+            ),
+            patch(
+                "app.services.document_extractor.get_llm_client",
+                return_value=mock_client,
+            ),
+        ):
+            results = pipeline_mod.process_approved_sources(document_sources)
+
+        assert results == {source_id: None for source_id in document_sources}
+        assert in_flight["peak"] == len(document_sources)
+        assert db_session.query(ProjectItem).count() == len(document_sources)
+        statuses = {s.ingestion_status for s in db_session.query(Source).all()}
+        assert statuses == {"processed"}
+
+    def test_database_work_stays_off_the_llm_loop(self, db_session, document_sources):
+        """Session queries and commits run in worker threads, not on the shared loop."""
+        import app.services.ingestion_pipeline as pipeline_mod
+
+        engine = db_session.get_bind()
+        threads = []
+
+        def record(conn, cursor, statement, *args):
+            threads.append(threading.current_thread().name)
+
+        mock_client = MagicMock()
+        mock_client.create_message = AsyncMock(return_value=_message("[]"))
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            with (
+                patch.object(pipeline_mod, "SessionLocal", sessionmaker(bind=engine)),
+                patch(
+                    "app.services.document_extractor.get_llm_client",
+                    return_value=mock_client,
+                ),
+            ):
+                pipeline_mod.process_approved_source(document_sources[0])
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert threads
+        assert "llm-event-loop" not in threads
+        assert db_session.get(Source, document_sources[0]).ingestion_status == "processed"
+
+    def test_batch_reports_per_source_errors(self, db_session, document_sources):
+        import app.services.ingestion_pipeline as pipeline_mod
+
+        async def failing(source_id):
+            if source_id == document_sources[0]:
+                raise RuntimeError("boom")
+
+        with patch.object(pipeline_mod, "process_approved_source_async", side_effect=failing):
+            results = pipeline_mod.process_approved_sources(document_sources)
+
+        assert results[document_sources[0]] == "boom"
+        assert all(results[s] is None for s in document_sources[1:])
@@ -4,6 +4,7 @@ import uuid
 from datetime import datetime, timedelta
 
 import pytest
+from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
 from app.database.models import (
@@ -502,6 +503,202 @@ class TestFacets:
         assert disc_counts["structural"] >= 3  # appears in decisions, action_item, topic
         assert disc_counts["architecture"] >= 2
 
+    def test_compute_item_facets_uses_aggregates(self, db_session, test_project, test_items):
+        """compute_item_facets returns per-group counts for the whole project."""
+        from app.services.item_facets import compute_item_facets
+
+        facets = compute_item_facets(db_session, test_project.id)
+
+        assert facets["item_types"] == {
+            "decision": 2,
+            "action_item": 1,
+            "topic": 1,
+            "idea": 1,
+            "information": 1,
+        }
+        assert facets["source_types"] == {"meeting": 5, "manual_input": 1}
+        assert facets["disciplines"] == {
+            "structural": 4,
+            "architecture": 3,
+            "civil": 1,
+            "landscape": 1,
+            "sustainability": 1,
+            "general": 1,
+        }
+
+    def test_facets_reflect_filters_except_their_own(self, db_session, test_project, test_items):
+        """Each facet applies every active filter but its own dimension."""
+        from app.services.item_facets import compute_item_facets
+
+        facets = compute_item_facets(
+            db_session,
+            test_project.id,
+            {"item_type": ProjectItem.item_type.in_(["decision"])},
+        )
+
+        assert facets["item_types"]["topic"] == 1  # Own filter ignored
+        assert facets["source_types"] == {"meeting": 2}
+        assert facets["disciplines"] == {"structural": 2, "architecture": 2}
+
+    def test_list_endpoint_returns_filtered_facets(
+        self, db_session, test_project, test_items, test_user
+    ):
+        """GET /items?source_type=manual_input narrows the other facets."""
+        import asyncio
+        from types import SimpleNamespace
+
+        from app.api.routes.project_items import list_project_items
+
+        result = asyncio.run(
+            list_project_items(
+                str(test_project.id),
+                SimpleNamespace(state=SimpleNamespace(user=test_user)),
+                db=db_session,
+                item_type=None,
+                source_type="manual_input",
+                discipline=None,
+                is_milestone=None,
+                date_from=None,
+                date_to=None,
+                search=None,
+                sort_by="created_at",
+                sort_order="desc",
+                limit=50,
+                offset=0,
+            )
+        )
+
+        assert result["total"] == 1
+        assert result["facets"]["item_types"] == {"idea": 1}
+        assert result["facets"]["source_types"] == {"meeting": 5, "manual_input": 1}
+        assert result["facets"]["disciplines"] == {
+            "landscape": 1,
+            "architecture": 1,
+            "sustainability": 1,
+        }
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Cursor Pagination Tests
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def _list_items(db_session, project, user, **overrides):
+    """Call list_project_items directly with every query parameter set."""
+    import asyncio
+    from types import SimpleNamespace
+
+    from app.api.routes.project_items import list_project_items
+
+    params = {
+        "item_type": None,
+        "source_type": None,
+        "discipline": None,
+        "is_milestone": None,
+        "date_from": None,
+        "date_to": None,
+        "search": None,
+        "sort_by": "created_at",
+        "sort_order": "desc",
+        "limit": 50,
+        "offset": 0,
+        "cursor": None,
+        "count": "exact",
+    }
+    params.update(overrides)
+    return asyncio.run(
+        list_project_items(
+            str(project.id),
+            SimpleNamespace(state=SimpleNamespace(user=user)),
+            db=db_session,
+            **params,
+        )
+    )
+
+
+class TestCursorPagination:
+    """Tests for keyset pagination of GET /items."""
+
+    @pytest.mark.parametrize(
+        "sort_by,sort_order",
+        [("created_at", "desc"), ("confidence", "asc"), ("confidence", "desc"), ("item_type", "asc")],
+    )
+    def test_cursor_pages_match_single_page(
+        self, db_session, test_project, test_items, test_user, sort_by, sort_order
+    ):
+        """Walking next_cursor visits every item once, in the full-list order."""
+        test_items[0].confidence = None
+        db_session.commit()
+
+        full = _list_items(db_session, test_project, test_user, sort_by=sort_by, sort_order=sort_order)
+        assert full["next_cursor"] is None
+
+        seen, cursor = [], None
+        while True:
+            page = _list_items(
+                db_session,
+                test_project,
+                test_user,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                limit=4,
+                cursor=cursor,
+                is_milestone=False if sort_by == "item_type" else None,
+            )
+            seen += [item["id"] for item in page["items"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        expected = [
+            item["id"]
+            for item in full["items"]
+            if sort_by != "item_type" or not item["is_milestone"]
+        ]
+        assert seen == expected
+
+    def test_cursor_from_other_sort_rejected(self, db_session, test_project, test_items, test_user):
+        """A cursor only continues the sort mode that produced it."""
+        page = _list_items(db_session, test_project, test_user, limit=2)
+
+        with pytest.raises(HTTPException) as exc_info:
+            _list_items(
+                db_session, test_project, test_user, limit=2, sort_by="confidence", cursor=page["next_cursor"]
+            )
+        assert exc_info.value.status_code == 400
+
+        with pytest.raises(HTTPException):
+            _list_items(db_session, test_project, test_user, cursor="garbage")
+
+    def test_keyset_condition_is_a_row_value_comparison(self):
+        """Non-NULL cursors compile to (a, b) < (x, y), an index range condition."""
+        from sqlalchemy.dialects import postgresql
+
+        from app.services.pagination import keyset_after
+
+        item_id = uuid.uuid4()
+        desc = keyset_after([ProjectItem.created_at, ProjectItem.id], [datetime(2026, 3, 1), item_id])
+        nullable_asc = keyset_after(
+            [ProjectItem.confidence, ProjectItem.id], [0.5, item_id], descending=False
+        )
+
+        assert "(project_items.created_at, project_items.id) < (" in str(
+            desc.compile(dialect=postgresql.dialect())
+        )
+        # NULL confidences follow 0.5 in ascending order: expanded form
+        assert "project_items.confidence IS NULL" in str(
+            nullable_asc.compile(dialect=postgresql.dialect())
+        )
+
+    def test_count_modes(self, db_session, test_project, test_items, test_user):
+        """count=none skips the total; count=estimated is exact on SQLite."""
+        none = _list_items(db_session, test_project, test_user, item_type="decision", count="none")
+        estimated = _list_items(db_session, test_project, test_user, item_type="decision", count="estimated")
+
+        assert none["total"] is None
+        assert len(none["items"]) == 2
+        assert estimated["total"] == 2
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Response Format Tests
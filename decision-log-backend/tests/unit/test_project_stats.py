@@ -0,0 +1,293 @@
+"""Tests for the project_stats rollup table and its incremental maintenance."""
+
+import uuid
+from datetime import datetime
+
+import pytest
+
+from app.database.models import Project, ProjectItem, ProjectStat, User
+from app.database.project_stats import (
+    ALL_DISCIPLINES,
+    backfill_project_stats,
+    rebuild_project_stats,
+    rollup_facets,
+)
+from app.services.project_service import get_projects
+
+
+@pytest.fixture
+def project(db_session):
+    project = Project(id=uuid.uuid4(), name="Stats Project")
+    db_session.add(project)
+    db_session.commit()
+    return project
+
+
+def _make_item(project, item_type="decision", source_type="meeting", disciplines=None, **kwargs):
+    return ProjectItem(
+        id=uuid.uuid4(),
+        project_id=project.id,
+        item_type=item_type,
+        source_type=source_type,
+        statement="Statement",
+        decision_statement="Statement",
+        who="Ana",
+        timestamp="00:00:00",
+        discipline="general",
+        affected_disciplines=disciplines if disciplines is not None else ["architecture"],
+        why="Because",
+        consensus={},
+        **kwargs,
+    )
+
+
+def _stats(db_session, project):
+    """Rollup rows as {(item_type, source_type, discipline): (items, milestones, done, latest)}."""
+    db_session.expire_all()
+    return {
+        (row.item_type, row.source_type, row.discipline): (
+            row.item_count,
+            row.milestone_count,
+            row.done_count,
+            row.latest_item_at,
+        )
+        for row in db_session.query(ProjectStat).filter(ProjectStat.project_id == project.id)
+    }
+
+
+def _counts(stats):
+    return {key: value[:3] for key, value in stats.items()}
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Incremental maintenance
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestIncrementalMaintenance:
+    def test_insert_adds_total_and_discipline_rows(self, db_session, project):
+        created = datetime(2026, 3, 1, 12, 0)
+        db_session.add(
+            _make_item(project, disciplines=["architecture", "mep"], is_milestone=True, created_at=created)
+        )
+        db_session.add(_make_item(project, item_type="idea", disciplines=["mep"]))
+        db_session.commit()
+
+        stats = _stats(db_session, project)
+        assert _counts(stats) == {
+            ("decision", "meeting", ALL_DISCIPLINES): (1, 1, 0),
+            ("decision", "meeting", "architecture"): (1, 1, 0),
+            ("decision", "meeting", "mep"): (1, 1, 0),
+            ("idea", "meeting", ALL_DISCIPLINES): (1, 0, 0),
+            ("idea", "meeting", "mep"): (1, 0, 0),
+        }
+        assert stats[("decision", "meeting", ALL_DISCIPLINES)][3] == created
+        assert stats[("idea", "meeting", ALL_DISCIPLINES)][3] is not None
+
+    def test_update_moves_item_between_groups(self, db_session, project):
+        item = _make_item(project, disciplines=["architecture"])
+        db_session.add(item)
+        db_session.commit()
+
+        item.item_type = "action_item"
+        item.affected_disciplines = ["structural"]
+        item.is_done = True
+        db_session.commit()
+
+        assert _counts(_stats(db_session, project)) == {
+            ("action_item", "meeting", ALL_DISCIPLINES): (1, 0, 1),
+            ("action_item", "meeting", "structural"): (1, 0, 1),
+        }
+
+    def test_flag_update_keeps_group(self, db_session, project):
+        item = _make_item(project)
+        other = _make_item(project)
+        db_session.add_all([item, other])
+        db_session.commit()
+
+        item.is_milestone = True
+        db_session.commit()
+        item.is_milestone = False
+        other.is_done = True
+        db_session.commit()
+
+        assert _counts(_stats(db_session, project)) == {
+            ("decision", "meeting", ALL_DISCIPLINES): (2, 0, 1),
+            ("decision", "meeting", "architecture"): (2, 0, 1),
+        }
+
+    def test_delete_recomputes_latest_and_drops_empty_rows(self, db_session, project):
+        old = _make_item(project, created_at=datetime(2026, 1, 1))
+        new = _make_item(project, disciplines=["mep"], created_at=datetime(2026, 2, 1))
+        db_session.add_all([old, new])
+        db_session.commit()
+        assert _stats(db_session, project)[("decision", "meeting", ALL_DISCIPLINES)][3] == datetime(2026, 2, 1)
+
+        db_session.delete(new)
+        db_session.commit()
+
+        stats = _stats(db_session, project)
+        assert _counts(stats) == {
+            ("decision", "meeting", ALL_DISCIPLINES): (1, 0, 0),
+            ("decision", "meeting", "architecture"): (1, 0, 0),
+        }
+        assert stats[("decision", "meeting", ALL_DISCIPLINES)][3] == datetime(2026, 1, 1)
+
+    def test_rollback_discards_changes(self, db_session, project):
+        db_session.add(_make_item(project))
+        db_session.flush()
+        assert _stats(db_session, project)
+        db_session.rollback()
+
+        assert _stats(db_session, project) == {}
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Rebuild and read helpers
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestRebuild:
+    def test_rebuild_matches_incremental_rollup(self, db_session, project):
+        db_session.add_all(
+            [
+                _make_item(project, disciplines=["architecture", "mep"], is_milestone=True),
+                _make_item(project, item_type="idea", source_type="email", disciplines=[]),
+                _make_item(project, disciplines=["mep", "mep"], is_done=True),
+            ]
+        )
+        db_session.commit()
+        incremental = _counts(_stats(db_session, project))
+
+        # Simulate drift from a bulk statement that bypasses the ORM events
+        db_session.query(ProjectStat).delete()
+        db_session.commit()
+        rebuild_project_stats(db_session)
+        db_session.commit()
+
+        assert _counts(_stats(db_session, project)) == incremental
+
+    def test_rebuild_limited_to_project(self, db_session, project):
+        other = Project(id=uuid.uuid4(), name="Other")
+        db_session.add(other)
+        db_session.add_all([_make_item(project), _make_item(other)])
+        db_session.commit()
+        db_session.query(ProjectItem).filter(ProjectItem.project_id == other.id).update(
+            {"item_type": "idea"}
+        )
+
+        rebuild_project_stats(db_session, [project.id])
+        db_session.commit()
+
+        # The other project keeps its (now stale) rows
+        assert ("decision", "meeting", ALL_DISCIPLINES) in _stats(db_session, other)
+        assert ("decision", "meeting", ALL_DISCIPLINES) in _stats(db_session, project)
+
+    def test_rollup_facets(self, db_session, project):
+        db_session.add_all(
+            [
+                _make_item(project, disciplines=["architecture", "mep"], is_milestone=True),
+                _make_item(project, item_type="idea", source_type="email"),
+            ]
+        )
+        db_session.commit()
+
+        assert rollup_facets(db_session, project.id) == {
+            "item_types": {"decision": 1, "idea": 1},
+            "source_types": {"meeting": 1, "email": 1},
+            "disciplines": {"architecture": 2, "mep": 1},
+        }
+
+    def test_get_projects_reads_rollup(self, db_session, project):
+        director = User(
+            id=uuid.uuid4(), email="stats-director@example.com", password_hash="hashed", name="D", role="director"
+        )
+        db_session.add(director)
+        db_session.add_all([_make_item(project, created_at=datetime(2026, 4, 1)), _make_item(project)])
+        db_session.commit()
+
+        projects, _ = get_projects(db_session, director.id)
+
+        entry = next(p for p in projects if p["id"] == str(project.id))
+        assert entry["decision_count"] == 2
+        assert entry["latest_decision"] is not None
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Missing rollup rows
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestWithoutRollup:
+    """Projects whose items predate the project_stats table."""
+
+    @pytest.fixture
+    def legacy(self, db_session, project):
+        db_session.add_all(
+            [
+                _make_item(project, disciplines=["mep"], created_at=datetime(2026, 4, 1)),
+                _make_item(project, item_type="idea", source_type="email", created_at=datetime(2026, 3, 1)),
+            ]
+        )
+        db_session.commit()
+        db_session.query(ProjectStat).delete()
+        db_session.commit()
+        return project
+
+    def test_rollup_facets_none_without_rows(self, db_session, legacy):
+        assert rollup_facets(db_session, legacy.id) is None
+
+    def test_item_list_falls_back_to_live_facets(self, db_session, legacy):
+        import asyncio
+        from types import SimpleNamespace
+
+        from app.api.routes.project_items import list_project_items
+
+        user = SimpleNamespace(id=uuid.uuid4(), role="director")
+        response = asyncio.run(
+            list_project_items(
+                str(legacy.id),
+                SimpleNamespace(state=SimpleNamespace(user=user)),
+                db=db_session,
+                item_type=None,
+                source_type=None,
+                discipline=None,
+                is_milestone=None,
+                date_from=None,
+                date_to=None,
+                search=None,
+                sort_by="created_at",
+                sort_order="desc",
+                limit=50,
+                offset=0,
+                cursor=None,
+                count="exact",
+            )
+        )
+
+        assert response["total"] == 2
+        assert response["facets"]["item_types"] == {"decision": 1, "idea": 1}
+        assert response["facets"]["disciplines"]["mep"] == 1
+
+    def test_get_projects_counts_items_live(self, db_session, legacy):
+        director = User(
+            id=uuid.uuid4(), email="live-director@example.com", password_hash="hashed", name="D", role="director"
+        )
+        db_session.add(director)
+        db_session.commit()
+
+        projects, _ = get_projects(db_session, director.id)
+
+        entry = next(p for p in projects if p["id"] == str(legacy.id))
+        assert entry["decision_count"] == 2
+        assert entry["latest_decision"].startswith("2026-04-01")
+
+    def test_backfill_fills_empty_table_only(self, db_session, legacy):
+        assert backfill_project_stats(db_session) > 0
+        db_session.commit()
+        filled = _counts(_stats(db_session, legacy))
+        assert filled[("decision", "meeting", ALL_DISCIPLINES)] == (1, 0, 0)
+
+        # A populated table is left alone
+        assert backfill_project_stats(db_session) == 0
+        assert _counts(_stats(db_session, legacy)) == filled
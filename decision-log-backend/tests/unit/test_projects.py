@@ -1,21 +1,28 @@
 """Tests for project service and endpoints."""
 
-import pytest
+import asyncio
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
+from types import SimpleNamespace
 
-from app.database.models import User, Project, ProjectMember, ProjectItem, Transcript
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 
-# Backward compatibility alias
-Decision = ProjectItem
+from app.api.routes import projects as projects_mod
+from app.database.models import Project, ProjectItem, ProjectMember, Transcript, User
+from app.services.pagination import InvalidCursorError
 from app.services.project_service import (
-    get_projects,
-    get_project,
-    ProjectNotFoundError,
     PermissionDeniedError,
+    ProjectNotFoundError,
+    get_project,
+    get_projects,
+    project_cursor,
 )
 from app.utils.security import hash_password
 
+# Backward compatibility alias
+Decision = ProjectItem
+
 
 @pytest.fixture
 def director_user(db_session: Session) -> User:
@@ -51,7 +58,6 @@ def test_projects(
 ) -> tuple:
     """Create test projects with members and decisions."""
     # Create 3 projects with explicit timestamps for predictable sorting
-    from datetime import timedelta
     base_time = datetime.utcnow()
 
     project1 = Project(
@@ -194,6 +200,93 @@ class TestGetProjects:
         assert "member_count" in project
         assert "decision_count" in project
 
+    def test_counts_and_latest_decision(
+        self, db_session: Session, director_user: User, test_projects: tuple
+    ):
+        """Counts come from the single page query."""
+        projects, _ = get_projects(db_session, str(director_user.id))
+        alpha = next(p for p in projects if p["name"] == "Project Alpha")
+        beta = next(p for p in projects if p["name"] == "Project Beta")
+
+        assert alpha["member_count"] == 2
+        assert alpha["decision_count"] == 3
+        assert alpha["latest_decision"] is not None
+        assert beta["member_count"] == 1
+        assert beta["decision_count"] == 0
+        assert beta["latest_decision"] is None
+
+    def test_keyset_pagination(
+        self, db_session: Session, director_user: User, test_projects: tuple
+    ):
+        """A cursor continues after the previous page's last project."""
+        page1, total = get_projects(db_session, str(director_user.id), limit=2)
+        page2, _ = get_projects(
+            db_session, str(director_user.id), limit=2, cursor=project_cursor(page1[-1])
+        )
+
+        assert total == 3
+        assert [p["name"] for p in page1 + page2] == [
+            "Project Gamma",
+            "Project Beta",
+            "Project Alpha",
+        ]
+
+    def test_invalid_cursor(self, db_session: Session, director_user: User):
+        with pytest.raises(InvalidCursorError):
+            get_projects(db_session, str(director_user.id), cursor="not-a-cursor")
+
+    def test_next_cursor_only_when_more_projects_exist(
+        self, db_session: Session, director_user: User, test_projects: tuple
+    ):
+        """A page that ends exactly at the last project has no next_cursor."""
+        request = SimpleNamespace(state=SimpleNamespace(user=director_user))
+
+        def list_page(limit, cursor=None):
+            return asyncio.run(
+                projects_mod.list_projects(
+                    request, db=db_session, limit=limit, offset=0, archived=False, cursor=cursor
+                )
+            )
+
+        full = list_page(3)
+        first = list_page(2)
+        last = list_page(2, cursor=first["next_cursor"])
+
+        assert len(full["projects"]) == 3
+        assert full["next_cursor"] is None
+        assert first["next_cursor"] is not None
+        assert [p["name"] for p in last["projects"]] == ["Project Alpha"]
+        assert last["next_cursor"] is None
+
+    def test_query_count_constant_in_page_size(
+        self, db_session: Session, director_user: User, test_projects: tuple
+    ):
+        """The page is one query however many projects it holds."""
+        for i in range(10):
+            db_session.add(Project(name=f"Extra {i}"))
+        db_session.commit()
+        user_id = str(director_user.id)
+
+        def count_queries(limit):
+            statements = []
+
+            def record(conn, cursor, statement, parameters, context, executemany):
+                statements.append(statement)
+
+            engine = db_session.get_bind()
+            event.listen(engine, "before_cursor_execute", record)
+            try:
+                projects, _ = get_projects(db_session, user_id, limit=limit)
+            finally:
+                event.remove(engine, "before_cursor_execute", record)
+            return len(projects), len(statements)
+
+        small, small_queries = count_queries(1)
+        large, large_queries = count_queries(13)
+
+        assert (small, large) == (1, 13)
+        assert small_queries == large_queries <= 3
+
 
 class TestGetProject:
     """Tests for get_project service function."""
@@ -348,3 +441,46 @@ class TestProjectStatistics:
 
         assert "multi-disciplinary" in stats
         assert stats["multi-disciplinary"] >= 1
+
+    def test_meeting_types_across_transcripts(
+        self, db_session: Session, director_user: User, test_projects: tuple
+    ):
+        """Items group by their transcript's meeting type; items without one are skipped."""
+        project = test_projects[1]
+        kickoff = Transcript(
+            project_id=project.id,
+            meeting_id="meet_kickoff",
+            meeting_type="kickoff",
+            participants=[],
+            transcript_text="Kickoff",
+            meeting_date=datetime.utcnow(),
+        )
+        untyped = Transcript(
+            project_id=project.id,
+            meeting_id="meet_untyped",
+            participants=[],
+            transcript_text="Untyped",
+            meeting_date=datetime.utcnow(),
+        )
+        db_session.add_all([kickoff, untyped])
+        db_session.commit()
+        for i, transcript in enumerate([kickoff, kickoff, untyped, None]):
+            db_session.add(
+                Decision(
+                    project_id=project.id,
+                    transcript_id=transcript.id if transcript else None,
+                    decision_statement=f"Decision {i}",
+                    who="User",
+                    timestamp="00:00:00",
+                    discipline="architecture",
+                    why="Testing",
+                    consensus={},
+                )
+            )
+        db_session.commit()
+
+        result = get_project(db_session, str(project.id), str(director_user.id))
+
+        assert result["stats"]["total_decisions"] == 4
+        assert result["stats"]["decisions_by_meeting_type"] == {"kickoff": 2}
+        assert result["stats"]["decisions_by_discipline"] == {"architecture": 4}
@@ -0,0 +1,44 @@
+"""Tests for streamed document storage with incremental size limits."""
+
+import io
+
+import pytest
+
+from app.services.upload_storage import FileTooLargeError, LimitedWriter, save_stream
+
+
+class TestSaveStream:
+    """Tests for save_stream."""
+
+    def test_copies_in_chunks(self, tmp_path):
+        dest = tmp_path / "p" / "doc.pdf"
+        written = save_stream(io.BytesIO(b"a" * 1000), str(dest), max_bytes=1000, chunk_bytes=64)
+
+        assert written == 1000
+        assert dest.read_bytes() == b"a" * 1000
+
+    def test_over_limit_stops_early_and_removes_file(self, tmp_path):
+        src = io.BytesIO(b"a" * 10_000)
+        dest = tmp_path / "doc.pdf"
+
+        with pytest.raises(FileTooLargeError):
+            save_stream(src, str(dest), max_bytes=100, chunk_bytes=64)
+
+        assert not dest.exists()
+        assert src.tell() == 128  # Stopped after the chunk that crossed the limit
+
+
+class TestLimitedWriter:
+    """Tests for LimitedWriter."""
+
+    def test_writes_until_limit(self):
+        buf = io.BytesIO()
+        writer = LimitedWriter(buf, max_bytes=8)
+        writer.write(b"1234")
+        writer.write(b"5678")
+
+        with pytest.raises(FileTooLargeError):
+            writer.write(b"9")
+
+        assert buf.getvalue() == b"12345678"
+        assert writer.written == 9